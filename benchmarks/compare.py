@@ -0,0 +1,59 @@
+import argparse
+import json
+import sys
+from typing import List, Tuple
+
+
+def load_results(path: str) -> dict:
+    with open(path, 'r') as json_file:
+        return {result['name']: result for result in json.load(json_file)['benchmarks']}
+
+
+def compare_results(baseline: dict, current: dict, threshold: float) -> Tuple[List[str], List[str]]:
+    # Returns report lines and the names of benchmarks whose rate dropped by more than threshold (a fraction)
+    lines = ['{:<60} {:>14} {:>14} {:>9}'.format('benchmark', 'baseline/s', 'current/s', 'change')]
+    regressions = []
+
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            lines.append('{:<60} {:>14,.1f} {:>14} {:>9}'.format(name, baseline[name]['rate'], '-', 'removed'))
+            continue
+
+        if name not in baseline:
+            lines.append('{:<60} {:>14} {:>14,.1f} {:>9}'.format(name, '-', current[name]['rate'], 'new'))
+            continue
+
+        change = current[name]['rate'] / baseline[name]['rate'] - 1
+        line = '{:<60} {:>14,.1f} {:>14,.1f} {:>+8.1f}%'.format(
+            name, baseline[name]['rate'], current[name]['rate'], change * 100)
+
+        if change < -threshold:
+            regressions.append(name)
+            line += '  REGRESSION'
+
+        lines.append(line)
+
+    return lines, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two benchmark runs and flag regressions')
+    parser.add_argument('baseline', help='JSON written by pytest --bench-json')
+    parser.add_argument('current', help='JSON written by pytest --bench-json')
+    parser.add_argument('-t', '--threshold', type=float, default=10.0,
+                        help='Slowdown in percent that counts as a regression, defaults to 10')
+
+    args = parser.parse_args()
+
+    lines, regressions = compare_results(load_results(args.baseline), load_results(args.current),
+                                         args.threshold / 100)
+
+    print('\n'.join(lines))
+
+    if regressions:
+        print('\n{} regression(s) beyond {}%'.format(len(regressions), args.threshold))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, List
+
+import pytest
+
+from gameboy.gameboy import GameBoy
+from gameboy.rom import ROM
+
+TEST_ROMS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'test_roms')
+
+
+def load_rom(file_name: str) -> ROM:
+    with open(os.path.join(TEST_ROMS_PATH, file_name), 'rb') as binary_file:
+        return ROM(bytearray(binary_file.read()))
+
+
+def load_game_boy(file_name: str) -> GameBoy:
+    game_boy = GameBoy()
+    game_boy.load_rom(load_rom(file_name))
+
+    return game_boy
+
+
+class BenchmarkResults:
+    def __init__(self):
+        self._results: List[dict] = []
+
+    def add(self, result: dict) -> None:
+        self._results.append(result)
+
+    def get_results(self) -> List[dict]:
+        return self._results
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'machine': {
+                'python': sys.version.split()[0],
+                'implementation': platform.python_implementation(),
+                'platform': platform.platform(),
+                'processor': platform.machine()
+            },
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'benchmarks': self._results
+        }, indent=2)
+
+
+_benchmark_results_key = pytest.StashKey[BenchmarkResults]()
+
+
+class Benchmark:
+    def __init__(self, name: str, rounds: int, benchmark_results: BenchmarkResults):
+        self._name = name
+        self._rounds = rounds
+        self._benchmark_results = benchmark_results
+
+    def __call__(self, function: Callable, operations: int=1, unit: str='op', setup: Callable=None) -> float:
+        # Runs function once per round, passing it a fresh setup() result when given. Returns operations per second.
+        round_times = []
+
+        for _ in range(0, self._rounds):
+            argument = setup() if setup is not None else None
+
+            start_time = time.perf_counter()
+
+            if setup is not None:
+                function(argument)
+            else:
+                function()
+
+            round_times.append(time.perf_counter() - start_time)
+
+        # The best round is what gets compared, it's the one least disturbed by whatever else the machine was doing
+        best_time = min(round_times)
+        rate = operations / best_time
+
+        self._benchmark_results.add({
+            'name': self._name,
+            'unit': unit,
+            'operations': operations,
+            'rounds': self._rounds,
+            'best_seconds': best_time,
+            'mean_seconds': sum(round_times) / len(round_times),
+            'rate': rate
+        })
+
+        return rate
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('bench')
+    group.addoption('--bench-json', default=None, help='Write results to this JSON file for compare.py')
+    group.addoption('--bench-rounds', type=int, default=5, help='Rounds per benchmark, the best one is kept')
+
+
+def pytest_configure(config):
+    config.stash[_benchmark_results_key] = BenchmarkResults()
+
+
+@pytest.fixture()
+def bench(request) -> Benchmark:
+    return Benchmark(
+        request.node.nodeid.split('::', 1)[-1],
+        request.config.getoption('bench_rounds'),
+        request.config.stash[_benchmark_results_key]
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash[_benchmark_results_key].get_results()
+
+    if not results:
+        return
+
+    terminalreporter.section('benchmarks')
+
+    for result in results:
+        terminalreporter.write_line('{:<60} {:>14,.1f} {}/s'.format(result['name'], result['rate'], result['unit']))
+
+
+def pytest_sessionfinish(session):
+    json_path = session.config.getoption('bench_json')
+    benchmark_results = session.config.stash[_benchmark_results_key]
+
+    if json_path and benchmark_results.get_results():
+        with open(json_path, 'w') as json_file:
+            json_file.write(benchmark_results.to_json())
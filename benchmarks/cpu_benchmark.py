@@ -0,0 +1,94 @@
+import pytest
+
+from conftest import load_rom
+from gameboy.cpu.cpu import CPU
+from gameboy.memory.memory_unit import MemoryUnit
+
+PROGRAM_ADDRESS = 0xC000
+STEP_COUNT = 20000
+
+# Each mix is a loop in work RAM, the jr at the end jumps back to the start of the loop
+OPCODE_MIXES = {
+    'load': [
+        0x41,  # ld b, c
+        0x53,  # ld d, e
+        0x3E, 0x12,  # ld a, 0x12
+        0x67,  # ld h, a
+        0x68,  # ld l, b
+        0x18, 0xF8  # jr -8
+    ],
+    'alu': [
+        0x80,  # add a, b
+        0xA9,  # xor c
+        0x14,  # inc d
+        0x1D,  # dec e
+        0xE6, 0x0F,  # and 0x0f
+        0xFE, 0x03,  # cp 0x03
+        0xB0,  # or b
+        0x18, 0xF5  # jr -11
+    ],
+    'memory': [
+        0x21, 0x00, 0xD0,  # ld hl, 0xd000 (once, before the loop)
+        0x22,  # ld (hl+), a
+        0x3A,  # ld a, (hl-)
+        0x70,  # ld (hl), b
+        0x4E,  # ld c, (hl)
+        0x18, 0xFA  # jr -6
+    ],
+    'stack_branch': [
+        0xCD, 0x08, 0xC0,  # call 0xc008
+        0xC5,  # push bc
+        0xC1,  # pop bc
+        0x18, 0xF9,  # jr -7
+        0x00,  # nop (padding)
+        0xC9  # ret
+    ],
+    'extended': [
+        0xCB, 0x37,  # swap a
+        0xCB, 0x7F,  # bit 7, a
+        0xCB, 0x11,  # rl c
+        0xCB, 0xC0,  # set 0, b
+        0xCB, 0x80,  # res 0, b
+        0x18, 0xF4  # jr -12
+    ]
+}
+
+
+def _create_cpu(program: list) -> CPU:
+    memory_unit = MemoryUnit()
+    memory_unit.set_cartridge_rom(load_rom('instr_timing.gb'))
+    memory_unit.write_byte(0xFF50, 1)  # Lock boot ROM
+
+    for offset, byte in enumerate(program):
+        memory_unit.write_byte(PROGRAM_ADDRESS + offset, byte)
+
+    cpu = CPU(memory_unit)
+    cpu.get_registers().set_program_counter(PROGRAM_ADDRESS)
+    cpu.get_registers().set_stack_pointer(0xDFFE)
+
+    return cpu
+
+
+def _run_steps(cpu: CPU):
+    step = cpu.step
+
+    for _ in range(0, STEP_COUNT):
+        step()
+
+
+@pytest.mark.parametrize('mix', sorted(OPCODE_MIXES))
+def test_benchmark_cpu_instructions(bench, mix):
+    bench(_run_steps, operations=STEP_COUNT, unit='instruction', setup=lambda: _create_cpu(OPCODE_MIXES[mix]))
+
+
+def test_benchmark_cpu_step_with_interrupts(bench):
+    # The per step overhead GameBoy.step_cpu adds on top of the instruction itself
+    def run_steps(cpu: CPU):
+        memory_unit = cpu.get_memory_unit()
+
+        for _ in range(0, STEP_COUNT):
+            cpu.handle_interrupts()
+            cpu.step()
+            memory_unit.dma_update()
+
+    bench(run_steps, operations=STEP_COUNT, unit='instruction', setup=lambda: _create_cpu(OPCODE_MIXES['alu']))
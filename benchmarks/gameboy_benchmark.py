@@ -0,0 +1,56 @@
+import pytest
+
+from conftest import load_game_boy
+from gameboy.gameboy import GameBoy
+
+FRAME_COUNT = 2
+FORK_COUNT = 200
+ROM_FILE_NAMES = ['TETRIS.GB', 'instr_timing.gb']
+
+
+@pytest.mark.parametrize('rom_file_name', ROM_FILE_NAMES)
+def test_benchmark_gameboy_frames(bench, rom_file_name):
+    # Headless from power on, a fresh GameBoy per round so every round runs the same frames
+    bench(lambda game_boy: game_boy.run_frames(FRAME_COUNT), operations=FRAME_COUNT, unit='frame',
+              setup=lambda: load_game_boy(rom_file_name))
+
+
+@pytest.mark.parametrize('rom_file_name', ROM_FILE_NAMES)
+def test_benchmark_gameboy_frames_fused(bench, rom_file_name):
+    def setup() -> GameBoy:
+        game_boy = load_game_boy(rom_file_name)
+        game_boy.get_cpu().enable_instruction_fusion()
+
+        return game_boy
+
+    bench(lambda game_boy: game_boy.run_frames(FRAME_COUNT), operations=FRAME_COUNT, unit='frame', setup=setup)
+
+
+@pytest.fixture()
+def running_game_boy_fixture() -> GameBoy:
+    game_boy = load_game_boy('TETRIS.GB')
+    game_boy.run_frames(1)
+
+    return game_boy
+
+
+def test_benchmark_gameboy_save_state(bench, running_game_boy_fixture):
+    # Forks are our save states
+    def save_states():
+        for _ in range(0, FORK_COUNT):
+            running_game_boy_fixture.fork()
+
+    bench(save_states, operations=FORK_COUNT, unit='save state')
+
+
+def test_benchmark_gameboy_save_state_diverged(bench, running_game_boy_fixture):
+    # A save state that then runs, paying for the copy-on-write copies its first writes make
+    def save_states():
+        for _ in range(0, FORK_COUNT):
+            forked_game_boy = running_game_boy_fixture.fork()
+            memory_unit = forked_game_boy.get_memory_unit()
+
+            for address in (0x8000, 0xC000, 0xFE00, 0xFF80):
+                memory_unit.write_byte(address, 0x01)
+
+    bench(save_states, operations=FORK_COUNT, unit='save state')
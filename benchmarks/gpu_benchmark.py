@@ -0,0 +1,44 @@
+import pytest
+
+from conftest import load_rom
+from gameboy.gpu.gpu import GPU
+from gameboy.memory.memory_unit import MemoryUnit
+
+SCANLINE_CLOCK_CYCLES = 456
+SCANLINE_COUNT = 20
+
+
+@pytest.fixture()
+def gpu_fixture() -> GPU:
+    memory_unit = MemoryUnit()
+    memory_unit.set_cartridge_rom(load_rom('instr_timing.gb'))
+
+    # Some tile data and sprites so every path in draw_pixel is taken
+    for address in range(0x8000, 0x8800):
+        memory_unit.write_byte(address, address & 0xFF)
+
+    for sprite_index in range(0, 10):
+        memory_unit.write_byte(0xFE00 + sprite_index * 4, 16)  # Y on the first scanline
+        memory_unit.write_byte(0xFE01 + sprite_index * 4, 8 + sprite_index * 16)  # X
+
+    memory_unit.write_byte(0xFF47, 0xE4)  # Background palette
+    memory_unit.write_byte(0xFF48, 0xE4)  # Sprite palette 0
+    memory_unit.write_byte(0xFF40, 0x93)  # LCD, background and sprites on, low tile data
+
+    return GPU(memory_unit)
+
+
+def _run_scanlines(gpu: GPU):
+    for _ in range(0, SCANLINE_COUNT * SCANLINE_CLOCK_CYCLES):
+        gpu.video_update()
+
+
+def test_benchmark_gpu_scanline(bench, gpu_fixture):
+    bench(lambda: _run_scanlines(gpu_fixture), operations=SCANLINE_COUNT, unit='scanline')
+
+
+def test_benchmark_gpu_scanline_rendering_disabled(bench, gpu_fixture):
+    # Timing and interrupts only, what frame skipping costs per scanline
+    gpu_fixture.set_rendering_enabled(False)
+
+    bench(lambda: _run_scanlines(gpu_fixture), operations=SCANLINE_COUNT, unit='scanline')
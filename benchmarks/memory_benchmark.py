@@ -0,0 +1,73 @@
+import pytest
+
+from conftest import load_rom
+from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.memory.watchpoint import Watchpoint
+
+ACCESS_COUNT = 50000
+
+READ_REGIONS = {
+    'rom_bank_0': 0x0150,
+    'rom_banked': 0x4150,
+    'video_ram': 0x8100,
+    'cartridge_ram': 0xA100,
+    'work_ram': 0xC100,
+    'work_ram_mirror': 0xE100,
+    'oam': 0xFE10,
+    'io': 0xFF42,
+    'interrupt_flags': 0xFF0F,
+    'high_ram': 0xFF90,
+    'interrupt_enable': 0xFFFF
+}
+
+# Writes to ROM go to the memory bank controller
+WRITE_REGIONS = dict(READ_REGIONS, rom_bank_0=0x0000, rom_banked=0x2000)
+
+
+@pytest.fixture()
+def memory_unit_fixture() -> MemoryUnit:
+    memory_unit = MemoryUnit()
+    memory_unit.set_cartridge_rom(load_rom('instr_timing.gb'))
+    memory_unit.write_byte(0xFF50, 1)  # Lock boot ROM
+
+    return memory_unit
+
+
+@pytest.mark.parametrize('region', sorted(READ_REGIONS))
+def test_benchmark_memory_unit_read_byte(bench, memory_unit_fixture, region):
+    address = READ_REGIONS[region]
+    read_byte = memory_unit_fixture.read_byte
+
+    def read():
+        for _ in range(0, ACCESS_COUNT):
+            read_byte(address)
+
+    bench(read, operations=ACCESS_COUNT, unit='read')
+
+
+@pytest.mark.parametrize('region', sorted(WRITE_REGIONS))
+def test_benchmark_memory_unit_write_byte(bench, memory_unit_fixture, region):
+    address = WRITE_REGIONS[region]
+    write_byte = memory_unit_fixture.write_byte
+
+    def write():
+        for _ in range(0, ACCESS_COUNT):
+            write_byte(address, 0x01)
+
+    bench(write, operations=ACCESS_COUNT, unit='write')
+
+
+@pytest.mark.parametrize('watched', [False, True])
+def test_benchmark_memory_unit_write_byte_with_watchpoints(bench, memory_unit_fixture, watched):
+    # Dozens of watched score addresses on another page, writes here should only pay for the page check
+    for address in range(0xD000, 0xD040):
+        memory_unit_fixture.add_watchpoint(Watchpoint(address, callback=lambda *_: None))
+
+    address = 0xD000 if watched else 0xC100
+    write_byte = memory_unit_fixture.write_byte
+
+    def write():
+        for _ in range(0, ACCESS_COUNT):
+            write_byte(address, 0x01)
+
+    bench(write, operations=ACCESS_COUNT, unit='write')
@@ -13,6 +13,7 @@ def main():
 
     game_boy = GameBoy()
     game_boy.load_rom(rom=test_rom)
+    print('Loaded ROM: {}'.format(test_rom.get_title()))
 
     test_rom.validate_header_checksum()
     test_rom.validate_rom_checksum()
@@ -0,0 +1,255 @@
+import copy
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from gameboy.apu.audio_capture import AudioCapture
+from gameboy.apu.band_limited_resampler import BandLimitedResampler
+from gameboy.apu.channel import Channel
+from gameboy.apu.noise_channel import NoiseChannel
+from gameboy.apu.sample_ring import SampleRing
+from gameboy.apu.square_channel import SquareChannel
+from gameboy.apu.wave_channel import WaveChannel
+
+# Bits that always read back as 1 for 0xFF10-0xFF2F, write-only bits included
+READ_MASKS = bytes([
+    0x80, 0x3F, 0x00, 0xFF, 0xBF,  # NR10-NR14
+    0xFF, 0x3F, 0x00, 0xFF, 0xBF,  # NR20-NR24
+    0x7F, 0xFF, 0x9F, 0xFF, 0xBF,  # NR30-NR34
+    0xFF, 0xFF, 0x00, 0x00, 0xBF,  # NR40-NR44
+    0x00, 0x00, 0x70,  # NR50-NR52
+    0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF
+])
+
+# 4 channels at full master volume (8) swing from -32 to 32
+OUTPUT_SCALE = 32767 / 32
+
+
+class APU:
+    # Sound is synthesized a block at a time rather than per cycle. Every register write first renders everything
+    # up to the current clock with the registers as they were, and update() renders the rest when the caller wants
+    # the samples. Blocks are split where the 512Hz frame sequencer clocks lengths, sweep and envelopes, so those
+    # land on the right sample. Mixed level changes are band-limited by a BandLimitedResampler, which outputs to a
+    # ring buffer as stereo 16 bit frames. There's no high-pass filter, channels with their DAC on carry its DC
+    # offset.
+    CLOCK_CYCLES_PER_SECOND = 4194304
+    FRAME_SEQUENCER_PERIOD = 8192  # Clock cycles, 512Hz
+
+    DEFAULT_SAMPLE_RATE = 48000
+    DEFAULT_BUFFER_FRAME_COUNT = 48000
+
+    MASTER_CONTROL_ADDRESS = 0xFF26
+
+    def __init__(self, cycle_source: Callable[[], int], sample_rate: int=DEFAULT_SAMPLE_RATE,
+                 buffer_frame_count: int=DEFAULT_BUFFER_FRAME_COUNT):
+        if sample_rate < 1 or sample_rate > self.CLOCK_CYCLES_PER_SECOND:
+            raise ValueError(f'Invalid sample rate: {sample_rate}')
+
+        self._cycle_source = cycle_source
+        self._sample_ring = SampleRing(buffer_frame_count)
+
+        self._channels: List[Channel] = self._create_channels()
+        self._powered = False
+        self._volume_control = 0  # NR50
+        self._panning = 0  # NR51
+        self._frame_sequencer_step = 0
+
+        self._rendered_clock_cycles = cycle_source()
+        self._resampler = BandLimitedResampler(self.CLOCK_CYCLES_PER_SECOND, sample_rate, self._rendered_clock_cycles)
+
+        # What each channel last sent to the resampler, left and right
+        self._channel_outputs = [[0.0, 0.0] for _ in self._channels]
+
+        # Gets every rendered frame too, whether or not anyone reads the sample ring
+        self._capture: AudioCapture = None
+
+    @staticmethod
+    def _create_channels() -> List[Channel]:
+        return [SquareChannel(has_sweep=True), SquareChannel(), WaveChannel(), NoiseChannel()]
+
+    def get_sample_rate(self) -> int:
+        return self._resampler.get_sample_rate()
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        # Can be adjusted while running, by a caller keeping the sample ring's fill level steady. Samples already
+        # rendered keep the old rate.
+        if sample_rate < 1 or sample_rate > self.CLOCK_CYCLES_PER_SECOND:
+            raise ValueError(f'Invalid sample rate: {sample_rate}')
+
+        self.update()
+        self._resampler.set_sample_rate(sample_rate)
+
+    def get_sample_ring(self) -> SampleRing:
+        return self._sample_ring
+
+    def get_channels(self) -> List[Channel]:
+        return self._channels
+
+    def get_capture(self) -> Optional[AudioCapture]:
+        return self._capture
+
+    def set_capture(self, capture: Optional[AudioCapture]) -> None:
+        self._capture = capture
+
+    def is_powered(self) -> bool:
+        return self._powered
+
+    def set_cycle_source(self, cycle_source: Callable[[], int]) -> None:
+        self._cycle_source = cycle_source
+
+    def fork(self, cycle_source: Callable[[], int]) -> 'APU':
+        # Carries on from our state into its own, empty, ring buffer
+        forked_apu = copy.copy(self)
+
+        forked_apu._cycle_source = cycle_source
+        forked_apu._sample_ring = SampleRing(self._sample_ring.get_capacity())
+        forked_apu._channels = [copy.deepcopy(channel) for channel in self._channels]
+        forked_apu._resampler = copy.deepcopy(self._resampler)
+        forked_apu._channel_outputs = copy.deepcopy(self._channel_outputs)
+        forked_apu._capture = None
+
+        return forked_apu
+
+    def read_byte(self, address: int) -> int:
+        if address >= 0xFF30:
+            return self._get_wave_channel().read_wave_ram(address)
+
+        if address < 0xFF24:
+            channel_index, register_index = divmod(address - 0xFF10, 5)
+            value = self._channels[channel_index].get_register(register_index)
+        elif address == 0xFF24:
+            value = self._volume_control
+        elif address == 0xFF25:
+            value = self._panning
+        elif address == self.MASTER_CONTROL_ADDRESS:
+            value = (0x80 if self._powered else 0) | \
+                sum(1 << bit for bit, channel in enumerate(self._channels) if channel.is_enabled())
+        else:
+            value = 0
+
+        return value | READ_MASKS[address - 0xFF10]
+
+    def write_byte(self, address: int, value: int) -> None:
+        # Everything before this write still plays with the old registers
+        self.update()
+
+        if address >= 0xFF30:
+            return self._get_wave_channel().write_wave_ram(address, value)
+
+        if address == self.MASTER_CONTROL_ADDRESS:
+            return self._set_powered(value & 0x80 > 0)
+
+        # Registers are held at 0 while powered off
+        if not self._powered:
+            return
+
+        if address < 0xFF24:
+            channel_index, register_index = divmod(address - 0xFF10, 5)
+            self._channels[channel_index].write_register(register_index, value)
+        elif address == 0xFF24:
+            self._volume_control = value
+        elif address == 0xFF25:
+            self._panning = value
+
+    def _get_wave_channel(self) -> WaveChannel:
+        return self._channels[2]
+
+    def _set_powered(self, powered: bool) -> None:
+        if powered == self._powered:
+            return
+
+        self._powered = powered
+
+        if powered:
+            self._frame_sequencer_step = 0
+
+            return
+
+        # Powering off clears every register, wave RAM survives
+        wave_ram = self._get_wave_channel().get_wave_ram()
+
+        self._channels = self._create_channels()
+        self._get_wave_channel().get_wave_ram()[:] = wave_ram
+        self._volume_control = 0
+        self._panning = 0
+
+    def update(self) -> None:
+        # Renders up to the current clock
+        clock_cycles = self._cycle_source()
+
+        while self._rendered_clock_cycles < clock_cycles:
+            next_step_clock_cycles = (self._rendered_clock_cycles // self.FRAME_SEQUENCER_PERIOD + 1) * \
+                self.FRAME_SEQUENCER_PERIOD
+            block_end = min(clock_cycles, next_step_clock_cycles)
+
+            self._render_block(self._rendered_clock_cycles, block_end)
+            self._rendered_clock_cycles = block_end
+
+            if block_end == next_step_clock_cycles and self._powered:
+                self._clock_frame_sequencer()
+
+    def _render_block(self, start_clock_cycles: int, end_clock_cycles: int) -> None:
+        # The registers don't change within a block, so each channel's contribution to each side only changes at the
+        # channel's own steps. Those changes go to the resampler as deltas.
+        clock_cycles = end_clock_cycles - start_clock_cycles
+
+        for bit, channel in enumerate(self._channels):
+            gains = self._get_channel_gains(bit, channel)
+            outputs = self._channel_outputs[bit]
+
+            if gains[0] or gains[1]:
+                offsets = channel.get_level_change_offsets(clock_cycles)
+
+                # The DAC maps 0-15 to 1.0 down to -1.0
+                analog = 1.0 - channel.render(offsets) / 7.5
+            elif outputs[0] or outputs[1]:
+                offsets = np.zeros(1, dtype=np.int64)
+                analog = np.zeros(1, dtype=np.float64)
+            else:
+                channel.advance(clock_cycles)
+
+                continue
+
+            for side in (0, 1):
+                levels = analog * gains[side]
+                deltas = np.diff(levels, prepend=outputs[side])
+                changed = deltas != 0
+
+                self._resampler.add_deltas(side, start_clock_cycles + offsets[changed], deltas[changed])
+                outputs[side] = levels[-1]
+
+            channel.advance(clock_cycles)
+
+        self._resampler.end_block(end_clock_cycles)
+
+        frames = self._resampler.read_frames()
+        self._sample_ring.write(frames)
+
+        if self._capture is not None:
+            self._capture.write(frames)
+
+    def _get_channel_gains(self, bit: int, channel: Channel) -> Tuple[float, float]:
+        # What the channel's analog output is multiplied by on the left and right
+        if not self._powered or not channel.is_dac_enabled():
+            return 0.0, 0.0
+
+        left_gain = OUTPUT_SCALE * (((self._volume_control >> 4) & 0x07) + 1) if self._panning & (0x10 << bit) else 0.0
+        right_gain = OUTPUT_SCALE * ((self._volume_control & 0x07) + 1) if self._panning & (0x01 << bit) else 0.0
+
+        return left_gain, right_gain
+
+    def _clock_frame_sequencer(self) -> None:
+        step = self._frame_sequencer_step
+        self._frame_sequencer_step = (step + 1) & 0x07
+
+        if not step & 0x01:
+            for channel in self._channels:
+                channel.clock_length()
+
+        if step in (2, 6):
+            self._channels[0].clock_sweep()
+
+        if step == 7:
+            self._channels[0].clock_envelope()
+            self._channels[1].clock_envelope()
+            self._channels[3].clock_envelope()
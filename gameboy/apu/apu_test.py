@@ -0,0 +1,205 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameboy.apu.apu import APU
+
+
+@pytest.fixture()
+def apu_fixture(cycle_source_fixture) -> APU:
+    apu = APU(cycle_source_fixture, sample_rate=32768)
+
+    apu.write_byte(0xFF26, 0x80)
+    apu.write_byte(0xFF24, 0x77)
+    apu.write_byte(0xFF25, 0x11)  # Channel 1 to both sides
+
+    return apu
+
+
+def _play_square(apu: APU) -> None:
+    apu.write_byte(0xFF11, 0x80)
+    apu.write_byte(0xFF12, 0xF0)
+    apu.write_byte(0xFF13, 0x00)
+    apu.write_byte(0xFF14, 0x87)
+
+
+def test_apu_init(cycle_source_fixture):
+    apu = APU(cycle_source_fixture)
+
+    assert apu.get_sample_rate() == APU.DEFAULT_SAMPLE_RATE
+    assert apu.get_sample_ring().get_capacity() == APU.DEFAULT_BUFFER_FRAME_COUNT
+    assert len(apu.get_channels()) == 4
+    assert not apu.is_powered()
+
+    with pytest.raises(ValueError):
+        APU(cycle_source_fixture, sample_rate=0)
+
+
+def test_apu_read_byte(apu_fixture):
+    assert apu_fixture.read_byte(0xFF26) == 0xF0
+    assert apu_fixture.read_byte(0xFF24) == 0x77
+    assert apu_fixture.read_byte(0xFF13) == 0xFF
+    assert apu_fixture.read_byte(0xFF27) == 0xFF
+
+    _play_square(apu_fixture)
+
+    assert apu_fixture.read_byte(0xFF11) == 0xBF
+    assert apu_fixture.read_byte(0xFF12) == 0xF0
+    assert apu_fixture.read_byte(0xFF26) == 0xF1
+
+    apu_fixture.write_byte(0xFF3F, 0x5A)
+
+    assert apu_fixture.read_byte(0xFF3F) == 0x5A
+
+
+def test_apu_power_off(apu_fixture):
+    _play_square(apu_fixture)
+    apu_fixture.write_byte(0xFF30, 0x12)
+    apu_fixture.write_byte(0xFF26, 0x00)
+
+    assert apu_fixture.read_byte(0xFF26) == 0x70
+    assert apu_fixture.read_byte(0xFF12) == 0x00
+    assert apu_fixture.read_byte(0xFF24) == 0x00
+    assert apu_fixture.read_byte(0xFF30) == 0x12
+
+    # Ignored until powered back on
+    apu_fixture.write_byte(0xFF24, 0x77)
+
+    assert apu_fixture.read_byte(0xFF24) == 0x00
+
+    apu_fixture.write_byte(0xFF26, 0x80)
+    apu_fixture.write_byte(0xFF24, 0x77)
+
+    assert apu_fixture.read_byte(0xFF24) == 0x77
+
+
+def _read_frames(apu: APU) -> np.ndarray:
+    return np.frombuffer(apu.get_sample_ring().read(), dtype=np.int16).reshape(-1, 2)
+
+
+def test_apu_update_sample_count(apu_fixture, cycle_source_fixture):
+    # A sample is out once nothing later can change it, 1 every 128 clock cycles from sample 0 at clock cycle 0
+    cycle_source_fixture.clock_cycles = APU.CLOCK_CYCLES_PER_SECOND // 4
+    apu_fixture.update()
+
+    assert apu_fixture.get_sample_ring().get_available_frame_count() == 32768 // 4 + 1
+
+    # Samples are rendered once, however often we catch up
+    apu_fixture.update()
+    cycle_source_fixture.clock_cycles += 3
+    apu_fixture.update()
+    cycle_source_fixture.clock_cycles += 125
+    apu_fixture.update()
+
+    assert apu_fixture.get_sample_ring().get_available_frame_count() == 32768 // 4 + 2
+
+
+def test_apu_render_square(apu_fixture, cycle_source_fixture):
+    _play_square(apu_fixture)
+    apu_fixture.write_byte(0xFF13, 0x00)
+    apu_fixture.write_byte(0xFF14, 0x80)  # Frequency 0, 64 samples per duty step
+
+    cycle_source_fixture.clock_cycles = 8192 * 8
+    apu_fixture.update()
+
+    frames = _read_frames(apu_fixture)
+
+    assert len(frames) == 8 * 64 + 1
+    assert (frames[:, 0] == frames[:, 1]).all()
+
+    # Mid-step, allowing for the resampler's 8 sample lag. Digital 15 is the DAC's low end.
+    assert list(frames[8 + 32::64, 0]) == [-8192, 8192, 8192, 8192, 8192, -8192, -8192, -8192]
+
+    # Edges are band-limited, there's a ramp with some ringing rather than a jump
+    edge = frames[8 + 64 - 10:8 + 64 + 10, 0]
+
+    assert len(set(edge)) > 10
+    assert abs(frames[:, 0]).max() < 9000
+
+
+def test_apu_render_panning(apu_fixture, cycle_source_fixture):
+    _play_square(apu_fixture)
+    apu_fixture.write_byte(0xFF14, 0x80)
+    apu_fixture.write_byte(0xFF25, 0x10)
+    apu_fixture.write_byte(0xFF24, 0x70)
+
+    cycle_source_fixture.clock_cycles = 8192
+    apu_fixture.update()
+
+    frames = _read_frames(apu_fixture)
+
+    assert frames[8 + 32, 0] == -8192
+    assert (frames[:, 1] == 0).all()
+
+
+def test_apu_register_write_catches_up(apu_fixture, cycle_source_fixture):
+    _play_square(apu_fixture)
+    apu_fixture.write_byte(0xFF14, 0x80)
+
+    # The DAC switches off half way through the first duty step, the first half still plays
+    cycle_source_fixture.clock_cycles = 4096
+    apu_fixture.write_byte(0xFF12, 0x00)
+    cycle_source_fixture.clock_cycles = 8192
+    apu_fixture.update()
+
+    frames = _read_frames(apu_fixture)
+
+    assert frames[8 + 16, 0] == -8192
+    assert frames[8 + 48, 0] == 0
+
+
+def test_apu_set_sample_rate(apu_fixture, cycle_source_fixture):
+    cycle_source_fixture.clock_cycles = 4096
+    apu_fixture.set_sample_rate(65536)
+    cycle_source_fixture.clock_cycles = 8192
+    apu_fixture.update()
+
+    assert apu_fixture.get_sample_rate() == 65536
+    assert apu_fixture.get_sample_ring().get_available_frame_count() == 32 + 64 + 1
+
+    with pytest.raises(ValueError):
+        apu_fixture.set_sample_rate(0)
+
+
+def test_apu_frame_sequencer(apu_fixture, cycle_source_fixture):
+    apu_fixture.write_byte(0xFF11, 0x80 | 62)
+    apu_fixture.write_byte(0xFF12, 0xF0)
+    apu_fixture.write_byte(0xFF14, 0xC7)
+
+    # Lengths are clocked every other step, the second one switches the channel off
+    cycle_source_fixture.clock_cycles = APU.FRAME_SEQUENCER_PERIOD * 2
+    apu_fixture.update()
+
+    assert apu_fixture.read_byte(0xFF26) == 0xF1
+
+    cycle_source_fixture.clock_cycles = APU.FRAME_SEQUENCER_PERIOD * 3
+    apu_fixture.update()
+
+    assert apu_fixture.read_byte(0xFF26) == 0xF0
+
+
+def test_apu_fork(apu_fixture, cycle_source_fixture, new_cycle_source_fixture):
+    _play_square(apu_fixture)
+    cycle_source_fixture.clock_cycles = 1024
+    apu_fixture.update()
+
+    forked_clock = new_cycle_source_fixture()
+    forked_clock.clock_cycles = 1024
+    forked_apu = apu_fixture.fork(forked_clock)
+
+    assert forked_apu.get_sample_ring() is not apu_fixture.get_sample_ring()
+    assert forked_apu.get_sample_ring().get_available_frame_count() == 0
+    assert forked_apu.read_byte(0xFF26) == 0xF1
+
+    forked_apu.write_byte(0xFF26, 0x00)
+
+    assert apu_fixture.is_powered()
+    assert apu_fixture.get_channels()[0].is_enabled()
+
+    cycle_source_fixture.clock_cycles = 2048
+    forked_clock.clock_cycles = 2048
+    apu_fixture.update()
+    forked_apu.update()
+
+    assert apu_fixture.get_sample_ring().get_available_frame_count() == 17
+    assert forked_apu.get_sample_ring().get_available_frame_count() == 8
@@ -0,0 +1,157 @@
+import queue
+import sys
+import threading
+import wave
+from array import array
+from enum import Enum
+
+
+class AudioCapture:
+    # Writes 16 bit frames to disk as WAV or raw little-endian PCM. Frames are only gathered by write(), the disk is
+    # touched from end_batch() once a whole chunk is waiting, and with threaded=True chunks are handed to a background
+    # writer so the emulation loop never waits on I/O. Frames are whatever the APU renders, so the capture runs at
+    # emulated time however fast or slow the emulator goes.
+    class Format(Enum):
+        WAV = 0
+        RAW = 1
+
+    DEFAULT_CHUNK_FRAME_COUNT = 16384
+
+    def __init__(self, path: str, sample_rate: int, channel_count: int=2, capture_format: Format=Format.WAV,
+                 threaded: bool=False, chunk_frame_count: int=DEFAULT_CHUNK_FRAME_COUNT):
+        self._path = path
+        self._sample_rate = sample_rate
+        self._channel_count = channel_count
+        self._format = capture_format
+        self._chunk_byte_count = chunk_frame_count * channel_count * 2
+
+        if capture_format == self.Format.WAV:
+            self._file = wave.open(path, 'wb')
+            self._file.setnchannels(channel_count)
+            self._file.setsampwidth(2)
+            self._file.setframerate(sample_rate)
+        else:
+            self._file = open(path, 'wb')
+
+        self._pending = bytearray()
+        self._frame_count = 0
+        self._closed = False
+
+        self._queue: queue.Queue = None
+        self._writer_thread: threading.Thread = None
+        self._writer_error: Exception = None
+
+        if threaded:
+            self._queue = queue.Queue()
+            self._writer_thread = threading.Thread(target=self._run_writer, name='AudioCapture', daemon=True)
+            self._writer_thread.start()
+
+    def __enter__(self) -> 'AudioCapture':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_path(self) -> str:
+        return self._path
+
+    def get_sample_rate(self) -> int:
+        return self._sample_rate
+
+    def get_format(self) -> Format:
+        return self._format
+
+    def get_frame_count(self) -> int:
+        # Frames captured so far, written out or not
+        return self._frame_count
+
+    def is_threaded(self) -> bool:
+        return self._writer_thread is not None
+
+    def write(self, samples) -> None:
+        # samples is interleaved 16 bit frames through the buffer protocol, an array('h') or a NumPy int16 array
+        if self._closed:
+            raise ValueError('Audio capture is closed')
+
+        samples = memoryview(samples)
+
+        if not samples.nbytes:
+            return
+
+        samples = samples.cast('B')
+
+        if sys.byteorder == 'big':
+            swapped_samples = array('h', samples)
+            swapped_samples.byteswap()
+            samples = memoryview(swapped_samples).cast('B')
+
+        self._pending += samples
+        self._frame_count += len(samples) // (self._channel_count * 2)
+
+    def end_batch(self) -> None:
+        # Called between batches of emulated frames, writes out what's pending once it makes up a chunk
+        if len(self._pending) >= self._chunk_byte_count:
+            self._write_pending()
+
+    def flush(self) -> None:
+        # Writes out everything pending, with a writer thread this waits until it's on disk
+        self._write_pending()
+
+        if self._queue is not None:
+            self._queue.join()
+            self._check_writer_error()
+
+    def _write_pending(self) -> None:
+        self._check_writer_error()
+
+        if not self._pending:
+            return
+
+        chunk = bytes(self._pending)
+        self._pending.clear()
+
+        if self._queue is not None:
+            self._queue.put(chunk)
+        else:
+            self._write_chunk(chunk)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+
+            if self._writer_thread is not None:
+                self._queue.put(None)
+                self._writer_thread.join()
+
+            # Fills in the WAV header's lengths
+            self._file.close()
+
+    def _write_chunk(self, chunk: bytes) -> None:
+        if self._format == self.Format.WAV:
+            self._file.writeframesraw(chunk)
+        else:
+            self._file.write(chunk)
+
+    def _run_writer(self) -> None:
+        while True:
+            chunk = self._queue.get()
+
+            try:
+                if chunk is None:
+                    return
+
+                if self._writer_error is None:
+                    self._write_chunk(chunk)
+            except Exception as exception:
+                self._writer_error = exception
+            finally:
+                self._queue.task_done()
+
+    def _check_writer_error(self) -> None:
+        if self._writer_error is not None:
+            raise self._writer_error
@@ -0,0 +1,101 @@
+import os
+import sys
+import wave
+from array import array
+
+import pytest
+
+from gameboy.apu.audio_capture import AudioCapture
+
+
+def _frames(*values: int) -> array:
+    return array('h', [sample for value in values for sample in (value, -value)])
+
+
+def _to_le_bytes(samples: array) -> bytes:
+    samples = array('h', samples)
+
+    if sys.byteorder == 'big':
+        samples.byteswap()
+
+    return samples.tobytes()
+
+
+@pytest.fixture(params=[False, True], ids=['direct', 'threaded'])
+def threaded_fixture(request) -> bool:
+    return request.param
+
+
+def test_audio_capture_wav(tmpdir, threaded_fixture):
+    path = os.path.join(str(tmpdir), 'audio.wav')
+
+    with AudioCapture(path, 32768, threaded=threaded_fixture) as audio_capture:
+        assert audio_capture.get_path() == path
+        assert audio_capture.get_sample_rate() == 32768
+        assert audio_capture.get_format() == AudioCapture.Format.WAV
+        assert audio_capture.is_threaded() == threaded_fixture
+
+        audio_capture.write(_frames(1, 2, 3))
+        audio_capture.write(array('h'))
+        audio_capture.write(_frames(4))
+
+        assert audio_capture.get_frame_count() == 4
+
+    with wave.open(path, 'rb') as wave_file:
+        assert wave_file.getnchannels() == 2
+        assert wave_file.getsampwidth() == 2
+        assert wave_file.getframerate() == 32768
+        assert wave_file.getnframes() == 4
+        assert wave_file.readframes(4) == _to_le_bytes(_frames(1, 2, 3, 4))
+
+
+def test_audio_capture_raw(tmpdir, threaded_fixture):
+    path = os.path.join(str(tmpdir), 'audio.raw')
+
+    with AudioCapture(path, 48000, capture_format=AudioCapture.Format.RAW, threaded=threaded_fixture) as audio_capture:
+        audio_capture.write(_frames(-5, 300))
+
+    with open(path, 'rb') as raw_file:
+        assert raw_file.read() == _to_le_bytes(_frames(-5, 300))
+
+
+def test_audio_capture_end_batch(tmpdir, threaded_fixture):
+    path = os.path.join(str(tmpdir), 'audio.raw')
+    audio_capture = AudioCapture(path, 48000, capture_format=AudioCapture.Format.RAW, threaded=threaded_fixture,
+                                 chunk_frame_count=3)
+
+    # Frames wait until a whole chunk has built up
+    audio_capture.write(_frames(1, 2))
+    audio_capture.end_batch()
+
+    assert len(audio_capture._pending) == 2 * 4
+
+    audio_capture.write(_frames(3))
+    audio_capture.end_batch()
+
+    assert len(audio_capture._pending) == 0
+
+    audio_capture.write(_frames(4))
+    audio_capture.close()
+    audio_capture.close()
+
+    with open(path, 'rb') as raw_file:
+        assert raw_file.read() == _to_le_bytes(_frames(1, 2, 3, 4))
+
+    with pytest.raises(ValueError):
+        audio_capture.write(_frames(5))
+
+
+def test_audio_capture_writer_error(tmpdir):
+    audio_capture = AudioCapture(os.path.join(str(tmpdir), 'audio.raw'), 48000,
+                                 capture_format=AudioCapture.Format.RAW, threaded=True)
+
+    # Errors on the writer thread come back on the next flush
+    audio_capture._file.close()
+    audio_capture.write(_frames(1))
+
+    with pytest.raises(ValueError):
+        audio_capture.flush()
+
+    with pytest.raises(ValueError):
+        audio_capture.close()
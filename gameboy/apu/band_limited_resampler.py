@@ -0,0 +1,117 @@
+import math
+
+import numpy as np
+
+# Each output level change is spread over KERNEL_WIDTH samples, with the kernel picked from PHASE_COUNT by where the
+# change falls between two samples
+PHASE_COUNT = 32
+KERNEL_WIDTH = 16
+
+# Of the output's Nyquist frequency, leaves room for the window's roll-off
+CUTOFF = 0.9
+
+
+def _build_step_kernels() -> np.ndarray:
+    # Row n is a Blackman windowed sinc for a change n / PHASE_COUNT of the way past a sample, centred KERNEL_WIDTH / 2
+    # samples later. Summed up, rows make band-limited steps instead of hard edges. Every row adds up to exactly 1 so
+    # the steps settle on the level they were asked for.
+    half_width = KERNEL_WIDTH / 2
+    distances = np.arange(1, KERNEL_WIDTH + 1)[None, :] - (np.arange(PHASE_COUNT) / PHASE_COUNT)[:, None] - half_width
+    window_positions = (distances + half_width) / KERNEL_WIDTH
+
+    windows = 0.42 - 0.5 * np.cos(2 * math.pi * window_positions) + 0.08 * np.cos(4 * math.pi * window_positions)
+    kernels = np.sinc(distances * CUTOFF) * windows
+
+    return kernels / kernels.sum(axis=1, keepdims=True)
+
+
+STEP_KERNELS = _build_step_kernels()
+
+
+class BandLimitedResampler:
+    # Turns level changes at clock cycle timestamps into stereo samples at the output rate. Changes are added a block
+    # at a time as deltas, then output samples are the running sum of those deltas after each has been spread by its
+    # step kernel. A sample is ready once no later change can reach it, so output lags by KERNEL_WIDTH / 2 samples.
+
+    def __init__(self, clock_rate: int, sample_rate: int, start_clock_cycles: int):
+        self._clock_rate = clock_rate
+        self._sample_rate = sample_rate
+
+        # Deltas waiting to be summed, sample 0 is the next one out
+        self._deltas = np.zeros((2, 1024), dtype=np.float64)
+        self._levels = np.zeros(2, dtype=np.float64)
+
+        # Clock cycles are converted to sample positions from the end of the last block, so the sample rate can change
+        # between blocks
+        self._anchor_clock_cycles = start_clock_cycles
+        self._anchor_position = 0.0
+
+    def get_sample_rate(self) -> int:
+        return self._sample_rate
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        # Takes effect from the end of the last block, for nudging the rate to keep an output buffer level
+        self._sample_rate = sample_rate
+
+    def _get_positions(self, clock_cycles: np.ndarray) -> np.ndarray:
+        sample_rate_ratio = self._sample_rate / self._clock_rate
+
+        return self._anchor_position + (clock_cycles - self._anchor_clock_cycles) * sample_rate_ratio
+
+    def add_deltas(self, side: int, clock_cycles: np.ndarray, deltas: np.ndarray) -> None:
+        # side is 0 for left and 1 for right, clock_cycles are absolute and no earlier than the end of the last block
+        if not len(deltas):
+            return
+
+        positions = self._get_positions(clock_cycles)
+        sample_indexes = np.floor(positions)
+        phases = ((positions - sample_indexes) * PHASE_COUNT).astype(np.int64)
+
+        tap_indexes = (sample_indexes.astype(np.int64) + 1)[:, None] + np.arange(KERNEL_WIDTH)
+        end_index = int(tap_indexes[-1, -1]) + 1
+
+        self._reserve(end_index)
+
+        self._deltas[side, :end_index] += np.bincount(
+            tap_indexes.ravel(), weights=(deltas[:, None] * STEP_KERNELS[phases]).ravel(), minlength=end_index)
+
+    def end_block(self, clock_cycles: int) -> None:
+        self._anchor_position = float(self._get_positions(np.int64(clock_cycles)))
+        self._anchor_clock_cycles = clock_cycles
+
+    def get_ready_frame_count(self) -> int:
+        return max(math.floor(self._anchor_position) + 1, 0)
+
+    def read_frames(self) -> np.ndarray:
+        # Every ready sample as (left, right) 16 bit frames
+        frame_count = self.get_ready_frame_count()
+
+        if not frame_count:
+            return np.empty((0, 2), dtype=np.int16)
+
+        self._reserve(frame_count)
+
+        levels = self._levels[:, None] + np.cumsum(self._deltas[:, :frame_count], axis=1)
+        self._levels = levels[:, -1].copy()
+
+        self._deltas[:, :-frame_count] = self._deltas[:, frame_count:]
+        self._deltas[:, -frame_count:] = 0
+        self._anchor_position -= frame_count
+
+        frames = np.empty((frame_count, 2), dtype=np.int16)
+        frames[:] = np.clip(np.round(levels.T), -32768, 32767)
+
+        return frames
+
+    def _reserve(self, sample_count: int) -> None:
+        capacity = self._deltas.shape[1]
+
+        if sample_count + KERNEL_WIDTH <= capacity:
+            return
+
+        while sample_count + KERNEL_WIDTH > capacity:
+            capacity *= 2
+
+        deltas = np.zeros((2, capacity), dtype=np.float64)
+        deltas[:, :self._deltas.shape[1]] = self._deltas
+        self._deltas = deltas
@@ -0,0 +1,64 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameboy.apu.band_limited_resampler import BandLimitedResampler, KERNEL_WIDTH, STEP_KERNELS
+
+
+@pytest.fixture()
+def band_limited_resampler_fixture() -> BandLimitedResampler:
+    # 16 clock cycles per sample
+    return BandLimitedResampler(16 * 1000, 1000, 0)
+
+
+def test_band_limited_resampler_step_kernels():
+    assert np.allclose(STEP_KERNELS.sum(axis=1), 1)
+    assert STEP_KERNELS.shape[1] == KERNEL_WIDTH
+
+
+def test_band_limited_resampler_step(band_limited_resampler_fixture):
+    band_limited_resampler_fixture.add_deltas(0, np.array([16 * 10]), np.array([1000.0]))
+    band_limited_resampler_fixture.add_deltas(1, np.array([16 * 20 + 8]), np.array([-500.0]))
+    band_limited_resampler_fixture.end_block(16 * 40)
+
+    assert band_limited_resampler_fixture.get_ready_frame_count() == 41
+
+    frames = band_limited_resampler_fixture.read_frames()
+
+    assert band_limited_resampler_fixture.get_ready_frame_count() == 0
+    assert frames.shape == (41, 2)
+
+    # Flat before the step and settled after it, with the step itself centred half the kernel later
+    assert (frames[:11, 0] == 0).all()
+    assert (frames[10 + KERNEL_WIDTH:, 0] == 1000).all()
+    assert frames[10 + KERNEL_WIDTH // 2 - 1, 0] < 500 < frames[10 + KERNEL_WIDTH // 2, 0]
+    assert (frames[:21, 1] == 0).all()
+    assert (frames[20 + KERNEL_WIDTH + 1:, 1] == -500).all()
+
+    # Levels carry on into the next read
+    band_limited_resampler_fixture.end_block(16 * 50)
+
+    assert (band_limited_resampler_fixture.read_frames() == [[1000, -500]] * 10).all()
+
+
+def test_band_limited_resampler_sample_rate(band_limited_resampler_fixture):
+    band_limited_resampler_fixture.end_block(16 * 10)
+    band_limited_resampler_fixture.read_frames()
+    band_limited_resampler_fixture.set_sample_rate(2000)
+    band_limited_resampler_fixture.end_block(16 * 20)
+
+    assert band_limited_resampler_fixture.get_sample_rate() == 2000
+    assert band_limited_resampler_fixture.get_ready_frame_count() == 20
+
+
+def test_band_limited_resampler_long_block(band_limited_resampler_fixture):
+    clock_cycles = np.arange(0, 16 * 5000, 16 * 7)
+    deltas = np.where(np.arange(len(clock_cycles)) % 2, -100.0, 100.0)
+
+    band_limited_resampler_fixture.add_deltas(0, clock_cycles, deltas)
+    band_limited_resampler_fixture.end_block(16 * 6000)
+
+    frames = band_limited_resampler_fixture.read_frames()
+
+    assert len(frames) == 6001
+    assert (frames[5000 + KERNEL_WIDTH:, 0] == deltas.sum()).all()
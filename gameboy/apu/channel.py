@@ -0,0 +1,132 @@
+from typing import Optional
+
+import numpy as np
+
+
+class Channel:
+    # Length counter, DAC and on/off state shared by all four channels. Registers are written by index, 0 for NRx0
+    # up to 4 for NRx4.
+    MAX_LENGTH = 64
+
+    def __init__(self):
+        self._registers = bytearray(5)
+
+        self._enabled = False
+        self._dac_enabled = False
+        self._length_counter = 0
+        self._length_enabled = False
+
+    def get_register(self, index: int) -> int:
+        return self._registers[index]
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def is_dac_enabled(self) -> bool:
+        return self._dac_enabled
+
+    def get_length_counter(self) -> int:
+        return self._length_counter
+
+    def get_frequency(self) -> int:
+        return ((self._registers[4] & 0x07) << 8) | self._registers[3]
+
+    def write_register(self, index: int, value: int) -> None:
+        self._registers[index] = value
+
+        if index == 1:
+            self._length_counter = self.MAX_LENGTH - (value & (self.MAX_LENGTH - 1))
+        elif index == 4:
+            self._length_enabled = value & 0x40 > 0
+
+            if value & 0x80:
+                self.trigger()
+
+    def trigger(self) -> None:
+        if not self._length_counter:
+            self._length_counter = self.MAX_LENGTH
+
+        self._enabled = self._dac_enabled
+
+    def _set_dac_enabled(self, value: bool) -> None:
+        self._dac_enabled = value
+
+        # The channel can't stay on without its DAC
+        if not value:
+            self._enabled = False
+
+    def clock_length(self) -> None:
+        if self._length_enabled and self._length_counter:
+            self._length_counter -= 1
+
+            if not self._length_counter:
+                self._enabled = False
+
+    def get_level_change_offsets(self, clock_cycles: int) -> np.ndarray:
+        # Offsets in clock cycles from now, within the next clock_cycles, where render() may change value. Always
+        # starts with 0, the level we're at now.
+        step_period = self._get_step_period()
+
+        if not self._enabled or step_period is None:
+            return np.zeros(1, dtype=np.int64)
+
+        first_step_offset = step_period - self._get_step_position() % step_period
+
+        return np.concatenate((np.zeros(1, dtype=np.int64), np.arange(first_step_offset, clock_cycles, step_period)))
+
+    def _get_step_period(self) -> Optional[int]:
+        # Clock cycles between the points the output can change at, None while it can't
+        raise NotImplementedError()
+
+    def _get_step_position(self) -> int:
+        raise NotImplementedError()
+
+    def render(self, sample_offsets: np.ndarray) -> np.ndarray:
+        # Digital output (0-15) at each offset in clock cycles from now, while the registers stay as they are
+        raise NotImplementedError()
+
+    def advance(self, clock_cycles: int) -> None:
+        raise NotImplementedError()
+
+
+class EnvelopeChannel(Channel):
+    # Square and noise channels set their volume with an envelope in NRx2
+
+    def __init__(self):
+        super().__init__()
+
+        self._volume = 0
+        self._envelope_timer = 0
+
+    def get_volume(self) -> int:
+        return self._volume
+
+    def write_register(self, index: int, value: int) -> None:
+        if index == 2:
+            self._set_dac_enabled(value & 0xF8 > 0)
+
+        super().write_register(index, value)
+
+    def trigger(self) -> None:
+        super().trigger()
+
+        self._volume = self._registers[2] >> 4
+        self._envelope_timer = self._registers[2] & 0x07
+
+    def clock_envelope(self) -> None:
+        envelope_period = self._registers[2] & 0x07
+
+        if not envelope_period or not self._envelope_timer:
+            return
+
+        self._envelope_timer -= 1
+
+        if self._envelope_timer:
+            return
+
+        self._envelope_timer = envelope_period
+
+        if self._registers[2] & 0x08:
+            self._volume = min(self._volume + 1, 15)
+        else:
+            self._volume = max(self._volume - 1, 0)
@@ -0,0 +1,93 @@
+from typing import Optional
+
+import numpy as np
+
+from gameboy.apu.channel import EnvelopeChannel
+
+# NR43 divisor code to clock cycles, before the clock shift
+DIVISORS = (8, 16, 32, 48, 64, 80, 96, 112)
+
+
+def _build_lfsr_outputs(width_7_bit: bool) -> np.ndarray:
+    # The LFSR only ever starts from all ones, so each width runs through one fixed sequence. Entry n is the output
+    # after n shifts, the whole period is precomputed so blocks of samples are just lookups.
+    lfsr = 0x7FFF
+    outputs = []
+
+    for _ in range(0, 127 if width_7_bit else 32767):
+        outputs.append(~lfsr & 0x01)
+
+        feedback = (lfsr & 0x01) ^ ((lfsr >> 1) & 0x01)
+        lfsr = (lfsr >> 1) | (feedback << 14)
+
+        if width_7_bit:
+            lfsr = (lfsr & ~0x40) | (feedback << 6)
+
+    return np.array(outputs, dtype=np.int16)
+
+
+LFSR_15_BIT_OUTPUTS = _build_lfsr_outputs(False)
+LFSR_7_BIT_OUTPUTS = _build_lfsr_outputs(True)
+
+
+class NoiseChannel(EnvelopeChannel):
+    # Channel 4
+
+    def __init__(self):
+        super().__init__()
+
+        # Shifts since the last trigger and clock cycles towards the next one
+        self._lfsr_position = 0
+        self._shift_position = 0
+
+    def get_shift_period(self) -> int:
+        return DIVISORS[self._registers[3] & 0x07] << (self._registers[3] >> 4)
+
+    def _get_lfsr_outputs(self) -> np.ndarray:
+        return LFSR_7_BIT_OUTPUTS if self._registers[3] & 0x08 else LFSR_15_BIT_OUTPUTS
+
+    def write_register(self, index: int, value: int) -> None:
+        # NR43 sits where the other channels keep their frequency, it has no length enable or frequency high bits
+        super().write_register(index, value)
+
+        if index == 3:
+            self._shift_position %= self.get_shift_period()
+
+            # Switching widths without a trigger isn't modelled, we carry on from the same place in the new sequence
+            self._lfsr_position %= len(self._get_lfsr_outputs())
+
+    def trigger(self) -> None:
+        super().trigger()
+
+        self._lfsr_position = 0
+        self._shift_position = 0
+
+    def _is_clocked(self) -> bool:
+        # Clock shifts of 14 and 15 stop the LFSR
+        return self._registers[3] >> 4 < 14
+
+    def _get_step_period(self) -> Optional[int]:
+        return self.get_shift_period() if self._is_clocked() else None
+
+    def _get_step_position(self) -> int:
+        return self._shift_position
+
+    def render(self, sample_offsets: np.ndarray) -> np.ndarray:
+        if not self._enabled or not self._volume:
+            return np.zeros(len(sample_offsets), dtype=np.int16)
+
+        lfsr_outputs = self._get_lfsr_outputs()
+
+        if not self._is_clocked():
+            return np.full(len(sample_offsets), lfsr_outputs[self._lfsr_position] * self._volume, dtype=np.int16)
+
+        shifts = (self._shift_position + sample_offsets) // self.get_shift_period()
+
+        return lfsr_outputs[(self._lfsr_position + shifts) % len(lfsr_outputs)] * self._volume
+
+    def advance(self, clock_cycles: int) -> None:
+        if not self._is_clocked():
+            return
+
+        shifts, self._shift_position = divmod(self._shift_position + clock_cycles, self.get_shift_period())
+        self._lfsr_position = (self._lfsr_position + shifts) % len(self._get_lfsr_outputs())
@@ -0,0 +1,63 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameboy.apu.noise_channel import NoiseChannel, LFSR_15_BIT_OUTPUTS, LFSR_7_BIT_OUTPUTS
+
+
+@pytest.fixture()
+def noise_channel_fixture() -> NoiseChannel:
+    noise_channel = NoiseChannel()
+
+    noise_channel.write_register(2, 0xF0)
+    noise_channel.write_register(3, 0x00)  # Shift every 8 clock cycles, 15 bit
+    noise_channel.write_register(4, 0x80)
+
+    return noise_channel
+
+
+def test_noise_channel_lfsr_outputs():
+    assert len(LFSR_15_BIT_OUTPUTS) == 32767
+    assert len(LFSR_7_BIT_OUTPUTS) == 127
+
+    # Starting from all ones the first outputs are low until a zero shifts down
+    assert list(LFSR_15_BIT_OUTPUTS[:16]) == [0] * 15 + [1]
+    assert list(LFSR_7_BIT_OUTPUTS[:8]) == [0] * 7 + [1]
+
+
+def test_noise_channel_shift_period(noise_channel_fixture):
+    assert noise_channel_fixture.get_shift_period() == 8
+
+    noise_channel_fixture.write_register(3, 0x25)
+
+    assert noise_channel_fixture.get_shift_period() == 80 << 2
+
+
+def test_noise_channel_render(noise_channel_fixture):
+    offsets = np.arange(0, 40) * 8
+
+    assert list(noise_channel_fixture.render(offsets)) == list(LFSR_15_BIT_OUTPUTS[:40] * 15)
+
+    noise_channel_fixture.advance(8 * 20 + 4)
+
+    assert list(noise_channel_fixture.render(np.array([0, 4]))) == list(LFSR_15_BIT_OUTPUTS[20:22] * 15)
+
+    noise_channel_fixture.write_register(3, 0x08)
+    noise_channel_fixture.write_register(4, 0x80)
+
+    assert list(noise_channel_fixture.render(offsets)) == list(LFSR_7_BIT_OUTPUTS[:40] * 15)
+
+
+def test_noise_channel_stopped(noise_channel_fixture):
+    noise_channel_fixture.write_register(3, 0xE0)
+    noise_channel_fixture.advance(100000)
+
+    assert not noise_channel_fixture.render(np.arange(0, 100) * 1000).any()
+
+
+def test_noise_channel_level_change_offsets(noise_channel_fixture):
+    assert list(noise_channel_fixture.get_level_change_offsets(30)) == [0, 8, 16, 24]
+
+    noise_channel_fixture.write_register(3, 0xE0)
+
+    assert list(noise_channel_fixture.get_level_change_offsets(30)) == [0]
@@ -0,0 +1,100 @@
+from array import array
+
+
+class SampleRing:
+    # Interleaved 16 bit frames, (left, right) by default, in a preallocated array('h'). Safe without a lock for one
+    # producer and one consumer on different threads: the producer only moves the write count, the consumer only the
+    # read count, and each is published after the samples it covers. Frames that don't fit are dropped by the
+    # producer rather than waiting on the consumer. The fill level is there for callers matching the output rate to
+    # how fast frames are consumed.
+
+    def __init__(self, capacity: int, channel_count: int=2):
+        if capacity < 1:
+            raise ValueError('A sample ring needs room for at least 1 frame')
+
+        self._capacity = capacity
+        self._channel_count = channel_count
+        self._samples = array('h', bytes(capacity * channel_count * 2))
+
+        # Totals since creation, their difference is what's waiting to be read
+        self._written_frame_count = 0
+        self._read_frame_count = 0
+
+        self._dropped_frame_count = 0
+        self._underrun_count = 0
+
+    def get_capacity(self) -> int:
+        return self._capacity
+
+    def get_channel_count(self) -> int:
+        return self._channel_count
+
+    def get_available_frame_count(self) -> int:
+        return self._written_frame_count - self._read_frame_count
+
+    def get_free_frame_count(self) -> int:
+        return self._capacity - self.get_available_frame_count()
+
+    def get_fill_level(self) -> float:
+        return self.get_available_frame_count() / self._capacity
+
+    def get_dropped_frame_count(self) -> int:
+        return self._dropped_frame_count
+
+    def get_underrun_count(self) -> int:
+        return self._underrun_count
+
+    def write(self, samples) -> int:
+        # Producer side. samples is anything exposing 16 bit interleaved frames through the buffer protocol, a NumPy
+        # int16 array or another array('h'). Returns the number of frames written.
+        samples = memoryview(samples)
+
+        if not samples.nbytes:
+            return 0
+
+        samples = samples.cast('B').cast('h')
+        frame_count = len(samples) // self._channel_count
+        written_frame_count = min(frame_count, self.get_free_frame_count())
+
+        self._dropped_frame_count += frame_count - written_frame_count
+
+        if written_frame_count:
+            self._copy(samples, self._written_frame_count, written_frame_count, to_ring=True)
+            self._written_frame_count += written_frame_count
+
+        return written_frame_count
+
+    def read(self, max_frame_count: int=None) -> array:
+        # Consumer side, oldest first. Asking for more frames than are available counts as an underrun.
+        frame_count = self.get_available_frame_count()
+
+        if max_frame_count is not None:
+            if max_frame_count > frame_count:
+                self._underrun_count += 1
+
+            frame_count = min(frame_count, max_frame_count)
+
+        samples = array('h', bytes(frame_count * self._channel_count * 2))
+
+        if frame_count:
+            self._copy(memoryview(samples), self._read_frame_count, frame_count, to_ring=False)
+            self._read_frame_count += frame_count
+
+        return samples
+
+    def clear(self) -> None:
+        # Consumer side, drops everything waiting to be read
+        self._read_frame_count = self._written_frame_count
+
+    def _copy(self, samples: memoryview, frame_index: int, frame_count: int, to_ring: bool) -> None:
+        ring = memoryview(self._samples)
+        start = (frame_index % self._capacity) * self._channel_count
+        first_part_length = min(frame_count * self._channel_count, len(ring) - start)
+        length = frame_count * self._channel_count
+
+        if to_ring:
+            ring[start:start + first_part_length] = samples[:first_part_length]
+            ring[:length - first_part_length] = samples[first_part_length:length]
+        else:
+            samples[:first_part_length] = ring[start:start + first_part_length]
+            samples[first_part_length:length] = ring[:length - first_part_length]
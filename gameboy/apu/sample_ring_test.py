@@ -0,0 +1,110 @@
+import threading
+import time
+from array import array
+
+import pytest
+
+from gameboy.apu.sample_ring import SampleRing
+
+
+@pytest.fixture()
+def sample_ring_fixture() -> SampleRing:
+    return SampleRing(4)
+
+
+def _frames(*values: int) -> array:
+    return array('h', [sample for value in values for sample in (value, -value)])
+
+
+def test_sample_ring_init(sample_ring_fixture):
+    assert sample_ring_fixture.get_capacity() == 4
+    assert sample_ring_fixture.get_channel_count() == 2
+    assert sample_ring_fixture.get_available_frame_count() == 0
+    assert sample_ring_fixture.get_free_frame_count() == 4
+    assert sample_ring_fixture.get_fill_level() == 0
+    assert sample_ring_fixture.get_dropped_frame_count() == 0
+    assert len(sample_ring_fixture.read()) == 0
+
+    with pytest.raises(ValueError):
+        SampleRing(0)
+
+
+def test_sample_ring_write_read(sample_ring_fixture):
+    assert sample_ring_fixture.write(_frames(1, 2, 3)) == 3
+    assert sample_ring_fixture.get_available_frame_count() == 3
+    assert sample_ring_fixture.get_fill_level() == 0.75
+    assert sample_ring_fixture.read(2) == _frames(1, 2)
+
+    # Wraps around the end of the buffer
+    sample_ring_fixture.write(_frames(4, 5, 6))
+
+    assert sample_ring_fixture.get_available_frame_count() == 4
+    assert sample_ring_fixture.read() == _frames(3, 4, 5, 6)
+    assert sample_ring_fixture.get_available_frame_count() == 0
+    assert sample_ring_fixture.get_dropped_frame_count() == 0
+
+
+def test_sample_ring_write_numpy(sample_ring_fixture):
+    np = pytest.importorskip('numpy')
+
+    sample_ring_fixture.write(np.array([[1, -1], [2, -2]], dtype=np.int16))
+
+    assert sample_ring_fixture.read() == _frames(1, 2)
+
+
+def test_sample_ring_overflow(sample_ring_fixture):
+    # The producer never moves the consumer's place, frames that don't fit are lost instead
+    sample_ring_fixture.write(_frames(1, 2, 3))
+
+    assert sample_ring_fixture.write(_frames(4, 5, 6)) == 1
+    assert sample_ring_fixture.get_dropped_frame_count() == 2
+    assert sample_ring_fixture.get_free_frame_count() == 0
+    assert sample_ring_fixture.read() == _frames(1, 2, 3, 4)
+
+
+def test_sample_ring_underrun(sample_ring_fixture):
+    sample_ring_fixture.write(_frames(1, 2))
+
+    assert sample_ring_fixture.read(1) == _frames(1)
+    assert sample_ring_fixture.get_underrun_count() == 0
+    assert sample_ring_fixture.read(2) == _frames(2)
+    assert sample_ring_fixture.get_underrun_count() == 1
+
+
+def test_sample_ring_clear(sample_ring_fixture):
+    sample_ring_fixture.write(_frames(1, 2))
+    sample_ring_fixture.clear()
+
+    assert sample_ring_fixture.get_available_frame_count() == 0
+    assert sample_ring_fixture.get_dropped_frame_count() == 0
+
+
+def test_sample_ring_threads():
+    sample_ring = SampleRing(7, channel_count=1)
+    frame_total = 5000
+    received = array('h')
+
+    def consume():
+        while len(received) < frame_total:
+            samples = sample_ring.read(5)
+            received.extend(samples)
+
+            if not samples:
+                time.sleep(0)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+
+    # Frames the ring had no room for are offered again, so nothing should go missing or out of order
+    sent = 0
+
+    while sent < frame_total:
+        written_frame_count = sample_ring.write(array('h', range(sent, min(sent + 3, frame_total))))
+        sent += written_frame_count
+
+        if not written_frame_count:
+            time.sleep(0)
+
+    consumer.join()
+
+    assert list(received) == list(range(0, frame_total))
@@ -0,0 +1,113 @@
+import numpy as np
+
+from gameboy.apu.channel import EnvelopeChannel
+
+# One waveform is 8 duty steps, these are 12.5%, 25%, 50% and 75%
+DUTY_WAVEFORMS = np.array([
+    [0, 0, 0, 0, 0, 0, 0, 1],
+    [1, 0, 0, 0, 0, 0, 0, 1],
+    [1, 0, 0, 0, 0, 1, 1, 1],
+    [0, 1, 1, 1, 1, 1, 1, 0]
+], dtype=np.int16)
+
+
+class SquareChannel(EnvelopeChannel):
+    # Channels 1 and 2, only channel 1 has the frequency sweep in NR10
+
+    def __init__(self, has_sweep: bool=False):
+        super().__init__()
+
+        self._has_sweep = has_sweep
+
+        # Clock cycles into the current waveform
+        self._waveform_position = 0
+
+        self._sweep_enabled = False
+        self._sweep_timer = 0
+        self._shadow_frequency = 0
+
+    def get_duty_step_period(self) -> int:
+        return (2048 - self.get_frequency()) * 4
+
+    def write_register(self, index: int, value: int) -> None:
+        if index in (3, 4):
+            # Keep our place in the waveform, only the step length changes
+            duty_step = self._waveform_position // self.get_duty_step_period()
+            super().write_register(index, value)
+            self._waveform_position = duty_step * self.get_duty_step_period()
+
+            return
+
+        super().write_register(index, value)
+
+    def trigger(self) -> None:
+        super().trigger()
+
+        if not self._has_sweep:
+            return
+
+        sweep_period = (self._registers[0] >> 4) & 0x07
+        sweep_shift = self._registers[0] & 0x07
+
+        self._shadow_frequency = self.get_frequency()
+        self._sweep_timer = sweep_period or 8
+        self._sweep_enabled = bool(sweep_period or sweep_shift)
+
+        if sweep_shift:
+            self._calculate_sweep_frequency()
+
+    def clock_sweep(self) -> None:
+        if not self._has_sweep:
+            return
+
+        self._sweep_timer -= 1
+
+        if self._sweep_timer > 0:
+            return
+
+        sweep_period = (self._registers[0] >> 4) & 0x07
+        self._sweep_timer = sweep_period or 8
+
+        if not self._sweep_enabled or not sweep_period:
+            return
+
+        frequency = self._calculate_sweep_frequency()
+
+        if frequency <= 2047 and self._registers[0] & 0x07:
+            self._shadow_frequency = frequency
+            self._registers[3] = frequency & 0xFF
+            self._registers[4] = (self._registers[4] & 0xF8) | (frequency >> 8)
+            self._waveform_position %= self.get_duty_step_period() * 8
+
+            # Checked again with the new frequency, only to switch the channel off
+            self._calculate_sweep_frequency()
+
+    def _calculate_sweep_frequency(self) -> int:
+        change = self._shadow_frequency >> (self._registers[0] & 0x07)
+
+        if self._registers[0] & 0x08:
+            frequency = self._shadow_frequency - change
+        else:
+            frequency = self._shadow_frequency + change
+
+        if frequency > 2047:
+            self._enabled = False
+
+        return frequency
+
+    def _get_step_period(self) -> int:
+        return self.get_duty_step_period()
+
+    def _get_step_position(self) -> int:
+        return self._waveform_position
+
+    def render(self, sample_offsets: np.ndarray) -> np.ndarray:
+        if not self._enabled or not self._volume:
+            return np.zeros(len(sample_offsets), dtype=np.int16)
+
+        duty_steps = ((self._waveform_position + sample_offsets) // self.get_duty_step_period()) & 0x07
+
+        return DUTY_WAVEFORMS[self._registers[1] >> 6][duty_steps] * self._volume
+
+    def advance(self, clock_cycles: int) -> None:
+        self._waveform_position = (self._waveform_position + clock_cycles) % (self.get_duty_step_period() * 8)
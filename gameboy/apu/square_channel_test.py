@@ -0,0 +1,125 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameboy.apu.square_channel import SquareChannel
+
+
+@pytest.fixture()
+def square_channel_fixture() -> SquareChannel:
+    square_channel = SquareChannel(has_sweep=True)
+
+    square_channel.write_register(1, 0x80)  # 50% duty, length 64
+    square_channel.write_register(2, 0xF0)  # Volume 15, no envelope
+    square_channel.write_register(3, 0x00)
+    square_channel.write_register(4, 0x87)  # Trigger, frequency 0x700
+
+    return square_channel
+
+
+def test_square_channel_trigger(square_channel_fixture):
+    assert square_channel_fixture.is_enabled()
+    assert square_channel_fixture.is_dac_enabled()
+    assert square_channel_fixture.get_volume() == 15
+    assert square_channel_fixture.get_frequency() == 0x700
+    assert square_channel_fixture.get_duty_step_period() == 1024
+
+
+def test_square_channel_dac_off():
+    square_channel = SquareChannel()
+
+    square_channel.write_register(2, 0x07)
+    square_channel.write_register(4, 0x80)
+
+    assert not square_channel.is_dac_enabled()
+    assert not square_channel.is_enabled()
+
+
+def test_square_channel_render(square_channel_fixture):
+    offsets = np.arange(0, 8) * 1024
+
+    assert list(square_channel_fixture.render(offsets)) == [15, 0, 0, 0, 0, 15, 15, 15]
+
+    # Rendering doesn't move the channel, advancing does
+    square_channel_fixture.advance(1024 * 5 + 10)
+
+    assert list(square_channel_fixture.render(np.array([0, 1014]))) == [15, 15]
+    assert list(square_channel_fixture.render(np.array([3061, 3062, 4086]))) == [15, 15, 0]
+
+
+def test_square_channel_length(square_channel_fixture):
+    square_channel_fixture.write_register(1, 0x80 | 62)
+    square_channel_fixture.write_register(4, 0x47)
+
+    assert square_channel_fixture.get_length_counter() == 2
+
+    square_channel_fixture.clock_length()
+
+    assert square_channel_fixture.is_enabled()
+
+    square_channel_fixture.clock_length()
+
+    assert not square_channel_fixture.is_enabled()
+    assert not square_channel_fixture.render(np.arange(0, 8)).any()
+
+
+def test_square_channel_envelope(square_channel_fixture):
+    square_channel_fixture.write_register(2, 0x12)  # Volume 1, decreasing every 2 clocks
+    square_channel_fixture.write_register(4, 0x87)
+
+    square_channel_fixture.clock_envelope()
+
+    assert square_channel_fixture.get_volume() == 1
+
+    square_channel_fixture.clock_envelope()
+
+    assert square_channel_fixture.get_volume() == 0
+
+    square_channel_fixture.clock_envelope()
+    square_channel_fixture.clock_envelope()
+
+    assert square_channel_fixture.get_volume() == 0
+
+
+def test_square_channel_sweep(square_channel_fixture):
+    square_channel_fixture.write_register(0, 0x11)  # Every sweep clock, up by frequency >> 1
+    square_channel_fixture.write_register(3, 0x00)
+    square_channel_fixture.write_register(4, 0x82)
+
+    square_channel_fixture.clock_sweep()
+
+    assert square_channel_fixture.get_frequency() == 0x300
+    assert square_channel_fixture.is_enabled()
+
+    square_channel_fixture.clock_sweep()
+
+    assert square_channel_fixture.get_frequency() == 0x480
+
+    # 0x6C0 next, then 0xA20 is out of range, checked straight after
+    square_channel_fixture.clock_sweep()
+
+    assert square_channel_fixture.get_frequency() == 0x6C0
+    assert not square_channel_fixture.is_enabled()
+
+
+def test_square_channel_no_sweep():
+    square_channel = SquareChannel()
+
+    square_channel.write_register(0, 0x11)
+    square_channel.write_register(2, 0xF0)
+    square_channel.write_register(4, 0x82)
+    square_channel.clock_sweep()
+
+    assert square_channel.get_frequency() == 0x200
+
+
+def test_square_channel_level_change_offsets(square_channel_fixture):
+    assert list(square_channel_fixture.get_level_change_offsets(3000)) == [0, 1024, 2048]
+
+    square_channel_fixture.advance(1000)
+
+    assert list(square_channel_fixture.get_level_change_offsets(1048)) == [0, 24]
+
+    square_channel_fixture.write_register(2, 0x00)
+
+    assert list(square_channel_fixture.get_level_change_offsets(3000)) == [0]
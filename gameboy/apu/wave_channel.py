@@ -0,0 +1,71 @@
+import numpy as np
+
+from gameboy.apu.channel import Channel
+
+# NR32 volume code to how far samples are shifted right, 4 mutes
+VOLUME_SHIFTS = (4, 0, 1, 2)
+
+
+class WaveChannel(Channel):
+    # Channel 3, plays the 32 4 bit samples in wave RAM (0xFF30-0xFF3F), high nibble first
+    MAX_LENGTH = 256
+
+    def __init__(self):
+        super().__init__()
+
+        self._wave_ram = bytearray(16)
+
+        # Clock cycles into the current pass over wave RAM
+        self._wave_position = 0
+
+    def get_wave_ram(self) -> bytearray:
+        return self._wave_ram
+
+    def get_sample_period(self) -> int:
+        return (2048 - self.get_frequency()) * 2
+
+    def write_register(self, index: int, value: int) -> None:
+        if index == 0:
+            self._set_dac_enabled(value & 0x80 > 0)
+
+        if index in (3, 4):
+            sample_index = self._wave_position // self.get_sample_period()
+            super().write_register(index, value)
+            self._wave_position = sample_index * self.get_sample_period()
+
+            return
+
+        super().write_register(index, value)
+
+    def trigger(self) -> None:
+        super().trigger()
+
+        self._wave_position = 0
+
+    def read_wave_ram(self, address: int) -> int:
+        return self._wave_ram[address - 0xFF30]
+
+    def write_wave_ram(self, address: int, value: int) -> None:
+        self._wave_ram[address - 0xFF30] = value
+
+    def _get_step_period(self) -> int:
+        return self.get_sample_period()
+
+    def _get_step_position(self) -> int:
+        return self._wave_position
+
+    def render(self, sample_offsets: np.ndarray) -> np.ndarray:
+        if not self._enabled:
+            return np.zeros(len(sample_offsets), dtype=np.int16)
+
+        wave_bytes = np.frombuffer(bytes(self._wave_ram), dtype=np.uint8)
+        samples = np.empty(32, dtype=np.int16)
+        samples[0::2] = wave_bytes >> 4
+        samples[1::2] = wave_bytes & 0x0F
+
+        sample_indexes = ((self._wave_position + sample_offsets) // self.get_sample_period()) & 0x1F
+
+        return samples[sample_indexes] >> VOLUME_SHIFTS[(self._registers[2] >> 5) & 0x03]
+
+    def advance(self, clock_cycles: int) -> None:
+        self._wave_position = (self._wave_position + clock_cycles) % (self.get_sample_period() * 32)
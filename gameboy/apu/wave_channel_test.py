@@ -0,0 +1,66 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameboy.apu.wave_channel import WaveChannel
+
+
+@pytest.fixture()
+def wave_channel_fixture() -> WaveChannel:
+    wave_channel = WaveChannel()
+
+    for index in range(0, 16):
+        wave_channel.write_wave_ram(0xFF30 + index, ((index * 2) & 0x0F) << 4 | ((index * 2 + 1) & 0x0F))
+
+    wave_channel.write_register(0, 0x80)
+    wave_channel.write_register(2, 0x20)  # Full volume
+    wave_channel.write_register(3, 0x00)
+    wave_channel.write_register(4, 0x87)  # Trigger, frequency 0x700
+
+    return wave_channel
+
+
+def test_wave_channel_wave_ram(wave_channel_fixture):
+    assert wave_channel_fixture.read_wave_ram(0xFF30) == 0x01
+    assert wave_channel_fixture.read_wave_ram(0xFF3F) == 0xEF
+    assert wave_channel_fixture.get_sample_period() == 512
+
+
+def test_wave_channel_render(wave_channel_fixture):
+    offsets = np.arange(0, 34) * 512
+
+    assert list(wave_channel_fixture.render(offsets)) == [index & 0x0F for index in range(0, 34)]
+
+    wave_channel_fixture.advance(512 * 3)
+
+    assert list(wave_channel_fixture.render(np.array([0]))) == [3]
+
+
+def test_wave_channel_volume(wave_channel_fixture):
+    offsets = np.array([0, 512 * 15])
+
+    wave_channel_fixture.write_register(2, 0x40)
+
+    assert list(wave_channel_fixture.render(offsets)) == [0, 7]
+
+    wave_channel_fixture.write_register(2, 0x00)
+
+    assert list(wave_channel_fixture.render(offsets)) == [0, 0]
+
+
+def test_wave_channel_dac(wave_channel_fixture):
+    wave_channel_fixture.write_register(0, 0x00)
+
+    assert not wave_channel_fixture.is_dac_enabled()
+    assert not wave_channel_fixture.is_enabled()
+
+
+def test_wave_channel_length(wave_channel_fixture):
+    wave_channel_fixture.write_register(1, 0xFF)
+    wave_channel_fixture.write_register(4, 0x47)
+
+    assert wave_channel_fixture.get_length_counter() == 1
+
+    wave_channel_fixture.clock_length()
+
+    assert not wave_channel_fixture.is_enabled()
@@ -0,0 +1,795 @@
+from functools import partial
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from gameboy.batch.gameboy_batch import GameBoyBatch
+
+B = GameBoyBatch.REGISTER_B
+C = GameBoyBatch.REGISTER_C
+D = GameBoyBatch.REGISTER_D
+E = GameBoyBatch.REGISTER_E
+H = GameBoyBatch.REGISTER_H
+L = GameBoyBatch.REGISTER_L
+F = GameBoyBatch.REGISTER_FLAGS
+A = GameBoyBatch.REGISTER_A
+
+# 16 bit registers are (high, low) register rows, stack pointer has its own array
+BC = (B, C)
+DE = (D, E)
+HL = (H, L)
+AF = (A, F)
+SP = None
+
+# Jump conditions as (flag bit, flag expected to be set)
+CONDITION_NOT_ZERO = (0x80, False)
+CONDITION_ZERO = (0x80, True)
+CONDITION_NOT_CARRY = (0x10, False)
+CONDITION_CARRY = (0x10, True)
+
+
+class BatchCPUInstructions:
+    # Vectorized versions of the CPUInstructions handlers. Every handler takes an array of instance indexes that
+    # all decoded the same op code, and must leave registers, flags and cycle counts exactly as the scalar CPU
+    # would. Instances a handler can't run (operands in IO, stack outside of plain RAM...) are returned untouched
+    # so the batch can step them on the scalar path instead.
+
+    def __init__(self, batch: GameBoyBatch):
+        self._batch = batch
+
+        self._instruction_table: list = [None] * 256
+        self._extended_instruction_table: list = [None] * 256
+
+        self._build_instruction_table()
+        self._build_extended_instruction_table()
+
+    def get_instruction(self, op_code: int) -> Optional[Callable]:
+        return self._instruction_table[op_code]
+
+    def get_extended_instruction(self, op_code: int) -> Optional[Callable]:
+        return self._extended_instruction_table[op_code]
+
+    def _build_instruction_table(self) -> None:
+        table = self._instruction_table
+
+        table[0x00] = self.no_op
+        table[0xF3] = self.disable_interrupts
+        table[0xFB] = self.enable_interrupts
+        table[0x37] = self.set_carry_flag
+        table[0x3F] = self.complement_carry_flag
+
+        # ~`~ 8 bit loads ~`~
+        for op_code in range(0x40, 0x80):
+            if op_code == 0x76:  # halt
+                continue
+
+            destination = (op_code >> 3) & 0x07
+            source = op_code & 0x07
+
+            if source == 6:
+                table[op_code] = partial(self.load_register_with_memory, register=destination)
+            elif destination == 6:
+                table[op_code] = partial(self.load_memory_with_register, register=source)
+            else:
+                table[op_code] = partial(self.load, from_register=source, to_register=destination)
+
+        for op_code, register in ((0x06, B), (0x0E, C), (0x16, D), (0x1E, E), (0x26, H), (0x2E, L), (0x3E, A)):
+            table[op_code] = partial(self.load_register_with_immediate_byte, register=register)
+
+        table[0x36] = self.load_memory_with_immediate
+        table[0x0A] = partial(self.load_register_with_memory, register=A, memory_register_16=BC)
+        table[0x1A] = partial(self.load_register_with_memory, register=A, memory_register_16=DE)
+        table[0x02] = partial(self.load_memory_with_register, register=A, memory_register_16=BC)
+        table[0x12] = partial(self.load_memory_with_register, register=A, memory_register_16=DE)
+        table[0x22] = partial(self.load_memory_with_register, register=A, increment_memory_register=True)
+        table[0x2A] = partial(self.load_register_with_memory, register=A, increment_memory_register=True)
+        table[0x32] = partial(self.load_memory_with_register, register=A, decrement_memory_register=True)
+        table[0x3A] = partial(self.load_register_with_memory, register=A, decrement_memory_register=True)
+        table[0xEA] = self.load_immediate_memory_with_register
+        table[0xFA] = self.load_register_with_immediate_memory
+        table[0xE0] = partial(self.load_immediate_memory_with_register, high_memory_load=True)
+        table[0xF0] = partial(self.load_register_with_immediate_memory, high_memory_read=True)
+        table[0xE2] = self.load_offset_memory_at_register_with_register
+        table[0xF2] = self.load_register_with_offset_memory_at_register
+
+        # ~`~ 16 bit loads and stack ~`~
+        for op_code, register_16 in ((0x01, BC), (0x11, DE), (0x21, HL), (0x31, SP)):
+            table[op_code] = partial(self.load_register_with_immediate_word, register_16=register_16)
+
+        for op_code, register_16 in ((0xC5, BC), (0xD5, DE), (0xE5, HL), (0xF5, AF)):
+            table[op_code] = partial(self.push_register_to_stack, register_16=register_16)
+
+        for op_code, register_16 in ((0xC1, BC), (0xD1, DE), (0xE1, HL), (0xF1, AF)):
+            table[op_code] = partial(self.pop_stack_to_register, register_16=register_16)
+
+        # ~`~ 8 bit math ~`~
+        operations = (
+            self._add, partial(self._add, with_carry_bit=True),
+            self._subtract, partial(self._subtract, with_carry_bit=True),
+            self._bitwise_and, self._bitwise_xor, self._bitwise_or,
+            partial(self._subtract, compare_only=True)
+        )
+
+        for op_code in range(0x80, 0xC0):
+            operation = operations[(op_code >> 3) & 0x07]
+            source = op_code & 0x07
+
+            if source == 6:
+                table[op_code] = partial(self.math_with_hl_memory, operation=operation)
+            else:
+                table[op_code] = partial(self.math_with_register, operation=operation, register=source)
+
+        for op_code, operation in zip((0xC6, 0xCE, 0xD6, 0xDE, 0xE6, 0xEE, 0xF6, 0xFE), operations):
+            table[op_code] = partial(self.math_with_immediate, operation=operation)
+
+        for op_code, register in ((0x04, B), (0x0C, C), (0x14, D), (0x1C, E), (0x24, H), (0x2C, L), (0x3C, A)):
+            table[op_code] = partial(self.increment_8_bit_register, register=register)
+
+        for op_code, register in ((0x05, B), (0x0D, C), (0x15, D), (0x1D, E), (0x25, H), (0x2D, L), (0x3D, A)):
+            table[op_code] = partial(self.decrement_8_bit_register, register=register)
+
+        table[0x34] = self.increment_memory_at_register
+        table[0x35] = self.decrement_memory_at_register
+
+        table[0x07] = self.rotate_register_a_left
+        table[0x17] = partial(self.rotate_register_a_left, with_carry_bit=True)
+        table[0x0F] = self.rotate_register_a_right
+        table[0x1F] = partial(self.rotate_register_a_right, with_carry_bit=True)
+
+        # ~`~ 16 bit math ~`~
+        for op_code, register_16 in ((0x03, BC), (0x13, DE), (0x23, HL), (0x33, SP)):
+            table[op_code] = partial(self.modify_16_bit_register, register_16=register_16, change=1)
+
+        for op_code, register_16 in ((0x0B, BC), (0x1B, DE), (0x2B, HL), (0x3B, SP)):
+            table[op_code] = partial(self.modify_16_bit_register, register_16=register_16, change=-1)
+
+        for op_code, register_16 in ((0x09, BC), (0x19, DE), (0x29, HL), (0x39, SP)):
+            table[op_code] = partial(self.add_16_bit_registers, register_16=register_16)
+
+        # ~`~ Jump, call, return ~`~
+        conditions = (CONDITION_NOT_ZERO, CONDITION_ZERO, CONDITION_NOT_CARRY, CONDITION_CARRY)
+
+        table[0xC3] = self.jump_to_immediate
+        table[0x18] = partial(self.jump_to_immediate, relative=True)
+        table[0xE9] = self.jump_to_hl
+        table[0xCD] = self.call_immediate
+        table[0xC9] = self.return_
+        table[0xD9] = partial(self.return_, enable_interrupts=True)
+
+        for op_code, condition in zip((0xC2, 0xCA, 0xD2, 0xDA), conditions):
+            table[op_code] = partial(self.jump_to_immediate, condition=condition)
+
+        for op_code, condition in zip((0x20, 0x28, 0x30, 0x38), conditions):
+            table[op_code] = partial(self.jump_to_immediate, condition=condition, relative=True)
+
+        for op_code, condition in zip((0xC4, 0xCC, 0xD4, 0xDC), conditions):
+            table[op_code] = partial(self.call_immediate, condition=condition)
+
+        for op_code, condition in zip((0xC0, 0xC8, 0xD0, 0xD8), conditions):
+            table[op_code] = partial(self.return_, condition=condition)
+
+        for op_code in range(0xC7, 0x100, 8):
+            table[op_code] = partial(self.reset, address=op_code - 0xC7)
+
+        table[0xCB] = self.execute_extended_operation
+
+    def _build_extended_instruction_table(self) -> None:
+        table = self._extended_instruction_table
+
+        # (HL) operands are left to the scalar CPU
+        for op_code in range(0, 0x100):
+            register = op_code & 0x07
+
+            if register == 6:
+                continue
+
+            operation = op_code >> 6
+            bit_index_or_sub_op = (op_code >> 3) & 0x07
+
+            if operation == 0:
+                table[op_code] = partial(self._extended_op_shift, register=register, sub_op=bit_index_or_sub_op)
+            elif operation == 1:
+                table[op_code] = partial(self._extended_op_read_bit, register=register, bit_index=bit_index_or_sub_op)
+            elif operation == 2:
+                table[op_code] = partial(self._extended_op_modify_bit, register=register,
+                                         and_mask=0xFF & ~(1 << bit_index_or_sub_op), or_mask=0)
+            else:
+                table[op_code] = partial(self._extended_op_modify_bit, register=register,
+                                         and_mask=0xFF, or_mask=1 << bit_index_or_sub_op)
+
+    # ~`~ Helpers ~`~
+
+    def _advance(self, index: np.ndarray, length: int, machine_cycles) -> None:
+        program_counters = self._batch._program_counters
+
+        program_counters[index] = (program_counters[index] + length) & 0xFFFF
+        self._batch._clock_cycles[index] += machine_cycles * 4
+
+    def _read_immediate_bytes(self, index: np.ndarray, offset: int=1) -> Tuple[np.ndarray, np.ndarray]:
+        return self._batch.read_bytes(index, (self._batch._program_counters[index] + offset) & 0xFFFF)
+
+    def _read_immediate_words(self, index: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        low_bytes, low_readable = self._read_immediate_bytes(index, 1)
+        high_bytes, high_readable = self._read_immediate_bytes(index, 2)
+
+        return (high_bytes << 8) | low_bytes, low_readable & high_readable
+
+    def _get_16_bit_register_values(self, index: np.ndarray, register_16) -> np.ndarray:
+        if register_16 is SP:
+            return self._batch._stack_pointers[index]
+
+        registers = self._batch._registers
+
+        return (registers[register_16[0], index] << 8) | registers[register_16[1], index]
+
+    def _set_16_bit_register_values(self, index: np.ndarray, register_16, values: np.ndarray) -> None:
+        if register_16 is SP:
+            self._batch._stack_pointers[index] = values & 0xFFFF
+            return
+
+        registers = self._batch._registers
+
+        registers[register_16[0], index] = values >> 8
+        # Like CPURegisters.write_af, the low nibble of the flags can never be set
+        registers[register_16[1], index] = values & (0xF0 if register_16 is AF else 0xFF)
+
+    def _is_condition_met(self, index: np.ndarray, condition) -> np.ndarray:
+        if condition is None:
+            return np.ones(len(index), dtype=bool)
+
+        flag_bit, expected = condition
+
+        return ((self._batch._registers[F, index] & flag_bit) != 0) == expected
+
+    def _push(self, index: np.ndarray, values: np.ndarray) -> None:
+        stack_pointers = self._batch._stack_pointers
+        new_stack_pointers = (stack_pointers[index] - 2) & 0xFFFF
+
+        self._batch.write_bytes(index, new_stack_pointers, values & 0xFF)
+        self._batch.write_bytes(index, new_stack_pointers + 1, values >> 8)
+
+        stack_pointers[index] = new_stack_pointers
+
+    def _can_push(self, index: np.ndarray) -> np.ndarray:
+        new_stack_pointers = (self._batch._stack_pointers[index] - 2) & 0xFFFF
+
+        return self._batch.get_writable_mask(new_stack_pointers) & \
+            self._batch.get_writable_mask(new_stack_pointers + 1)
+
+    def _pop(self, index: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        stack_pointers = self._batch._stack_pointers[index]
+
+        low_bytes, low_readable = self._batch.read_bytes(index, stack_pointers)
+        high_bytes, high_readable = self._batch.read_bytes(index, stack_pointers + 1)
+
+        return low_bytes + (high_bytes << 8), low_readable & high_readable
+
+    @staticmethod
+    def _fallback(index: np.ndarray, supported: np.ndarray) -> Optional[np.ndarray]:
+        if supported.all():
+            return None
+
+        return index[~supported]
+
+    # ~`~ Misc ~`~
+
+    def no_op(self, index: np.ndarray):
+        self._advance(index, 1, 1)
+
+    def disable_interrupts(self, index: np.ndarray):
+        self._batch._interrupts_enabled[index] = False
+        self._batch._interrupt_enable_pending[index] = False
+
+        self._advance(index, 1, 1)
+
+    def enable_interrupts(self, index: np.ndarray):
+        self._batch._interrupt_enable_pending[index] = True
+
+        self._advance(index, 1, 1)
+
+    def set_carry_flag(self, index: np.ndarray):
+        registers = self._batch._registers
+        registers[F, index] = (registers[F, index] & 0x8F) | 0x10
+
+        self._advance(index, 1, 1)
+
+    def complement_carry_flag(self, index: np.ndarray):
+        registers = self._batch._registers
+        flags = registers[F, index]
+        registers[F, index] = (flags & 0x8F) | (~flags & 0x10)
+
+        self._advance(index, 1, 1)
+
+    # ~`~ 8 bit loads ~`~
+
+    def load(self, index: np.ndarray, from_register: int, to_register: int):
+        registers = self._batch._registers
+        registers[to_register, index] = registers[from_register, index]
+
+        self._advance(index, 1, 1)
+
+    def load_register_with_immediate_byte(self, index: np.ndarray, register: int):
+        values, readable = self._read_immediate_bytes(index)
+        run_index = index[readable]
+
+        self._batch._registers[register, run_index] = values[readable]
+        self._advance(run_index, 2, 2)
+
+        return self._fallback(index, readable)
+
+    def load_register_with_memory(self, index: np.ndarray, register: int, memory_register_16=HL,
+                                  increment_memory_register=False, decrement_memory_register=False):
+        addresses = self._get_16_bit_register_values(index, memory_register_16)
+        values, readable = self._batch.read_bytes(index, addresses)
+        run_index = index[readable]
+        addresses = addresses[readable]
+
+        self._batch._registers[register, run_index] = values[readable]
+
+        if increment_memory_register:
+            self._set_16_bit_register_values(run_index, memory_register_16, addresses + 1)
+
+        if decrement_memory_register:
+            self._set_16_bit_register_values(run_index, memory_register_16, addresses - 1)
+
+        self._advance(run_index, 1, 2)
+
+        return self._fallback(index, readable)
+
+    def load_memory_with_register(self, index: np.ndarray, register: int, memory_register_16=HL,
+                                  increment_memory_register=False, decrement_memory_register=False):
+        addresses = self._get_16_bit_register_values(index, memory_register_16)
+        writable = self._batch.get_writable_mask(addresses)
+        run_index = index[writable]
+        addresses = addresses[writable]
+
+        self._batch.write_bytes(run_index, addresses, self._batch._registers[register, run_index])
+
+        if increment_memory_register:
+            self._set_16_bit_register_values(run_index, memory_register_16, addresses + 1)
+
+        if decrement_memory_register:
+            self._set_16_bit_register_values(run_index, memory_register_16, addresses - 1)
+
+        self._advance(run_index, 1, 2)
+
+        return self._fallback(index, writable)
+
+    def load_memory_with_immediate(self, index: np.ndarray):
+        addresses = self._get_16_bit_register_values(index, HL)
+        values, readable = self._read_immediate_bytes(index)
+        supported = readable & self._batch.get_writable_mask(addresses)
+        run_index = index[supported]
+
+        self._batch.write_bytes(run_index, addresses[supported], values[supported])
+        self._advance(run_index, 2, 3)
+
+        return self._fallback(index, supported)
+
+    def load_immediate_memory_with_register(self, index: np.ndarray, high_memory_load=False):
+        if high_memory_load:
+            addresses, readable = self._read_immediate_bytes(index)
+            addresses = addresses + 0xFF00
+        else:
+            addresses, readable = self._read_immediate_words(index)
+
+        supported = readable & self._batch.get_writable_mask(addresses)
+        run_index = index[supported]
+
+        self._batch.write_bytes(run_index, addresses[supported], self._batch._registers[A, run_index])
+
+        if high_memory_load:
+            self._advance(run_index, 2, 3)
+        else:
+            self._advance(run_index, 3, 4)
+
+        return self._fallback(index, supported)
+
+    def load_register_with_immediate_memory(self, index: np.ndarray, high_memory_read=False):
+        if high_memory_read:
+            addresses, readable = self._read_immediate_bytes(index)
+            addresses = addresses + 0xFF00
+        else:
+            addresses, readable = self._read_immediate_words(index)
+
+        values, value_readable = self._batch.read_bytes(index, addresses)
+        supported = readable & value_readable
+        run_index = index[supported]
+
+        self._batch._registers[A, run_index] = values[supported]
+
+        if high_memory_read:
+            self._advance(run_index, 2, 3)
+        else:
+            self._advance(run_index, 3, 4)
+
+        return self._fallback(index, supported)
+
+    def load_offset_memory_at_register_with_register(self, index: np.ndarray):
+        registers = self._batch._registers
+        addresses = registers[C, index] + 0xFF00
+        writable = self._batch.get_writable_mask(addresses)
+        run_index = index[writable]
+
+        self._batch.write_bytes(run_index, addresses[writable], registers[A, run_index])
+        self._advance(run_index, 1, 2)
+
+        return self._fallback(index, writable)
+
+    def load_register_with_offset_memory_at_register(self, index: np.ndarray):
+        registers = self._batch._registers
+        values, readable = self._batch.read_bytes(index, registers[C, index] + 0xFF00)
+        run_index = index[readable]
+
+        registers[A, run_index] = values[readable]
+        self._advance(run_index, 1, 2)
+
+        return self._fallback(index, readable)
+
+    # ~`~ 16 bit loads and stack ~`~
+
+    def load_register_with_immediate_word(self, index: np.ndarray, register_16):
+        values, readable = self._read_immediate_words(index)
+        run_index = index[readable]
+
+        self._set_16_bit_register_values(run_index, register_16, values[readable])
+        self._advance(run_index, 3, 3)
+
+        return self._fallback(index, readable)
+
+    def push_register_to_stack(self, index: np.ndarray, register_16):
+        writable = self._can_push(index)
+        run_index = index[writable]
+
+        self._push(run_index, self._get_16_bit_register_values(run_index, register_16))
+        self._advance(run_index, 1, 3)
+
+        return self._fallback(index, writable)
+
+    def pop_stack_to_register(self, index: np.ndarray, register_16):
+        values, readable = self._pop(index)
+        run_index = index[readable]
+        stack_pointers = self._batch._stack_pointers
+
+        stack_pointers[run_index] = (stack_pointers[run_index] + 2) & 0xFFFF
+        self._set_16_bit_register_values(run_index, register_16, values[readable])
+        self._advance(run_index, 1, 3)
+
+        return self._fallback(index, readable)
+
+    # ~`~ 8 bit math ~`~
+
+    def _add(self, index: np.ndarray, values: np.ndarray, with_carry_bit=False):
+        registers = self._batch._registers
+        register_a_values = registers[A, index]
+        flags = registers[F, index]
+
+        sum_ = register_a_values + values
+        half_sum = (register_a_values & 0xF) + (values & 0xF)
+
+        if with_carry_bit:
+            carry_bits = (flags & 0x10) >> 4
+            sum_ += carry_bits
+            half_sum += carry_bits
+
+        registers[F, index] = (flags & 0x0F) | \
+            np.where((sum_ & 0xFF) == 0, 0x80, 0) | \
+            np.where(half_sum > 0xF, 0x20, 0) | \
+            np.where(sum_ > 0xFF, 0x10, 0)
+        registers[A, index] = sum_ & 0xFF
+
+    def _subtract(self, index: np.ndarray, values: np.ndarray, with_carry_bit=False, compare_only=False):
+        registers = self._batch._registers
+        register_a_values = registers[A, index]
+        flags = registers[F, index]
+
+        sum_ = register_a_values - values
+
+        if with_carry_bit:
+            carry_bits = (flags & 0x10) >> 4
+            sum_ -= carry_bits
+            values = values + carry_bits
+
+        registers[F, index] = (flags & 0x0F) | 0x40 | \
+            np.where((sum_ & 0xFF) == 0, 0x80, 0) | \
+            np.where((register_a_values & 0x0F) < (values & 0x0F), 0x20, 0) | \
+            np.where(values > register_a_values, 0x10, 0)
+
+        if not compare_only:
+            registers[A, index] = sum_ & 0xFF
+
+    def _bitwise_and(self, index: np.ndarray, values: np.ndarray):
+        registers = self._batch._registers
+        result = registers[A, index] & values
+
+        registers[A, index] = result
+        registers[F, index] = (registers[F, index] & 0x0F) | 0x20 | np.where(result == 0, 0x80, 0)
+
+    def _bitwise_or(self, index: np.ndarray, values: np.ndarray):
+        registers = self._batch._registers
+        result = registers[A, index] | values
+
+        registers[A, index] = result
+        registers[F, index] = (registers[F, index] & 0x0F) | np.where(result == 0, 0x80, 0)
+
+    def _bitwise_xor(self, index: np.ndarray, values: np.ndarray):
+        registers = self._batch._registers
+        result = registers[A, index] ^ values
+
+        registers[A, index] = result
+        registers[F, index] = (registers[F, index] & 0x0F) | np.where(result == 0, 0x80, 0)
+
+    def math_with_register(self, index: np.ndarray, operation: Callable, register: int):
+        operation(index, self._batch._registers[register, index])
+
+        self._advance(index, 1, 1)
+
+    def math_with_hl_memory(self, index: np.ndarray, operation: Callable):
+        values, readable = self._batch.read_bytes(index, self._get_16_bit_register_values(index, HL))
+        run_index = index[readable]
+
+        operation(run_index, values[readable])
+        self._advance(run_index, 1, 2)
+
+        return self._fallback(index, readable)
+
+    def math_with_immediate(self, index: np.ndarray, operation: Callable):
+        values, readable = self._read_immediate_bytes(index)
+        run_index = index[readable]
+
+        operation(run_index, values[readable])
+        self._advance(run_index, 2, 2)
+
+        return self._fallback(index, readable)
+
+    def _increment_flags(self, index: np.ndarray, values: np.ndarray, result: np.ndarray) -> None:
+        registers = self._batch._registers
+
+        registers[F, index] = (registers[F, index] & 0x1F) | \
+            np.where(result == 0, 0x80, 0) | \
+            np.where((values & 0xF) == 0xF, 0x20, 0)
+
+    def _decrement_flags(self, index: np.ndarray, values: np.ndarray, result: np.ndarray) -> None:
+        registers = self._batch._registers
+
+        registers[F, index] = (registers[F, index] & 0x1F) | 0x40 | \
+            np.where(result == 0, 0x80, 0) | \
+            np.where((values & 0xF) == 0, 0x20, 0)
+
+    def increment_8_bit_register(self, index: np.ndarray, register: int):
+        values = self._batch._registers[register, index]
+        result = (values + 1) & 0xFF
+
+        self._batch._registers[register, index] = result
+        self._increment_flags(index, values, result)
+        self._advance(index, 1, 1)
+
+    def decrement_8_bit_register(self, index: np.ndarray, register: int):
+        values = self._batch._registers[register, index]
+        result = (values - 1) & 0xFF
+
+        self._batch._registers[register, index] = result
+        self._decrement_flags(index, values, result)
+        self._advance(index, 1, 1)
+
+    def increment_memory_at_register(self, index: np.ndarray):
+        return self._modify_memory_at_register(index, 1, self._increment_flags)
+
+    def decrement_memory_at_register(self, index: np.ndarray):
+        return self._modify_memory_at_register(index, -1, self._decrement_flags)
+
+    def _modify_memory_at_register(self, index: np.ndarray, change: int, update_flags: Callable):
+        addresses = self._get_16_bit_register_values(index, HL)
+        values, readable = self._batch.read_bytes(index, addresses)
+        supported = readable & self._batch.get_writable_mask(addresses)
+        run_index = index[supported]
+        values = values[supported]
+        result = (values + change) & 0xFF
+
+        self._batch.write_bytes(run_index, addresses[supported], result)
+        update_flags(run_index, values, result)
+        self._advance(run_index, 1, 3)
+
+        return self._fallback(index, supported)
+
+    def rotate_register_a_left(self, index: np.ndarray, with_carry_bit=False):
+        registers = self._batch._registers
+        values = registers[A, index]
+        flags = registers[F, index]
+
+        if with_carry_bit:
+            rotated_values = (values << 1) | ((flags & 0x10) >> 4)
+        else:
+            rotated_values = (values << 1) | (values >> 7)
+
+        registers[F, index] = (flags & 0x0F) | ((values & 0x80) >> 3)
+        registers[A, index] = rotated_values & 0xFF
+
+        self._advance(index, 1, 1)
+
+    def rotate_register_a_right(self, index: np.ndarray, with_carry_bit=False):
+        registers = self._batch._registers
+        values = registers[A, index]
+        flags = registers[F, index]
+
+        if with_carry_bit:
+            rotated_values = (values >> 1) | ((flags & 0x10) << 3)
+        else:
+            rotated_values = (values >> 1) | (values << 7)
+
+        registers[F, index] = (flags & 0x0F) | ((values & 0x01) << 4)
+        registers[A, index] = rotated_values & 0xFF
+
+        self._advance(index, 1, 1)
+
+    # ~`~ 16 bit math ~`~
+
+    def modify_16_bit_register(self, index: np.ndarray, register_16, change: int):
+        values = self._get_16_bit_register_values(index, register_16)
+        self._set_16_bit_register_values(index, register_16, (values + change) & 0xFFFF)
+
+        self._advance(index, 1, 2)
+
+    def add_16_bit_registers(self, index: np.ndarray, register_16):
+        registers = self._batch._registers
+        hl_values = self._get_16_bit_register_values(index, HL)
+        add_values = self._get_16_bit_register_values(index, register_16)
+
+        sum_ = hl_values + add_values
+        half_sum = (hl_values & 0xFFF) + (add_values & 0xFFF)
+
+        registers[F, index] = (registers[F, index] & 0x8F) | \
+            np.where(half_sum > 0xFFF, 0x20, 0) | \
+            np.where(sum_ > 0xFFFF, 0x10, 0)
+
+        self._set_16_bit_register_values(index, HL, sum_ & 0xFFFF)
+        self._advance(index, 1, 3)
+
+    # ~`~ Jump, call, return ~`~
+
+    def jump_to_immediate(self, index: np.ndarray, condition=None, relative=False):
+        program_counters = self._batch._program_counters
+
+        if relative:
+            offsets, readable = self._read_immediate_bytes(index)
+            targets = program_counters[index] + 2 + np.where(offsets > 127, offsets - 256, offsets)
+            length = 2
+        else:
+            targets, readable = self._read_immediate_words(index)
+            length = 3
+
+        run_index = index[readable]
+        taken = self._is_condition_met(run_index, condition)
+
+        self._advance(run_index, length, length)
+
+        taken_index = run_index[taken]
+        program_counters[taken_index] = targets[readable][taken] & 0xFFFF
+
+        if condition is not None:
+            self._batch._clock_cycles[taken_index] += 4
+
+        return self._fallback(index, readable)
+
+    def jump_to_hl(self, index: np.ndarray):
+        self._batch._program_counters[index] = self._get_16_bit_register_values(index, HL) & 0xFFFF
+        self._batch._clock_cycles[index] += 4
+
+    def call_immediate(self, index: np.ndarray, condition=None):
+        targets, readable = self._read_immediate_words(index)
+        taken = self._is_condition_met(index, condition)
+        supported = readable & (~taken | self._can_push(index))
+
+        run_index = index[supported]
+        taken = taken[supported]
+
+        self._advance(run_index, 3, 3)
+
+        taken_index = run_index[taken]
+        self._push(taken_index, self._batch._program_counters[taken_index])
+        self._batch._program_counters[taken_index] = targets[supported][taken]
+        self._batch._clock_cycles[taken_index] += 8
+
+        return self._fallback(index, supported)
+
+    def return_(self, index: np.ndarray, condition=None, enable_interrupts=False):
+        values, readable = self._pop(index)
+        taken = self._is_condition_met(index, condition)
+        supported = ~taken | readable
+
+        run_index = index[supported]
+        taken = taken[supported]
+
+        self._advance(run_index, 1, 1)
+
+        taken_index = run_index[taken]
+        stack_pointers = self._batch._stack_pointers
+
+        stack_pointers[taken_index] = (stack_pointers[taken_index] + 2) & 0xFFFF
+        self._batch._program_counters[taken_index] = values[supported][taken] & 0xFFFF
+        self._batch._clock_cycles[taken_index] += 8
+
+        if enable_interrupts:
+            self._batch._interrupts_enabled[taken_index] = True
+
+        return self._fallback(index, supported)
+
+    def reset(self, index: np.ndarray, address: int):
+        writable = self._can_push(index)
+        run_index = index[writable]
+
+        self._push(run_index, (self._batch._program_counters[run_index] + 1) & 0xFFFF)
+        self._batch._program_counters[run_index] = address
+        self._batch._clock_cycles[run_index] += 12
+
+        return self._fallback(index, writable)
+
+    # ~`~ Extended operations ~`~
+
+    def execute_extended_operation(self, index: np.ndarray):
+        op_codes, readable = self._read_immediate_bytes(index)
+        fallback_indexes = [index[~readable]]
+
+        for op_code, group_index in self._batch._group_by_op_code(index[readable], op_codes[readable]):
+            instruction = self._extended_instruction_table[op_code]
+
+            if instruction is None:
+                fallback_indexes.append(group_index)
+            else:
+                instruction(group_index)
+
+        fallback_index = np.concatenate(fallback_indexes)
+
+        return fallback_index if len(fallback_index) else None
+
+    def _extended_op_shift(self, index: np.ndarray, register: int, sub_op: int):
+        registers = self._batch._registers
+        values = registers[register, index]
+        carry_bits = (registers[F, index] & 0x10) >> 4
+
+        # Zero is checked before masking to 8 bits, same as the scalar CPU
+        if sub_op == 0:  # rlc
+            shifted_values = (values << 1) | (values >> 7)
+            carry_out = values & 0x80
+        elif sub_op == 1:  # rrc
+            shifted_values = (values >> 1) | (values << 7)
+            carry_out = values & 0x01
+        elif sub_op == 2:  # rl
+            shifted_values = (values << 1) | carry_bits
+            carry_out = values & 0x80
+        elif sub_op == 3:  # rr
+            shifted_values = (values >> 1) | (carry_bits << 7)
+            carry_out = values & 0x01
+        elif sub_op == 4:  # sla
+            shifted_values = values << 1
+            carry_out = values & 0x80
+        elif sub_op == 5:  # sra
+            shifted_values = (values >> 1) | (values & 0x80)
+            carry_out = values & 0x01
+        elif sub_op == 6:  # swap
+            shifted_values = (values >> 4) | (values << 4)
+            carry_out = values & 0
+        else:  # srl
+            shifted_values = values >> 1
+            carry_out = values & 0x01
+
+        registers[F, index] = (registers[F, index] & 0x0F) | \
+            np.where(shifted_values == 0, 0x80, 0) | \
+            np.where(carry_out != 0, 0x10, 0)
+        registers[register, index] = shifted_values & 0xFF
+
+        self._advance(index, 2, 1 if sub_op == 6 else 2)
+
+    def _extended_op_read_bit(self, index: np.ndarray, register: int, bit_index: int):
+        registers = self._batch._registers
+
+        registers[F, index] = (registers[F, index] & 0x1F & ~0x20) | \
+            np.where((registers[register, index] & (1 << bit_index)) == 0, 0x80, 0)
+
+        self._advance(index, 2, 2)
+
+    def _extended_op_modify_bit(self, index: np.ndarray, register: int, and_mask: int, or_mask: int):
+        registers = self._batch._registers
+        registers[register, index] = (registers[register, index] & and_mask) | or_mask
+
+        self._advance(index, 2, 2)
@@ -0,0 +1,335 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from gameboy.gameboy import GameBoy
+from gameboy.memory.copy_on_write_memory_region import CopyOnWriteMemoryRegion
+from gameboy.memory.memory_region import MemoryRegion
+
+
+class GameBoyBatch:
+    # Register rows are laid out in CPU operand encoding order, (hl) has no register so slot 6 holds the flags
+    REGISTER_B = 0
+    REGISTER_C = 1
+    REGISTER_D = 2
+    REGISTER_E = 3
+    REGISTER_H = 4
+    REGISTER_L = 5
+    REGISTER_FLAGS = 6
+    REGISTER_A = 7
+
+    def __init__(self, game_boy: GameBoy, size: int):
+        if size < 1:
+            raise ValueError('Batch size must be at least 1')
+
+        # Every instance starts from the same state, forking shares the ROM and copies everything else
+        self._game_boys: List[GameBoy] = [game_boy] + [game_boy.fork() for _ in range(1, size)]
+        self._size = size
+
+        memory_unit = game_boy.get_memory_unit()
+        rom = game_boy.get_rom()
+
+        self._rom_data = np.frombuffer(rom._data, dtype=np.uint8)
+        self._rom_size = rom.get_rom_size()
+        self._boot_rom_data = np.frombuffer(memory_unit._boot_rom._data, dtype=np.uint8)
+
+        # CPU state, structure of arrays with one column per instance
+        self._registers = np.zeros((8, size), dtype=np.int32)
+        self._program_counters = np.zeros(size, dtype=np.int32)
+        self._stack_pointers = np.zeros(size, dtype=np.int32)
+        self._clock_cycles = np.zeros(size, dtype=np.int64)
+        self._interrupts_enabled = np.zeros(size, dtype=bool)
+        self._interrupt_enable_pending = np.zeros(size, dtype=bool)
+        self._halted = np.zeros(size, dtype=bool)
+        self._halt_bug = np.zeros(size, dtype=bool)
+        self._stopped = np.zeros(size, dtype=bool)
+
+        # Mirrors of memory unit state that only changes on the scalar path
+        self._rom_banks = np.zeros(size, dtype=np.int32)
+        self._boot_rom_locked = np.zeros(size, dtype=bool)
+        self._dma_busy = np.zeros(size, dtype=bool)
+
+        # Memories, the scalar instances read and write these rows directly
+        self._video_ram = self._bind_memory_regions(lambda m: m._video_ram)
+        self._work_ram = self._bind_memory_regions(lambda m: m._work_ram)
+        self._high_ram = self._bind_memory_regions(lambda m: m._high_ram)
+        self._oam = self._bind_memory_regions(lambda m: m._oam)
+        self._io_ram = self._bind_memory_regions(lambda m: m._io_ram)
+        self._interrupt_flags = self._bind_memory_regions(lambda m: m._interrupt_flag_register)
+        self._interrupt_enables = self._bind_memory_regions(lambda m: m._interrupt_enable_register)
+        self._cartridge_ram = self._bind_memory_regions(lambda m: m._cartridge_ram)
+
+        for index in range(0, size):
+            self._load_state(index)
+
+        # Clock each instance's GPU and scheduler have been brought up to, they're caught up after every step
+        self._peripheral_clock_cycles = self._clock_cycles.copy()
+
+        self._vectorized_instruction_count = 0
+        self._scalar_instruction_count = 0
+
+        self._instructions = BatchCPUInstructions(self)
+
+    def _bind_memory_regions(self, get_region) -> np.ndarray:
+        regions: List[MemoryRegion] = [get_region(g.get_memory_unit()) for g in self._game_boys]
+
+        for region in regions:
+            if isinstance(region, CopyOnWriteMemoryRegion):
+                region.unshare()
+
+        rows = np.zeros((self._size, len(regions[0]._data)), dtype=np.uint8)
+
+        for index, region in enumerate(regions):
+            rows[index] = np.frombuffer(bytes(region._data), dtype=np.uint8)
+            region._data = memoryview(rows[index])
+
+        return rows
+
+    def get_size(self) -> int:
+        return self._size
+
+    def get_game_boy(self, index: int) -> GameBoy:
+        # Registers live in the batch arrays, push them to the instance before handing it out
+        self._store_state(index)
+
+        return self._game_boys[index]
+
+    def get_registers(self) -> np.ndarray:
+        return self._registers
+
+    def get_program_counters(self) -> np.ndarray:
+        return self._program_counters
+
+    def get_stack_pointers(self) -> np.ndarray:
+        return self._stack_pointers
+
+    def get_clock_cycles(self) -> np.ndarray:
+        return self._clock_cycles
+
+    def get_video_ram(self) -> np.ndarray:
+        return self._video_ram
+
+    def get_work_ram(self) -> np.ndarray:
+        return self._work_ram
+
+    def get_high_ram(self) -> np.ndarray:
+        return self._high_ram
+
+    def get_vectorized_instruction_count(self) -> int:
+        return self._vectorized_instruction_count
+
+    def get_scalar_instruction_count(self) -> int:
+        return self._scalar_instruction_count
+
+    def step(self, count: int=1) -> None:
+        for _ in range(0, count):
+            self._step()
+
+    def _step(self) -> None:
+        interrupts_pending = (self._interrupt_flags[:, 0] & self._interrupt_enables[:, 0] & 0x1F) != 0
+        scalar_mask = self._stopped | self._halt_bug | self._dma_busy | interrupts_pending
+
+        # Halted instances with nothing to wake them just burn a machine cycle
+        idle_mask = self._halted & ~scalar_mask
+        self._clock_cycles[idle_mask] += 4
+
+        ready_index = np.flatnonzero(~(scalar_mask | self._halted))
+        scalar_indexes = [np.flatnonzero(scalar_mask)]
+
+        if len(ready_index):
+            # EI takes effect at the start of the following instruction
+            self._interrupts_enabled[ready_index] |= self._interrupt_enable_pending[ready_index]
+            self._interrupt_enable_pending[ready_index] = False
+
+            op_codes, readable = self.read_bytes(ready_index, self._program_counters[ready_index])
+
+            scalar_indexes.append(ready_index[~readable])
+            ready_index = ready_index[readable]
+            op_codes = op_codes[readable]
+
+            for op_code, group_index in self._group_by_op_code(ready_index, op_codes):
+                instruction = self._instructions.get_instruction(op_code)
+
+                if instruction is None:
+                    scalar_indexes.append(group_index)
+                    continue
+
+                fallback_index = instruction(group_index)
+
+                if fallback_index is None:
+                    self._vectorized_instruction_count += len(group_index)
+                else:
+                    self._vectorized_instruction_count += len(group_index) - len(fallback_index)
+                    scalar_indexes.append(fallback_index)
+
+        for scalar_index in scalar_indexes:
+            for index in scalar_index.tolist():
+                self._step_scalar(index)
+
+        self._update_peripherals()
+
+    def _update_peripherals(self) -> None:
+        # Same as GameBoy.run_for_cycles does after each step: a video update per elapsed clock cycle, then any
+        # scheduled events that are due. VBlank and LCD interrupts raised here wake halted instances next step.
+        elapsed_clock_cycles = self._clock_cycles - self._peripheral_clock_cycles
+
+        for index in np.flatnonzero(elapsed_clock_cycles).tolist():
+            game_boy = self._game_boys[index]
+            gpu = game_boy.get_gpu()
+
+            for _ in range(0, int(elapsed_clock_cycles[index])):
+                gpu.video_update()
+
+            clock_cycles = int(self._clock_cycles[index])
+            self._peripheral_clock_cycles[index] = clock_cycles
+
+            if clock_cycles >= game_boy.get_scheduler().get_deadline():
+                self._run_scheduled_events(index, lambda scheduler: scheduler.run_due(clock_cycles))
+
+        # Stopped instances don't advance their clock, so like run_for_cycles the next event can't wait for its cycle
+        for index in np.flatnonzero(self._stopped & (elapsed_clock_cycles == 0)).tolist():
+            self._run_scheduled_events(index, lambda scheduler: scheduler.run_next())
+
+    def _run_scheduled_events(self, index: int, run_events) -> None:
+        # Event handlers can read the instance's clock and change its CPU state, like ending STOP
+        self._store_state(index)
+        run_events(self._game_boys[index].get_scheduler())
+        self._load_state(index)
+
+    @staticmethod
+    def _group_by_op_code(index: np.ndarray, op_codes: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+        if not len(index):
+            return []
+
+        # Lockstep instances nearly always agree, skip the sort when they do
+        first_op_code = op_codes[0]
+
+        if (op_codes == first_op_code).all():
+            return [(int(first_op_code), index)]
+
+        unique_op_codes, inverse = np.unique(op_codes, return_inverse=True)
+
+        return [(int(op_code), index[inverse == i]) for i, op_code in enumerate(unique_op_codes)]
+
+    def _step_scalar(self, index: int) -> None:
+        self._store_state(index)
+        # Video and scheduled events are caught up for every instance at the end of the step
+        self._game_boys[index].step_cpu()
+        self._load_state(index)
+
+        self._scalar_instruction_count += 1
+
+    def _store_state(self, index: int) -> None:
+        cpu = self._game_boys[index].get_cpu()
+        registers = cpu.get_registers()
+
+        (registers._register_b, registers._register_c, registers._register_d, registers._register_e,
+         registers._register_h, registers._register_l, registers._flags, registers._register_a) = \
+            self._registers[:, index].tolist()
+
+        registers._program_counter = int(self._program_counters[index])
+        registers._stack_pointer = int(self._stack_pointers[index])
+        registers._interrupts_enabled = bool(self._interrupts_enabled[index])
+
+        cpu._interrupt_enable_pending = bool(self._interrupt_enable_pending[index])
+        cpu._is_halted = bool(self._halted[index])
+        cpu._halt_bug = bool(self._halt_bug[index])
+        cpu._is_stopped = bool(self._stopped[index])
+        cpu.get_cycle_clock()._total_clock_cycles = int(self._clock_cycles[index])
+
+    def _load_state(self, index: int) -> None:
+        game_boy = self._game_boys[index]
+        cpu = game_boy.get_cpu()
+        registers = cpu.get_registers()
+        memory_unit = game_boy.get_memory_unit()
+
+        self._registers[:, index] = (
+            registers._register_b, registers._register_c, registers._register_d, registers._register_e,
+            registers._register_h, registers._register_l, registers._flags, registers._register_a
+        )
+
+        self._program_counters[index] = registers._program_counter
+        self._stack_pointers[index] = registers._stack_pointer
+        self._interrupts_enabled[index] = registers._interrupts_enabled
+
+        self._interrupt_enable_pending[index] = cpu._interrupt_enable_pending
+        self._halted[index] = cpu._is_halted
+        self._halt_bug[index] = cpu._halt_bug
+        self._stopped[index] = cpu._is_stopped
+        self._clock_cycles[index] = cpu.get_cycle_clock().get_total_clock_cycles()
+
+        self._rom_banks[index] = memory_unit._mbc_rom_bank
+        self._boot_rom_locked[index] = memory_unit.get_io_ram().get_boot_ram_locked()
+        self._dma_busy[index] = memory_unit.is_dma_busy()
+
+    def read_bytes(self, index: np.ndarray, addresses: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # Returns the byte at each address and a mask of which addresses could be read without side effects.
+        # Anything outside of ROM and plain RAM has to go through the scalar memory unit.
+        values = np.zeros(len(index), dtype=np.int32)
+        readable = np.zeros(len(index), dtype=bool)
+
+        lowest_address = addresses.min() if len(addresses) else 0
+        highest_address = addresses.max() if len(addresses) else 0
+
+        if lowest_address < 0x4000:  # ROM bank 0 or boot ROM
+            mask = addresses < 0x4000
+            rom_addresses = addresses[mask]
+            rom_values = self._rom_data[rom_addresses % len(self._rom_data)].astype(np.int32)
+
+            boot_mask = (rom_addresses <= 0xFF) & ~self._boot_rom_locked[index[mask]]
+            rom_values[boot_mask] = self._boot_rom_data[rom_addresses[boot_mask] % len(self._boot_rom_data)]
+
+            values[mask] = rom_values
+            readable |= mask
+
+        if lowest_address < 0x8000 and highest_address >= 0x4000:  # Banked ROM
+            mask = (addresses >= 0x4000) & (addresses < 0x8000)
+            cartridge_addresses = (self._rom_banks[index[mask]] * 0x4000) + addresses[mask] - 0x4000
+
+            values[mask] = self._rom_data[(cartridge_addresses % self._rom_size) % len(self._rom_data)]
+            readable |= mask
+
+        for rows, start, end, base in self._get_ram_areas(lowest_address, highest_address):
+            mask = (addresses >= start) & (addresses < end)
+            values[mask] = rows[index[mask], addresses[mask] - base]
+            readable |= mask
+
+        return values, readable
+
+    def get_writable_mask(self, addresses: np.ndarray) -> np.ndarray:
+        # Plain RAM only, writes anywhere else can bank switch, start DMA or poke IO
+        writable = np.zeros(len(addresses), dtype=bool)
+
+        if not len(addresses):
+            return writable
+
+        for _, start, end, _ in self._get_ram_areas(addresses.min(), addresses.max(), include_io=False):
+            writable |= (addresses >= start) & (addresses < end)
+
+        return writable
+
+    def write_bytes(self, index: np.ndarray, addresses: np.ndarray, values: np.ndarray) -> None:
+        # Callers must have checked get_writable_mask first
+        if not len(addresses):
+            return
+
+        for rows, start, end, base in self._get_ram_areas(addresses.min(), addresses.max(), include_io=False):
+            mask = (addresses >= start) & (addresses < end)
+            rows[index[mask], addresses[mask] - base] = values[mask]
+
+    def _get_ram_areas(self, lowest_address: int, highest_address: int, include_io: bool=True) -> list:
+        areas = [
+            (self._video_ram, 0x8000, 0xA000, 0x8000),
+            (self._work_ram, 0xC000, 0xE000, 0xC000),
+            (self._work_ram, 0xE000, 0xFE00, 0xE000),  # Work RAM mirror
+            (self._high_ram, 0xFF80, 0xFFFF, 0xFF80),
+        ]
+
+        if include_io:
+            areas.append((self._io_ram, 0xFF40, 0xFF4C, 0xFF00))  # LCD registers have no read side effects
+
+        return [area for area in areas if lowest_address < area[2] and highest_address >= area[1]]
+
+
+# Down here to avoid circular dependency, same as the scalar CPU
+from gameboy.batch.batch_cpu_instructions import BatchCPUInstructions
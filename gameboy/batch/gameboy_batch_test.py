@@ -0,0 +1,240 @@
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameboy.batch.gameboy_batch import GameBoyBatch
+from gameboy.gameboy import GameBoy
+from gameboy.memory.joypad import Joypad
+
+BATCH_SIZE = 16
+CODE_ADDRESS = 0xC100
+
+
+@pytest.fixture()
+def gameboy_batch_fixture(test_rom_fixture) -> GameBoyBatch:
+    game_boy = GameBoy()
+    game_boy.load_rom(test_rom_fixture)
+    game_boy.get_memory_unit().write_byte(0xFF50, 1)  # Lock boot ROM
+
+    return GameBoyBatch(game_boy, BATCH_SIZE)
+
+
+def _randomize_instance(batch: GameBoyBatch, index: int, op_code: int, rng: random.Random):
+    registers = batch.get_registers()
+
+    for register in range(0, 8):
+        registers[register, index] = rng.randrange(0, 0x100)
+
+    registers[GameBoyBatch.REGISTER_FLAGS, index] &= 0xF0
+
+    # Keep memory operands mostly in RAM, but send a few to ROM and IO so the scalar fallback gets exercised
+    for high_register, low_register in ((GameBoyBatch.REGISTER_B, GameBoyBatch.REGISTER_C),
+                                        (GameBoyBatch.REGISTER_D, GameBoyBatch.REGISTER_E),
+                                        (GameBoyBatch.REGISTER_H, GameBoyBatch.REGISTER_L)):
+        address = rng.choice((rng.randrange(0xC200, 0xDFFF), rng.randrange(0xFF80, 0xFFFE),
+                              rng.randrange(0xC200, 0xDFFF), rng.randrange(0xFF40, 0xFF46), 0x150))
+        registers[high_register, index] = address >> 8
+        registers[low_register, index] = address & 0xFF
+
+    batch.get_stack_pointers()[index] = rng.choice((rng.randrange(0xC202, 0xDFFE), 0xFFFE, 0x0200))
+    batch.get_program_counters()[index] = CODE_ADDRESS
+
+    work_ram = batch.get_work_ram()
+    work_ram[index, :] = np.frombuffer(rng.randbytes(work_ram.shape[1]), dtype=np.uint8)
+    work_ram[index, CODE_ADDRESS - 0xC000] = op_code
+
+
+def _get_state(game_boy: GameBoy) -> tuple:
+    cpu = game_boy.get_cpu()
+    registers = cpu.get_registers()
+    memory_unit = game_boy.get_memory_unit()
+
+    return (
+        registers.read_af(), registers.read_bc(), registers.read_de(), registers.read_hl(),
+        registers.get_program_counter(), registers.get_stack_pointer(), registers.get_interrupts_enabled(),
+        cpu.get_interrupt_enable_pending(), cpu.get_cycle_clock().get_total_clock_cycles(),
+        bytes(memory_unit._work_ram.read_byte_range(0xC000, 0x2000)),
+        bytes(memory_unit._high_ram.read_byte_range(0xFF80, 0x7F)),
+    )
+
+
+def test_gameboy_batch_init(gameboy_batch_fixture):
+    assert gameboy_batch_fixture.get_size() == BATCH_SIZE
+    assert gameboy_batch_fixture.get_registers().shape == (8, BATCH_SIZE)
+    assert (gameboy_batch_fixture.get_program_counters() == 0x0000).all()
+    assert len({id(gameboy_batch_fixture.get_game_boy(i)) for i in range(0, BATCH_SIZE)}) == BATCH_SIZE
+
+
+def test_gameboy_batch_init_invalid_size(test_rom_fixture):
+    with pytest.raises(ValueError):
+        GameBoyBatch(GameBoy(), 0)
+
+
+def test_gameboy_batch_memory_shared_with_instances(gameboy_batch_fixture):
+    gameboy_batch_fixture.get_game_boy(3).get_memory_unit().write_byte(0xC010, 0x42)
+    gameboy_batch_fixture.get_video_ram()[5, 0x20] = 0x24
+
+    assert gameboy_batch_fixture.get_work_ram()[3, 0x10] == 0x42
+    assert gameboy_batch_fixture.get_game_boy(5).get_memory_unit().read_byte(0x8020) == 0x24
+
+
+def test_gameboy_batch_fork_instance_is_private(gameboy_batch_fixture):
+    gameboy_batch_fixture.get_work_ram()[0, 0] = 0x11
+
+    forked_game_boy = gameboy_batch_fixture.get_game_boy(0).fork()
+    forked_game_boy.get_memory_unit().write_byte(0xC000, 0x99)
+
+    assert forked_game_boy.get_memory_unit().read_byte(0xC000) == 0x99
+    assert gameboy_batch_fixture.get_work_ram()[0, 0] == 0x11
+
+
+@pytest.mark.parametrize('op_code', [op_code for op_code in range(0, 0x100)
+                                     if op_code not in (0x10, 0x76, 0xD3, 0xDB, 0xDD, 0xE3, 0xE4, 0xEB, 0xEC,
+                                                        0xED, 0xF4, 0xFC, 0xFD)])
+def test_gameboy_batch_step_matches_scalar(gameboy_batch_fixture, op_code):
+    rng = random.Random(op_code)
+
+    for index in range(0, BATCH_SIZE):
+        _randomize_instance(gameboy_batch_fixture, index, op_code, rng)
+
+    expected_game_boys = [gameboy_batch_fixture.get_game_boy(i).fork() for i in range(0, BATCH_SIZE)]
+
+    for game_boy in expected_game_boys:
+        game_boy.step_cpu()
+
+    gameboy_batch_fixture.step()
+
+    for index, expected_game_boy in enumerate(expected_game_boys):
+        assert _get_state(gameboy_batch_fixture.get_game_boy(index)) == _get_state(expected_game_boy)
+
+
+@pytest.mark.parametrize('op_code', range(0, 0x100))
+def test_gameboy_batch_step_extended_matches_scalar(gameboy_batch_fixture, op_code):
+    rng = random.Random(op_code)
+
+    for index in range(0, BATCH_SIZE):
+        _randomize_instance(gameboy_batch_fixture, index, 0xCB, rng)
+        gameboy_batch_fixture.get_work_ram()[index, CODE_ADDRESS - 0xC000 + 1] = op_code
+
+    expected_game_boys = [gameboy_batch_fixture.get_game_boy(i).fork() for i in range(0, BATCH_SIZE)]
+
+    for game_boy in expected_game_boys:
+        game_boy.step_cpu()
+
+    gameboy_batch_fixture.step()
+
+    for index, expected_game_boy in enumerate(expected_game_boys):
+        assert _get_state(gameboy_batch_fixture.get_game_boy(index)) == _get_state(expected_game_boy)
+
+
+def test_gameboy_batch_step_divergent_op_codes(gameboy_batch_fixture):
+    rng = random.Random(1)
+    op_codes = [0x00, 0x3C, 0x80, 0xC5, 0xCD, 0x76, 0x27, 0x18]
+
+    for index in range(0, BATCH_SIZE):
+        _randomize_instance(gameboy_batch_fixture, index, op_codes[index % len(op_codes)], rng)
+
+    expected_game_boys = [gameboy_batch_fixture.get_game_boy(i).fork() for i in range(0, BATCH_SIZE)]
+
+    for game_boy in expected_game_boys:
+        game_boy.step_cpu()
+
+    gameboy_batch_fixture.step()
+
+    for index, expected_game_boy in enumerate(expected_game_boys):
+        assert _get_state(gameboy_batch_fixture.get_game_boy(index)) == _get_state(expected_game_boy)
+
+
+def test_gameboy_batch_step_counts(gameboy_batch_fixture):
+    rng = random.Random(2)
+
+    for index in range(0, BATCH_SIZE):
+        _randomize_instance(gameboy_batch_fixture, index, 0x00 if index else 0x27, rng)  # DAA is scalar only
+
+    gameboy_batch_fixture.step()
+
+    assert gameboy_batch_fixture.get_vectorized_instruction_count() == BATCH_SIZE - 1
+    assert gameboy_batch_fixture.get_scalar_instruction_count() == 1
+
+
+def test_gameboy_batch_step_pending_interrupt_uses_scalar(gameboy_batch_fixture):
+    rng = random.Random(3)
+
+    for index in range(0, BATCH_SIZE):
+        _randomize_instance(gameboy_batch_fixture, index, 0x00, rng)
+
+    game_boy = gameboy_batch_fixture.get_game_boy(0)
+    game_boy.get_cpu().get_registers().enable_interrupts()
+    game_boy.get_memory_unit().write_byte(0xFFFF, 0x01)
+    game_boy.get_memory_unit().write_byte(0xFF0F, 0x01)
+    gameboy_batch_fixture._load_state(0)
+
+    gameboy_batch_fixture.step()
+
+    assert gameboy_batch_fixture.get_scalar_instruction_count() == 1
+    assert gameboy_batch_fixture.get_program_counters()[0] != CODE_ADDRESS + 1
+
+
+@pytest.fixture()
+def gameboy_batch_lcd_on_fixture(test_rom_fixture) -> GameBoyBatch:
+    # Small, every instance pays for a video update per clock cycle
+    game_boy = GameBoy(skip_boot=True)
+    game_boy.load_rom(test_rom_fixture)
+
+    return GameBoyBatch(game_boy, 2)
+
+
+def _load_code(batch: GameBoyBatch, code: bytes):
+    for index in range(0, batch.get_size()):
+        batch.get_work_ram()[index, CODE_ADDRESS - 0xC000:CODE_ADDRESS - 0xC000 + len(code)] = list(code)
+        batch.get_program_counters()[index] = CODE_ADDRESS
+
+
+def test_gameboy_batch_step_updates_video(gameboy_batch_lcd_on_fixture):
+    _load_code(gameboy_batch_lcd_on_fixture, bytes([0x18, 0xFE]))  # jr -2
+
+    gameboy_batch_lcd_on_fixture.step(100)
+
+    for index in range(0, 2):
+        game_boy = gameboy_batch_lcd_on_fixture.get_game_boy(index)
+
+        clock_cycles = game_boy.get_cpu().get_cycle_clock().get_total_clock_cycles()
+
+        assert clock_cycles >= 456
+        assert game_boy.get_memory_unit().read_byte(0xFF44) == (clock_cycles - 1) // 456
+
+
+def test_gameboy_batch_step_vblank_wakes_halted(gameboy_batch_lcd_on_fixture):
+    _load_code(gameboy_batch_lcd_on_fixture, bytes([0x76, 0x00]))  # halt, nop
+
+    for index in range(0, 2):
+        game_boy = gameboy_batch_lcd_on_fixture.get_game_boy(index)
+        game_boy.get_memory_unit().write_byte(0xFFFF, 0x01)  # VBlank, interrupts stay disabled
+        game_boy.get_memory_unit().write_byte(0xFF0F, 0x00)
+        game_boy.get_gpu()._frame_progress = 144 * 456 - 40
+
+    gameboy_batch_lcd_on_fixture.step(5)
+
+    assert gameboy_batch_lcd_on_fixture._halted.all()
+
+    gameboy_batch_lcd_on_fixture.step(10)
+
+    for index in range(0, 2):
+        assert not gameboy_batch_lcd_on_fixture._halted[index]
+        assert gameboy_batch_lcd_on_fixture.get_program_counters()[index] > CODE_ADDRESS + 1
+
+
+def test_gameboy_batch_step_runs_scheduled_events(gameboy_batch_lcd_on_fixture):
+    _load_code(gameboy_batch_lcd_on_fixture, bytes([0x18, 0xFE]))  # jr -2
+
+    gameboy_batch_lcd_on_fixture.get_game_boy(1).queue_input(100, Joypad.Button.A.value)
+    gameboy_batch_lcd_on_fixture.step(5)
+
+    assert not gameboy_batch_lcd_on_fixture.get_game_boy(1).get_joypad().is_pressed(Joypad.Button.A)
+
+    gameboy_batch_lcd_on_fixture.step(20)
+
+    assert gameboy_batch_lcd_on_fixture.get_game_boy(1).get_joypad().is_pressed(Joypad.Button.A)
+    assert not gameboy_batch_lcd_on_fixture.get_game_boy(0).get_joypad().is_pressed(Joypad.Button.A)
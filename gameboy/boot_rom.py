@@ -22,3 +22,6 @@ class BootROM(MemoryRegion):
             0xF5, 0x06, 0x19, 0x78, 0x86, 0x23, 0x05, 0x20, 0xFB, 0x86, 0x20, 0xFE, 0x3E, 0x01, 0xE0, 0x50
         ]
         super().__init__(bytearray(data), 0x00)
+
+    def fork(self) -> 'BootROM':
+        return self
@@ -1,9 +1,36 @@
+from typing import Callable
+
 import pytest
 
+from gameboy.memory.real_time_clock import CLOCK_CYCLES_PER_SECOND
 from gameboy.rom import ROM
 
 
+class FakeCycleSource:
+    # Stands in for CycleClock.get_total_clock_cycles where a component follows the CPU clock, tests move
+    # clock_cycles on by hand
+    def __init__(self):
+        self.clock_cycles = 0
+
+    def __call__(self) -> int:
+        return self.clock_cycles
+
+    def advance(self, seconds: float) -> None:
+        self.clock_cycles += int(seconds * CLOCK_CYCLES_PER_SECOND)
+
+
 @pytest.fixture()
 def test_rom_fixture() -> ROM:
     with open("../test_roms/instr_timing.gb", "rb") as binary_file:
         return ROM(bytearray(binary_file.read()))
+
+
+@pytest.fixture()
+def cycle_source_fixture() -> FakeCycleSource:
+    return FakeCycleSource()
+
+
+@pytest.fixture()
+def new_cycle_source_fixture() -> Callable[[], FakeCycleSource]:
+    # For tests that need more clocks than cycle_source_fixture, like a forked component's
+    return FakeCycleSource
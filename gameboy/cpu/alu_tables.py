@@ -0,0 +1,144 @@
+from array import array
+
+# 8 bit ALU results precomputed as (result << 8) | flags, one lookup replaces the arithmetic and the flag updates.
+# Entries follow the CPUInstructions formulas they replace, quirks included, so the batch CPU still matches.
+# Carry-in is the carry flag bit (0x10) shifted into the index above the operands.
+
+SHIFT_RLC = 0
+SHIFT_RRC = 1
+SHIFT_RL = 2
+SHIFT_RR = 3
+SHIFT_SLA = 4
+SHIFT_SRA = 5
+SHIFT_SWAP = 6
+SHIFT_SRL = 7
+
+
+def _pack(result: int, zero: bool, subtract: bool, half_carry: bool, carry: bool) -> int:
+    return ((result & 0xFF) << 8) | (0x80 if zero else 0) | (0x40 if subtract else 0) | \
+        (0x20 if half_carry else 0) | (0x10 if carry else 0)
+
+
+def _build_add_table() -> array:
+    # Index: (carry flag << 12) | (a << 8) | value
+    table = array('H')
+
+    for carry_bit in (0, 1):
+        for register_value in range(0, 0x100):
+            for add_value in range(0, 0x100):
+                sum_ = register_value + add_value + carry_bit
+                half_sum = (register_value & 0xF) + (add_value & 0xF) + carry_bit
+
+                table.append(_pack(sum_, sum_ & 0xFF == 0, False, half_sum > 0xF, sum_ > 0xFF))
+
+    return table
+
+
+def _build_subtract_table() -> array:
+    # Index: (carry flag << 12) | (a << 8) | value, also used by cp which only keeps the flags
+    table = array('H')
+
+    for carry_bit in (0, 1):
+        for register_value in range(0, 0x100):
+            for subtract_value in range(0, 0x100):
+                sum_ = register_value - subtract_value - carry_bit
+                subtract_value += carry_bit
+
+                table.append(_pack(sum_, sum_ & 0xFF == 0, True,
+                                   (register_value & 0x0F) < (subtract_value & 0x0F), subtract_value > register_value))
+
+    return table
+
+
+def _build_increment_table() -> array:
+    # Index: (carry flag << 4) | value, inc leaves carry alone
+    table = array('H')
+
+    for carry_bit in (0, 1):
+        for register_value in range(0, 0x100):
+            result = (register_value + 1) & 0xFF
+
+            table.append(_pack(result, result == 0, False, (register_value & 0xF) == 0xF, carry_bit))
+
+    return table
+
+
+def _build_decrement_table() -> array:
+    # Index: (carry flag << 4) | value, dec leaves carry alone
+    table = array('H')
+
+    for carry_bit in (0, 1):
+        for register_value in range(0, 0x100):
+            result = (register_value - 1) & 0xFF
+
+            table.append(_pack(result, result == 0, True, (register_value & 0xF) == 0x0, carry_bit))
+
+    return table
+
+
+def _build_decimal_adjust_table() -> array:
+    # Index: (flags << 4) | a, the entry is the new AF
+    table = array('H')
+
+    for flags in range(0, 0x100, 0x10):
+        subtract = flags & 0x40
+        half_carry = flags & 0x20
+        carry = flags & 0x10
+
+        for register_a_value in range(0, 0x100):
+            if subtract:
+                if half_carry:
+                    register_a_value -= 0x06
+                    register_a_value &= 0xFF
+
+                if carry:
+                    register_a_value -= 0x60
+            else:
+                if register_a_value & 0x0F > 0x09 or half_carry:
+                    register_a_value += 0x06
+
+                if register_a_value > 0x9F or carry:
+                    register_a_value += 0x60
+
+            table.append(_pack(register_a_value, register_a_value & 0xFF == 0, subtract, False,
+                               carry or register_a_value & 0x100))
+
+    return table
+
+
+def _build_shift_table() -> array:
+    # Index: (shift << 9) | (carry flag << 4) | value for the CB rotate, shift and swap ops
+    table = array('H')
+
+    for shift in range(0, 8):
+        for carry_bit in (0, 1):
+            for value in range(0, 0x100):
+                # Zero is checked before masking to 8 bits, same as the scalar CPU always has
+                if shift == SHIFT_RLC:
+                    shifted_value, carry_out = (value << 1) | (value >> 7), value & 0x80
+                elif shift == SHIFT_RRC:
+                    shifted_value, carry_out = (value >> 1) | (value << 7), value & 0x01
+                elif shift == SHIFT_RL:
+                    shifted_value, carry_out = (value << 1) | carry_bit, value & 0x80
+                elif shift == SHIFT_RR:
+                    shifted_value, carry_out = (value >> 1) | (carry_bit << 7), value & 0x01
+                elif shift == SHIFT_SLA:
+                    shifted_value, carry_out = value << 1, value & 0x80
+                elif shift == SHIFT_SRA:
+                    shifted_value, carry_out = (value >> 1) | (value & 0x80), value & 0x01
+                elif shift == SHIFT_SWAP:
+                    shifted_value, carry_out = (value >> 4) | (value << 4), 0
+                else:
+                    shifted_value, carry_out = value >> 1, value & 0x01
+
+                table.append(_pack(shifted_value, shifted_value == 0, False, False, carry_out))
+
+    return table
+
+
+ADD_TABLE = _build_add_table()
+SUBTRACT_TABLE = _build_subtract_table()
+INCREMENT_TABLE = _build_increment_table()
+DECREMENT_TABLE = _build_decrement_table()
+DECIMAL_ADJUST_TABLE = _build_decimal_adjust_table()
+SHIFT_TABLE = _build_shift_table()
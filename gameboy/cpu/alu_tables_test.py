@@ -0,0 +1,66 @@
+from gameboy.cpu import alu_tables
+
+
+def _lookup_two_operands(table, register_value: int, value: int, carry: bool=False) -> (int, int):
+    result = table[((0x10 if carry else 0) << 12) | (register_value << 8) | value]
+
+    return result >> 8, result & 0xFF
+
+
+def test_alu_tables_sizes():
+    assert len(alu_tables.ADD_TABLE) == 0x20000
+    assert len(alu_tables.SUBTRACT_TABLE) == 0x20000
+    assert len(alu_tables.INCREMENT_TABLE) == 0x200
+    assert len(alu_tables.DECREMENT_TABLE) == 0x200
+    assert len(alu_tables.DECIMAL_ADJUST_TABLE) == 0x1000
+    assert len(alu_tables.SHIFT_TABLE) == 0x1000
+
+
+def test_alu_tables_add():
+    assert _lookup_two_operands(alu_tables.ADD_TABLE, 0x3A, 0xC6) == (0x00, 0xB0)
+    assert _lookup_two_operands(alu_tables.ADD_TABLE, 0x0E, 0x01) == (0x0F, 0x00)
+    assert _lookup_two_operands(alu_tables.ADD_TABLE, 0x0E, 0x01, carry=True) == (0x10, 0x20)
+    assert _lookup_two_operands(alu_tables.ADD_TABLE, 0xFF, 0x00, carry=True) == (0x00, 0xB0)
+
+
+def test_alu_tables_subtract():
+    assert _lookup_two_operands(alu_tables.SUBTRACT_TABLE, 0x3E, 0x3E) == (0x00, 0xC0)
+    assert _lookup_two_operands(alu_tables.SUBTRACT_TABLE, 0x3E, 0x0F) == (0x2F, 0x60)
+    assert _lookup_two_operands(alu_tables.SUBTRACT_TABLE, 0x3E, 0x40) == (0xFE, 0x50)
+    assert _lookup_two_operands(alu_tables.SUBTRACT_TABLE, 0x3B, 0x2A, carry=True) == (0x10, 0x40)
+
+
+def test_alu_tables_increment_keeps_carry():
+    assert alu_tables.INCREMENT_TABLE[0xFF] == 0x00A0
+    assert alu_tables.INCREMENT_TABLE[0x100 | 0x0F] == 0x1030
+    assert alu_tables.INCREMENT_TABLE[0x100 | 0x01] == 0x0210
+
+
+def test_alu_tables_decrement_keeps_carry():
+    assert alu_tables.DECREMENT_TABLE[0x01] == 0x00C0
+    assert alu_tables.DECREMENT_TABLE[0x100 | 0x10] == 0x0F70
+    assert alu_tables.DECREMENT_TABLE[0x100 | 0x00] == 0xFF70
+
+
+def test_alu_tables_decimal_adjust():
+    # 0x45 + 0x38 = 0x7D, adjusted back to BCD 83
+    assert alu_tables.DECIMAL_ADJUST_TABLE[0x7D] == 0x8300
+    # 0x99 + 0x01 = 0x9A, adjusted to 00 with carry, the result is masked to 8 bits
+    assert alu_tables.DECIMAL_ADJUST_TABLE[0x9A] == 0x0090
+    # 0x10 - 0x01 = 0x0F with half carry, adjusted to 09 and subtract kept
+    assert alu_tables.DECIMAL_ADJUST_TABLE[(0x60 << 4) | 0x0F] == 0x0940
+
+
+def test_alu_tables_shift():
+    def shift(shift_type: int, value: int, carry: bool=False) -> int:
+        return alu_tables.SHIFT_TABLE[(shift_type << 9) | ((0x10 if carry else 0) << 4) | value]
+
+    assert shift(alu_tables.SHIFT_RLC, 0x85) == 0x0B10
+    assert shift(alu_tables.SHIFT_RRC, 0x01) == 0x8010
+    assert shift(alu_tables.SHIFT_RL, 0x80) == 0x0010
+    assert shift(alu_tables.SHIFT_RL, 0x00, carry=True) == 0x0100
+    assert shift(alu_tables.SHIFT_RR, 0x01, carry=True) == 0x8010
+    assert shift(alu_tables.SHIFT_SLA, 0x00) == 0x0080
+    assert shift(alu_tables.SHIFT_SRA, 0x81) == 0xC010
+    assert shift(alu_tables.SHIFT_SWAP, 0xF1) == 0x1F00
+    assert shift(alu_tables.SHIFT_SRL, 0x01) == 0x0090
@@ -1,6 +1,14 @@
+import copy
+
 from gameboy.cpu.cpu_registers import CPURegisters
+from gameboy.cpu.decode_cache import DecodeCache
+from gameboy.cpu.instruction_fuser import InstructionFuser
+from gameboy.cpu.loop_accelerator import LoopAccelerator
+from gameboy.cpu.opcode_profiler import OpcodeProfiler
+from gameboy.cpu.pc_sampling_profiler import PCSamplingProfiler
 from gameboy.cycle_clock import CycleClock
 from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.memory.watchpoint import Watchpoint
 
 
 class CPU:
@@ -15,6 +23,15 @@ class CPU:
         self._halt_bug = False
         self._is_stopped = False
         self._interrupt_enable_pending = False
+        self._opcode_profiler: OpcodeProfiler = None
+        self._pc_sampling_profiler: PCSamplingProfiler = None
+        self._instruction_fuser: InstructionFuser = None
+        self._loop_accelerator: LoopAccelerator = None
+
+        # Operands of the instruction being run when it came out of the decode cache
+        self._decode_cache = DecodeCache()
+        self._cached_operands = b''
+        self._cached_operands_address = 0
 
     def reset(self):
         self._registers.reset()
@@ -25,6 +42,102 @@ class CPU:
         self._is_stopped = False
         self._interrupt_enable_pending = False
 
+    def fork(self, memory_unit: MemoryUnit) -> 'CPU':
+        forked_cpu = copy.copy(self)
+
+        forked_cpu._memory_unit = memory_unit
+        forked_cpu._registers = copy.copy(self._registers)
+        forked_cpu._cycle_clock = copy.copy(self._cycle_clock)
+        forked_cpu._cpu_instructions = CPUInstructions(forked_cpu)
+        forked_cpu._opcode_profiler = None
+        forked_cpu._pc_sampling_profiler = None
+
+        # The fused table is built around this CPU, forks get their own
+        forked_cpu._instruction_fuser = None
+
+        if self._instruction_fuser is not None:
+            forked_cpu.enable_instruction_fusion(InstructionFuser(self._instruction_fuser.get_sequences()))
+
+        forked_cpu._loop_accelerator = None
+
+        if self._loop_accelerator is not None:
+            forked_cpu.enable_loop_acceleration()
+
+        # A watched _execute_operation is bound to this CPU, the fork picks up its own memory unit's watchpoints
+        forked_cpu.__dict__.pop('_execute_operation', None)
+        forked_cpu.update_execute_watchpoints()
+
+        return forked_cpu
+
+    def get_cpu_instructions(self) -> 'CPUInstructions':
+        return self._cpu_instructions
+
+    def get_opcode_profiler(self) -> OpcodeProfiler:
+        return self._opcode_profiler
+
+    def enable_opcode_profiler(self, opcode_profiler: OpcodeProfiler=None) -> OpcodeProfiler:
+        # Swaps in an instrumented instruction table, the plain one runs untouched while disabled
+        self.disable_opcode_profiler()
+
+        self._opcode_profiler = opcode_profiler or OpcodeProfiler()
+        self._opcode_profiler.attach(self)
+
+        return self._opcode_profiler
+
+    def disable_opcode_profiler(self) -> None:
+        if self._opcode_profiler is not None:
+            self._opcode_profiler.detach()
+            self._opcode_profiler = None
+
+    def get_pc_sampling_profiler(self) -> PCSamplingProfiler:
+        return self._pc_sampling_profiler
+
+    def enable_pc_sampling_profiler(self, pc_sampling_profiler: PCSamplingProfiler=None) -> PCSamplingProfiler:
+        self.disable_pc_sampling_profiler()
+
+        self._pc_sampling_profiler = pc_sampling_profiler or PCSamplingProfiler()
+        self._pc_sampling_profiler.attach(self)
+
+        return self._pc_sampling_profiler
+
+    def disable_pc_sampling_profiler(self) -> None:
+        if self._pc_sampling_profiler is not None:
+            self._pc_sampling_profiler.detach()
+            self._pc_sampling_profiler = None
+
+    def get_instruction_fuser(self) -> InstructionFuser:
+        return self._instruction_fuser
+
+    def enable_instruction_fusion(self, instruction_fuser: InstructionFuser=None) -> InstructionFuser:
+        # Attach after any profiler so the fused table wraps the instrumented one
+        self.disable_instruction_fusion()
+
+        self._instruction_fuser = instruction_fuser or InstructionFuser()
+        self._instruction_fuser.attach(self)
+
+        return self._instruction_fuser
+
+    def disable_instruction_fusion(self) -> None:
+        if self._instruction_fuser is not None:
+            self._instruction_fuser.detach()
+            self._instruction_fuser = None
+
+    def get_loop_accelerator(self) -> LoopAccelerator:
+        return self._loop_accelerator
+
+    def enable_loop_acceleration(self, loop_accelerator: LoopAccelerator=None) -> LoopAccelerator:
+        self.disable_loop_acceleration()
+
+        self._loop_accelerator = loop_accelerator or LoopAccelerator()
+        self._loop_accelerator.attach(self)
+
+        return self._loop_accelerator
+
+    def disable_loop_acceleration(self) -> None:
+        if self._loop_accelerator is not None:
+            self._loop_accelerator.detach()
+            self._loop_accelerator = None
+
     def get_interrupt_enable_pending(self) -> bool:
         return self._interrupt_enable_pending
 
@@ -44,6 +157,26 @@ class CPU:
             self._registers.enable_interrupts()
             self._interrupt_enable_pending = False
 
+        program_counter = self._registers.get_program_counter()
+
+        if program_counter < 0x8000 and not self._halt_bug:
+            bank = self._memory_unit.get_code_bank(program_counter)
+
+            if bank is not None:
+                decoded_instruction = self._decode_cache.get(self._memory_unit.get_cartridge_rom(), bank,
+                                                             program_counter)
+
+                if decoded_instruction is not None:
+                    op_code, self._cached_operands = decoded_instruction
+                    self._cached_operands_address = program_counter + 1
+                    self._registers.set_program_counter(program_counter + 1)
+
+                    self._execute_operation(op_code)
+
+                    return
+
+        # Another bank may be mapped in by now
+        self._cached_operands = b''
         op_code = self.read_immediate_byte()
 
         if self._halt_bug:
@@ -53,9 +186,20 @@ class CPU:
         self._execute_operation(op_code)
 
     def _execute_operation(self, op_code: int):
-        print(f'Executed op code {hex(op_code)}')
         self._cpu_instructions.execute_instruction(op_code)
 
+    def _execute_watched_operation(self, op_code: int):
+        # The op code has been fetched, so the instruction started one byte back
+        self._memory_unit.check_execute_watchpoints((self._registers.get_program_counter() - 1) & 0xFFFF, op_code)
+        self._cpu_instructions.execute_instruction(op_code)
+
+    def update_execute_watchpoints(self) -> None:
+        # Call after changing execute watchpoints on the memory unit. Only checks the program counter while some are set.
+        if self._memory_unit.has_watchpoints(Watchpoint.AccessType.EXECUTE):
+            self._execute_operation = self._execute_watched_operation
+        elif '_execute_operation' in self.__dict__:
+            del self._execute_operation
+
     def get_registers(self) -> CPURegisters:
         return self._registers
 
@@ -129,7 +273,20 @@ class CPU:
     def stop(self):
         self._is_stopped = True
 
+    def is_stopped(self) -> bool:
+        return self._is_stopped
+
+    def clear_stopped(self) -> None:
+        self._is_stopped = False
+
     def read_immediate_word(self) -> int:
+        program_counter = self._registers.get_program_counter()
+
+        if program_counter == self._cached_operands_address and len(self._cached_operands) == 2:
+            self._registers.set_program_counter(program_counter + 2)
+
+            return int.from_bytes(self._cached_operands, 'little')
+
         low_byte = self.read_immediate_byte()
         high_byte = self.read_immediate_byte()
 
@@ -141,8 +298,16 @@ class CPU:
         return unsigned_byte if unsigned_byte <= 127 else unsigned_byte - 256
 
     def read_immediate_byte(self) -> int:
-        self._registers.increment_program_counter()
-        return self._memory_unit.read_byte(self._registers.get_program_counter() - 1)
+        program_counter = self._registers.get_program_counter()
+        self._registers.set_program_counter(program_counter + 1)
+
+        # Anything past the cached operands (the next fused instruction, say) is fetched as usual
+        operand_index = program_counter - self._cached_operands_address
+
+        if 0 <= operand_index < len(self._cached_operands):
+            return self._cached_operands[operand_index]
+
+        return self._memory_unit.read_byte(program_counter)
 
     def push_word_to_stack(self, value):
         stack_pointer = self._registers.get_stack_pointer()
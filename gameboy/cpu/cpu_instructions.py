@@ -1,558 +1,29 @@
+from gameboy.cpu import alu_tables
 from gameboy.cpu.cpu import CPU
 
 
 class CPUInstructions:
+    # Op code to handler, filled in below the class
+    INSTRUCTION_TABLE: list = None
+
     def __init__(self, cpu: CPU):
         self._cpu = cpu
+        self._instruction_table: list = self.INSTRUCTION_TABLE
+
+    def get_instruction_table(self) -> list:
+        return self._instruction_table
+
+    def set_instruction_table(self, instruction_table: list) -> None:
+        # Swapping the whole table lets instrumentation cost nothing while it's off
+        self._instruction_table = instruction_table
 
     def execute_instruction(self, op_code: int):
-        # ~`~ No-op ~`~
-        if op_code == 0x00:
-            return self.no_op()
-
-        # ~`~ Register-to-register loads ~`~
-        if op_code == 0x40:
-            return self.load('b', 'b')
-        if op_code == 0x41:
-            return self.load('b', 'c')
-        if op_code == 0x42:
-            return self.load('b', 'd')
-        if op_code == 0x43:
-            return self.load('b', 'e')
-        if op_code == 0x44:
-            return self.load('b', 'h')
-        if op_code == 0x45:
-            return self.load('b', 'l')
-        if op_code == 0x47:
-            return self.load('b', 'a')
-        if op_code == 0x48:
-            return self.load('c', 'b')
-        if op_code == 0x49:
-            return self.load('c', 'c')
-        if op_code == 0x4A:
-            return self.load('c', 'd')
-        if op_code == 0x4B:
-            return self.load('c', 'e')
-        if op_code == 0x4C:
-            return self.load('c', 'h')
-        if op_code == 0x4D:
-            return self.load('c', 'l')
-        if op_code == 0x4F:
-            return self.load('c', 'a')
-        if op_code == 0x50:
-            return self.load('d', 'b')
-        if op_code == 0x51:
-            return self.load('d', 'c')
-        if op_code == 0x52:
-            return self.load('d', 'd')
-        if op_code == 0x53:
-            return self.load('d', 'e')
-        if op_code == 0x54:
-            return self.load('d', 'h')
-        if op_code == 0x55:
-            return self.load('d', 'l')
-        if op_code == 0x57:
-            return self.load('d', 'a')
-        if op_code == 0x58:
-            return self.load('e', 'b')
-        if op_code == 0x59:
-            return self.load('e', 'c')
-        if op_code == 0x5A:
-            return self.load('e', 'd')
-        if op_code == 0x5B:
-            return self.load('e', 'e')
-        if op_code == 0x5C:
-            return self.load('e', 'h')
-        if op_code == 0x5D:
-            return self.load('e', 'l')
-        if op_code == 0x5F:
-            return self.load('e', 'a')
-        if op_code == 0x60:
-            return self.load('h', 'b')
-        if op_code == 0x61:
-            return self.load('h', 'c')
-        if op_code == 0x62:
-            return self.load('h', 'd')
-        if op_code == 0x63:
-            return self.load('h', 'e')
-        if op_code == 0x64:
-            return self.load('h', 'h')
-        if op_code == 0x65:
-            return self.load('h', 'l')
-        if op_code == 0x67:
-            return self.load('h', 'a')
-        if op_code == 0x68:
-            return self.load('l', 'b')
-        if op_code == 0x69:
-            return self.load('l', 'c')
-        if op_code == 0x6A:
-            return self.load('l', 'd')
-        if op_code == 0x6B:
-            return self.load('l', 'e')
-        if op_code == 0x6C:
-            return self.load('l', 'h')
-        if op_code == 0x6D:
-            return self.load('l', 'l')
-        if op_code == 0x6F:
-            return self.load('l', 'a')
-        if op_code == 0x78:
-            return self.load('a', 'b')
-        if op_code == 0x79:
-            return self.load('a', 'c')
-        if op_code == 0x7A:
-            return self.load('a', 'd')
-        if op_code == 0x7B:
-            return self.load('a', 'e')
-        if op_code == 0x7C:
-            return self.load('a', 'h')
-        if op_code == 0x7D:
-            return self.load('a', 'l')
-        if op_code == 0x7F:
-            return self.load('a', 'a')
-
-        # ~`~ Memory-to-register loads ~`~
-        if op_code == 0x46:
-            return self.load_register_with_memory('b')
-        if op_code == 0x4E:
-            return self.load_register_with_memory('c')
-        if op_code == 0x56:
-            return self.load_register_with_memory('d')
-        if op_code == 0x5E:
-            return self.load_register_with_memory('e')
-        if op_code == 0x66:
-            return self.load_register_with_memory('h')
-        if op_code == 0x6E:
-            return self.load_register_with_memory('l')
-        if op_code == 0x7E:
-            return self.load_register_with_memory('a')
-
-        # ~`~ Register-to-memory loads ~`~
-        if op_code == 0x70:
-            return self.load_memory_with_register('b')
-        if op_code == 0x71:
-            return self.load_memory_with_register('c')
-        if op_code == 0x72:
-            return self.load_memory_with_register('d')
-        if op_code == 0x73:
-            return self.load_memory_with_register('e')
-        if op_code == 0x74:
-            return self.load_memory_with_register('h')
-        if op_code == 0x75:
-            return self.load_memory_with_register('l')
-        if op_code == 0x77:
-            return self.load_memory_with_register('a')
-
-        # ~`~ Immediate to HL address ~`~
-        if op_code == 0x36:
-            return self.load_memory_with_immediate()
-
-        # ~`~ Special, "a" register only loads ~`~
-        if op_code == 0x0A:
-            return self.load_register_with_memory('a', memory_register_16='bc')
-        if op_code == 0x1A:
-            return self.load_register_with_memory('a', memory_register_16='de')
-        if op_code == 0x02:
-            return self.load_memory_with_register('a', memory_register_16='bc')
-        if op_code == 0x12:
-            return self.load_memory_with_register('a', memory_register_16='de')
-        if op_code == 0xEA:
-            return self.load_immediate_memory_with_register('a')
-        if op_code == 0xFA:
-            return self.load_register_with_immediate_memory('a')
-        if op_code == 0x22:
-            return self.load_memory_with_register('a', increment_memory_register=True)
-        if op_code == 0x2A:
-            return self.load_register_with_memory('a', increment_memory_register=True)
-        if op_code == 0x32:
-            return self.load_memory_with_register('a', decrement_memory_register=True)
-        if op_code == 0x3A:
-            return self.load_register_with_memory('a', decrement_memory_register=True)
-        if op_code == 0xE0:
-            return self.load_immediate_memory_with_register('a', high_memory_load=True)
-        if op_code == 0xE2:
-            return self.load_offset_memory_at_register_with_register('c', 'a')
-        if op_code == 0xF0:
-            return self.load_register_with_immediate_memory('a', high_memory_read=True)
-        if op_code == 0xF2:
-            return self.load_register_with_offset_memory_at_register('a', 'c')
-
-        # ~`~ Immediate-to-register loads ~`~
-        if op_code == 0x06:
-            return self.load_register_with_immediate_byte('b')
-        if op_code == 0x0E:
-            return self.load_register_with_immediate_byte('c')
-        if op_code == 0x16:
-            return self.load_register_with_immediate_byte('d')
-        if op_code == 0x1E:
-            return self.load_register_with_immediate_byte('e')
-        if op_code == 0x26:
-            return self.load_register_with_immediate_byte('h')
-        if op_code == 0x2E:
-            return self.load_register_with_immediate_byte('l')
-        if op_code == 0x3E:
-            return self.load_register_with_immediate_byte('a')
-        if op_code == 0x01:
-            return self.load_register_with_immediate_word('bc')
-        if op_code == 0x11:
-            return self.load_register_with_immediate_word('de')
-        if op_code == 0x21:
-            return self.load_register_with_immediate_word('hl')
-        if op_code == 0x31:
-            return self.load_register_with_immediate_word('sp')
-
-        # ~`~ Stack pointer ~`~
-        if op_code == 0x08:
-            return self.load_immediate_memory_with_16_bit_register('sp')
-        if op_code == 0xF9:
-            return self.load_16_bit('hl', 'sp')
-        if op_code == 0xF8:
-            return self.load_16_bit('sp', 'hl', immediate_signed_offset=True)
-
-        # ~`~ Pop & push to stack ~`~
-        if op_code == 0xC1:
-            return self.pop_stack_to_register('bc')
-        if op_code == 0xD1:
-            return self.pop_stack_to_register('de')
-        if op_code == 0xE1:
-            return self.pop_stack_to_register('hl')
-        if op_code == 0xF1:
-            return self.pop_stack_to_register('af')
-        if op_code == 0xC5:
-            return self.push_register_to_stack('bc')
-        if op_code == 0xD5:
-            return self.push_register_to_stack('de')
-        if op_code == 0xE5:
-            return self.push_register_to_stack('hl')
-        if op_code == 0xF5:
-            return self.push_register_to_stack('af')
-
-        # ~`~ Add ~`~
-        if op_code == 0x80:
-            return self.add_8_bit_registers('a', 'b')
-        if op_code == 0x81:
-            return self.add_8_bit_registers('a', 'c')
-        if op_code == 0x82:
-            return self.add_8_bit_registers('a', 'd')
-        if op_code == 0x83:
-            return self.add_8_bit_registers('a', 'e')
-        if op_code == 0x84:
-            return self.add_8_bit_registers('a', 'h')
-        if op_code == 0x85:
-            return self.add_8_bit_registers('a', 'l')
-        if op_code == 0x87:
-            return self.add_8_bit_registers('a', 'a')
-        if op_code == 0x86:
-            return self.add_8_bit_hl_memory_to_register('a')
-        if op_code == 0xC6:
-            return self.add_8_bit_immediate_to_register('a')
-
-        # ~`~ Add with carry ~`~
-        if op_code == 0x88:
-            return self.add_8_bit_registers('a', 'b', with_carry_bit=True)
-        if op_code == 0x89:
-            return self.add_8_bit_registers('a', 'c', with_carry_bit=True)
-        if op_code == 0x8A:
-            return self.add_8_bit_registers('a', 'd', with_carry_bit=True)
-        if op_code == 0x8B:
-            return self.add_8_bit_registers('a', 'e', with_carry_bit=True)
-        if op_code == 0x8C:
-            return self.add_8_bit_registers('a', 'h', with_carry_bit=True)
-        if op_code == 0x8D:
-            return self.add_8_bit_registers('a', 'l', with_carry_bit=True)
-        if op_code == 0x8F:
-            return self.add_8_bit_registers('a', 'a', with_carry_bit=True)
-        if op_code == 0x8E:
-            return self.add_8_bit_hl_memory_to_register('a', with_carry_bit=True)
-        if op_code == 0xCE:
-            return self.add_8_bit_immediate_to_register('a', with_carry_bit=True)
-
-        # ~`~ Subtract ~`~
-        if op_code == 0x90:
-            return self.subtract_8_bit_registers('a', 'b')
-        if op_code == 0x91:
-            return self.subtract_8_bit_registers('a', 'c')
-        if op_code == 0x92:
-            return self.subtract_8_bit_registers('a', 'd')
-        if op_code == 0x93:
-            return self.subtract_8_bit_registers('a', 'e')
-        if op_code == 0x94:
-            return self.subtract_8_bit_registers('a', 'h')
-        if op_code == 0x95:
-            return self.subtract_8_bit_registers('a', 'l')
-        if op_code == 0x97:
-            return self.subtract_8_bit_registers('a', 'a')
-        if op_code == 0x96:
-            return self.subtract_8_bit_hl_memory_to_register('a')
-        if op_code == 0xD6:
-            return self.subtract_8_bit_immediate_to_register('a')
-
-        # ~`~ Subtract with carry ~`~
-        if op_code == 0x98:
-            return self.subtract_8_bit_registers('a', 'b', with_carry_bit=True)
-        if op_code == 0x99:
-            return self.subtract_8_bit_registers('a', 'c', with_carry_bit=True)
-        if op_code == 0x9A:
-            return self.subtract_8_bit_registers('a', 'd', with_carry_bit=True)
-        if op_code == 0x9B:
-            return self.subtract_8_bit_registers('a', 'e', with_carry_bit=True)
-        if op_code == 0x9C:
-            return self.subtract_8_bit_registers('a', 'h', with_carry_bit=True)
-        if op_code == 0x9D:
-            return self.subtract_8_bit_registers('a', 'l', with_carry_bit=True)
-        if op_code == 0x9F:
-            return self.subtract_8_bit_registers('a', 'a', with_carry_bit=True)
-        if op_code == 0x9E:
-            return self.subtract_8_bit_hl_memory_to_register('a', with_carry_bit=True)
-        if op_code == 0xDE:
-            return self.subtract_8_bit_immediate_to_register('a', with_carry_bit=True)
-
-        # ~`~ Increment ~`~
-        if op_code == 0x04:
-            return self.increment_8_bit_register('b')
-        if op_code == 0x0C:
-            return self.increment_8_bit_register('c')
-        if op_code == 0x14:
-            return self.increment_8_bit_register('d')
-        if op_code == 0x1C:
-            return self.increment_8_bit_register('e')
-        if op_code == 0x24:
-            return self.increment_8_bit_register('h')
-        if op_code == 0x2C:
-            return self.increment_8_bit_register('l')
-        if op_code == 0x3C:
-            return self.increment_8_bit_register('a')
-
-        # ~`~ Decrement ~`~
-        if op_code == 0x05:
-            return self.decrement_8_bit_register('b')
-        if op_code == 0x0D:
-            return self.decrement_8_bit_register('c')
-        if op_code == 0x15:
-            return self.decrement_8_bit_register('d')
-        if op_code == 0x1D:
-            return self.decrement_8_bit_register('e')
-        if op_code == 0x25:
-            return self.decrement_8_bit_register('h')
-        if op_code == 0x2D:
-            return self.decrement_8_bit_register('l')
-        if op_code == 0x3D:
-            return self.decrement_8_bit_register('a')
-
-        # ~`~ Compare ~`~
-        if op_code == 0xB8:
-            return self.subtract_8_bit_registers('a', 'b', compare_only=True)
-        if op_code == 0xB9:
-            return self.subtract_8_bit_registers('a', 'c', compare_only=True)
-        if op_code == 0xBA:
-            return self.subtract_8_bit_registers('a', 'd', compare_only=True)
-        if op_code == 0xBB:
-            return self.subtract_8_bit_registers('a', 'e', compare_only=True)
-        if op_code == 0xBC:
-            return self.subtract_8_bit_registers('a', 'h', compare_only=True)
-        if op_code == 0xBD:
-            return self.subtract_8_bit_registers('a', 'l', compare_only=True)
-        if op_code == 0xBF:
-            return self.subtract_8_bit_registers('a', 'a', compare_only=True)
-        if op_code == 0xBE:
-            return self.subtract_8_bit_hl_memory_to_register('a', compare_only=True)
-        if op_code == 0xFE:
-            return self.subtract_8_bit_immediate_to_register('a', compare_only=True)
-
-        # ~`~ Bitwise ~`~
-        if op_code == 0xA0:
-            return self.bitwise_and_8_bit_register('a', 'b')
-        if op_code == 0xA1:
-            return self.bitwise_and_8_bit_register('a', 'c')
-        if op_code == 0xA2:
-            return self.bitwise_and_8_bit_register('a', 'd')
-        if op_code == 0xA3:
-            return self.bitwise_and_8_bit_register('a', 'e')
-        if op_code == 0xA4:
-            return self.bitwise_and_8_bit_register('a', 'h')
-        if op_code == 0xA5:
-            return self.bitwise_and_8_bit_register('a', 'l')
-        if op_code == 0xA7:
-            return self.bitwise_and_8_bit_register('a', 'a')
-        if op_code == 0xB0:
-            return self.bitwise_or_8_bit_register('a', 'b')
-        if op_code == 0xB1:
-            return self.bitwise_or_8_bit_register('a', 'c')
-        if op_code == 0xB2:
-            return self.bitwise_or_8_bit_register('a', 'd')
-        if op_code == 0xB3:
-            return self.bitwise_or_8_bit_register('a', 'e')
-        if op_code == 0xB4:
-            return self.bitwise_or_8_bit_register('a', 'h')
-        if op_code == 0xB5:
-            return self.bitwise_or_8_bit_register('a', 'l')
-        if op_code == 0xB7:
-            return self.bitwise_or_8_bit_register('a', 'a')
-        if op_code == 0xA8:
-            return self.bitwise_xor_8_bit_register('a', 'b')
-        if op_code == 0xA9:
-            return self.bitwise_xor_8_bit_register('a', 'c')
-        if op_code == 0xAA:
-            return self.bitwise_xor_8_bit_register('a', 'd')
-        if op_code == 0xAB:
-            return self.bitwise_xor_8_bit_register('a', 'e')
-        if op_code == 0xAC:
-            return self.bitwise_xor_8_bit_register('a', 'h')
-        if op_code == 0xAD:
-            return self.bitwise_xor_8_bit_register('a', 'l')
-        if op_code == 0xAF:
-            return self.bitwise_xor_8_bit_register('a', 'a')
-        if op_code == 0xA6:
-            return self.bitwise_and_8_bit_register_with_memory('a', 'hl')
-        if op_code == 0xB6:
-            return self.bitwise_or_8_bit_register_with_memory('a', 'hl')
-        if op_code == 0xAE:
-            return self.bitwise_xor_8_bit_register_with_memory('a', 'hl')
-        if op_code == 0xE6:
-            return self.bitwise_and_8_bit_register_with_immediate_byte('a')
-        if op_code == 0xF6:
-            return self.bitwise_or_8_bit_register_with_immediate_byte('a')
-        if op_code == 0xEE:
-            return self.bitwise_xor_8_bit_register_with_immediate_byte('a')
-        if op_code == 0x07:
-            return self.rotate_8_bit_register_left('a')
-        if op_code == 0x0F:
-            return self.rotate_8_bit_register_right('a')
-        if op_code == 0x17:
-            return self.rotate_8_bit_register_left('a', with_carry_bit=True)
-        if op_code == 0x1F:
-            return self.rotate_8_bit_register_right('a', with_carry_bit=True)
-        if op_code == 0x2F:
-            return self.complement_8_bit_register('a')
-
-        # ~`~ Extended operations ~`~
-        if op_code == 0xCB:
-            return self.execute_extended_operation()
-
-        # ~`~ 16 bit math ~`~
-        if op_code == 0x09:
-            return self.add_16_bit_registers('hl', 'bc')
-        if op_code == 0x19:
-            return self.add_16_bit_registers('hl', 'de')
-        if op_code == 0x29:
-            return self.add_16_bit_registers('hl', 'hl')
-        if op_code == 0x39:
-            return self.add_16_bit_registers('hl', 'sp')
-        if op_code == 0xE8:
-            return self.add_signed_immediate_to_16_bit_register('sp')
-        if op_code == 0x03:
-            return self.increment_16_bit_register('bc')
-        if op_code == 0x13:
-            return self.increment_16_bit_register('de')
-        if op_code == 0x23:
-            return self.increment_16_bit_register('hl')
-        if op_code == 0x33:
-            return self.increment_16_bit_register('sp')
-        if op_code == 0x0B:
-            return self.decrement_16_bit_register('bc')
-        if op_code == 0x1B:
-            return self.decrement_16_bit_register('de')
-        if op_code == 0x2B:
-            return self.decrement_16_bit_register('hl')
-        if op_code == 0x3B:
-            return self.decrement_16_bit_register('sp')
-        if op_code == 0x34:
-            return self.increment_memory_at_register('hl')
-        if op_code == 0x35:
-            return self.decrement_memory_at_register('hl')
-
-        # ~`~ Jump ~`~
-        if op_code == 0xE9:
-            return self.jump_to_16_bit_register('hl')
-        if op_code == 0xC3:
-            return self.jump_to_immediate()
-        if op_code == 0xC2:
-            return self.jump_to_immediate(conditional_zero_flag=False)
-        if op_code == 0xCA:
-            return self.jump_to_immediate(conditional_zero_flag=True)
-        if op_code == 0xD2:
-            return self.jump_to_immediate(conditional_carry_flag=False)
-        if op_code == 0xDA:
-            return self.jump_to_immediate(conditional_carry_flag=True)
-        if op_code == 0x18:
-            return self.jump_to_immediate(relative=True)
-        if op_code == 0x20:
-            return self.jump_to_immediate(relative=True, conditional_zero_flag=False)
-        if op_code == 0x28:
-            return self.jump_to_immediate(relative=True, conditional_zero_flag=True)
-        if op_code == 0x30:
-            return self.jump_to_immediate(relative=True, conditional_carry_flag=False)
-        if op_code == 0x38:
-            return self.jump_to_immediate(relative=True, conditional_carry_flag=True)
-
-        # ~`~ Call ~`~
-        if op_code == 0xC4:
-            return self.call_immediate(conditional_zero_flag=False)
-        if op_code == 0xCC:
-            return self.call_immediate(conditional_zero_flag=True)
-        if op_code == 0xD4:
-            return self.call_immediate(conditional_carry_flag=False)
-        if op_code == 0xDC:
-            return self.call_immediate(conditional_carry_flag=True)
-        if op_code == 0xCD:
-            return self.call_immediate()
-
-        # ~`~ Reset ~`~
-        if op_code == 0xC7:
-            return self.reset(0x00)
-        if op_code == 0xCF:
-            return self.reset(0x08)
-        if op_code == 0xD7:
-            return self.reset(0x10)
-        if op_code == 0xDF:
-            return self.reset(0x18)
-        if op_code == 0xE7:
-            return self.reset(0x20)
-        if op_code == 0xEF:
-            return self.reset(0x28)
-        if op_code == 0xF7:
-            return self.reset(0x30)
-        if op_code == 0xFF:
-            return self.reset(0x38)
-
-        # ~`~ Return ~`~
-        if op_code == 0xC9:
-            return self.return_()
-        if op_code == 0xC0:
-            return self.return_(conditional_zero_flag=False)
-        if op_code == 0xC8:
-            return self.return_(conditional_zero_flag=True)
-        if op_code == 0xD0:
-            return self.return_(conditional_carry_flag=False)
-        if op_code == 0xD8:
-            return self.return_(conditional_carry_flag=True)
-        if op_code == 0xD9:
-            return self.return_(enable_interrupts=True)
-
-        # ~`~ Enable/disable interrupts ~`~
-        if op_code == 0xF3:
-            return self.disable_interrupts()
-        if op_code == 0xFB:
-            return self.enable_interrupts()
-
-        # ~`~ Halt ~`~
-        if op_code == 0x76:
-            return self.halt()
-
-        # ~`~ DAA ~`~
-        if op_code == 0x27:
-            return self.decimal_adjust_accumulator()
-
-        # ~`~ Stop ~`~
-        if op_code == 0x10:
-            return self.stop()
-
-        # ~`~ Carry flag ops ~`~
-        if op_code == 0x37:
-            return self.set_carry_flag()
-        if op_code == 0x3F:
-            return self.complement_carry_flag()
-
-        raise NotImplementedError(f'Opcode {op_code} not implemented.')
+        instruction = self._instruction_table[op_code]
+
+        if instruction is None:
+            raise NotImplementedError(f'Opcode {op_code} not implemented.')
+
+        return instruction(self)
 
     def no_op(self):
         self._cpu.get_cycle_clock().tick()
@@ -834,23 +305,15 @@ class CPUInstructions:
         self._cpu.get_cycle_clock().tick(2)
 
     def _add_8_bit(self, add_value: int, result_register: str, with_carry_bit: bool=False):
+        registers = self._cpu.get_registers()
         result_register_name = self._get_8_bit_register_name_from_key(result_register)
         result_register_value = self._get_8_bit_register_value(result_register_name)
+        carry_flag = registers.read_flag_carry() if with_carry_bit else 0
 
-        sum_ = result_register_value + add_value
-        half_sum = (result_register_value & 0xF) + (add_value & 0xF)
+        result = alu_tables.ADD_TABLE[(carry_flag << 12) | (result_register_value << 8) | add_value]
 
-        if with_carry_bit and self._cpu.get_registers().read_flag_carry():
-            sum_ += 1
-            half_sum += 1
-
-        self._cpu.get_registers().update_flags(
-            zero=sum_ & 0xFF == 0,
-            subtract=False,
-            half_carry=half_sum > 0xF,
-            carry=sum_ > 0xFF)
-
-        self._set_8_bit_register_value(result_register_name, sum_ & 0xFF)
+        registers.set_flags(result & 0xFF)
+        self._set_8_bit_register_value(result_register_name, result >> 8)
 
     # add $reg16, $reg16: add two 16 bit registers together
     def add_16_bit_registers(self, result_register_16: str, add_register_16: str):
@@ -926,55 +389,41 @@ class CPUInstructions:
 
     def _subtract_8_bit(self, subtract_value: int, result_register: str,
                         with_carry_bit: bool=False, compare_only: bool=False):
+        registers = self._cpu.get_registers()
         result_register_name = self._get_8_bit_register_name_from_key(result_register)
         result_register_value = self._get_8_bit_register_value(result_register_name)
+        carry_flag = registers.read_flag_carry() if with_carry_bit else 0
 
-        sum_ = result_register_value - subtract_value
-
-        if with_carry_bit and self._cpu.get_registers().read_flag_carry():
-            sum_ -= 1
-            subtract_value += 1
+        result = alu_tables.SUBTRACT_TABLE[(carry_flag << 12) | (result_register_value << 8) | subtract_value]
 
-        self._cpu.get_registers().update_flags(
-            zero=sum_ & 0xFF == 0,
-            subtract=True,
-            half_carry=(result_register_value & 0x0F) < (subtract_value & 0x0F),
-            carry=subtract_value > result_register_value)
+        registers.set_flags(result & 0xFF)
 
         if not compare_only:
-            self._set_8_bit_register_value(result_register_name, sum_ & 0xFF)
+            self._set_8_bit_register_value(result_register_name, result >> 8)
 
     # inc $reg8: Increment 8 bit register
     def increment_8_bit_register(self, increment_register: str):
+        registers = self._cpu.get_registers()
         register_name = self._get_8_bit_register_name_from_key(increment_register)
         register_value = self._get_8_bit_register_value(register_name)
-        result = (register_value + 1) & 0xFF
 
-        self._set_8_bit_register_value(register_name, result)
+        result = alu_tables.INCREMENT_TABLE[(registers.read_flag_carry() << 4) | register_value]
 
-        self._cpu.get_registers().update_flags(
-            zero=result == 0,
-            subtract=False,
-            half_carry=(register_value & 0xF) == 0xF,
-            carry=self._cpu.get_registers().read_flag_carry() > 0
-        )
+        self._set_8_bit_register_value(register_name, result >> 8)
+        registers.set_flags(result & 0xFF)
 
         self._cpu.get_cycle_clock().tick(1)
 
     # dec $reg8: Decrement 8 bit register
     def decrement_8_bit_register(self, decrement_register: str):
+        registers = self._cpu.get_registers()
         register_name = self._get_8_bit_register_name_from_key(decrement_register)
         register_value = self._get_8_bit_register_value(register_name)
-        result = (register_value - 1) & 0xFF
 
-        self._set_8_bit_register_value(register_name, result)
+        result = alu_tables.DECREMENT_TABLE[(registers.read_flag_carry() << 4) | register_value]
 
-        self._cpu.get_registers().update_flags(
-            zero=result == 0,
-            subtract=True,
-            half_carry=(register_value & 0xF) == 0x0,
-            carry=self._cpu.get_registers().read_flag_carry() > 0
-        )
+        self._set_8_bit_register_value(register_name, result >> 8)
+        registers.set_flags(result & 0xFF)
 
         self._cpu.get_cycle_clock().tick(1)
 
@@ -1148,56 +597,39 @@ class CPUInstructions:
     # rl(c) $reg8: Rotate 8 bit register left
     # with_carry_bit will optionally consider the carry flag as an extra bit
     def rotate_8_bit_register_left(self, result_register: str, with_carry_bit: bool=False):
-        result_register_name = self._get_8_bit_register_name_from_key(result_register)
-        result_register_value = self._get_8_bit_register_value(result_register_name)
-        carry_bit = self._cpu.get_registers().read_flag_carry()
-
-        self._cpu.get_registers().update_flags(
-            zero=False,
-            subtract=False,
-            half_carry=False,
-            carry=(result_register_value & 0x80) > 0)
-
-        if with_carry_bit:
-            rotated_register_value = (result_register_value << 1) | (0x01 if carry_bit else 0x00)
-        else:
-            rotated_register_value = (result_register_value << 1) | (result_register_value >> 7)
-
-        self._set_8_bit_register_value(result_register_name, rotated_register_value & 0xFF)
+        self._rotate_8_bit_register(result_register, alu_tables.SHIFT_RL if with_carry_bit else alu_tables.SHIFT_RLC)
 
         self._cpu.get_cycle_clock().tick(1)
 
     # rrc $reg8: Rotate 8 bit register right
     def rotate_8_bit_register_right(self, result_register: str, with_carry_bit: bool=False):
-        result_register_name = self._get_8_bit_register_name_from_key(result_register)
-        result_register_value = self._get_8_bit_register_value(result_register_name)
-        carry_bit = self._cpu.get_registers().read_flag_carry()
+        self._rotate_8_bit_register(result_register, alu_tables.SHIFT_RR if with_carry_bit else alu_tables.SHIFT_RRC)
 
-        self._cpu.get_registers().update_flags(
-            zero=False,
-            subtract=False,
-            half_carry=False,
-            carry=(result_register_value & 0x01) > 0)
+        self._cpu.get_cycle_clock().tick(1)
 
-        if with_carry_bit:
-            rotated_register_value = (result_register_value >> 1) | (0x80 if carry_bit else 0x00)
-        else:
-            rotated_register_value = (result_register_value >> 1) | (result_register_value << 7)
+    def _rotate_8_bit_register(self, result_register: str, shift: int):
+        registers = self._cpu.get_registers()
+        result_register_name = self._get_8_bit_register_name_from_key(result_register)
+        result_register_value = self._get_8_bit_register_value(result_register_name)
 
-        self._set_8_bit_register_value(result_register_name, rotated_register_value & 0xFF)
+        result = alu_tables.SHIFT_TABLE[(shift << 9) | (registers.read_flag_carry() << 4) | result_register_value]
 
-        self._cpu.get_cycle_clock().tick(1)
+        # Unlike the CB versions these always clear zero
+        registers.set_flags(result & 0x10)
+        self._set_8_bit_register_value(result_register_name, result >> 8)
 
     # cpl reg8: invert all bits in a register
     def complement_8_bit_register(self, result_register: str):
-        self._cpu.get_registers().update_flag_subtract(False)
-        self._cpu.get_registers().update_flag_half_carry(False)
+        self._cpu.get_registers().update_flag_subtract(True)
+        self._cpu.get_registers().update_flag_half_carry(True)
 
         register_name = self._get_8_bit_register_name_from_key(result_register)
         register_value = self._get_8_bit_register_value(register_name)
 
         self._set_8_bit_register_value(register_name, register_value ^ 0xFF)
 
+        self._cpu.get_cycle_clock().tick()
+
     def jump_to_16_bit_register(self, register_16: str):
         self._jump(self._get_16_bit_register_value(register_16))
 
@@ -1235,29 +667,12 @@ class CPUInstructions:
 
     # daa: I...don't get it
     def decimal_adjust_accumulator(self):
+        registers = self._cpu.get_registers()
         register_a_value = self._get_8_bit_register_value('_register_a')
 
-        if self._cpu.get_registers().read_flag_subtract():
-            if self._cpu.get_registers().read_flag_half_carry():
-                register_a_value -= 0x06
-                register_a_value &= 0xFF
-
-            if self._cpu.get_registers().read_flag_carry():
-                register_a_value -= 0x60
-        else:
-            if register_a_value & 0x0F > 0x09 or self._cpu.get_registers().read_flag_half_carry():
-                register_a_value += 0x06
-
-            if register_a_value > 0x9F or self._cpu.get_registers().read_flag_carry():
-                register_a_value += 0x60
-
-        self._cpu.get_registers().update_flag_zero(register_a_value & 0xFF == 0)
-        self._cpu.get_registers().update_flag_half_carry(False)
+        registers.write_af(alu_tables.DECIMAL_ADJUST_TABLE[(registers.get_flags() << 4) | register_a_value])
 
-        if register_a_value & 0x100:
-            self._cpu.get_registers().update_flag_carry(True)
-
-        self._set_8_bit_register_value('_register_a', register_a_value)
+        self._cpu.get_cycle_clock().tick()
 
     def execute_extended_operation(self):
         operation, bit_index_or_sub_op, register = self._get_extended_operation_parts()
@@ -1301,65 +716,52 @@ class CPUInstructions:
         return operation, bit_index_or_sub_op, register
 
     def _extended_op_rotate_left(self, register_index: int, with_carry_bit=False, shift_only=False):
-        value = self._get_extended_op_register_value(register_index)
-
         if shift_only:
-            shifted_value = value << 1
+            shift = alu_tables.SHIFT_SLA
+        elif with_carry_bit:
+            shift = alu_tables.SHIFT_RL
         else:
-            if with_carry_bit:
-                shifted_value = (value << 1) | (1 if self._cpu.get_registers().read_flag_carry() else 0)
-            else:
-                shifted_value = (value << 1) | (value >> 7)
+            shift = alu_tables.SHIFT_RLC
 
-        self._cpu.get_registers().update_flags(
-            zero=shifted_value == 0,
-            subtract=False,
-            half_carry=False,
-            carry=(value & 0x80) > 0
-        )
+        registers = self._cpu.get_registers()
+        value = self._get_extended_op_register_value(register_index)
+
+        result = alu_tables.SHIFT_TABLE[(shift << 9) | (registers.read_flag_carry() << 4) | value]
 
-        self._set_extended_op_register_value(register_index, shifted_value & 255)
+        registers.set_flags(result & 0xFF)
+        self._set_extended_op_register_value(register_index, result >> 8)
 
         self._cpu.get_cycle_clock().tick(4 if register_index == 6 else 2)  # writing to (HL) takes 2 extra cycles
 
     def _extended_op_rotate_right(self, register_index: int, with_carry_bit=False, shift_only=False,
                                   shift_only_special=False):
-        value = self._get_extended_op_register_value(register_index)
-
         if shift_only:
-            shifted_value = (value >> 1)
+            shift = alu_tables.SHIFT_SRL
         elif shift_only_special:
-            shifted_value = (value >> 1) | (value & 0x80)
+            shift = alu_tables.SHIFT_SRA
+        elif with_carry_bit:
+            shift = alu_tables.SHIFT_RR
         else:
-            if with_carry_bit:
-                shifted_value = (value >> 1) | (0x80 if self._cpu.get_registers().read_flag_carry() else 0)
-            else:
-                shifted_value = (value >> 1) | (value << 7)
+            shift = alu_tables.SHIFT_RRC
 
-        self._cpu.get_registers().update_flags(
-            zero=shifted_value == 0,
-            subtract=False,
-            half_carry=False,
-            carry=(value & 0x01) > 0
-        )
+        registers = self._cpu.get_registers()
+        value = self._get_extended_op_register_value(register_index)
 
-        self._set_extended_op_register_value(register_index, shifted_value & 255)
+        result = alu_tables.SHIFT_TABLE[(shift << 9) | (registers.read_flag_carry() << 4) | value]
+
+        registers.set_flags(result & 0xFF)
+        self._set_extended_op_register_value(register_index, result >> 8)
 
         self._cpu.get_cycle_clock().tick(4 if register_index == 6 else 2)  # writing to (HL) takes 2 extra cycles
 
     def _extended_op_swap(self, register_index: int):
+        registers = self._cpu.get_registers()
         value = self._get_extended_op_register_value(register_index)
 
-        swapped_value = (value >> 4) | (value << 4)
+        result = alu_tables.SHIFT_TABLE[(alu_tables.SHIFT_SWAP << 9) | (registers.read_flag_carry() << 4) | value]
 
-        self._cpu.get_registers().update_flags(
-            zero=swapped_value == 0,
-            subtract=False,
-            half_carry=False,
-            carry=False
-        )
-
-        self._set_extended_op_register_value(register_index, swapped_value & 255)
+        registers.set_flags(result & 0xFF)
+        self._set_extended_op_register_value(register_index, result >> 8)
 
         self._cpu.get_cycle_clock().tick(1)
 
@@ -1457,7 +859,7 @@ class CPUInstructions:
         register_setter_name = self._get_16_bit_register_setter_name(register_name)
         current_register_value = self._get_16_bit_register_value(register_name)
 
-        getattr(self._cpu.get_registers(), register_setter_name)(current_register_value + change)
+        getattr(self._cpu.get_registers(), register_setter_name)((current_register_value + change) & 0xFFFF)
 
     def _set_16_bit_register_value(self, register_name: str, value: int):
         register_setter_name = self._get_16_bit_register_setter_name(register_name)
@@ -1494,3 +896,314 @@ class CPUInstructions:
 
     def _is_carry(self, result, input_):
         return (result & 0xFF) < (input_ & 0xFF)
+
+
+def _build_instruction_table() -> list:
+    # Handlers are looked up on the instance when called, so patching a method on an instance still works
+    table = [None] * 256
+
+    # ~`~ No-op ~`~
+    table[0x00] = lambda self: self.no_op()
+
+    # ~`~ Register-to-register loads ~`~
+    table[0x40] = lambda self: self.load('b', 'b')
+    table[0x41] = lambda self: self.load('c', 'b')
+    table[0x42] = lambda self: self.load('d', 'b')
+    table[0x43] = lambda self: self.load('e', 'b')
+    table[0x44] = lambda self: self.load('h', 'b')
+    table[0x45] = lambda self: self.load('l', 'b')
+    table[0x47] = lambda self: self.load('a', 'b')
+    table[0x48] = lambda self: self.load('b', 'c')
+    table[0x49] = lambda self: self.load('c', 'c')
+    table[0x4A] = lambda self: self.load('d', 'c')
+    table[0x4B] = lambda self: self.load('e', 'c')
+    table[0x4C] = lambda self: self.load('h', 'c')
+    table[0x4D] = lambda self: self.load('l', 'c')
+    table[0x4F] = lambda self: self.load('a', 'c')
+    table[0x50] = lambda self: self.load('b', 'd')
+    table[0x51] = lambda self: self.load('c', 'd')
+    table[0x52] = lambda self: self.load('d', 'd')
+    table[0x53] = lambda self: self.load('e', 'd')
+    table[0x54] = lambda self: self.load('h', 'd')
+    table[0x55] = lambda self: self.load('l', 'd')
+    table[0x57] = lambda self: self.load('a', 'd')
+    table[0x58] = lambda self: self.load('b', 'e')
+    table[0x59] = lambda self: self.load('c', 'e')
+    table[0x5A] = lambda self: self.load('d', 'e')
+    table[0x5B] = lambda self: self.load('e', 'e')
+    table[0x5C] = lambda self: self.load('h', 'e')
+    table[0x5D] = lambda self: self.load('l', 'e')
+    table[0x5F] = lambda self: self.load('a', 'e')
+    table[0x60] = lambda self: self.load('b', 'h')
+    table[0x61] = lambda self: self.load('c', 'h')
+    table[0x62] = lambda self: self.load('d', 'h')
+    table[0x63] = lambda self: self.load('e', 'h')
+    table[0x64] = lambda self: self.load('h', 'h')
+    table[0x65] = lambda self: self.load('l', 'h')
+    table[0x67] = lambda self: self.load('a', 'h')
+    table[0x68] = lambda self: self.load('b', 'l')
+    table[0x69] = lambda self: self.load('c', 'l')
+    table[0x6A] = lambda self: self.load('d', 'l')
+    table[0x6B] = lambda self: self.load('e', 'l')
+    table[0x6C] = lambda self: self.load('h', 'l')
+    table[0x6D] = lambda self: self.load('l', 'l')
+    table[0x6F] = lambda self: self.load('a', 'l')
+    table[0x78] = lambda self: self.load('b', 'a')
+    table[0x79] = lambda self: self.load('c', 'a')
+    table[0x7A] = lambda self: self.load('d', 'a')
+    table[0x7B] = lambda self: self.load('e', 'a')
+    table[0x7C] = lambda self: self.load('h', 'a')
+    table[0x7D] = lambda self: self.load('l', 'a')
+    table[0x7F] = lambda self: self.load('a', 'a')
+
+    # ~`~ Memory-to-register loads ~`~
+    table[0x46] = lambda self: self.load_register_with_memory('b')
+    table[0x4E] = lambda self: self.load_register_with_memory('c')
+    table[0x56] = lambda self: self.load_register_with_memory('d')
+    table[0x5E] = lambda self: self.load_register_with_memory('e')
+    table[0x66] = lambda self: self.load_register_with_memory('h')
+    table[0x6E] = lambda self: self.load_register_with_memory('l')
+    table[0x7E] = lambda self: self.load_register_with_memory('a')
+
+    # ~`~ Register-to-memory loads ~`~
+    table[0x70] = lambda self: self.load_memory_with_register('b')
+    table[0x71] = lambda self: self.load_memory_with_register('c')
+    table[0x72] = lambda self: self.load_memory_with_register('d')
+    table[0x73] = lambda self: self.load_memory_with_register('e')
+    table[0x74] = lambda self: self.load_memory_with_register('h')
+    table[0x75] = lambda self: self.load_memory_with_register('l')
+    table[0x77] = lambda self: self.load_memory_with_register('a')
+
+    # ~`~ Immediate to HL address ~`~
+    table[0x36] = lambda self: self.load_memory_with_immediate()
+
+    # ~`~ Special, "a" register only loads ~`~
+    table[0x0A] = lambda self: self.load_register_with_memory('a', memory_register_16='bc')
+    table[0x1A] = lambda self: self.load_register_with_memory('a', memory_register_16='de')
+    table[0x02] = lambda self: self.load_memory_with_register('a', memory_register_16='bc')
+    table[0x12] = lambda self: self.load_memory_with_register('a', memory_register_16='de')
+    table[0xEA] = lambda self: self.load_immediate_memory_with_register('a')
+    table[0xFA] = lambda self: self.load_register_with_immediate_memory('a')
+    table[0x22] = lambda self: self.load_memory_with_register('a', increment_memory_register=True)
+    table[0x2A] = lambda self: self.load_register_with_memory('a', increment_memory_register=True)
+    table[0x32] = lambda self: self.load_memory_with_register('a', decrement_memory_register=True)
+    table[0x3A] = lambda self: self.load_register_with_memory('a', decrement_memory_register=True)
+    table[0xE0] = lambda self: self.load_immediate_memory_with_register('a', high_memory_load=True)
+    table[0xE2] = lambda self: self.load_offset_memory_at_register_with_register('c', 'a')
+    table[0xF0] = lambda self: self.load_register_with_immediate_memory('a', high_memory_read=True)
+    table[0xF2] = lambda self: self.load_register_with_offset_memory_at_register('a', 'c')
+
+    # ~`~ Immediate-to-register loads ~`~
+    table[0x06] = lambda self: self.load_register_with_immediate_byte('b')
+    table[0x0E] = lambda self: self.load_register_with_immediate_byte('c')
+    table[0x16] = lambda self: self.load_register_with_immediate_byte('d')
+    table[0x1E] = lambda self: self.load_register_with_immediate_byte('e')
+    table[0x26] = lambda self: self.load_register_with_immediate_byte('h')
+    table[0x2E] = lambda self: self.load_register_with_immediate_byte('l')
+    table[0x3E] = lambda self: self.load_register_with_immediate_byte('a')
+    table[0x01] = lambda self: self.load_register_with_immediate_word('bc')
+    table[0x11] = lambda self: self.load_register_with_immediate_word('de')
+    table[0x21] = lambda self: self.load_register_with_immediate_word('hl')
+    table[0x31] = lambda self: self.load_register_with_immediate_word('sp')
+
+    # ~`~ Stack pointer ~`~
+    table[0x08] = lambda self: self.load_immediate_memory_with_16_bit_register('sp')
+    table[0xF9] = lambda self: self.load_16_bit('hl', 'sp')
+    table[0xF8] = lambda self: self.load_16_bit('sp', 'hl', immediate_signed_offset=True)
+
+    # ~`~ Pop & push to stack ~`~
+    table[0xC1] = lambda self: self.pop_stack_to_register('bc')
+    table[0xD1] = lambda self: self.pop_stack_to_register('de')
+    table[0xE1] = lambda self: self.pop_stack_to_register('hl')
+    table[0xF1] = lambda self: self.pop_stack_to_register('af')
+    table[0xC5] = lambda self: self.push_register_to_stack('bc')
+    table[0xD5] = lambda self: self.push_register_to_stack('de')
+    table[0xE5] = lambda self: self.push_register_to_stack('hl')
+    table[0xF5] = lambda self: self.push_register_to_stack('af')
+
+    # ~`~ Add ~`~
+    table[0x80] = lambda self: self.add_8_bit_registers('a', 'b')
+    table[0x81] = lambda self: self.add_8_bit_registers('a', 'c')
+    table[0x82] = lambda self: self.add_8_bit_registers('a', 'd')
+    table[0x83] = lambda self: self.add_8_bit_registers('a', 'e')
+    table[0x84] = lambda self: self.add_8_bit_registers('a', 'h')
+    table[0x85] = lambda self: self.add_8_bit_registers('a', 'l')
+    table[0x87] = lambda self: self.add_8_bit_registers('a', 'a')
+    table[0x86] = lambda self: self.add_8_bit_hl_memory_to_register('a')
+    table[0xC6] = lambda self: self.add_8_bit_immediate_to_register('a')
+
+    # ~`~ Add with carry ~`~
+    table[0x88] = lambda self: self.add_8_bit_registers('a', 'b', with_carry_bit=True)
+    table[0x89] = lambda self: self.add_8_bit_registers('a', 'c', with_carry_bit=True)
+    table[0x8A] = lambda self: self.add_8_bit_registers('a', 'd', with_carry_bit=True)
+    table[0x8B] = lambda self: self.add_8_bit_registers('a', 'e', with_carry_bit=True)
+    table[0x8C] = lambda self: self.add_8_bit_registers('a', 'h', with_carry_bit=True)
+    table[0x8D] = lambda self: self.add_8_bit_registers('a', 'l', with_carry_bit=True)
+    table[0x8F] = lambda self: self.add_8_bit_registers('a', 'a', with_carry_bit=True)
+    table[0x8E] = lambda self: self.add_8_bit_hl_memory_to_register('a', with_carry_bit=True)
+    table[0xCE] = lambda self: self.add_8_bit_immediate_to_register('a', with_carry_bit=True)
+
+    # ~`~ Subtract ~`~
+    table[0x90] = lambda self: self.subtract_8_bit_registers('a', 'b')
+    table[0x91] = lambda self: self.subtract_8_bit_registers('a', 'c')
+    table[0x92] = lambda self: self.subtract_8_bit_registers('a', 'd')
+    table[0x93] = lambda self: self.subtract_8_bit_registers('a', 'e')
+    table[0x94] = lambda self: self.subtract_8_bit_registers('a', 'h')
+    table[0x95] = lambda self: self.subtract_8_bit_registers('a', 'l')
+    table[0x97] = lambda self: self.subtract_8_bit_registers('a', 'a')
+    table[0x96] = lambda self: self.subtract_8_bit_hl_memory_to_register('a')
+    table[0xD6] = lambda self: self.subtract_8_bit_immediate_to_register('a')
+
+    # ~`~ Subtract with carry ~`~
+    table[0x98] = lambda self: self.subtract_8_bit_registers('a', 'b', with_carry_bit=True)
+    table[0x99] = lambda self: self.subtract_8_bit_registers('a', 'c', with_carry_bit=True)
+    table[0x9A] = lambda self: self.subtract_8_bit_registers('a', 'd', with_carry_bit=True)
+    table[0x9B] = lambda self: self.subtract_8_bit_registers('a', 'e', with_carry_bit=True)
+    table[0x9C] = lambda self: self.subtract_8_bit_registers('a', 'h', with_carry_bit=True)
+    table[0x9D] = lambda self: self.subtract_8_bit_registers('a', 'l', with_carry_bit=True)
+    table[0x9F] = lambda self: self.subtract_8_bit_registers('a', 'a', with_carry_bit=True)
+    table[0x9E] = lambda self: self.subtract_8_bit_hl_memory_to_register('a', with_carry_bit=True)
+    table[0xDE] = lambda self: self.subtract_8_bit_immediate_to_register('a', with_carry_bit=True)
+
+    # ~`~ Increment ~`~
+    table[0x04] = lambda self: self.increment_8_bit_register('b')
+    table[0x0C] = lambda self: self.increment_8_bit_register('c')
+    table[0x14] = lambda self: self.increment_8_bit_register('d')
+    table[0x1C] = lambda self: self.increment_8_bit_register('e')
+    table[0x24] = lambda self: self.increment_8_bit_register('h')
+    table[0x2C] = lambda self: self.increment_8_bit_register('l')
+    table[0x3C] = lambda self: self.increment_8_bit_register('a')
+
+    # ~`~ Decrement ~`~
+    table[0x05] = lambda self: self.decrement_8_bit_register('b')
+    table[0x0D] = lambda self: self.decrement_8_bit_register('c')
+    table[0x15] = lambda self: self.decrement_8_bit_register('d')
+    table[0x1D] = lambda self: self.decrement_8_bit_register('e')
+    table[0x25] = lambda self: self.decrement_8_bit_register('h')
+    table[0x2D] = lambda self: self.decrement_8_bit_register('l')
+    table[0x3D] = lambda self: self.decrement_8_bit_register('a')
+
+    # ~`~ Compare ~`~
+    table[0xB8] = lambda self: self.subtract_8_bit_registers('a', 'b', compare_only=True)
+    table[0xB9] = lambda self: self.subtract_8_bit_registers('a', 'c', compare_only=True)
+    table[0xBA] = lambda self: self.subtract_8_bit_registers('a', 'd', compare_only=True)
+    table[0xBB] = lambda self: self.subtract_8_bit_registers('a', 'e', compare_only=True)
+    table[0xBC] = lambda self: self.subtract_8_bit_registers('a', 'h', compare_only=True)
+    table[0xBD] = lambda self: self.subtract_8_bit_registers('a', 'l', compare_only=True)
+    table[0xBF] = lambda self: self.subtract_8_bit_registers('a', 'a', compare_only=True)
+    table[0xBE] = lambda self: self.subtract_8_bit_hl_memory_to_register('a', compare_only=True)
+    table[0xFE] = lambda self: self.subtract_8_bit_immediate_to_register('a', compare_only=True)
+
+    # ~`~ Bitwise ~`~
+    table[0xA0] = lambda self: self.bitwise_and_8_bit_register('a', 'b')
+    table[0xA1] = lambda self: self.bitwise_and_8_bit_register('a', 'c')
+    table[0xA2] = lambda self: self.bitwise_and_8_bit_register('a', 'd')
+    table[0xA3] = lambda self: self.bitwise_and_8_bit_register('a', 'e')
+    table[0xA4] = lambda self: self.bitwise_and_8_bit_register('a', 'h')
+    table[0xA5] = lambda self: self.bitwise_and_8_bit_register('a', 'l')
+    table[0xA7] = lambda self: self.bitwise_and_8_bit_register('a', 'a')
+    table[0xB0] = lambda self: self.bitwise_or_8_bit_register('a', 'b')
+    table[0xB1] = lambda self: self.bitwise_or_8_bit_register('a', 'c')
+    table[0xB2] = lambda self: self.bitwise_or_8_bit_register('a', 'd')
+    table[0xB3] = lambda self: self.bitwise_or_8_bit_register('a', 'e')
+    table[0xB4] = lambda self: self.bitwise_or_8_bit_register('a', 'h')
+    table[0xB5] = lambda self: self.bitwise_or_8_bit_register('a', 'l')
+    table[0xB7] = lambda self: self.bitwise_or_8_bit_register('a', 'a')
+    table[0xA8] = lambda self: self.bitwise_xor_8_bit_register('a', 'b')
+    table[0xA9] = lambda self: self.bitwise_xor_8_bit_register('a', 'c')
+    table[0xAA] = lambda self: self.bitwise_xor_8_bit_register('a', 'd')
+    table[0xAB] = lambda self: self.bitwise_xor_8_bit_register('a', 'e')
+    table[0xAC] = lambda self: self.bitwise_xor_8_bit_register('a', 'h')
+    table[0xAD] = lambda self: self.bitwise_xor_8_bit_register('a', 'l')
+    table[0xAF] = lambda self: self.bitwise_xor_8_bit_register('a', 'a')
+    table[0xA6] = lambda self: self.bitwise_and_8_bit_register_with_memory('a', 'hl')
+    table[0xB6] = lambda self: self.bitwise_or_8_bit_register_with_memory('a', 'hl')
+    table[0xAE] = lambda self: self.bitwise_xor_8_bit_register_with_memory('a', 'hl')
+    table[0xE6] = lambda self: self.bitwise_and_8_bit_register_with_immediate_byte('a')
+    table[0xF6] = lambda self: self.bitwise_or_8_bit_register_with_immediate_byte('a')
+    table[0xEE] = lambda self: self.bitwise_xor_8_bit_register_with_immediate_byte('a')
+    table[0x07] = lambda self: self.rotate_8_bit_register_left('a')
+    table[0x0F] = lambda self: self.rotate_8_bit_register_right('a')
+    table[0x17] = lambda self: self.rotate_8_bit_register_left('a', with_carry_bit=True)
+    table[0x1F] = lambda self: self.rotate_8_bit_register_right('a', with_carry_bit=True)
+    table[0x2F] = lambda self: self.complement_8_bit_register('a')
+
+    # ~`~ Extended operations ~`~
+    table[0xCB] = lambda self: self.execute_extended_operation()
+
+    # ~`~ 16 bit math ~`~
+    table[0x09] = lambda self: self.add_16_bit_registers('hl', 'bc')
+    table[0x19] = lambda self: self.add_16_bit_registers('hl', 'de')
+    table[0x29] = lambda self: self.add_16_bit_registers('hl', 'hl')
+    table[0x39] = lambda self: self.add_16_bit_registers('hl', 'sp')
+    table[0xE8] = lambda self: self.add_signed_immediate_to_16_bit_register('sp')
+    table[0x03] = lambda self: self.increment_16_bit_register('bc')
+    table[0x13] = lambda self: self.increment_16_bit_register('de')
+    table[0x23] = lambda self: self.increment_16_bit_register('hl')
+    table[0x33] = lambda self: self.increment_16_bit_register('sp')
+    table[0x0B] = lambda self: self.decrement_16_bit_register('bc')
+    table[0x1B] = lambda self: self.decrement_16_bit_register('de')
+    table[0x2B] = lambda self: self.decrement_16_bit_register('hl')
+    table[0x3B] = lambda self: self.decrement_16_bit_register('sp')
+    table[0x34] = lambda self: self.increment_memory_at_register('hl')
+    table[0x35] = lambda self: self.decrement_memory_at_register('hl')
+
+    # ~`~ Jump ~`~
+    table[0xE9] = lambda self: self.jump_to_16_bit_register('hl')
+    table[0xC3] = lambda self: self.jump_to_immediate()
+    table[0xC2] = lambda self: self.jump_to_immediate(conditional_zero_flag=False)
+    table[0xCA] = lambda self: self.jump_to_immediate(conditional_zero_flag=True)
+    table[0xD2] = lambda self: self.jump_to_immediate(conditional_carry_flag=False)
+    table[0xDA] = lambda self: self.jump_to_immediate(conditional_carry_flag=True)
+    table[0x18] = lambda self: self.jump_to_immediate(relative=True)
+    table[0x20] = lambda self: self.jump_to_immediate(relative=True, conditional_zero_flag=False)
+    table[0x28] = lambda self: self.jump_to_immediate(relative=True, conditional_zero_flag=True)
+    table[0x30] = lambda self: self.jump_to_immediate(relative=True, conditional_carry_flag=False)
+    table[0x38] = lambda self: self.jump_to_immediate(relative=True, conditional_carry_flag=True)
+
+    # ~`~ Call ~`~
+    table[0xC4] = lambda self: self.call_immediate(conditional_zero_flag=False)
+    table[0xCC] = lambda self: self.call_immediate(conditional_zero_flag=True)
+    table[0xD4] = lambda self: self.call_immediate(conditional_carry_flag=False)
+    table[0xDC] = lambda self: self.call_immediate(conditional_carry_flag=True)
+    table[0xCD] = lambda self: self.call_immediate()
+
+    # ~`~ Reset ~`~
+    table[0xC7] = lambda self: self.reset(0x00)
+    table[0xCF] = lambda self: self.reset(0x08)
+    table[0xD7] = lambda self: self.reset(0x10)
+    table[0xDF] = lambda self: self.reset(0x18)
+    table[0xE7] = lambda self: self.reset(0x20)
+    table[0xEF] = lambda self: self.reset(0x28)
+    table[0xF7] = lambda self: self.reset(0x30)
+    table[0xFF] = lambda self: self.reset(0x38)
+
+    # ~`~ Return ~`~
+    table[0xC9] = lambda self: self.return_()
+    table[0xC0] = lambda self: self.return_(conditional_zero_flag=False)
+    table[0xC8] = lambda self: self.return_(conditional_zero_flag=True)
+    table[0xD0] = lambda self: self.return_(conditional_carry_flag=False)
+    table[0xD8] = lambda self: self.return_(conditional_carry_flag=True)
+    table[0xD9] = lambda self: self.return_(enable_interrupts=True)
+
+    # ~`~ Enable/disable interrupts ~`~
+    table[0xF3] = lambda self: self.disable_interrupts()
+    table[0xFB] = lambda self: self.enable_interrupts()
+
+    # ~`~ Halt ~`~
+    table[0x76] = lambda self: self.halt()
+
+    # ~`~ DAA ~`~
+    table[0x27] = lambda self: self.decimal_adjust_accumulator()
+
+    # ~`~ Stop ~`~
+    table[0x10] = lambda self: self.stop()
+
+    # ~`~ Carry flag ops ~`~
+    table[0x37] = lambda self: self.set_carry_flag()
+    table[0x3F] = lambda self: self.complement_carry_flag()
+
+    return table
+
+
+CPUInstructions.INSTRUCTION_TABLE = _build_instruction_table()
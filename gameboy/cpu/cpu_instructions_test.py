@@ -902,6 +902,9 @@ def test_cpu_instructions_complement(cpu_instructions_fixture):
     cpu_instructions_fixture.complement_8_bit_register('a')
 
     assert cpu_instructions_fixture._cpu._registers._register_a == 0b01010101
+    assert cpu_instructions_fixture._cpu._registers.read_flag_subtract()
+    assert cpu_instructions_fixture._cpu._registers.read_flag_half_carry()
+    assert cpu_instructions_fixture._cpu._cycle_clock.get_total_machine_cycles() == 1
 
 
 def test_cpu_instructions_get_extended_op_register_value(cpu_instructions_fixture):
@@ -1667,49 +1670,49 @@ def test_cpu_instructions_0x41_ld_b_c(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x41)
 
-    cpu_instructions_fixture.load.assert_called_once_with('b', 'c')
+    cpu_instructions_fixture.load.assert_called_once_with('c', 'b')
 
 
 def test_cpu_instructions_0x42_ld_b_d(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x42)
 
-    cpu_instructions_fixture.load.assert_called_once_with('b', 'd')
+    cpu_instructions_fixture.load.assert_called_once_with('d', 'b')
 
 
 def test_cpu_instructions_0x43_ld_b_e(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x43)
 
-    cpu_instructions_fixture.load.assert_called_once_with('b', 'e')
+    cpu_instructions_fixture.load.assert_called_once_with('e', 'b')
 
 
 def test_cpu_instructions_0x44_ld_b_h(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x44)
 
-    cpu_instructions_fixture.load.assert_called_once_with('b', 'h')
+    cpu_instructions_fixture.load.assert_called_once_with('h', 'b')
 
 
 def test_cpu_instructions_0x45_ld_b_l(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x45)
 
-    cpu_instructions_fixture.load.assert_called_once_with('b', 'l')
+    cpu_instructions_fixture.load.assert_called_once_with('l', 'b')
 
 
 def test_cpu_instructions_0x47_ld_b_a(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x47)
 
-    cpu_instructions_fixture.load.assert_called_once_with('b', 'a')
+    cpu_instructions_fixture.load.assert_called_once_with('a', 'b')
 
 
 def test_cpu_instructions_0x48_ld_c_b(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x48)
 
-    cpu_instructions_fixture.load.assert_called_once_with('c', 'b')
+    cpu_instructions_fixture.load.assert_called_once_with('b', 'c')
 
 
 def test_cpu_instructions_0x49_ld_c_c(cpu_instructions_fixture):
@@ -1723,48 +1726,48 @@ def test_cpu_instructions_0x4A_ld_c_d(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x4A)
 
-    cpu_instructions_fixture.load.assert_called_once_with('c', 'd')
+    cpu_instructions_fixture.load.assert_called_once_with('d', 'c')
 
 
 def test_cpu_instructions_0x4B_ld_c_e(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x4B)
 
-    cpu_instructions_fixture.load.assert_called_once_with('c', 'e')
+    cpu_instructions_fixture.load.assert_called_once_with('e', 'c')
 
 
 def test_cpu_instructions_0x4C_ld_c_h(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x4C)
 
-    cpu_instructions_fixture.load.assert_called_once_with('c', 'h')
+    cpu_instructions_fixture.load.assert_called_once_with('h', 'c')
 
 
 def test_cpu_instructions_0x4D_ld_c_l(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x4D)
 
-    cpu_instructions_fixture.load.assert_called_once_with('c', 'l')
+    cpu_instructions_fixture.load.assert_called_once_with('l', 'c')
 
 
 def test_cpu_instructions_0x4F_ld_c_a(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x4F)
 
-    cpu_instructions_fixture.load.assert_called_once_with('c', 'a')
+    cpu_instructions_fixture.load.assert_called_once_with('a', 'c')
 
 def test_cpu_instructions_0x50_ld_d_b(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x50)
 
-    cpu_instructions_fixture.load.assert_called_once_with('d', 'b')
+    cpu_instructions_fixture.load.assert_called_once_with('b', 'd')
 
 
 def test_cpu_instructions_0x51_ld_d_c(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x51)
 
-    cpu_instructions_fixture.load.assert_called_once_with('d', 'c')
+    cpu_instructions_fixture.load.assert_called_once_with('c', 'd')
 
 
 def test_cpu_instructions_0x52_ld_d_d(cpu_instructions_fixture):
@@ -1778,49 +1781,49 @@ def test_cpu_instructions_0x53_ld_d_e(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x53)
 
-    cpu_instructions_fixture.load.assert_called_once_with('d', 'e')
+    cpu_instructions_fixture.load.assert_called_once_with('e', 'd')
 
 
 def test_cpu_instructions_0x54_ld_d_h(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x54)
 
-    cpu_instructions_fixture.load.assert_called_once_with('d', 'h')
+    cpu_instructions_fixture.load.assert_called_once_with('h', 'd')
 
 
 def test_cpu_instructions_0x55_ld_d_l(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x55)
 
-    cpu_instructions_fixture.load.assert_called_once_with('d', 'l')
+    cpu_instructions_fixture.load.assert_called_once_with('l', 'd')
 
 
 def test_cpu_instructions_0x57_ld_d_a(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x57)
 
-    cpu_instructions_fixture.load.assert_called_once_with('d', 'a')
+    cpu_instructions_fixture.load.assert_called_once_with('a', 'd')
 
 
 def test_cpu_instructions_0x58_ld_e_b(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x58)
 
-    cpu_instructions_fixture.load.assert_called_once_with('e', 'b')
+    cpu_instructions_fixture.load.assert_called_once_with('b', 'e')
 
 
 def test_cpu_instructions_0x59_ld_e_c(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x59)
 
-    cpu_instructions_fixture.load.assert_called_once_with('e', 'c')
+    cpu_instructions_fixture.load.assert_called_once_with('c', 'e')
 
 
 def test_cpu_instructions_0x5A_ld_e_d(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x5A)
 
-    cpu_instructions_fixture.load.assert_called_once_with('e', 'd')
+    cpu_instructions_fixture.load.assert_called_once_with('d', 'e')
 
 
 def test_cpu_instructions_0x5B_ld_e_e(cpu_instructions_fixture):
@@ -1834,49 +1837,49 @@ def test_cpu_instructions_0x5C_ld_e_h(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x5C)
 
-    cpu_instructions_fixture.load.assert_called_once_with('e', 'h')
+    cpu_instructions_fixture.load.assert_called_once_with('h', 'e')
 
 
 def test_cpu_instructions_0x5D_ld_e_l(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x5D)
 
-    cpu_instructions_fixture.load.assert_called_once_with('e', 'l')
+    cpu_instructions_fixture.load.assert_called_once_with('l', 'e')
 
 
 def test_cpu_instructions_0x5F_ld_e_a(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x5F)
 
-    cpu_instructions_fixture.load.assert_called_once_with('e', 'a')
+    cpu_instructions_fixture.load.assert_called_once_with('a', 'e')
 
 
 def test_cpu_instructions_0x60_ld_h_b(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x60)
 
-    cpu_instructions_fixture.load.assert_called_once_with('h', 'b')
+    cpu_instructions_fixture.load.assert_called_once_with('b', 'h')
 
 
 def test_cpu_instructions_0x61_ld_h_c(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x61)
 
-    cpu_instructions_fixture.load.assert_called_once_with('h', 'c')
+    cpu_instructions_fixture.load.assert_called_once_with('c', 'h')
 
 
 def test_cpu_instructions_0x62_ld_h_d(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x62)
 
-    cpu_instructions_fixture.load.assert_called_once_with('h', 'd')
+    cpu_instructions_fixture.load.assert_called_once_with('d', 'h')
 
 
 def test_cpu_instructions_0x63_ld_h_e(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x63)
 
-    cpu_instructions_fixture.load.assert_called_once_with('h', 'e')
+    cpu_instructions_fixture.load.assert_called_once_with('e', 'h')
 
 
 def test_cpu_instructions_0x64_ld_h_h(cpu_instructions_fixture):
@@ -1890,49 +1893,49 @@ def test_cpu_instructions_0x65_ld_h_l(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x65)
 
-    cpu_instructions_fixture.load.assert_called_once_with('h', 'l')
+    cpu_instructions_fixture.load.assert_called_once_with('l', 'h')
 
 
 def test_cpu_instructions_0x67_ld_h_a(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x67)
 
-    cpu_instructions_fixture.load.assert_called_once_with('h', 'a')
+    cpu_instructions_fixture.load.assert_called_once_with('a', 'h')
 
 
 def test_cpu_instructions_0x68_ld_l_b(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x68)
 
-    cpu_instructions_fixture.load.assert_called_once_with('l', 'b')
+    cpu_instructions_fixture.load.assert_called_once_with('b', 'l')
 
 
 def test_cpu_instructions_0x69_ld_l_c(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x69)
 
-    cpu_instructions_fixture.load.assert_called_once_with('l', 'c')
+    cpu_instructions_fixture.load.assert_called_once_with('c', 'l')
 
 
 def test_cpu_instructions_0x6A_ld_l_d(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x6A)
 
-    cpu_instructions_fixture.load.assert_called_once_with('l', 'd')
+    cpu_instructions_fixture.load.assert_called_once_with('d', 'l')
 
 
 def test_cpu_instructions_0x6B_ld_l_e(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x6B)
 
-    cpu_instructions_fixture.load.assert_called_once_with('l', 'e')
+    cpu_instructions_fixture.load.assert_called_once_with('e', 'l')
 
 
 def test_cpu_instructions_0x6C_ld_l_h(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x6C)
 
-    cpu_instructions_fixture.load.assert_called_once_with('l', 'h')
+    cpu_instructions_fixture.load.assert_called_once_with('h', 'l')
 
 
 def test_cpu_instructions_0x6D_ld_l_l(cpu_instructions_fixture):
@@ -1946,49 +1949,49 @@ def test_cpu_instructions_0x6F_ld_l_a(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x6F)
 
-    cpu_instructions_fixture.load.assert_called_once_with('l', 'a')
+    cpu_instructions_fixture.load.assert_called_once_with('a', 'l')
 
 
 def test_cpu_instructions_0x78_ld_a_b(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x78)
 
-    cpu_instructions_fixture.load.assert_called_once_with('a', 'b')
+    cpu_instructions_fixture.load.assert_called_once_with('b', 'a')
 
 
 def test_cpu_instructions_0x79_ld_a_c(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x79)
 
-    cpu_instructions_fixture.load.assert_called_once_with('a', 'c')
+    cpu_instructions_fixture.load.assert_called_once_with('c', 'a')
 
 
 def test_cpu_instructions_0x7A_ld_a_d(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x7A)
 
-    cpu_instructions_fixture.load.assert_called_once_with('a', 'd')
+    cpu_instructions_fixture.load.assert_called_once_with('d', 'a')
 
 
 def test_cpu_instructions_0x7B_ld_a_e(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x7B)
 
-    cpu_instructions_fixture.load.assert_called_once_with('a', 'e')
+    cpu_instructions_fixture.load.assert_called_once_with('e', 'a')
 
 
 def test_cpu_instructions_0x7C_ld_a_h(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x7C)
 
-    cpu_instructions_fixture.load.assert_called_once_with('a', 'h')
+    cpu_instructions_fixture.load.assert_called_once_with('h', 'a')
 
 
 def test_cpu_instructions_0x7D_ld_a_l(cpu_instructions_fixture):
     cpu_instructions_fixture.load = mock.Mock()
     cpu_instructions_fixture.execute_instruction(0x7D)
 
-    cpu_instructions_fixture.load.assert_called_once_with('a', 'l')
+    cpu_instructions_fixture.load.assert_called_once_with('l', 'a')
 
 
 def test_cpu_instructions_0x7F_ld_a_a(cpu_instructions_fixture):
@@ -3368,3 +3371,22 @@ def test_cpu_instructions_0x3F_complement_carry_flag(cpu_instructions_fixture):
 
     cpu_instructions_fixture.complement_carry_flag.assert_called_once()
 
+
+
+def test_cpu_instructions_decimal_adjust_accumulator(cpu_instructions_fixture):
+    registers = cpu_instructions_fixture._cpu._registers
+    registers._register_a = 0x9A
+
+    cpu_instructions_fixture.decimal_adjust_accumulator()
+
+    assert registers._register_a == 0x00
+    assert registers.read_flag_zero()
+    assert registers.read_flag_carry()
+    assert not registers.read_flag_half_carry()
+    assert cpu_instructions_fixture._cpu._cycle_clock.get_total_machine_cycles() == 1
+
+    registers.write_af(0x0F60)  # Subtract and half carry
+
+    cpu_instructions_fixture.decimal_adjust_accumulator()
+
+    assert registers.read_af() == 0x0940
@@ -77,6 +77,12 @@ class CPURegisters:
         self._register_h = value >> 8
         self._register_l = value & 0xFF
 
+    def get_flags(self) -> int:
+        return self._flags
+
+    def set_flags(self, value: int):
+        self._flags = value & 0xF0
+
     def update_flags(self, zero: bool, subtract: bool, half_carry: bool, carry: bool):
         self.update_flag_zero(zero)
         self.update_flag_subtract(subtract)
@@ -144,6 +144,14 @@ def test_cpu_registers_write_af(cpu_registers_fixture):
     assert cpu_registers_fixture.read_af() == 496
 
 
+def test_cpu_registers_set_flags(cpu_registers_fixture):
+    cpu_registers_fixture.set_flags(0xBF)
+
+    assert cpu_registers_fixture.get_flags() == 0xB0
+    assert cpu_registers_fixture.read_flag_zero()
+    assert not cpu_registers_fixture.read_flag_subtract()
+
+
 def test_cpu_registers_write_bc(cpu_registers_fixture):
     cpu_registers_fixture.write_bc(500)
 
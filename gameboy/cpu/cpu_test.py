@@ -6,6 +6,7 @@ import pytest
 from gameboy.cpu.cpu import CPU
 from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
 from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.rom import ROM
 
 
 @pytest.fixture()
@@ -363,6 +364,50 @@ def test_cpu_step_halt_bug(cpu_fixture):
     assert cpu_fixture._registers._program_counter == 0xC000
 
 
+def test_cpu_step_decode_cache(cpu_fixture):
+    rom_data = bytearray(0x10000)
+    rom_data[0x0147] = 0x01  # MBC1
+    rom_data[0x0148] = 0x01  # 64KB
+    rom_data[0x4000:0x4003] = bytes([0x01, 0x34, 0x12])  # Bank 1 ld bc,$1234
+    rom_data[0x8000:0x8003] = bytes([0x11, 0x78, 0x56])  # Bank 2 ld de,$5678
+
+    cpu_fixture._memory_unit.set_cartridge_rom(ROM(rom_data))
+    cpu_fixture._registers.set_program_counter(0x4000)
+    cpu_fixture.step()
+
+    assert cpu_fixture._registers.read_bc() == 0x1234
+    assert cpu_fixture._registers.get_program_counter() == 0x4003
+    assert cpu_fixture._decode_cache.get_entry_count() == 1
+
+    cpu_fixture._memory_unit.write_byte(0x2000, 0x02)
+    cpu_fixture._registers.set_program_counter(0x4000)
+    cpu_fixture.step()
+
+    assert cpu_fixture._registers.read_de() == 0x5678
+    assert cpu_fixture._decode_cache.get_entry_count() == 2
+
+
+def test_cpu_step_decode_cache_boot_rom(cpu_fixture):
+    cpu_fixture._memory_unit.set_cartridge_rom(ROM(bytearray(0x8000)))
+    cpu_fixture._registers.set_program_counter(0x0000)
+
+    # ld sp,$fffe from the boot ROM, it isn't cached while mapped over the cartridge
+    cpu_fixture.step()
+
+    assert cpu_fixture._registers.get_stack_pointer() == 0xFFFE
+    assert cpu_fixture._decode_cache.get_entry_count() == 0
+
+
+def test_cpu_read_immediate_byte_past_cached_operands(cpu_fixture):
+    cpu_fixture._memory_unit.write_byte(0xC001, 15)
+    cpu_fixture._registers._program_counter = 0xC000
+    cpu_fixture._cached_operands = bytes([1, 2])
+    cpu_fixture._cached_operands_address = 0xBFFF
+
+    assert cpu_fixture.read_immediate_byte() == 2
+    assert cpu_fixture.read_immediate_byte() == 15
+
+
 def test_cpu_stop(cpu_fixture):
     cpu_fixture.stop()
     assert cpu_fixture._is_stopped
@@ -373,3 +418,96 @@ def test_cpu_execute_operation(cpu_fixture):
     cpu_fixture._execute_operation(0x00)
 
     cpu_fixture._cpu_instructions.execute_instruction.assert_called_once_with(0x00)
+
+
+def test_cpu_fork(cpu_fixture):
+    memory_unit = MemoryUnit()
+    cpu_fixture._registers._register_a = 1
+    cpu_fixture._cycle_clock.tick(2)
+    cpu_fixture._is_halted = True
+
+    forked_cpu = cpu_fixture.fork(memory_unit)
+
+    assert forked_cpu.get_memory_unit() == memory_unit
+    assert forked_cpu._cpu_instructions._cpu == forked_cpu
+    assert forked_cpu._registers._register_a == 1
+    assert forked_cpu._cycle_clock.get_total_machine_cycles() == 2
+    assert forked_cpu._is_halted
+
+    forked_cpu._registers._register_a = 2
+    forked_cpu._cycle_clock.tick()
+
+    assert cpu_fixture._registers._register_a == 1
+    assert cpu_fixture._cycle_clock.get_total_machine_cycles() == 2
+
+
+def test_cpu_get_cpu_instructions(cpu_fixture):
+    assert cpu_fixture.get_cpu_instructions() == cpu_fixture._cpu_instructions
+
+
+def test_cpu_enable_opcode_profiler(cpu_fixture):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+
+    assert cpu_fixture.get_opcode_profiler() is opcode_profiler
+    assert opcode_profiler.is_attached()
+    assert cpu_fixture.fork(MemoryUnit()).get_opcode_profiler() is None
+
+    cpu_fixture.disable_opcode_profiler()
+
+    assert cpu_fixture.get_opcode_profiler() is None
+    assert not opcode_profiler.is_attached()
+
+
+def test_cpu_enable_instruction_fusion(cpu_fixture):
+    instruction_fuser = cpu_fixture.enable_instruction_fusion()
+
+    assert cpu_fixture.get_instruction_fuser() is instruction_fuser
+    assert instruction_fuser.is_attached()
+
+    forked_cpu = cpu_fixture.fork(MemoryUnit())
+
+    assert forked_cpu.get_instruction_fuser() is not instruction_fuser
+    assert forked_cpu.get_instruction_fuser().get_sequences() == instruction_fuser.get_sequences()
+    assert forked_cpu.get_cpu_instructions().get_instruction_table() is not \
+        cpu_fixture.get_cpu_instructions().get_instruction_table()
+
+    cpu_fixture.disable_instruction_fusion()
+
+    assert cpu_fixture.get_instruction_fuser() is None
+    assert not instruction_fuser.is_attached()
+    assert forked_cpu.get_instruction_fuser().is_attached()
+
+
+def test_cpu_enable_loop_acceleration(cpu_fixture):
+    loop_accelerator = cpu_fixture.enable_loop_acceleration()
+
+    assert cpu_fixture.get_loop_accelerator() is loop_accelerator
+    assert loop_accelerator.is_attached()
+
+    forked_cpu = cpu_fixture.fork(MemoryUnit())
+
+    assert forked_cpu.get_loop_accelerator() is not loop_accelerator
+    assert forked_cpu.get_loop_accelerator().is_attached()
+
+    cpu_fixture.disable_loop_acceleration()
+
+    assert cpu_fixture.get_loop_accelerator() is None
+    assert not loop_accelerator.is_attached()
+    assert forked_cpu.get_loop_accelerator().is_attached()
+
+
+def test_cpu_enable_pc_sampling_profiler(cpu_fixture):
+    pc_sampling_profiler = cpu_fixture.enable_pc_sampling_profiler()
+
+    assert cpu_fixture.get_pc_sampling_profiler() is pc_sampling_profiler
+    assert pc_sampling_profiler.is_attached()
+
+    forked_cpu = cpu_fixture.fork(MemoryUnit())
+
+    assert forked_cpu.get_pc_sampling_profiler() is None
+    assert 'call_immediate' not in forked_cpu.get_cpu_instructions().__dict__
+
+    cpu_fixture.disable_pc_sampling_profiler()
+
+    assert cpu_fixture.get_pc_sampling_profiler() is None
+    assert not pc_sampling_profiler.is_attached()
@@ -0,0 +1,72 @@
+from typing import Dict, Optional, Tuple
+
+from gameboy.rom import ROM
+
+# Bytes after the op code each handler reads with read_immediate_byte/read_immediate_word. stop doesn't read its
+# padding byte here, and prefixed op codes are one byte in the extended table.
+_ONE_BYTE_OPERAND_OP_CODES = (
+    0x06, 0x0E, 0x16, 0x1E, 0x26, 0x2E, 0x36, 0x3E,  # ld r,n
+    0x18, 0x20, 0x28, 0x30, 0x38,  # jr
+    0xC6, 0xCE, 0xD6, 0xDE, 0xE6, 0xEE, 0xF6, 0xFE,  # alu a,n
+    0xE0, 0xF0, 0xE8, 0xF8, 0xCB
+)
+
+_TWO_BYTE_OPERAND_OP_CODES = (
+    0x01, 0x11, 0x21, 0x31, 0x08, 0xEA, 0xFA,  # 16 bit loads
+    0xC2, 0xC3, 0xCA, 0xD2, 0xDA,  # jp
+    0xC4, 0xCC, 0xCD, 0xD4, 0xDC  # call
+)
+
+OPERAND_LENGTHS = bytes(
+    1 if op_code in _ONE_BYTE_OPERAND_OP_CODES else 2 if op_code in _TWO_BYTE_OPERAND_OP_CODES else 0
+    for op_code in range(0, 0x100)
+)
+
+# Instructions running into the next bank depend on which bank is mapped there, they're fetched byte by byte
+_UNCACHEABLE = ()
+
+
+class DecodeCache:
+    # Cartridge ROM never changes, so the op code and operand bytes fetched from a bank and address can be kept for
+    # good. Entries are filled in the first time each instruction runs. Handlers are still looked up in the CPU's
+    # instruction table on every step since profilers and fusion swap it.
+
+    def __init__(self):
+        self._rom: ROM = None
+        self._entries: Dict[int, tuple] = {}
+
+    def get_rom(self) -> ROM:
+        return self._rom
+
+    def get_entry_count(self) -> int:
+        return len(self._entries)
+
+    def get(self, rom: ROM, bank: int, address: int) -> Optional[Tuple[int, bytes]]:
+        # (op code, operand bytes), None when the instruction has to be fetched through the memory unit
+        if rom is not self._rom:
+            self._rom = rom
+            self._entries = {}
+
+        key = (bank << 16) | address
+        entry = self._entries.get(key)
+
+        if entry is None:
+            entry = self._entries[key] = self._decode(bank, address)
+
+        return entry or None
+
+    def _decode(self, bank: int, address: int) -> tuple:
+        op_code = self._read_byte(bank, address)
+        operand_length = OPERAND_LENGTHS[op_code]
+
+        if (address + operand_length) >> 14 != address >> 14:
+            return _UNCACHEABLE
+
+        return op_code, bytes(self._read_byte(bank, address + 1 + i) for i in range(0, operand_length))
+
+    def _read_byte(self, bank: int, address: int) -> int:
+        # Same as MemoryUnit reads ROM
+        if address < 0x4000:
+            return self._rom.read_byte(address)
+
+        return self._rom.read_byte((bank * 0x4000 + address - 0x4000) % self._rom.get_rom_size())
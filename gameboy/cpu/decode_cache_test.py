@@ -0,0 +1,60 @@
+import pytest
+
+from gameboy.cpu.decode_cache import DecodeCache, OPERAND_LENGTHS
+from gameboy.rom import ROM
+
+
+@pytest.fixture()
+def rom_fixture() -> ROM:
+    data = bytearray(0x10000)
+    data[0x0148] = 0x01  # 64KB, 4 banks
+
+    data[0x0150:0x0153] = bytes([0x01, 0x34, 0x12])  # ld bc,$1234
+    data[0x3FFF] = 0x3E  # ld a,n with n in the next bank
+    data[0x4000] = 0x00  # Bank 1 nop
+    data[0x8000:0x8002] = bytes([0x3E, 0x42])  # Bank 2 ld a,$42
+
+    return ROM(data)
+
+
+@pytest.fixture()
+def decode_cache_fixture() -> DecodeCache:
+    return DecodeCache()
+
+
+def test_decode_cache_get(decode_cache_fixture, rom_fixture):
+    assert decode_cache_fixture.get(rom_fixture, 0, 0x0150) == (0x01, bytes([0x34, 0x12]))
+    assert decode_cache_fixture.get(rom_fixture, 0, 0x0153) == (0x00, b'')
+    assert decode_cache_fixture.get_rom() is rom_fixture
+    assert decode_cache_fixture.get_entry_count() == 2
+
+
+def test_decode_cache_get_banked(decode_cache_fixture, rom_fixture):
+    assert decode_cache_fixture.get(rom_fixture, 1, 0x4000) == (0x00, b'')
+    assert decode_cache_fixture.get(rom_fixture, 2, 0x4000) == (0x3E, bytes([0x42]))
+
+    # Banks past the end of the ROM wrap around like the memory unit reads them
+    assert decode_cache_fixture.get(rom_fixture, 6, 0x4000) == (0x3E, bytes([0x42]))
+
+
+def test_decode_cache_get_crosses_bank(decode_cache_fixture, rom_fixture):
+    assert decode_cache_fixture.get(rom_fixture, 0, 0x3FFF) is None
+    assert decode_cache_fixture.get_entry_count() == 1
+
+
+def test_decode_cache_new_rom(decode_cache_fixture, rom_fixture):
+    decode_cache_fixture.get(rom_fixture, 0, 0x0150)
+
+    other_rom = ROM(bytearray(0x8000))
+
+    assert decode_cache_fixture.get(other_rom, 0, 0x0150) == (0x00, b'')
+    assert decode_cache_fixture.get_rom() is other_rom
+    assert decode_cache_fixture.get_entry_count() == 1
+
+
+def test_decode_cache_operand_lengths():
+    assert OPERAND_LENGTHS[0x00] == 0
+    assert OPERAND_LENGTHS[0xCB] == 1
+    assert OPERAND_LENGTHS[0x20] == 1
+    assert OPERAND_LENGTHS[0xCD] == 2
+    assert OPERAND_LENGTHS[0x10] == 0
@@ -0,0 +1,126 @@
+from typing import Callable, Dict, Sequence, Tuple
+
+# Hottest adjacent op code sequences from OpcodeProfiler.get_hot_pairs on the test ROMs
+DEFAULT_SEQUENCES: Tuple[Tuple[int, ...], ...] = (
+    (0x05, 0x20),  # dec b; jr nz
+    (0x0D, 0x20),  # dec c; jr nz
+    (0x15, 0x20),  # dec d; jr nz
+    (0x1D, 0x20),  # dec e; jr nz
+    (0x3D, 0x20),  # dec a; jr nz
+    (0x2C, 0x20),  # inc l; jr nz
+    (0x0B, 0x78, 0xB1, 0x20),  # dec bc; ld a,b; or c; jr nz
+    (0x32, 0x05, 0x20),  # ld (hl-),a; dec b; jr nz
+    (0x22, 0x05, 0x20),  # ld (hl+),a; dec b; jr nz
+    (0x77, 0x2C, 0x20),  # ld (hl),a; inc l; jr nz
+    (0x2A, 0x12, 0x13),  # ld a,(hl+); ld (de),a; inc de
+    (0x1A, 0x13),  # ld a,(de); inc de
+    (0x1A, 0x22),  # ld a,(de); ld (hl+),a
+    (0xF0, 0xFE, 0x20),  # ldh a,(n); cp n; jr nz
+    (0xF0, 0xFE, 0x28),  # ldh a,(n); cp n; jr z
+    (0xF0, 0xE6),  # ldh a,(n); and n
+    (0xF0, 0xA7),  # ldh a,(n); and a
+    (0xFE, 0x20),  # cp n; jr nz
+    (0xFE, 0x28),  # cp n; jr z
+    (0x00, 0x00)  # nop; nop
+)
+
+# stop, halt, di, ei and reti change what step does before the next instruction, they can't be fused
+UNFUSABLE_OP_CODES = (0x10, 0x76, 0xF3, 0xFB, 0xD9)
+
+
+class InstructionFuser:
+    # Runs the rest of a known op code sequence straight from the first instruction's handler, skipping the
+    # per-instruction trip through GameBoy.step. Nothing but the CPU runs mid sequence, so interrupts can only be
+    # raised by the sequence itself writing IF/IE and are serviced once it ends. The GPU catches up on the whole
+    # sequence's cycles afterwards, so video timing is a little coarser while attached. Sequences stop early while
+    # an OAM DMA needs its per step updates, and aren't chained at all while any watchpoints are set.
+
+    def __init__(self, sequences: Sequence[Sequence[int]]=DEFAULT_SEQUENCES):
+        for sequence in sequences:
+            if len(sequence) < 2:
+                raise ValueError('Fused sequences need at least 2 op codes')
+
+            if any(op_code < 0 or op_code > 0xFF for op_code in sequence):
+                raise ValueError(f'Invalid op code in fused sequence: {sequence}')
+
+            if any(op_code in UNFUSABLE_OP_CODES for op_code in sequence):
+                raise ValueError(f'Fused sequence has an op code that can\'t be fused: {sequence}')
+
+        self._sequences = tuple(tuple(sequence) for sequence in sequences)
+
+        self._cpu = None
+        self._original_instruction_table: list = None
+
+    def get_sequences(self) -> Tuple[Tuple[int, ...], ...]:
+        return self._sequences
+
+    def is_attached(self) -> bool:
+        return self._cpu is not None
+
+    def attach(self, cpu) -> None:
+        if self._cpu is not None:
+            raise ValueError('Instruction fuser is already attached to a CPU')
+
+        cpu_instructions = cpu.get_cpu_instructions()
+
+        self._cpu = cpu
+        self._original_instruction_table = cpu_instructions.get_instruction_table()
+
+        cpu_instructions.set_instruction_table(self._build_fused_table(self._original_instruction_table))
+
+    def detach(self) -> None:
+        if self._cpu is None:
+            return
+
+        self._cpu.get_cpu_instructions().set_instruction_table(self._original_instruction_table)
+
+        self._cpu = None
+        self._original_instruction_table = None
+
+    def _build_fused_table(self, instruction_table: list) -> list:
+        # Sequences sharing a first op code share a trie of (next op code -> (instruction, continuations))
+        continuations: Dict[int, dict] = {}
+
+        for sequence in self._sequences:
+            if any(instruction_table[op_code] is None for op_code in sequence):
+                raise ValueError(f'Fused sequence has an unimplemented op code: {sequence}')
+
+            node = continuations.setdefault(sequence[0], {})
+
+            for op_code in sequence[1:]:
+                node = node.setdefault(op_code, (instruction_table[op_code], {}))[1]
+
+        fused_table = list(instruction_table)
+
+        for op_code, node in continuations.items():
+            fused_table[op_code] = self._fuse(instruction_table[op_code], node)
+
+        return fused_table
+
+    def _fuse(self, instruction: Callable, continuations: dict) -> Callable:
+        registers = self._cpu.get_registers()
+        memory_unit = self._cpu.get_memory_unit()
+
+        def fused_instruction(cpu_instructions):
+            instruction(cpu_instructions)
+
+            node = continuations
+
+            while node and not memory_unit.is_dma_busy():
+                program_counter = registers.get_program_counter()
+
+                # Fetching the next op code ourselves would skip execute watchpoints and double up read ones
+                if memory_unit.is_fetch_watched(program_counter):
+                    return
+
+                continuation = node.get(memory_unit.read_byte(program_counter))
+
+                if continuation is None:
+                    return
+
+                registers.set_program_counter(program_counter + 1)
+
+                next_instruction, node = continuation
+                next_instruction(cpu_instructions)
+
+        return fused_instruction
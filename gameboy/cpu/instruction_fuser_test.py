@@ -0,0 +1,140 @@
+import pytest
+
+from gameboy.cpu.cpu import CPU
+from gameboy.cpu.cpu_instructions import CPUInstructions
+from gameboy.cpu.instruction_fuser import InstructionFuser, DEFAULT_SEQUENCES
+from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.memory.watchpoint import Watchpoint
+
+# ld b,$04; ld hl,$c080; loop: ld (hl-),a; dec b; jr nz,loop; ld a,$10; cp $10; jr z,+0; halt
+COPY_LOOP_CODE = [0x06, 0x04, 0x21, 0x80, 0xC0, 0x32, 0x05, 0x20, 0xFC, 0x3E, 0x10, 0xFE, 0x10, 0x28, 0x00, 0x76]
+
+
+@pytest.fixture()
+def cpu_fixture(test_rom_fixture) -> CPU:
+    memory_unit = MemoryUnit()
+    memory_unit.set_cartridge_rom(test_rom_fixture)
+    memory_unit.write_byte(0xFF50, 1)  # Lock boot ROM
+
+    cpu = CPU(memory_unit)
+
+    for offset, byte in enumerate(COPY_LOOP_CODE):
+        memory_unit.write_byte(0xC000 + offset, byte)
+
+    cpu.get_registers().set_program_counter(0xC000)
+    cpu.get_registers()._register_a = 0xAB
+
+    return cpu
+
+
+def _run_until_halted(cpu: CPU) -> int:
+    steps = 0
+
+    while not cpu._is_halted:
+        cpu.step()
+        steps += 1
+
+    return steps
+
+
+def test_instruction_fuser_invalid_sequences():
+    with pytest.raises(ValueError):
+        InstructionFuser([(0x05,)])
+
+    with pytest.raises(ValueError):
+        InstructionFuser([(0x05, 0x100)])
+
+    with pytest.raises(ValueError):
+        InstructionFuser([(0xFB, 0x00)])
+
+
+def test_instruction_fuser_attach(cpu_fixture):
+    instruction_fuser = InstructionFuser()
+    instruction_fuser.attach(cpu_fixture)
+
+    instruction_table = cpu_fixture.get_cpu_instructions().get_instruction_table()
+
+    assert instruction_fuser.is_attached()
+    assert instruction_table is not CPUInstructions.INSTRUCTION_TABLE
+    assert instruction_table[0x05] is not CPUInstructions.INSTRUCTION_TABLE[0x05]
+    assert instruction_table[0x06] is CPUInstructions.INSTRUCTION_TABLE[0x06]
+
+    with pytest.raises(ValueError):
+        instruction_fuser.attach(cpu_fixture)
+
+    instruction_fuser.detach()
+
+    assert not instruction_fuser.is_attached()
+    assert cpu_fixture.get_cpu_instructions().get_instruction_table() is CPUInstructions.INSTRUCTION_TABLE
+
+
+def test_instruction_fuser_unimplemented_op_code(cpu_fixture):
+    with pytest.raises(ValueError):
+        InstructionFuser([(0x05, 0xD3)]).attach(cpu_fixture)
+
+
+def test_instruction_fuser_matches_unfused(cpu_fixture):
+    unfused_cpu = cpu_fixture.fork(cpu_fixture.get_memory_unit().fork())
+    unfused_steps = _run_until_halted(unfused_cpu)
+
+    cpu_fixture.enable_instruction_fusion()
+    fused_steps = _run_until_halted(cpu_fixture)
+
+    assert fused_steps < unfused_steps
+    assert cpu_fixture.get_registers().__dict__ == unfused_cpu.get_registers().__dict__
+    assert cpu_fixture.get_cycle_clock().get_total_clock_cycles() == \
+        unfused_cpu.get_cycle_clock().get_total_clock_cycles()
+
+    for address in range(0xC07C, 0xC081):
+        assert cpu_fixture.get_memory_unit().read_byte(address) == unfused_cpu.get_memory_unit().read_byte(address)
+
+
+def test_instruction_fuser_runs_whole_sequence(cpu_fixture):
+    cpu_fixture.enable_instruction_fusion()
+    cpu_fixture.step()
+    cpu_fixture.step()
+
+    # ld (hl-),a; dec b; jr nz as one step
+    cpu_fixture.step()
+
+    assert cpu_fixture.get_registers().get_program_counter() == 0xC005
+    assert cpu_fixture.get_registers()._register_b == 3
+
+
+def test_instruction_fuser_stops_for_dma(cpu_fixture):
+    cpu_fixture.enable_instruction_fusion()
+    cpu_fixture.step()
+    cpu_fixture.step()
+
+    cpu_fixture.get_memory_unit().write_byte(0xFF46, 0xC0)
+    cpu_fixture.step()
+
+    assert cpu_fixture.get_registers().get_program_counter() == 0xC006
+
+
+@pytest.mark.parametrize('access_type', [Watchpoint.AccessType.READ, Watchpoint.AccessType.EXECUTE])
+def test_instruction_fuser_stops_for_watchpoints(cpu_fixture, access_type):
+    cpu_fixture.enable_instruction_fusion()
+    cpu_fixture.get_memory_unit().add_watchpoint(Watchpoint(0xC0F0, access_type=access_type))
+    cpu_fixture.step()
+    cpu_fixture.step()
+    cpu_fixture.step()
+
+    assert cpu_fixture.get_registers().get_program_counter() == 0xC006
+
+
+def test_instruction_fuser_ignores_watchpoints_elsewhere(cpu_fixture):
+    cpu_fixture.enable_instruction_fusion()
+    cpu_fixture.get_memory_unit().add_watchpoint(Watchpoint(0xD000))
+    cpu_fixture.get_memory_unit().add_watchpoint(Watchpoint(0xD000, access_type=Watchpoint.AccessType.EXECUTE))
+    cpu_fixture.step()
+    cpu_fixture.step()
+    cpu_fixture.step()
+
+    assert cpu_fixture.get_registers().get_program_counter() == 0xC005
+
+
+def test_instruction_fuser_default_sequences_are_implemented():
+    for sequence in DEFAULT_SEQUENCES:
+        for op_code in sequence:
+            assert CPUInstructions.INSTRUCTION_TABLE[op_code] is not None
@@ -0,0 +1,267 @@
+from typing import Callable, Dict, Optional, Tuple
+
+from gameboy.cpu import alu_tables
+
+# dec r op codes usable as loop counters
+COUNTER_REGISTERS = {0x05: '_register_b', 0x0D: '_register_c', 0x15: '_register_d', 0x1D: '_register_e'}
+
+# dec bc; ld a,b; or c counts with all of bc. It reloads a every iteration, so only copy loops can use it.
+BC_COUNTER_CODE = (0x0B, 0x78, 0xB1)
+BC_COUNTER = 'bc'
+
+FILL_UP = 0
+FILL_DOWN = 1
+COPY_FROM_HL = 2
+COPY_FROM_DE = 3
+
+_POINTER_REGISTERS = ('_register_d', '_register_e', '_register_h', '_register_l')
+
+# (first op code, op codes between it and the dec r, loop kind, registers the body uses and can't count with)
+_LOOP_SHAPES = (
+    # ld (hl+),a; dec r; jr nz
+    (0x22, (), FILL_UP, _POINTER_REGISTERS[2:]),
+    # ld (hl-),a; dec r; jr nz
+    (0x32, (), FILL_DOWN, _POINTER_REGISTERS[2:]),
+    # ld a,(hl+); ld (de),a; inc de; dec r; jr nz
+    (0x2A, (0x12, 0x13), COPY_FROM_HL, _POINTER_REGISTERS),
+    # ld a,(de); ld (hl+),a; inc de; dec r; jr nz
+    (0x1A, (0x22, 0x13), COPY_FROM_DE, _POINTER_REGISTERS)
+)
+
+
+class LoopAccelerator:
+    # Runs canonical fill and copy loops as one bulk write through the memory unit. The first pass through the loop
+    # runs normally and measures what one iteration costs, then at the start of the second everything but the last
+    # iteration is done at once: memory, pointers, counter, flags and clock all end up where stepping would have
+    # left them. Only plain RAM (and ROM for copy sources) is done in bulk, IO, cartridge RAM, MBC registers and the
+    # echo area always step. Nothing else runs during the bulk part, so loops are left alone while interrupts could
+    # be taken, and VRAM/OAM writes step while the LCD is on since the GPU would only catch up afterwards.
+
+    def __init__(self):
+        self._cpu = None
+        self._original_instruction_table: list = None
+
+        # (bank, address) to (loop kind, counter register, loop length) for loops found in ROM, None for no loop
+        self._rom_loops: Dict[Tuple[int, int], Optional[Tuple[int, str, int]]] = {}
+
+        # (loop address, counter, hl, de, total clock cycles) the last time a loop start was reached
+        self._last_visit: tuple = None
+        self._accelerated_iteration_count = 0
+
+    def get_accelerated_iteration_count(self) -> int:
+        return self._accelerated_iteration_count
+
+    def is_attached(self) -> bool:
+        return self._cpu is not None
+
+    def attach(self, cpu) -> None:
+        if self._cpu is not None:
+            raise ValueError('Loop accelerator is already attached to a CPU')
+
+        cpu_instructions = cpu.get_cpu_instructions()
+
+        self._cpu = cpu
+        self._original_instruction_table = cpu_instructions.get_instruction_table()
+
+        accelerated_table = list(self._original_instruction_table)
+
+        for op_code, _, _, _ in _LOOP_SHAPES:
+            accelerated_table[op_code] = self._accelerate(op_code, self._original_instruction_table[op_code])
+
+        cpu_instructions.set_instruction_table(accelerated_table)
+
+    def detach(self) -> None:
+        if self._cpu is None:
+            return
+
+        self._cpu.get_cpu_instructions().set_instruction_table(self._original_instruction_table)
+
+        self._cpu = None
+        self._original_instruction_table = None
+        self._rom_loops = {}
+        self._last_visit = None
+
+    def _accelerate(self, op_code: int, instruction: Callable) -> Callable:
+        registers = self._cpu.get_registers()
+
+        def accelerated_instruction(cpu_instructions):
+            # The op code has already been fetched
+            loop_address = (registers.get_program_counter() - 1) & 0xFFFF
+            loop = self._find_loop(op_code, loop_address)
+
+            if loop is not None:
+                self._visit(loop_address, loop)
+
+            instruction(cpu_instructions)
+
+        return accelerated_instruction
+
+    def _find_loop(self, op_code: int, loop_address: int) -> Optional[Tuple[int, str, int]]:
+        memory_unit = self._cpu.get_memory_unit()
+
+        # Nothing is done in bulk while these are around, and the code can't be read in one go either
+        if memory_unit.get_watchpoints() or memory_unit.is_dma_busy():
+            return None
+
+        # Code in ROM doesn't change under us, RAM is checked every time
+        if loop_address < 0x8000 and memory_unit.get_io_ram().get_boot_ram_locked():
+            location = (memory_unit.get_rom_bank() if loop_address >= 0x4000 else 0, loop_address)
+
+            if location not in self._rom_loops:
+                self._rom_loops[location] = self._match_loop(op_code, loop_address)
+
+            return self._rom_loops[location]
+
+        return self._match_loop(op_code, loop_address)
+
+    def _match_loop(self, op_code: int, loop_address: int) -> Optional[Tuple[int, str, int]]:
+        memory_unit = self._cpu.get_memory_unit()
+
+        for first_op_code, body, kind, body_registers in _LOOP_SHAPES:
+            if first_op_code != op_code:
+                continue
+
+            # Body, dec r, jr nz and its offset
+            code = memory_unit.read_byte_range(loop_address + 1, len(body) + 3)
+
+            if code is None or tuple(code[:len(body)]) != body:
+                return None
+
+            counter_length = 1
+            counter_register = COUNTER_REGISTERS.get(code[len(body)])
+
+            if code[len(body)] == BC_COUNTER_CODE[0] and kind in (COPY_FROM_HL, COPY_FROM_DE):
+                counter_length = len(BC_COUNTER_CODE)
+                code = memory_unit.read_byte_range(loop_address + 1, len(body) + counter_length + 2)
+
+                if code is None or tuple(code[len(body):len(body) + counter_length]) != BC_COUNTER_CODE:
+                    return None
+
+                counter_register = BC_COUNTER
+
+            loop_length = len(body) + counter_length + 3
+            jump_index = len(body) + counter_length
+
+            # jr nz back to the loop start
+            if counter_register is None or counter_register in body_registers or \
+                    code[jump_index] != 0x20 or code[jump_index + 1] != 0x100 - loop_length:
+                return None
+
+            return kind, counter_register, loop_length
+
+        return None
+
+    def _visit(self, loop_address: int, loop: Tuple[int, str, int]) -> None:
+        registers = self._cpu.get_registers()
+        cycle_clock = self._cpu.get_cycle_clock()
+
+        kind, counter_register, loop_length = loop
+
+        if counter_register == BC_COUNTER:
+            counter = registers.read_bc()
+            counter_mask = 0xFFFF
+        else:
+            counter = getattr(registers, counter_register)
+            counter_mask = 0xFF
+
+        hl = registers.read_hl()
+        de = registers.read_de()
+        total_clock_cycles = cycle_clock.get_total_clock_cycles()
+
+        last_visit = self._last_visit
+        self._last_visit = (loop_address, counter, hl, de, total_clock_cycles)
+
+        # Only straight after exactly one iteration of this loop
+        if last_visit is None or last_visit[0] != loop_address or last_visit[1] != (counter + 1) & counter_mask:
+            return
+
+        hl_step = -1 if kind == FILL_DOWN else 1
+        de_step = 1 if kind in (COPY_FROM_HL, COPY_FROM_DE) else 0
+
+        # Fill loops can count with d or e, so de only has to follow along in copies
+        if hl != (last_visit[2] + hl_step) & 0xFFFF or (de_step and de != (last_visit[3] + de_step) & 0xFFFF):
+            return
+
+        # The last iteration steps normally so the loop exits the usual way
+        iteration_count = counter - 1
+
+        if iteration_count < 1 or not self._can_run_in_bulk():
+            return
+
+        if not self._run_in_bulk(kind, loop_address, loop_length, iteration_count, hl, de):
+            return
+
+        registers.write_hl((hl + hl_step * iteration_count) & 0xFFFF)
+
+        if de_step:
+            registers.write_de((de + de_step * iteration_count) & 0xFFFF)
+
+        if counter_register == BC_COUNTER:
+            registers.write_bc(1)
+
+            # What the last skipped ld a,b; or c left, a = 0x00 | 0x01 with every flag clear
+            registers._register_a = 1
+            registers.set_flags(0)
+        else:
+            setattr(registers, counter_register, 1)
+
+            # What the last skipped dec r left, 2 -> 1
+            registers.set_flags(alu_tables.DECREMENT_TABLE[(registers.read_flag_carry() << 4) | 2])
+
+        cycle_clock.tick(iteration_count * (total_clock_cycles - last_visit[4]) // 4)
+
+        self._last_visit = None
+        self._accelerated_iteration_count += iteration_count
+
+    def _can_run_in_bulk(self) -> bool:
+        cpu = self._cpu
+
+        if cpu.get_interrupt_enable_pending():
+            return False
+
+        return not cpu.get_registers().get_interrupts_enabled() or \
+            not cpu.get_memory_unit().get_interrupt_enable_register().get_interrupt_enabled_bits()
+
+    def _run_in_bulk(self, kind: int, loop_address: int, loop_length: int, iteration_count: int, hl: int,
+                     de: int) -> bool:
+        memory_unit = self._cpu.get_memory_unit()
+        registers = self._cpu.get_registers()
+
+        if kind == FILL_DOWN:
+            destination = hl - iteration_count + 1
+        elif kind == COPY_FROM_HL:
+            destination = de
+        else:
+            destination = hl
+
+        # Loops that overwrite themselves or run off the end of the address space step
+        if destination < 0 or destination + iteration_count > 0x10000 or \
+                _overlaps(destination, iteration_count, loop_address, loop_length):
+            return False
+
+        if memory_unit.get_io_ram().get_lcd_on() and \
+                (_overlaps(destination, iteration_count, 0x8000, 0x2000) or
+                 _overlaps(destination, iteration_count, 0xFE00, 0xA0)):
+            return False
+
+        if kind in (FILL_UP, FILL_DOWN):
+            return memory_unit.write_byte_range(destination, bytes((registers._register_a,)) * iteration_count)
+
+        source = hl if kind == COPY_FROM_HL else de
+
+        # Overlapping copies would read bytes the loop has already written
+        if _overlaps(source, iteration_count, destination, iteration_count):
+            return False
+
+        data = memory_unit.read_byte_range(source, iteration_count)
+
+        if data is None or not memory_unit.write_byte_range(destination, data):
+            return False
+
+        registers._register_a = data[-1]
+
+        return True
+
+
+def _overlaps(start: int, length: int, other_start: int, other_length: int) -> bool:
+    return start < other_start + other_length and other_start < start + length
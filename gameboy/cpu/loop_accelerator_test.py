@@ -0,0 +1,237 @@
+import pytest
+
+from gameboy.cpu.cpu import CPU
+from gameboy.cpu.cpu_instructions import CPUInstructions
+from gameboy.cpu.loop_accelerator import LoopAccelerator
+from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.memory.watchpoint import Watchpoint
+
+# ld b,$40; ld hl,$c100; loop: ld (hl+),a; dec b; jr nz,loop; halt
+FILL_LOOP_CODE = [0x06, 0x40, 0x21, 0x00, 0xC1, 0x22, 0x05, 0x20, 0xFC, 0x76]
+
+# ld d,$00; ld hl,$c1ff; loop: ld (hl-),a; dec d; jr nz,loop; halt
+FILL_DOWN_LOOP_CODE = [0x16, 0x00, 0x21, 0xFF, 0xC1, 0x32, 0x15, 0x20, 0xFC, 0x76]
+
+# ld b,$20; ld hl,$0150; ld de,$c200; loop: ld a,(hl+); ld (de),a; inc de; dec b; jr nz,loop; halt
+COPY_LOOP_CODE = [0x06, 0x20, 0x21, 0x50, 0x01, 0x11, 0x00, 0xC2, 0x2A, 0x12, 0x13, 0x05, 0x20, 0xFA, 0x76]
+
+# ld c,$10; ld de,$ff80; ld hl,$c300; loop: ld a,(de); ld (hl+),a; inc de; dec c; jr nz,loop; halt
+COPY_FROM_DE_LOOP_CODE = [0x0E, 0x10, 0x11, 0x80, 0xFF, 0x21, 0x00, 0xC3, 0x1A, 0x22, 0x13, 0x0D, 0x20, 0xFA, 0x76]
+
+# ld bc,$0120; ld hl,$0150; ld de,$c200; loop: ld a,(hl+); ld (de),a; inc de; dec bc; ld a,b; or c; jr nz,loop; halt
+COPY_BC_LOOP_CODE = [0x01, 0x20, 0x01, 0x21, 0x50, 0x01, 0x11, 0x00, 0xC2,
+                     0x2A, 0x12, 0x13, 0x0B, 0x78, 0xB1, 0x20, 0xF8, 0x76]
+
+# ld bc,$0010; ld de,$ff80; ld hl,$c300; loop: ld a,(de); ld (hl+),a; inc de; dec bc; ld a,b; or c; jr nz,loop; halt
+COPY_FROM_DE_BC_LOOP_CODE = [0x01, 0x10, 0x00, 0x11, 0x80, 0xFF, 0x21, 0x00, 0xC3,
+                             0x1A, 0x22, 0x13, 0x0B, 0x78, 0xB1, 0x20, 0xF8, 0x76]
+
+# ld bc,$0040; ld hl,$c100; loop: ld (hl+),a; dec bc; ld a,b; or c; jr nz,loop; halt
+FILL_BC_LOOP_CODE = [0x01, 0x40, 0x00, 0x21, 0x00, 0xC1, 0x22, 0x0B, 0x78, 0xB1, 0x20, 0xFA, 0x76]
+
+
+@pytest.fixture()
+def cpu_fixture(test_rom_fixture) -> CPU:
+    memory_unit = MemoryUnit()
+    memory_unit.set_cartridge_rom(test_rom_fixture)
+    memory_unit.write_byte(0xFF50, 1)  # Lock boot ROM
+
+    cpu = CPU(memory_unit)
+    cpu.get_registers().set_program_counter(0xC000)
+    cpu.get_registers()._register_a = 0xAB
+
+    for offset in range(0, 0x10):
+        memory_unit.write_byte(0xFF80 + offset, offset * 3)
+
+    return cpu
+
+
+def _load_code(cpu: CPU, code: list) -> None:
+    for offset, byte in enumerate(code):
+        cpu.get_memory_unit().write_byte(0xC000 + offset, byte)
+
+
+def _run_until_halted(cpu: CPU) -> int:
+    steps = 0
+
+    while not cpu._is_halted:
+        cpu.step()
+        steps += 1
+
+    return steps
+
+
+def _assert_matches_stepped(cpu: CPU, addresses: range) -> LoopAccelerator:
+    stepped_cpu = cpu.fork(cpu.get_memory_unit().fork())
+    stepped_steps = _run_until_halted(stepped_cpu)
+
+    loop_accelerator = cpu.enable_loop_acceleration()
+    accelerated_steps = _run_until_halted(cpu)
+
+    assert accelerated_steps <= stepped_steps
+    assert cpu.get_registers().__dict__ == stepped_cpu.get_registers().__dict__
+    assert cpu.get_cycle_clock().get_total_clock_cycles() == stepped_cpu.get_cycle_clock().get_total_clock_cycles()
+
+    for address in addresses:
+        assert cpu.get_memory_unit().read_byte(address) == stepped_cpu.get_memory_unit().read_byte(address)
+
+    return loop_accelerator
+
+
+def test_loop_accelerator_attach(cpu_fixture):
+    loop_accelerator = LoopAccelerator()
+    loop_accelerator.attach(cpu_fixture)
+
+    instruction_table = cpu_fixture.get_cpu_instructions().get_instruction_table()
+
+    assert loop_accelerator.is_attached()
+    assert instruction_table[0x22] is not CPUInstructions.INSTRUCTION_TABLE[0x22]
+    assert instruction_table[0x05] is CPUInstructions.INSTRUCTION_TABLE[0x05]
+
+    with pytest.raises(ValueError):
+        loop_accelerator.attach(cpu_fixture)
+
+    loop_accelerator.detach()
+
+    assert not loop_accelerator.is_attached()
+    assert cpu_fixture.get_cpu_instructions().get_instruction_table() is CPUInstructions.INSTRUCTION_TABLE
+
+
+def test_loop_accelerator_fill(cpu_fixture):
+    _load_code(cpu_fixture, FILL_LOOP_CODE)
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC0FF, 0xC142))
+
+    # First and last iterations step
+    assert loop_accelerator.get_accelerated_iteration_count() == 0x40 - 2
+    assert cpu_fixture.get_memory_unit().read_byte(0xC13F) == 0xAB
+
+
+def test_loop_accelerator_fill_down_256_iterations(cpu_fixture):
+    _load_code(cpu_fixture, FILL_DOWN_LOOP_CODE)
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC0FF, 0xC201))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0x100 - 2
+    assert cpu_fixture.get_registers().read_hl() == 0xC0FF
+
+
+def test_loop_accelerator_copy_from_rom(cpu_fixture):
+    _load_code(cpu_fixture, COPY_LOOP_CODE)
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC1FF, 0xC221))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0x20 - 2
+    assert cpu_fixture.get_memory_unit().read_byte(0xC21F) == cpu_fixture.get_memory_unit().read_byte(0x016F)
+
+
+def test_loop_accelerator_copy_from_de(cpu_fixture):
+    _load_code(cpu_fixture, COPY_FROM_DE_LOOP_CODE)
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC2FF, 0xC311))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0x10 - 2
+    assert cpu_fixture.get_memory_unit().read_byte(0xC30F) == 0x0F * 3
+
+
+def test_loop_accelerator_copy_bc_counter(cpu_fixture):
+    _load_code(cpu_fixture, COPY_BC_LOOP_CODE)
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC1FF, 0xC321))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0x120 - 2
+    assert cpu_fixture.get_registers().read_bc() == 0
+    assert cpu_fixture.get_memory_unit().read_byte(0xC31F) == cpu_fixture.get_memory_unit().read_byte(0x026F)
+
+
+def test_loop_accelerator_copy_from_de_bc_counter(cpu_fixture):
+    _load_code(cpu_fixture, COPY_FROM_DE_BC_LOOP_CODE)
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC2FF, 0xC311))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0x10 - 2
+    assert cpu_fixture.get_memory_unit().read_byte(0xC30F) == 0x0F * 3
+
+
+def test_loop_accelerator_bc_counter_state_after_bulk(cpu_fixture):
+    # The last iteration overwrites a and the flags again, so check them straight after the bulk part
+    _load_code(cpu_fixture, COPY_BC_LOOP_CODE)
+    stepped_cpu = cpu_fixture.fork(cpu_fixture.get_memory_unit().fork())
+    loop_accelerator = cpu_fixture.enable_loop_acceleration()
+
+    while not loop_accelerator.get_accelerated_iteration_count():
+        cpu_fixture.step()
+
+    accelerated_clock_cycles = cpu_fixture.get_cycle_clock().get_total_clock_cycles()
+
+    while stepped_cpu.get_cycle_clock().get_total_clock_cycles() < accelerated_clock_cycles:
+        stepped_cpu.step()
+
+    assert cpu_fixture.get_registers().__dict__ == stepped_cpu.get_registers().__dict__
+
+
+def test_loop_accelerator_steps_fill_bc_counter(cpu_fixture):
+    # ld a,b changes what's written every iteration, it isn't a fill
+    _load_code(cpu_fixture, FILL_BC_LOOP_CODE)
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC0FF, 0xC142))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0
+
+
+def test_loop_accelerator_steps_cartridge_ram(cpu_fixture):
+    FILL_LOOP_CODE[4] = 0xA0
+
+    try:
+        _load_code(cpu_fixture, FILL_LOOP_CODE)
+    finally:
+        FILL_LOOP_CODE[4] = 0xC1
+
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xA000, 0xA041))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0
+
+
+def test_loop_accelerator_steps_video_ram_with_lcd_on(cpu_fixture):
+    _load_code(cpu_fixture, FILL_LOOP_CODE)
+    cpu_fixture.get_memory_unit().write_byte(0xC004, 0x80)
+    cpu_fixture.get_memory_unit().write_byte(0xFF40, 0x80)
+
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0x8000, 0x8041))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0
+
+
+def test_loop_accelerator_steps_with_interrupts_enabled(cpu_fixture):
+    _load_code(cpu_fixture, FILL_LOOP_CODE)
+    cpu_fixture.get_registers().enable_interrupts()
+    cpu_fixture.get_memory_unit().get_interrupt_enable_register().enable_vblank_interrupt()
+
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC0FF, 0xC142))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0
+
+
+def test_loop_accelerator_steps_overlapping_copy(cpu_fixture):
+    _load_code(cpu_fixture, COPY_LOOP_CODE)
+    cpu_fixture.get_memory_unit().write_byte(0xC003, 0xFF)
+    cpu_fixture.get_memory_unit().write_byte(0xC004, 0xC1)
+    cpu_fixture.get_memory_unit().write_byte(0xC1FF, 0x42)
+
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC1FF, 0xC221))
+
+    # Only the single iteration before the last one doesn't overlap
+    assert loop_accelerator.get_accelerated_iteration_count() == 1
+
+
+def test_loop_accelerator_steps_for_watchpoints(cpu_fixture):
+    _load_code(cpu_fixture, FILL_LOOP_CODE)
+    cpu_fixture.get_memory_unit().add_watchpoint(Watchpoint(0xD000))
+
+    loop_accelerator = cpu_fixture.enable_loop_acceleration()
+    _run_until_halted(cpu_fixture)
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0
+    assert cpu_fixture.get_memory_unit().read_byte(0xC13F) == 0xAB
+
+
+def test_loop_accelerator_with_instruction_fusion(cpu_fixture):
+    _load_code(cpu_fixture, FILL_LOOP_CODE)
+    cpu_fixture.enable_instruction_fusion()
+
+    loop_accelerator = _assert_matches_stepped(cpu_fixture, range(0xC0FF, 0xC142))
+
+    assert loop_accelerator.get_accelerated_iteration_count() == 0x40 - 2
@@ -0,0 +1,244 @@
+import json
+import time
+from typing import Callable, Dict, List, Tuple
+
+# CB prefixed op codes are counted after the 256 base op codes
+EXTENDED_OP_CODE_OFFSET = 0x100
+OP_CODE_COUNT = 0x200
+
+EXTENDED_SHIFT_NAMES = ('rlc', 'rrc', 'rl', 'rr', 'sla', 'sra', 'swap', 'srl')
+EXTENDED_BIT_NAMES = (None, 'bit', 'res', 'set')
+EXTENDED_REGISTER_NAMES = ('b', 'c', 'd', 'e', 'h', 'l', '(hl)', 'a')
+
+
+class OpcodeProfiler:
+    SORT_COUNT = 'count'
+    SORT_HOST_TIME = 'host_time'
+    SORT_CLOCK_CYCLES = 'clock_cycles'
+
+    def __init__(self):
+        self._counts = [0] * OP_CODE_COUNT
+        self._host_times = [0] * OP_CODE_COUNT  # Nanoseconds
+        self._clock_cycles = [0] * OP_CODE_COUNT
+        self._names = [None] * OP_CODE_COUNT
+
+        # Adjacent (op code, next op code) counts, what instruction fusion candidates are picked from
+        self._pair_counts: Dict[Tuple[int, int], int] = {}
+        self._previous_op_code = [None]
+
+        self._cpu = None
+        self._original_instruction_table: list = None
+
+    def attach(self, cpu) -> None:
+        if self._cpu is not None:
+            raise ValueError('Profiler is already attached to a CPU')
+
+        cpu_instructions = cpu.get_cpu_instructions()
+
+        self._cpu = cpu
+        self._original_instruction_table = cpu_instructions.get_instruction_table()
+
+        cpu_instructions.set_instruction_table(self._build_instrumented_table(self._original_instruction_table))
+
+    def detach(self) -> None:
+        if self._cpu is None:
+            return
+
+        self._cpu.get_cpu_instructions().set_instruction_table(self._original_instruction_table)
+
+        self._cpu = None
+        self._original_instruction_table = None
+
+    def is_attached(self) -> bool:
+        return self._cpu is not None
+
+    def reset(self) -> None:
+        self._counts = [0] * OP_CODE_COUNT
+        self._host_times = [0] * OP_CODE_COUNT
+        self._clock_cycles = [0] * OP_CODE_COUNT
+        self._pair_counts = {}
+        self._previous_op_code = [None]
+
+        # Instrumented handlers hold on to the old lists, rebuild them
+        if self._cpu is not None:
+            self._cpu.get_cpu_instructions().set_instruction_table(
+                self._build_instrumented_table(self._original_instruction_table))
+
+    def get_count(self, op_code: int) -> int:
+        return self._counts[op_code]
+
+    def get_host_time(self, op_code: int) -> int:
+        return self._host_times[op_code]
+
+    def get_clock_cycles(self, op_code: int) -> int:
+        return self._clock_cycles[op_code]
+
+    def get_pair_counts(self) -> Dict[Tuple[int, int], int]:
+        return self._pair_counts
+
+    def get_hot_pairs(self, limit: int=None) -> List[Tuple[Tuple[int, int], int]]:
+        return sorted(self._pair_counts.items(), key=lambda pair: pair[1], reverse=True)[:limit]
+
+    def _build_instrumented_table(self, instruction_table: list) -> list:
+        instrumented_table = []
+
+        for op_code, instruction in enumerate(instruction_table):
+            if instruction is None:
+                instrumented_table.append(None)
+                continue
+
+            self._names[op_code] = self._get_handler_name(instruction)
+
+            if op_code == 0xCB:
+                instrumented_table.append(self._instrument_extended(instruction))
+            else:
+                instrumented_table.append(self._instrument(op_code, instruction))
+
+        for op_code in range(0, 0x100):
+            self._names[EXTENDED_OP_CODE_OFFSET + op_code] = self._get_extended_name(op_code)
+
+        return instrumented_table
+
+    @staticmethod
+    def _get_handler_name(instruction: Callable) -> str:
+        # Table entries are lambdas calling a single CPUInstructions handler
+        code = getattr(instruction, '__code__', None)
+
+        if code is not None and code.co_names:
+            return code.co_names[0]
+
+        return getattr(instruction, '__name__', repr(instruction))
+
+    @staticmethod
+    def _get_extended_name(op_code: int) -> str:
+        operation = op_code >> 6
+        bit_index_or_sub_op = (op_code >> 3) & 0x07
+        register_name = EXTENDED_REGISTER_NAMES[op_code & 0x07]
+
+        if operation == 0:
+            return f'{EXTENDED_SHIFT_NAMES[bit_index_or_sub_op]} {register_name}'
+
+        return f'{EXTENDED_BIT_NAMES[operation]} {bit_index_or_sub_op}, {register_name}'
+
+    def _instrument(self, op_code: int, instruction: Callable) -> Callable:
+        counts = self._counts
+        host_times = self._host_times
+        clock_cycles = self._clock_cycles
+        pair_counts = self._pair_counts
+        previous_op_code = self._previous_op_code
+        cycle_clock = self._cpu.get_cycle_clock()
+        perf_counter_ns = time.perf_counter_ns
+
+        def instrumented_instruction(cpu_instructions):
+            if previous_op_code[0] is not None:
+                pair = (previous_op_code[0], op_code)
+                pair_counts[pair] = pair_counts.get(pair, 0) + 1
+
+            previous_op_code[0] = op_code
+
+            start_clock_cycles = cycle_clock.get_total_clock_cycles()
+            start_time = perf_counter_ns()
+
+            result = instruction(cpu_instructions)
+
+            host_times[op_code] += perf_counter_ns() - start_time
+            clock_cycles[op_code] += cycle_clock.get_total_clock_cycles() - start_clock_cycles
+            counts[op_code] += 1
+
+            return result
+
+        return instrumented_instruction
+
+    def _instrument_extended(self, instruction: Callable) -> Callable:
+        counts = self._counts
+        host_times = self._host_times
+        clock_cycles = self._clock_cycles
+        pair_counts = self._pair_counts
+        previous_op_code = self._previous_op_code
+        cycle_clock = self._cpu.get_cycle_clock()
+        registers = self._cpu.get_registers()
+        memory_unit = self._cpu.get_memory_unit()
+        perf_counter_ns = time.perf_counter_ns
+
+        def instrumented_extended_instruction(cpu_instructions):
+            # The CB byte has been fetched, the program counter is on the extended op code. The instruction reads it
+            # again, peeking keeps read watchpoints from seeing it twice.
+            op_code = EXTENDED_OP_CODE_OFFSET + memory_unit.peek_byte(registers.get_program_counter())
+
+            if previous_op_code[0] is not None:
+                pair = (previous_op_code[0], op_code)
+                pair_counts[pair] = pair_counts.get(pair, 0) + 1
+
+            previous_op_code[0] = op_code
+
+            start_clock_cycles = cycle_clock.get_total_clock_cycles()
+            start_time = perf_counter_ns()
+
+            result = instruction(cpu_instructions)
+
+            host_times[op_code] += perf_counter_ns() - start_time
+            clock_cycles[op_code] += cycle_clock.get_total_clock_cycles() - start_clock_cycles
+            counts[op_code] += 1
+
+            return result
+
+        return instrumented_extended_instruction
+
+    def get_entries(self, sort_by: str=SORT_HOST_TIME) -> List[dict]:
+        if sort_by not in (self.SORT_COUNT, self.SORT_HOST_TIME, self.SORT_CLOCK_CYCLES):
+            raise ValueError(f'Unknown sort: {sort_by}')
+
+        entries = []
+
+        for op_code in range(0, OP_CODE_COUNT):
+            count = self._counts[op_code]
+
+            if not count:
+                continue
+
+            extended = op_code >= EXTENDED_OP_CODE_OFFSET
+
+            entries.append({
+                'op_code': op_code & 0xFF,
+                'extended': extended,
+                'name': self._names[op_code],
+                'count': count,
+                'host_time': self._host_times[op_code],
+                'clock_cycles': self._clock_cycles[op_code]
+            })
+
+        entries.sort(key=lambda entry: entry[sort_by], reverse=True)
+
+        return entries
+
+    def get_report(self, sort_by: str=SORT_HOST_TIME, limit: int=None) -> str:
+        entries = self.get_entries(sort_by)
+        total_host_time = sum(entry['host_time'] for entry in entries) or 1
+
+        lines = [
+            '{:<8} {:<42} {:>10} {:>10} {:>7} {:>8} {:>12} {:>9}'.format(
+                'op code', 'handler', 'count', 'host ms', 'host %', 'ns/op', 'cycles', 'cycles/op')
+        ]
+
+        for entry in entries[:limit]:
+            op_code = ('CB {:02X}' if entry['extended'] else '{:02X}').format(entry['op_code'])
+
+            lines.append('{:<8} {:<42} {:>10} {:>10.3f} {:>7.2f} {:>8.0f} {:>12} {:>9.2f}'.format(
+                op_code,
+                entry['name'],
+                entry['count'],
+                entry['host_time'] / 1e6,
+                entry['host_time'] * 100 / total_host_time,
+                entry['host_time'] / entry['count'],
+                entry['clock_cycles'],
+                entry['clock_cycles'] / entry['count']
+            ))
+
+        return '\n'.join(lines)
+
+    def to_json(self, sort_by: str=SORT_HOST_TIME) -> str:
+        return json.dumps({'host_time_unit': 'ns', 'op_codes': self.get_entries(sort_by)}, indent=2)
+
+    def dump_json(self, path: str, sort_by: str=SORT_HOST_TIME) -> None:
+        with open(path, 'w') as json_file:
+            json_file.write(self.to_json(sort_by))
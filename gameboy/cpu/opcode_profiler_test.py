@@ -0,0 +1,173 @@
+import json
+import os
+from unittest import mock
+
+import pytest
+
+from gameboy.cpu.cpu import CPU
+from gameboy.cpu.cpu_instructions import CPUInstructions
+from gameboy.cpu.opcode_profiler import OpcodeProfiler, EXTENDED_OP_CODE_OFFSET
+from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.memory.watchpoint import Watchpoint
+
+
+@pytest.fixture()
+def cpu_fixture(test_rom_fixture) -> CPU:
+    memory_unit = MemoryUnit()
+    memory_unit.set_cartridge_rom(test_rom_fixture)
+    memory_unit.write_byte(0xFF50, 1)  # Lock boot ROM
+
+    return CPU(memory_unit)
+
+
+def _run_code(cpu: CPU, code: list, steps: int):
+    for offset, byte in enumerate(code):
+        cpu.get_memory_unit().write_byte(0xC000 + offset, byte)
+
+    cpu.get_registers().set_program_counter(0xC000)
+
+    for _ in range(0, steps):
+        cpu.step()
+
+
+def test_opcode_profiler_attach(cpu_fixture):
+    opcode_profiler = OpcodeProfiler()
+    opcode_profiler.attach(cpu_fixture)
+
+    assert opcode_profiler.is_attached()
+    assert cpu_fixture.get_cpu_instructions().get_instruction_table() is not CPUInstructions.INSTRUCTION_TABLE
+
+    with pytest.raises(ValueError):
+        opcode_profiler.attach(cpu_fixture)
+
+    opcode_profiler.detach()
+
+    assert not opcode_profiler.is_attached()
+    assert cpu_fixture.get_cpu_instructions().get_instruction_table() is CPUInstructions.INSTRUCTION_TABLE
+
+
+def test_opcode_profiler_counts(cpu_fixture):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+
+    # nop, nop, ld b,$12, inc b, swap b
+    _run_code(cpu_fixture, [0x00, 0x00, 0x06, 0x12, 0x04, 0xCB, 0x30], 5)
+
+    assert opcode_profiler.get_count(0x00) == 2
+    assert opcode_profiler.get_count(0x06) == 1
+    assert opcode_profiler.get_count(0x04) == 1
+    assert opcode_profiler.get_count(0xCB) == 0
+    assert opcode_profiler.get_count(EXTENDED_OP_CODE_OFFSET + 0x30) == 1
+
+    assert opcode_profiler.get_clock_cycles(0x00) == 8
+    assert opcode_profiler.get_clock_cycles(0x06) == 8
+    assert opcode_profiler.get_clock_cycles(EXTENDED_OP_CODE_OFFSET + 0x30) == 4
+    assert opcode_profiler.get_host_time(0x00) > 0
+
+    # Instrumentation can't change what the instructions do
+    assert cpu_fixture.get_registers().read_bc() >> 8 == 0x31
+
+
+def test_opcode_profiler_pair_counts(cpu_fixture):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+
+    # nop, nop, ld b,$12, inc b, swap b
+    _run_code(cpu_fixture, [0x00, 0x00, 0x06, 0x12, 0x04, 0xCB, 0x30], 5)
+
+    assert opcode_profiler.get_pair_counts() == {
+        (0x00, 0x00): 1,
+        (0x00, 0x06): 1,
+        (0x06, 0x04): 1,
+        (0x04, EXTENDED_OP_CODE_OFFSET + 0x30): 1
+    }
+    assert opcode_profiler.get_hot_pairs(1) == [((0x00, 0x00), 1)]
+
+    opcode_profiler.reset()
+
+    assert opcode_profiler.get_pair_counts() == {}
+
+
+def test_opcode_profiler_disabled_keeps_counts(cpu_fixture):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+    _run_code(cpu_fixture, [0x00], 1)
+
+    cpu_fixture.disable_opcode_profiler()
+    _run_code(cpu_fixture, [0x00], 1)
+
+    assert cpu_fixture.get_opcode_profiler() is None
+    assert opcode_profiler.get_count(0x00) == 1
+
+
+def test_opcode_profiler_reset(cpu_fixture):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+    _run_code(cpu_fixture, [0x00], 1)
+
+    opcode_profiler.reset()
+    _run_code(cpu_fixture, [0x00, 0x00], 2)
+
+    assert opcode_profiler.get_count(0x00) == 2
+
+
+def test_opcode_profiler_patched_handler(cpu_fixture):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+    cpu_fixture.get_cpu_instructions().no_op = mock.Mock()
+
+    cpu_fixture.get_cpu_instructions().execute_instruction(0x00)
+
+    cpu_fixture.get_cpu_instructions().no_op.assert_called_once()
+    assert opcode_profiler.get_count(0x00) == 1
+
+
+def test_opcode_profiler_get_entries(cpu_fixture):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+    _run_code(cpu_fixture, [0x00, 0x00, 0x3C, 0xCB, 0x7F], 4)
+
+    entries = opcode_profiler.get_entries(OpcodeProfiler.SORT_COUNT)
+
+    assert entries[0]['op_code'] == 0x00
+    assert entries[0]['name'] == 'no_op'
+    assert entries[0]['count'] == 2
+    assert {(entry['op_code'], entry['extended'], entry['name']) for entry in entries[1:]} == {
+        (0x3C, False, 'increment_8_bit_register'),
+        (0x7F, True, 'bit 7, a')
+    }
+
+    with pytest.raises(ValueError):
+        opcode_profiler.get_entries('name')
+
+
+def test_opcode_profiler_extended_read_watchpoint(cpu_fixture):
+    cpu_fixture.enable_opcode_profiler()
+    hits = []
+
+    cpu_fixture.get_memory_unit().add_watchpoint(
+        Watchpoint(0xC002, access_type=Watchpoint.AccessType.READ,
+                   callback=lambda _, address, value: hits.append((address, value))))
+
+    _run_code(cpu_fixture, [0x00, 0xCB, 0x11], 2)
+
+    assert hits == [(0xC002, 0x11)]
+
+
+def test_opcode_profiler_report(cpu_fixture):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+    _run_code(cpu_fixture, [0x00, 0xCB, 0x11], 2)
+
+    report = opcode_profiler.get_report(limit=5).split('\n')
+
+    assert len(report) == 3
+    assert 'handler' in report[0]
+    assert any(line.startswith('CB 11') and 'rl c' in line for line in report)
+
+
+def test_opcode_profiler_dump_json(cpu_fixture, tmpdir):
+    opcode_profiler = cpu_fixture.enable_opcode_profiler()
+    _run_code(cpu_fixture, [0x00], 1)
+
+    path = os.path.join(str(tmpdir), 'profile.json')
+    opcode_profiler.dump_json(path)
+
+    with open(path) as json_file:
+        profile = json.load(json_file)
+
+    assert profile['op_codes'][0]['op_code'] == 0
+    assert profile['op_codes'][0]['count'] == 1
@@ -0,0 +1,202 @@
+from typing import Callable, Dict, List, Tuple
+
+from gameboy.cpu.symbol_table import SymbolTable
+
+
+class PCSamplingProfiler:
+    DEFAULT_SAMPLE_INTERVAL = 1024  # Clock cycles
+    MAX_CALL_DEPTH = 256
+
+    # Call tracking wraps these CPUInstructions handlers, reset covers rst and interrupt dispatch too
+    CALL_HANDLERS = ('call_immediate', 'reset')
+    RETURN_HANDLERS = ('return_',)
+
+    def __init__(self, sample_interval: int=DEFAULT_SAMPLE_INTERVAL, symbol_table: SymbolTable=None):
+        if sample_interval < 1:
+            raise ValueError('Sample interval must be at least 1 clock cycle')
+
+        self._sample_interval = sample_interval
+        self._symbol_table = symbol_table or SymbolTable()
+
+        self._samples: Dict[Tuple[int, int], int] = {}
+        self._stack_samples: Dict[tuple, int] = {}
+        self._call_stack: List[Tuple[int, int]] = []
+        self._dropped_call_depth = 0
+        self._next_sample_clock_cycles = 0
+
+        self._cpu = None
+        self._original_instruction_table: list = None
+        self._original_handlers: Dict[str, Callable] = {}
+
+    def get_sample_interval(self) -> int:
+        return self._sample_interval
+
+    def get_symbol_table(self) -> SymbolTable:
+        return self._symbol_table
+
+    def load_symbols(self, path: str) -> None:
+        with open(path, 'r') as sym_file:
+            self._symbol_table.parse(sym_file.read())
+
+    def get_samples(self) -> Dict[Tuple[int, int], int]:
+        # (bank, address) to sample count
+        return self._samples
+
+    def get_sample_count(self) -> int:
+        return sum(self._samples.values())
+
+    def get_call_stack(self) -> List[Tuple[int, int]]:
+        return self._call_stack
+
+    def is_attached(self) -> bool:
+        return self._cpu is not None
+
+    def attach(self, cpu) -> None:
+        if self._cpu is not None:
+            raise ValueError('Profiler is already attached to a CPU')
+
+        self._cpu = cpu
+        cpu_instructions = cpu.get_cpu_instructions()
+
+        self._original_instruction_table = cpu_instructions.get_instruction_table()
+        cpu_instructions.set_instruction_table(self._build_sampling_table(self._original_instruction_table))
+
+        # Table entries look handlers up on the instance, so wrapping them here is seen by every op code
+        for handler_name in self.CALL_HANDLERS + self.RETURN_HANDLERS:
+            self._original_handlers[handler_name] = cpu_instructions.__dict__.get(handler_name)
+            handler = getattr(cpu_instructions, handler_name)
+
+            if handler_name in self.CALL_HANDLERS:
+                setattr(cpu_instructions, handler_name, self._track_call(handler))
+            else:
+                setattr(cpu_instructions, handler_name, self._track_return(handler))
+
+        self._next_sample_clock_cycles = cpu.get_cycle_clock().get_total_clock_cycles() + self._sample_interval
+
+    def detach(self) -> None:
+        if self._cpu is None:
+            return
+
+        cpu_instructions = self._cpu.get_cpu_instructions()
+        cpu_instructions.set_instruction_table(self._original_instruction_table)
+
+        for handler_name, handler in self._original_handlers.items():
+            if handler is None:
+                delattr(cpu_instructions, handler_name)
+            else:
+                setattr(cpu_instructions, handler_name, handler)
+
+        self._cpu = None
+        self._original_instruction_table = None
+        self._original_handlers = {}
+
+    def reset(self) -> None:
+        self._samples = {}
+        self._stack_samples = {}
+
+    def _get_bank(self, address: int) -> int:
+        # Only switchable ROM has a bank worth telling apart, everything else is reported as bank 0
+        if 0x4000 <= address < 0x8000:
+            return self._cpu.get_memory_unit().get_rom_bank()
+
+        return 0
+
+    def _build_sampling_table(self, instruction_table: list) -> list:
+        return [self._sample_before(instruction) if instruction else None for instruction in instruction_table]
+
+    def _sample_before(self, instruction: Callable) -> Callable:
+        cycle_clock = self._cpu.get_cycle_clock()
+
+        def sampled_instruction(cpu_instructions):
+            if cycle_clock.get_total_clock_cycles() >= self._next_sample_clock_cycles:
+                self._sample()
+
+            return instruction(cpu_instructions)
+
+        return sampled_instruction
+
+    def _sample(self) -> None:
+        total_clock_cycles = self._cpu.get_cycle_clock().get_total_clock_cycles()
+        self._next_sample_clock_cycles = total_clock_cycles + self._sample_interval
+
+        # The op code has already been fetched
+        address = (self._cpu.get_registers().get_program_counter() - 1) & 0xFFFF
+        location = (self._get_bank(address), address)
+
+        self._samples[location] = self._samples.get(location, 0) + 1
+
+        stack = tuple(self._call_stack) + (location,)
+        self._stack_samples[stack] = self._stack_samples.get(stack, 0) + 1
+
+    def _track_call(self, handler: Callable) -> Callable:
+        registers = self._cpu.get_registers()
+
+        def tracked_call(*args, **kwargs):
+            # Frames are the call sites, so each one symbolizes to the calling routine
+            stack_pointer = registers.get_stack_pointer()
+            address = registers.get_program_counter()
+            bank = self._get_bank(address)
+
+            result = handler(*args, **kwargs)
+
+            # Conditional calls that aren't taken leave the stack alone
+            if registers.get_stack_pointer() != stack_pointer:
+                if len(self._call_stack) < self.MAX_CALL_DEPTH:
+                    self._call_stack.append((bank, address))
+                else:
+                    self._dropped_call_depth += 1
+
+            return result
+
+        return tracked_call
+
+    def _track_return(self, handler: Callable) -> Callable:
+        registers = self._cpu.get_registers()
+
+        def tracked_return(*args, **kwargs):
+            stack_pointer = registers.get_stack_pointer()
+            result = handler(*args, **kwargs)
+
+            if registers.get_stack_pointer() != stack_pointer:
+                if self._dropped_call_depth:
+                    self._dropped_call_depth -= 1
+                elif self._call_stack:
+                    # Returns from calls made before we attached have nothing to pop
+                    self._call_stack.pop()
+
+            return result
+
+        return tracked_return
+
+    def get_folded_stacks(self) -> List[str]:
+        # One "caller;callee;leaf count" line per stack, the format flamegraph.pl and speedscope read
+        folded_stacks: Dict[str, int] = {}
+
+        for stack, count in self._stack_samples.items():
+            folded_stack = ';'.join(self._symbol_table.get_function_name(bank, address) for bank, address in stack)
+            folded_stacks[folded_stack] = folded_stacks.get(folded_stack, 0) + count
+
+        return [f'{folded_stack} {count}' for folded_stack, count in sorted(folded_stacks.items())]
+
+    def dump_folded_stacks(self, path: str) -> None:
+        with open(path, 'w') as folded_file:
+            for line in self.get_folded_stacks():
+                folded_file.write(line + '\n')
+
+    def get_hot_functions(self) -> List[Tuple[str, int]]:
+        functions: Dict[str, int] = {}
+
+        for (bank, address), count in self._samples.items():
+            function_name = self._symbol_table.get_function_name(bank, address)
+            functions[function_name] = functions.get(function_name, 0) + count
+
+        return sorted(functions.items(), key=lambda function: function[1], reverse=True)
+
+    def get_report(self, limit: int=20) -> str:
+        total_samples = self.get_sample_count() or 1
+        lines = ['{:>8} {:>7}  {}'.format('samples', '%', 'function')]
+
+        for function_name, count in self.get_hot_functions()[:limit]:
+            lines.append('{:>8} {:>7.2f}  {}'.format(count, count * 100 / total_samples, function_name))
+
+        return '\n'.join(lines)
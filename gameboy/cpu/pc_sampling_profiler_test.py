@@ -0,0 +1,160 @@
+import os
+
+import pytest
+
+from gameboy.cpu.cpu import CPU
+from gameboy.cpu.cpu_instructions import CPUInstructions
+from gameboy.cpu.pc_sampling_profiler import PCSamplingProfiler
+from gameboy.cpu.symbol_table import SymbolTable
+from gameboy.memory.memory_unit import MemoryUnit
+
+# Main calls Sub in a loop, Sub runs 8 nops before returning
+PROGRAM = {
+    0xC000: [0xCD, 0x10, 0xC0, 0x18, 0xFB],  # call Sub, jr Main
+    0xC010: [0x00] * 8 + [0xC9],  # nop x8, ret
+}
+SYMBOLS = '00:c000 Main\n00:c010 Sub\n'
+
+
+@pytest.fixture()
+def cpu_fixture(test_rom_fixture) -> CPU:
+    memory_unit = MemoryUnit()
+    memory_unit.set_cartridge_rom(test_rom_fixture)
+    memory_unit.write_byte(0xFF50, 1)  # Lock boot ROM
+
+    for address, code in PROGRAM.items():
+        for offset, byte in enumerate(code):
+            memory_unit.write_byte(address + offset, byte)
+
+    cpu = CPU(memory_unit)
+    cpu.get_registers().set_program_counter(0xC000)
+    cpu.get_registers().set_stack_pointer(0xDFFE)
+
+    return cpu
+
+
+@pytest.fixture()
+def pc_sampling_profiler_fixture() -> PCSamplingProfiler:
+    symbol_table = SymbolTable()
+    symbol_table.parse(SYMBOLS)
+
+    return PCSamplingProfiler(sample_interval=4, symbol_table=symbol_table)
+
+
+def _run(cpu: CPU, steps: int):
+    for _ in range(0, steps):
+        cpu.step()
+
+
+def test_pc_sampling_profiler_init_invalid():
+    with pytest.raises(ValueError):
+        PCSamplingProfiler(sample_interval=0)
+
+
+def test_pc_sampling_profiler_attach(cpu_fixture, pc_sampling_profiler_fixture):
+    cpu_instructions = cpu_fixture.get_cpu_instructions()
+
+    cpu_fixture.enable_pc_sampling_profiler(pc_sampling_profiler_fixture)
+
+    assert pc_sampling_profiler_fixture.is_attached()
+    assert cpu_instructions.get_instruction_table() is not CPUInstructions.INSTRUCTION_TABLE
+    assert 'call_immediate' in cpu_instructions.__dict__
+
+    with pytest.raises(ValueError):
+        pc_sampling_profiler_fixture.attach(cpu_fixture)
+
+    cpu_fixture.disable_pc_sampling_profiler()
+
+    assert cpu_fixture.get_pc_sampling_profiler() is None
+    assert not pc_sampling_profiler_fixture.is_attached()
+    assert cpu_instructions.get_instruction_table() is CPUInstructions.INSTRUCTION_TABLE
+    assert 'call_immediate' not in cpu_instructions.__dict__
+    assert 'return_' not in cpu_instructions.__dict__
+
+
+def test_pc_sampling_profiler_samples(cpu_fixture, pc_sampling_profiler_fixture):
+    cpu_fixture.enable_pc_sampling_profiler(pc_sampling_profiler_fixture)
+    _run(cpu_fixture, 110)
+
+    samples = pc_sampling_profiler_fixture.get_samples()
+
+    assert pc_sampling_profiler_fixture.get_sample_count() > 50
+    assert set(address for _, address in samples) <= {0xC000, 0xC003} | set(range(0xC010, 0xC019))
+    assert all(bank == 0 for bank, _ in samples)
+
+    hot_functions = pc_sampling_profiler_fixture.get_hot_functions()
+
+    assert hot_functions[0][0] == 'Sub'
+    assert hot_functions[1][0] == 'Main'
+
+
+def test_pc_sampling_profiler_call_stack(cpu_fixture, pc_sampling_profiler_fixture):
+    cpu_fixture.enable_pc_sampling_profiler(pc_sampling_profiler_fixture)
+
+    _run(cpu_fixture, 1)
+    assert pc_sampling_profiler_fixture.get_call_stack() == [(0, 0xC001)]
+
+    _run(cpu_fixture, 9)
+    assert pc_sampling_profiler_fixture.get_call_stack() == []
+
+    # Returning with nothing tracked leaves the stack empty
+    cpu_fixture.get_registers().set_program_counter(0xC018)
+    _run(cpu_fixture, 1)
+    assert pc_sampling_profiler_fixture.get_call_stack() == []
+
+
+def test_pc_sampling_profiler_folded_stacks(cpu_fixture, pc_sampling_profiler_fixture, tmpdir):
+    cpu_fixture.enable_pc_sampling_profiler(pc_sampling_profiler_fixture)
+    _run(cpu_fixture, 110)
+
+    folded_stacks = dict(line.rsplit(' ', 1) for line in pc_sampling_profiler_fixture.get_folded_stacks())
+
+    assert set(folded_stacks) == {'Main', 'Main;Sub'}
+    assert int(folded_stacks['Main;Sub']) > int(folded_stacks['Main'])
+
+    path = os.path.join(str(tmpdir), 'stacks.folded')
+    pc_sampling_profiler_fixture.dump_folded_stacks(path)
+
+    with open(path) as folded_file:
+        assert folded_file.read().split('\n')[:-1] == pc_sampling_profiler_fixture.get_folded_stacks()
+
+
+def test_pc_sampling_profiler_report(cpu_fixture, pc_sampling_profiler_fixture):
+    cpu_fixture.enable_pc_sampling_profiler(pc_sampling_profiler_fixture)
+    _run(cpu_fixture, 50)
+
+    report = pc_sampling_profiler_fixture.get_report().split('\n')
+
+    assert len(report) == 3
+    assert report[1].endswith('Sub')
+
+
+def test_pc_sampling_profiler_reset(cpu_fixture, pc_sampling_profiler_fixture):
+    cpu_fixture.enable_pc_sampling_profiler(pc_sampling_profiler_fixture)
+    _run(cpu_fixture, 50)
+
+    pc_sampling_profiler_fixture.reset()
+
+    assert pc_sampling_profiler_fixture.get_sample_count() == 0
+    assert pc_sampling_profiler_fixture.get_folded_stacks() == []
+
+
+def test_pc_sampling_profiler_banked_rom(cpu_fixture, pc_sampling_profiler_fixture):
+    cpu_fixture.enable_pc_sampling_profiler(pc_sampling_profiler_fixture)
+    cpu_fixture.get_memory_unit()._mbc_rom_bank = 2
+
+    assert pc_sampling_profiler_fixture._get_bank(0x4123) == 2
+    assert pc_sampling_profiler_fixture._get_bank(0x0123) == 0
+    assert pc_sampling_profiler_fixture._get_bank(0xC123) == 0
+
+
+def test_pc_sampling_profiler_load_symbols(tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sym')
+
+    with open(path, 'w') as sym_file:
+        sym_file.write(SYMBOLS)
+
+    pc_sampling_profiler = PCSamplingProfiler()
+    pc_sampling_profiler.load_symbols(path)
+
+    assert pc_sampling_profiler.get_symbol_table().get_symbol_count() == 2
@@ -0,0 +1,81 @@
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+
+class SymbolTable:
+    # Labels from an RGBDS .sym file, lines look like "01:4a3f MainLoop" with ";" comments
+
+    def __init__(self):
+        self._addresses: Dict[int, List[int]] = {}
+        self._names: Dict[int, List[str]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'SymbolTable':
+        symbol_table = cls()
+
+        with open(path, 'r') as sym_file:
+            symbol_table.parse(sym_file.read())
+
+        return symbol_table
+
+    def parse(self, text: str) -> None:
+        symbols: Dict[int, List[Tuple[int, str]]] = {}
+
+        for bank, addresses in self._addresses.items():
+            symbols[bank] = list(zip(addresses, self._names[bank]))
+
+        for line in text.splitlines():
+            line = line.split(';', 1)[0].strip()
+
+            if not line:
+                continue
+
+            location, _, name = line.partition(' ')
+            bank, separator, address = location.partition(':')
+
+            if not separator or not name:
+                raise ValueError(f'Invalid symbol line: {line}')
+
+            symbols.setdefault(int(bank, 16), []).append((int(address, 16), name.strip()))
+
+        for bank, bank_symbols in symbols.items():
+            bank_symbols.sort()
+
+            self._addresses[bank] = [address for address, _ in bank_symbols]
+            self._names[bank] = [name for _, name in bank_symbols]
+
+    def get_symbol_count(self) -> int:
+        return sum(len(names) for names in self._names.values())
+
+    def lookup(self, bank: int, address: int) -> Optional[Tuple[str, int]]:
+        # Closest label at or before the address in the same bank and 16KB region, and the offset from it
+        addresses = self._addresses.get(bank)
+
+        if not addresses:
+            return None
+
+        index = bisect_right(addresses, address) - 1
+
+        if index < 0 or addresses[index] >> 14 != address >> 14:
+            return None
+
+        return self._names[bank][index], address - addresses[index]
+
+    def symbolize(self, bank: int, address: int) -> str:
+        symbol = self.lookup(bank, address)
+
+        if symbol is None:
+            return '{:02x}:{:04x}'.format(bank, address)
+
+        name, offset = symbol
+
+        return name if not offset else f'{name}+0x{offset:x}'
+
+    def get_function_name(self, bank: int, address: int) -> str:
+        # Like symbolize without the offset, so samples inside a routine add up under its label
+        symbol = self.lookup(bank, address)
+
+        if symbol is None:
+            return '{:02x}:{:04x}'.format(bank, address)
+
+        return symbol[0]
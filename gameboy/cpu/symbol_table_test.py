@@ -0,0 +1,64 @@
+import os
+
+import pytest
+
+from gameboy.cpu.symbol_table import SymbolTable
+
+SYMBOLS = '''; File generated by rgblink
+00:0150 Start
+00:0200 Start.loop
+01:4000 BankedRoutine
+02:4000 OtherBankRoutine
+00:c000 wVariables
+'''
+
+
+@pytest.fixture()
+def symbol_table_fixture() -> SymbolTable:
+    symbol_table = SymbolTable()
+    symbol_table.parse(SYMBOLS)
+
+    return symbol_table
+
+
+def test_symbol_table_parse(symbol_table_fixture):
+    assert symbol_table_fixture.get_symbol_count() == 5
+
+
+def test_symbol_table_parse_invalid(symbol_table_fixture):
+    with pytest.raises(ValueError):
+        symbol_table_fixture.parse('nonsense')
+
+
+def test_symbol_table_lookup(symbol_table_fixture):
+    assert symbol_table_fixture.lookup(0, 0x0150) == ('Start', 0)
+    assert symbol_table_fixture.lookup(0, 0x0155) == ('Start', 5)
+    assert symbol_table_fixture.lookup(0, 0x0210) == ('Start.loop', 0x10)
+    assert symbol_table_fixture.lookup(1, 0x4100) == ('BankedRoutine', 0x100)
+    assert symbol_table_fixture.lookup(2, 0x4100) == ('OtherBankRoutine', 0x100)
+    assert symbol_table_fixture.lookup(3, 0x4100) is None
+    assert symbol_table_fixture.lookup(0, 0x0100) is None
+
+    # Labels don't run on into the next region
+    assert symbol_table_fixture.lookup(0, 0x8000) is None
+    assert symbol_table_fixture.lookup(0, 0xC001) == ('wVariables', 1)
+
+
+def test_symbol_table_symbolize(symbol_table_fixture):
+    assert symbol_table_fixture.symbolize(0, 0x0150) == 'Start'
+    assert symbol_table_fixture.symbolize(0, 0x0152) == 'Start+0x2'
+    assert symbol_table_fixture.symbolize(3, 0x4100) == '03:4100'
+
+
+def test_symbol_table_get_function_name(symbol_table_fixture):
+    assert symbol_table_fixture.get_function_name(0, 0x0152) == 'Start'
+    assert symbol_table_fixture.get_function_name(3, 0x4100) == '03:4100'
+
+
+def test_symbol_table_load(tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sym')
+
+    with open(path, 'w') as sym_file:
+        sym_file.write(SYMBOLS)
+
+    assert SymbolTable.load(path).get_symbol_count() == 5
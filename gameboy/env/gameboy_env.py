@@ -0,0 +1,111 @@
+from typing import Callable, Tuple
+
+import numpy as np
+
+from gameboy.gameboy import GameBoy
+from gameboy.gpu.gpu import GPU
+from gameboy.memory.ram_variable_map import RAMVariableMap
+from gameboy.rom import ROM
+
+
+class GameBoyEnv:
+    OBSERVATION_SHAPE = (GPU.SCREEN_HEIGHT, GPU.SCREEN_WIDTH)
+
+    # Actions are Joypad.Button bits for the buttons held through the step
+    ACTION_NONE = 0
+    ACTION_COUNT = 256
+
+    def __init__(self, rom: ROM, frame_skip: int=4, max_frames: int=None,
+                 reward_function: Callable[[GameBoy], float]=None, done_function: Callable[[GameBoy], bool]=None,
+                 frame_buffer=None, skip_boot: bool=False, variable_map: RAMVariableMap=None):
+        if frame_skip < 1:
+            raise ValueError('Frame skip must be at least 1')
+
+        # Every episode starts from a fork of this instance, so resets never reparse the ROM or copy memory
+        self._initial_game_boy = GameBoy(skip_boot=skip_boot)
+        self._initial_game_boy.load_rom(rom)
+
+        self._frame_skip = frame_skip
+        self._max_frames = max_frames
+        self._reward_function = reward_function
+        self._done_function = done_function
+        self._frame_buffer = frame_buffer
+        self._variable_map = variable_map
+
+        self._game_boy: GameBoy = None
+        self._observation: np.ndarray = None
+        self._frame_count = 0
+        self._elapsed_clock_cycles = 0
+
+    def get_game_boy(self) -> GameBoy:
+        return self._game_boy
+
+    def get_initial_game_boy(self) -> GameBoy:
+        return self._initial_game_boy
+
+    def get_frame_skip(self) -> int:
+        return self._frame_skip
+
+    def get_frame_count(self) -> int:
+        return self._frame_count
+
+    def get_observation(self) -> np.ndarray:
+        return self._observation
+
+    def reset(self) -> np.ndarray:
+        self._game_boy = self._initial_game_boy.fork()
+        self._frame_count = 0
+        self._elapsed_clock_cycles = 0
+
+        gpu = self._game_boy.get_gpu()
+
+        if self._frame_buffer is not None:
+            self._frame_buffer[:] = gpu.get_buffer()
+            gpu.set_buffer(self._frame_buffer)
+
+        # A view of the frame buffer, the GPU keeps drawing into it so it's always the latest frame
+        self._observation = np.frombuffer(gpu.get_buffer(), dtype=np.uint8).reshape(self.OBSERVATION_SHAPE)
+
+        return self._observation
+
+    def step(self, action: int) -> Tuple[np.ndarray, float, bool, dict]:
+        if self._game_boy is None:
+            raise ValueError('Environment must be reset before stepping')
+
+        if not 0 <= action < self.ACTION_COUNT:
+            raise ValueError(f'Invalid action: {action}')
+
+        self._game_boy.set_pressed_buttons(action)
+
+        gpu = self._game_boy.get_gpu()
+
+        # Skipped frames still run the LCD, only the last one is drawn
+        gpu.set_rendering_enabled(False)
+        self._run_to_frame(self._frame_count + self._frame_skip - 1)
+        gpu.set_rendering_enabled(True)
+        self._run_to_frame(self._frame_count + 1)
+
+        reward = self._reward_function(self._game_boy) if self._reward_function else 0.0
+        done = self._done_function(self._game_boy) if self._done_function else False
+
+        if self._max_frames is not None and self._frame_count >= self._max_frames:
+            done = True
+
+        info = {
+            'frame_count': self._frame_count,
+            'clock_cycles': self._game_boy.get_cpu().get_cycle_clock().get_total_clock_cycles()
+        }
+
+        if self._variable_map is not None:
+            info['variables'] = self._variable_map.decode(self._game_boy.get_memory_unit())
+
+        return self._observation, reward, done, info
+
+    def _run_to_frame(self, frame: int) -> None:
+        if frame <= self._frame_count:
+            return
+
+        # Aim for the frame boundary so instruction overshoot doesn't drift the frames
+        frame_end = frame * GameBoy.CLOCK_CYCLES_PER_FRAME
+        self._elapsed_clock_cycles += self._game_boy.run_for_cycles(frame_end - self._elapsed_clock_cycles)
+        self._frame_count = frame
@@ -0,0 +1,122 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameboy.env.gameboy_env import GameBoyEnv
+from gameboy.gameboy import GameBoy
+from gameboy.memory.joypad import Joypad
+from gameboy.memory.ram_variable_map import RAMVariable, RAMVariableMap
+
+
+@pytest.fixture()
+def gameboy_env_fixture(test_rom_fixture) -> GameBoyEnv:
+    return GameBoyEnv(test_rom_fixture, frame_skip=2)
+
+
+def test_gameboy_env_init(gameboy_env_fixture, test_rom_fixture):
+    assert gameboy_env_fixture.get_initial_game_boy().get_rom() == test_rom_fixture
+    assert gameboy_env_fixture.get_frame_skip() == 2
+    assert gameboy_env_fixture.get_game_boy() is None
+
+
+def test_gameboy_env_init_skip_boot(test_rom_fixture):
+    gameboy_env = GameBoyEnv(test_rom_fixture, skip_boot=True)
+
+    assert gameboy_env.get_initial_game_boy().get_skip_boot()
+    assert gameboy_env.reset() is not None
+    assert gameboy_env.get_game_boy().get_cpu().get_registers().get_program_counter() == 0x0100
+
+
+def test_gameboy_env_step_variables(test_rom_fixture):
+    variable_map = RAMVariableMap([RAMVariable('hram', 0xFF90)])
+    gameboy_env = GameBoyEnv(test_rom_fixture, frame_skip=1, variable_map=variable_map)
+    gameboy_env.reset()
+
+    _, _, _, info = gameboy_env.step(GameBoyEnv.ACTION_NONE)
+
+    assert info['variables'] == variable_map.decode(gameboy_env.get_game_boy().get_memory_unit())
+
+
+def test_gameboy_env_init_invalid_frame_skip(test_rom_fixture):
+    with pytest.raises(ValueError):
+        GameBoyEnv(test_rom_fixture, frame_skip=0)
+
+
+def test_gameboy_env_step_before_reset(gameboy_env_fixture):
+    with pytest.raises(ValueError):
+        gameboy_env_fixture.step(GameBoyEnv.ACTION_NONE)
+
+
+def test_gameboy_env_reset(gameboy_env_fixture):
+    observation = gameboy_env_fixture.reset()
+
+    assert observation.shape == (144, 160)
+    assert observation.dtype == np.uint8
+    assert gameboy_env_fixture.get_game_boy() is not gameboy_env_fixture.get_initial_game_boy()
+    assert gameboy_env_fixture.get_frame_count() == 0
+
+
+def test_gameboy_env_observation_is_view(gameboy_env_fixture):
+    observation = gameboy_env_fixture.reset()
+
+    gameboy_env_fixture.get_game_boy().get_gpu().get_buffer()[3 * 160 + 4] = 2
+
+    assert observation[3, 4] == 2
+
+
+def test_gameboy_env_step(gameboy_env_fixture):
+    gameboy_env_fixture.reset()
+
+    observation, reward, done, info = gameboy_env_fixture.step(GameBoyEnv.ACTION_NONE)
+
+    assert observation is gameboy_env_fixture.get_observation()
+    assert reward == 0.0
+    assert not done
+    assert info['frame_count'] == 2
+    assert info['clock_cycles'] >= 2 * GameBoy.CLOCK_CYCLES_PER_FRAME
+    assert gameboy_env_fixture.get_game_boy().get_gpu().get_rendering_enabled()
+
+
+def test_gameboy_env_step_action(gameboy_env_fixture):
+    gameboy_env_fixture.reset()
+    gameboy_env_fixture.step(Joypad.Button.START.value | Joypad.Button.A.value)
+
+    joypad = gameboy_env_fixture.get_game_boy().get_joypad()
+
+    assert joypad.is_pressed(Joypad.Button.START)
+    assert joypad.is_pressed(Joypad.Button.A)
+
+    gameboy_env_fixture.step(GameBoyEnv.ACTION_NONE)
+
+    assert joypad.get_pressed_buttons() == 0
+
+    with pytest.raises(ValueError):
+        gameboy_env_fixture.step(GameBoyEnv.ACTION_COUNT)
+
+
+def test_gameboy_env_step_reward_and_done(test_rom_fixture):
+    env = GameBoyEnv(test_rom_fixture, frame_skip=1, max_frames=2,
+                     reward_function=lambda game_boy: 1.5, done_function=lambda game_boy: False)
+    env.reset()
+
+    assert env.step(GameBoyEnv.ACTION_NONE)[1:3] == (1.5, False)
+    assert env.step(GameBoyEnv.ACTION_NONE)[1:3] == (1.5, True)
+
+
+def test_gameboy_env_reset_restarts_episode(gameboy_env_fixture):
+    gameboy_env_fixture.reset()
+    gameboy_env_fixture.step(GameBoyEnv.ACTION_NONE)
+    gameboy_env_fixture.reset()
+
+    assert gameboy_env_fixture.get_frame_count() == 0
+    assert gameboy_env_fixture.get_game_boy().get_cpu().get_cycle_clock().get_total_clock_cycles() == 0
+
+
+def test_gameboy_env_frame_buffer(test_rom_fixture):
+    frame_buffer = bytearray(160 * 144)
+    env = GameBoyEnv(test_rom_fixture, frame_buffer=frame_buffer)
+
+    env.reset()
+
+    assert env.get_game_boy().get_gpu().get_buffer() is frame_buffer
+    assert env.get_initial_game_boy().get_gpu().get_buffer() is not frame_buffer
@@ -0,0 +1,175 @@
+import multiprocessing
+import pickle
+from multiprocessing import shared_memory
+from typing import Callable, List, Sequence, Tuple
+
+import numpy as np
+
+from gameboy.env.gameboy_env import GameBoyEnv
+from gameboy.gameboy import GameBoy
+from gameboy.memory.ram_variable_map import RAMVariableMap
+from gameboy.rom import ROM
+
+_COMMAND_RESET = 'reset'
+_COMMAND_STEP = 'step'
+_COMMAND_CLOSE = 'close'
+
+
+def _run_worker(connection, rom_path: str, env_index: int, observations_memory: shared_memory.SharedMemory,
+                env_kwargs: dict) -> None:
+    frame_size = GameBoyEnv.OBSERVATION_SHAPE[0] * GameBoyEnv.OBSERVATION_SHAPE[1]
+    frame_buffer = observations_memory.buf[env_index * frame_size:(env_index + 1) * frame_size]
+
+    with open(rom_path, 'rb') as rom_file:
+        rom = ROM(bytearray(rom_file.read()))
+
+    # The GPU draws straight into our slot of the shared observations, nothing is copied back to the parent
+    env = GameBoyEnv(rom, frame_buffer=frame_buffer, **env_kwargs)
+
+    try:
+        while True:
+            command, argument = connection.recv()
+
+            if command == _COMMAND_CLOSE:
+                break
+
+            try:
+                if command == _COMMAND_RESET:
+                    env.reset()
+                    connection.send(None)
+                elif command == _COMMAND_STEP:
+                    _, reward, done, info = env.step(argument)
+
+                    # Like most vectorized envs, finished episodes restart right away
+                    if done:
+                        env.reset()
+
+                    connection.send((reward, done, info))
+            except Exception as exception:
+                # Raised again in the parent by _receive
+                connection.send(exception)
+    finally:
+        # The mapping goes away with the process, the parent owns and unlinks the shared memory
+        connection.close()
+
+
+class VectorGameBoyEnv:
+    def __init__(self, rom_path: str, env_count: int, frame_skip: int=4, max_frames: int=None,
+                 reward_function: Callable[[GameBoy], float]=None, done_function: Callable[[GameBoy], bool]=None,
+                 skip_boot: bool=False, variable_map: RAMVariableMap=None):
+        if env_count < 1:
+            raise ValueError('Env count must be at least 1')
+
+        # The functions go to the workers pickled, so they have to be module level functions or other picklable
+        # callables, not lambdas or closures. Checked here so it fails the same way whatever the start method.
+        for function in (reward_function, done_function):
+            if function is None:
+                continue
+
+            try:
+                pickle.dumps(function)
+            except (pickle.PicklingError, AttributeError, TypeError):
+                raise ValueError(f'Reward and done functions must be picklable: {function!r}') from None
+
+        self._env_count = env_count
+
+        observations_shape = (env_count,) + GameBoyEnv.OBSERVATION_SHAPE
+        self._observations_memory = shared_memory.SharedMemory(create=True, size=int(np.prod(observations_shape)))
+        self._observations = np.ndarray(observations_shape, dtype=np.uint8, buffer=self._observations_memory.buf)
+
+        env_kwargs = {
+            'frame_skip': frame_skip,
+            'max_frames': max_frames,
+            'reward_function': reward_function,
+            'done_function': done_function,
+            'skip_boot': skip_boot,
+            'variable_map': variable_map
+        }
+
+        self._connections = []
+        self._processes = []
+
+        for env_index in range(0, env_count):
+            connection, worker_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_run_worker,
+                args=(worker_connection, rom_path, env_index, self._observations_memory, env_kwargs),
+                daemon=True
+            )
+            process.start()
+            worker_connection.close()
+
+            self._connections.append(connection)
+            self._processes.append(process)
+
+        self._closed = False
+
+    def __enter__(self) -> 'VectorGameBoyEnv':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_env_count(self) -> int:
+        return self._env_count
+
+    def get_observations(self) -> np.ndarray:
+        return self._observations
+
+    def reset(self) -> np.ndarray:
+        for connection in self._connections:
+            connection.send((_COMMAND_RESET, None))
+
+        for connection in self._connections:
+            self._receive(connection)
+
+        return self._observations
+
+    def step(self, actions: Sequence[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[dict]]:
+        if len(actions) != self._env_count:
+            raise ValueError('Expected one action per env')
+
+        # Send everything first so the workers emulate in parallel
+        for connection, action in zip(self._connections, actions):
+            connection.send((_COMMAND_STEP, int(action)))
+
+        rewards = np.zeros(self._env_count, dtype=np.float64)
+        dones = np.zeros(self._env_count, dtype=bool)
+        infos = []
+
+        for env_index, connection in enumerate(self._connections):
+            rewards[env_index], dones[env_index], info = self._receive(connection)
+            infos.append(info)
+
+        return self._observations, rewards, dones, infos
+
+    @staticmethod
+    def _receive(connection):
+        message = connection.recv()
+
+        if isinstance(message, Exception):
+            raise message
+
+        return message
+
+    def close(self) -> None:
+        if self._closed:
+            return
+
+        self._closed = True
+
+        for connection in self._connections:
+            try:
+                connection.send((_COMMAND_CLOSE, None))
+            except (BrokenPipeError, OSError):
+                pass
+
+        for process in self._processes:
+            process.join()
+
+        for connection in self._connections:
+            connection.close()
+
+        del self._observations
+        self._observations_memory.close()
+        self._observations_memory.unlink()
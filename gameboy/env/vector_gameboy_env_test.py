@@ -0,0 +1,71 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from gameboy.env.gameboy_env import GameBoyEnv
+from gameboy.env.vector_gameboy_env import VectorGameBoyEnv
+
+TEST_ROM_PATH = '../test_roms/instr_timing.gb'
+
+
+def _one_reward(_) -> float:
+    return 1.0
+
+
+def test_vector_gameboy_env_init_invalid_count():
+    with pytest.raises(ValueError):
+        VectorGameBoyEnv(TEST_ROM_PATH, 0)
+
+
+def test_vector_gameboy_env_init_unpicklable_function():
+    with pytest.raises(ValueError):
+        VectorGameBoyEnv(TEST_ROM_PATH, 1, reward_function=lambda game_boy: 1.0)
+
+    with pytest.raises(ValueError):
+        VectorGameBoyEnv(TEST_ROM_PATH, 1, done_function=lambda game_boy: False)
+
+
+def test_vector_gameboy_env_reward_function():
+    with VectorGameBoyEnv(TEST_ROM_PATH, 1, frame_skip=1, reward_function=_one_reward) as vector_env:
+        vector_env.reset()
+        _, rewards, _, _ = vector_env.step([GameBoyEnv.ACTION_NONE])
+
+        assert (rewards == 1.0).all()
+
+
+def test_vector_gameboy_env_step():
+    with VectorGameBoyEnv(TEST_ROM_PATH, 2, frame_skip=1, max_frames=2) as vector_env:
+        observations = vector_env.reset()
+
+        assert vector_env.get_env_count() == 2
+        assert observations.shape == (2, 144, 160)
+        assert observations is vector_env.get_observations()
+
+        observations, rewards, dones, infos = vector_env.step([GameBoyEnv.ACTION_NONE] * 2)
+
+        assert observations.shape == (2, 144, 160)
+        assert (rewards == 0.0).all()
+        assert not dones.any()
+        assert [info['frame_count'] for info in infos] == [1, 1]
+
+        # Second frame ends the episode, the workers reset on their own
+        _, _, dones, _ = vector_env.step([GameBoyEnv.ACTION_NONE] * 2)
+
+        assert dones.all()
+
+        with pytest.raises(ValueError):
+            vector_env.step([GameBoyEnv.ACTION_NONE])
+
+
+def test_vector_gameboy_env_close_twice():
+    vector_env = VectorGameBoyEnv(TEST_ROM_PATH, 1)
+    vector_env.close()
+    vector_env.close()
+
+
+def test_vector_gameboy_env_worker_error():
+    with VectorGameBoyEnv(TEST_ROM_PATH, 1) as vector_env:
+        vector_env.reset()
+
+        with pytest.raises(ValueError):
+            vector_env.step([256])
@@ -1,31 +1,427 @@
+import copy
+import os
+from typing import Optional
+
+from gameboy.apu.audio_capture import AudioCapture
 from gameboy.cpu.cpu import CPU
+from gameboy.gpu.gpu import GPU
+from gameboy.memory.io_ram import IORAM
+from gameboy.memory.joypad import Joypad
 from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.memory.real_time_clock import RealTimeClock
+from gameboy.memory.serial_endpoint import LinkedSerialEndpoint, SerialEndpoint
+from gameboy.memory.serial_port import SerialPort
+from gameboy.memory.watchpoint import Watchpoint
 from gameboy.rom import ROM
+from gameboy.scheduler import Scheduler
 
 
 class GameBoy:
-    def __init__(self):
+    CLOCK_CYCLES_PER_SECOND = 4194304
+    CLOCK_CYCLES_PER_FRAME = 70224
+
+    # DMG register and IO values as the boot ROM leaves them when it jumps to the cartridge at 0x0100
+    POST_BOOT_AF = 0x01B0
+    POST_BOOT_BC = 0x0013
+    POST_BOOT_DE = 0x00D8
+    POST_BOOT_HL = 0x014D
+    POST_BOOT_STACK_POINTER = 0xFFFE
+    POST_BOOT_PROGRAM_COUNTER = 0x0100
+
+    POST_BOOT_IO_VALUES = (
+        (0xFF00, 0xCF),  # Joypad
+        (0xFF04, 0xAB),  # Divider
+        (0xFF05, 0x00),  # Timer counter
+        (0xFF06, 0x00),  # Timer modulo
+        (0xFF07, 0x00),  # Timer control
+        (0xFF0F, 0xE1),  # Interrupt flags
+        (0xFF10, 0x80),  # Sound
+        (0xFF11, 0xBF),
+        (0xFF12, 0xF3),
+        (0xFF14, 0xBF),
+        (0xFF16, 0x3F),
+        (0xFF17, 0x00),
+        (0xFF19, 0xBF),
+        (0xFF1A, 0x7F),
+        (0xFF1B, 0xFF),
+        (0xFF1C, 0x9F),
+        (0xFF1E, 0xBF),
+        (0xFF20, 0xFF),
+        (0xFF21, 0x00),
+        (0xFF22, 0x00),
+        (0xFF23, 0xBF),
+        (0xFF24, 0x77),
+        (0xFF25, 0xF3),
+        (0xFF26, 0xF1),
+        (0xFF40, 0x91),  # LCD control
+        (0xFF41, 0x85),  # LCD status
+        (0xFF42, 0x00),  # Scroll Y
+        (0xFF43, 0x00),  # Scroll X
+        (0xFF45, 0x00),  # LY compare
+        (0xFF47, 0xFC),  # Background palette
+        (0xFF48, 0xFF),  # Object palette 0
+        (0xFF49, 0xFF),  # Object palette 1
+        (0xFF4A, 0x00),  # Window Y
+        (0xFF4B, 0x00),  # Window X
+        (0xFF50, 0x01),  # Boot ROM lock
+        (0xFFFF, 0x00)  # Interrupt enable
+    )
+
+    def __init__(self, skip_boot: bool=False,
+                 rtc_time_source: RealTimeClock.TimeSource=RealTimeClock.TimeSource.EMULATED):
         self._rom = None
         self._memory_unit = MemoryUnit()
 
         self._cpu = CPU(self._memory_unit)
+        self._gpu = GPU(self._memory_unit)
 
-    def load_rom(self, rom: ROM) -> bool:
-        print('Loaded ROM: {}'.format(rom.get_title()))
+        self._scheduler = Scheduler()
+        self._connect_scheduler()
+
+        # Starts at the cartridge entry point as if the boot ROM had already run
+        self._skip_boot = skip_boot
+
+        self._rtc_time_source = rtc_time_source
 
+        self._save_path: str = None
+        self._save_flush_interval: int = None
+        self._next_save_flush_clock_cycles = 0
+
+        self._apu = None
+        self._audio_capture: AudioCapture = None
+
+        if skip_boot:
+            self._set_post_boot_registers()
+            self._set_post_boot_io()
+
+    def load_rom(self, rom: ROM) -> bool:
         self._rom = rom
         self._memory_unit.set_cartridge_rom(rom)
 
+        if rom.get_has_real_time_clock():
+            self._memory_unit.set_real_time_clock(RealTimeClock(
+                self._rtc_time_source, self._cpu.get_cycle_clock().get_total_clock_cycles))
+
         return True
 
     def start(self) -> None:
         pass
 
-    def step(self) -> None:
-        # TODO: input update
+    def step(self) -> int:
+        cycle_clock = self._cpu.get_cycle_clock()
+        start_clock_cycles = cycle_clock.get_total_clock_cycles()
+
+        self.step_cpu()
+
+        elapsed_clock_cycles = cycle_clock.get_total_clock_cycles() - start_clock_cycles
+
+        for _ in range(0, elapsed_clock_cycles):
+            self._gpu.video_update()
+
+        return elapsed_clock_cycles
+
+    def step_cpu(self) -> None:
+        memory_unit = self._memory_unit
+
+        if not memory_unit.is_dma_busy():
+            self._cpu.handle_interrupts()
+            self._cpu.step()
+
+            # Starts the delay before a transfer this instruction asked for
+            memory_unit.dma_update()
+
+            return
+
+        # OAM DMA copies a byte every machine cycle, code waiting on it in high RAM counts on that
+        cycle_clock = self._cpu.get_cycle_clock()
+        start_machine_cycles = cycle_clock.get_total_machine_cycles()
+
         self._cpu.handle_interrupts()
         self._cpu.step()
-        self._memory_unit.dma_update()
+
+        for _ in range(0, cycle_clock.get_total_machine_cycles() - start_machine_cycles):
+            memory_unit.dma_update()
+
+    def run_for_cycles(self, clock_cycles: int) -> int:
+        # Instructions aren't split, so this can overshoot by a few cycles. Returns the cycles actually run.
+        # Also returns early, after the instruction that hit it, when a breaking watchpoint is hit.
+        # Scheduled events, like queued input or serial transfers, are handled at the first instruction boundary at
+        # or after their cycle.
+        elapsed_clock_cycles = 0
+        memory_unit = self._memory_unit
+        scheduler = self._scheduler
+        start_clock_cycles = self._cpu.get_cycle_clock().get_total_clock_cycles()
+
+        memory_unit.clear_triggered_watchpoint()
+        scheduler.run_due(start_clock_cycles)
+
+        while elapsed_clock_cycles < clock_cycles:
+            step_clock_cycles = self.step()
+
+            if not step_clock_cycles:
+                # Stopped, nothing will advance the clock until we have joypad input, so the next event can't wait
+                # for its cycle
+                if scheduler.run_next():
+                    continue
+
+                break
+
+            elapsed_clock_cycles += step_clock_cycles
+
+            if memory_unit.get_triggered_watchpoint() is not None:
+                break
+
+            # Events scheduled by this step, like a serial transfer starting, can be due before any seen so far
+            if start_clock_cycles + elapsed_clock_cycles >= scheduler.get_deadline():
+                scheduler.run_due(start_clock_cycles + elapsed_clock_cycles)
+
+        if self._save_flush_interval is not None:
+            self._update_save_flush()
+
+        if self._apu is not None:
+            self._apu.update()
+
+            if self._audio_capture is not None:
+                self._audio_capture.end_batch()
+
+        return elapsed_clock_cycles
+
+    def run_frames(self, frame_count: int) -> int:
+        return self.run_for_cycles(frame_count * self.CLOCK_CYCLES_PER_FRAME)
+
+    def fork(self) -> 'GameBoy':
+        # Registers and small state are copied outright, large memories are shared copy-on-write and ROM is shared
+        forked_game_boy = copy.copy(self)
+
+        forked_game_boy._memory_unit = self._memory_unit.fork()
+        forked_game_boy._cpu = self._cpu.fork(forked_game_boy._memory_unit)
+        forked_game_boy._gpu = self._gpu.fork(forked_game_boy._memory_unit)
+
+        # Pending events, like queued input, carry on in the fork
+        forked_game_boy._scheduler = self._scheduler.fork()
+        forked_game_boy._connect_scheduler()
+
+        # The forked RTC carries on from our counter but follows the forked CPU's clock
+        real_time_clock = forked_game_boy._memory_unit.get_real_time_clock()
+
+        if real_time_clock is not None:
+            real_time_clock.set_cycle_source(forked_game_boy._cpu.get_cycle_clock().get_total_clock_cycles)
+
+        # Same for the APU, which starts the fork with an empty sample buffer
+        if self._apu is not None:
+            forked_game_boy._apu = self._apu.fork(forked_game_boy._cpu.get_cycle_clock().get_total_clock_cycles)
+            forked_game_boy._memory_unit.set_apu(forked_game_boy._apu)
+
+        # Like save files, an audio capture stays with the instance that started it
+        forked_game_boy._audio_capture = None
+
+        # Cartridge RAM forks are private copies, they don't write back to our save file
+        forked_game_boy._save_path = None
+        forked_game_boy._save_flush_interval = None
+
+        return forked_game_boy
+
+    def enable_audio(self, sample_rate: int=48000, buffer_frame_count: int=48000):
+        # Samples are rendered up to the CPU clock on every sound register write and at the end of run_for_cycles,
+        # read them from get_apu().get_sample_ring(). Sound registers already written, by the boot ROM or
+        # _set_post_boot_io, carry over into the APU.
+        from gameboy.apu.apu import APU
+
+        if self._apu is not None:
+            raise ValueError('Audio is already enabled')
+
+        io_ram = self._memory_unit.get_io_ram()
+        apu = APU(self._cpu.get_cycle_clock().get_total_clock_cycles, sample_rate, buffer_frame_count)
+
+        # Power first, writes to the other registers are ignored while the APU is off
+        for address in [APU.MASTER_CONTROL_ADDRESS] + list(range(0xFF10, 0xFF26)) + list(range(0xFF30, 0xFF40)):
+            apu.write_byte(address, io_ram.read_byte(address))
+
+        self._apu = apu
+        self._memory_unit.set_apu(apu)
+
+        return apu
+
+    def get_apu(self):
+        return self._apu
+
+    def start_audio_capture(self, path: str, capture_format: AudioCapture.Format=AudioCapture.Format.WAV,
+                            threaded: bool=False) -> AudioCapture:
+        # Everything the APU renders from now on goes to path, as WAV or raw 16 bit little-endian stereo PCM. Writes
+        # happen at the end of run_for_cycles once a chunk has built up, on a background thread if threaded.
+        if self._apu is None:
+            raise ValueError('Audio is not enabled')
+
+        if self._audio_capture is not None:
+            raise ValueError('Audio is already being captured')
+
+        # Everything up to now belongs to before the capture
+        self._apu.update()
+
+        self._audio_capture = AudioCapture(path, self._apu.get_sample_rate(), capture_format=capture_format,
+                                           threaded=threaded)
+        self._apu.set_capture(self._audio_capture)
+
+        return self._audio_capture
+
+    def get_audio_capture(self) -> Optional[AudioCapture]:
+        return self._audio_capture
+
+    def stop_audio_capture(self) -> None:
+        if self._audio_capture is None:
+            return
+
+        self._apu.update()
+        self._apu.set_capture(None)
+        self._audio_capture.close()
+        self._audio_capture = None
+
+    def get_scheduler(self) -> Scheduler:
+        return self._scheduler
+
+    def _connect_scheduler(self) -> None:
+        serial_port = self._memory_unit.get_serial_port()
+        serial_port.set_scheduler(self._scheduler, self._cpu.get_cycle_clock().get_total_clock_cycles)
+
+        self._scheduler.set_handler(Scheduler.EventType.JOYPAD, self.set_pressed_buttons)
+        self._scheduler.set_handler(Scheduler.EventType.SERIAL_TRANSFER, serial_port.complete_transfer)
+
+    def get_joypad(self) -> Joypad:
+        return self._memory_unit.get_joypad()
+
+    def set_pressed_buttons(self, pressed_buttons: int) -> None:
+        # Joypad.Button bits for every button held from now on, the joypad interrupt is raised for new presses
+        self._memory_unit.get_joypad().set_pressed_buttons(pressed_buttons)
+
+        # Any button press ends STOP mode
+        if pressed_buttons and self._cpu.is_stopped():
+            self._cpu.clear_stopped()
+
+    def get_serial_port(self) -> SerialPort:
+        return self._memory_unit.get_serial_port()
+
+    def set_serial_endpoint(self, endpoint: SerialEndpoint) -> None:
+        # What our serial transfers exchange bytes with, see gameboy.memory.serial_endpoint
+        self._memory_unit.get_serial_port().set_endpoint(endpoint)
+
+    def link_serial(self, game_boy: 'GameBoy') -> None:
+        # Connects a link cable between us and another GameBoy in this process
+        self.set_serial_endpoint(LinkedSerialEndpoint(game_boy.get_serial_port()))
+        game_boy.set_serial_endpoint(LinkedSerialEndpoint(self.get_serial_port()))
+
+    def queue_input(self, clock_cycles: int, pressed_buttons: int) -> None:
+        # The buttons held from the given total clock cycle count on, applied by run_for_cycles. Inputs for cycles
+        # already past are applied when the next run starts.
+        if pressed_buttons & ~0xFF:
+            raise ValueError(f'Invalid buttons: {pressed_buttons}')
+
+        self._scheduler.schedule(clock_cycles, Scheduler.EventType.JOYPAD, pressed_buttons)
+
+    def _set_post_boot_registers(self) -> None:
+        registers = self._cpu.get_registers()
+
+        registers.write_af(self.POST_BOOT_AF)
+        registers.write_bc(self.POST_BOOT_BC)
+        registers.write_de(self.POST_BOOT_DE)
+        registers.write_hl(self.POST_BOOT_HL)
+        registers.set_stack_pointer(self.POST_BOOT_STACK_POINTER)
+        registers.set_program_counter(self.POST_BOOT_PROGRAM_COUNTER)
+
+    def _set_post_boot_io(self) -> None:
+        for address, value in self.POST_BOOT_IO_VALUES:
+            self._memory_unit.write_byte(address, value)
+
+        # Writes can't set STAT's mode bits, the boot ROM hands over during VBlank
+        self._memory_unit.get_io_ram().set_lcd_mode(IORAM.LCDMode.LCD_VBLANK)
+
+    def add_watchpoint(self, watchpoint: Watchpoint) -> Watchpoint:
+        # Execute watchpoints need the CPU to know about them too, so prefer these over the memory unit's
+        self._memory_unit.add_watchpoint(watchpoint)
+        self._cpu.update_execute_watchpoints()
+
+        return watchpoint
+
+    def remove_watchpoint(self, watchpoint: Watchpoint) -> None:
+        self._memory_unit.remove_watchpoint(watchpoint)
+        self._cpu.update_execute_watchpoints()
+
+    def clear_watchpoints(self) -> None:
+        self._memory_unit.clear_watchpoints()
+        self._cpu.update_execute_watchpoints()
+
+    def get_triggered_watchpoint(self) -> Optional[Watchpoint]:
+        return self._memory_unit.get_triggered_watchpoint()
+
+    def map_save_file(self, path: str, flush_interval: int=CLOCK_CYCLES_PER_SECOND) -> None:
+        # Battery backed cartridge RAM lives in the .sav file from here on. flush_interval is in clock cycles, None to
+        # only flush on close_save_file. The RTC, if there is one, is saved after the RAM.
+        if self._rom is None:
+            raise ValueError('No ROM loaded')
+
+        if not self._rom.get_has_battery():
+            raise ValueError('Cartridge has no battery backed RAM')
+
+        if self._rom.get_ram_size():
+            self._memory_unit.get_cartridge_ram().map_save_file(path)
+
+        self._save_path = path
+        self._load_real_time_clock()
+
+        self._save_flush_interval = flush_interval
+        self._next_save_flush_clock_cycles = self._get_total_clock_cycles() + (flush_interval or 0)
+
+    def flush_save_file(self) -> None:
+        if self._save_path is None:
+            return
+
+        self._memory_unit.get_cartridge_ram().flush()
+        self._save_real_time_clock()
+
+    def close_save_file(self) -> None:
+        if self._save_path is None:
+            return
+
+        self._save_real_time_clock()
+        self._memory_unit.get_cartridge_ram().close_save_file()
+
+        self._save_path = None
+        self._save_flush_interval = None
+
+    def _load_real_time_clock(self) -> None:
+        real_time_clock = self._memory_unit.get_real_time_clock()
+
+        if real_time_clock is None or not os.path.exists(self._save_path):
+            return
+
+        with open(self._save_path, 'rb') as save_file:
+            save_file.seek(self._rom.get_ram_size())
+            data = save_file.read(RealTimeClock.SAVE_SIZE)
+
+        if data:
+            real_time_clock.load_bytes(data)
+
+    def _save_real_time_clock(self) -> None:
+        real_time_clock = self._memory_unit.get_real_time_clock()
+
+        if real_time_clock is None:
+            return
+
+        with open(self._save_path, 'r+b' if os.path.exists(self._save_path) else 'w+b') as save_file:
+            save_file.seek(self._rom.get_ram_size())
+            save_file.write(real_time_clock.to_bytes())
+
+    def _update_save_flush(self) -> None:
+        total_clock_cycles = self._get_total_clock_cycles()
+
+        if total_clock_cycles >= self._next_save_flush_clock_cycles:
+            self.flush_save_file()
+            self._next_save_flush_clock_cycles = total_clock_cycles + self._save_flush_interval
+
+    def _get_total_clock_cycles(self) -> int:
+        return self._cpu.get_cycle_clock().get_total_clock_cycles()
+
+    def get_skip_boot(self) -> bool:
+        return self._skip_boot
 
     def set_interrupt(self, interrupt_bit):
         pass
@@ -33,6 +429,19 @@ class GameBoy:
     def get_memory_unit(self) -> MemoryUnit:
         return self._memory_unit
 
+    def get_cpu(self) -> CPU:
+        return self._cpu
+
+    def get_gpu(self) -> GPU:
+        return self._gpu
+
+    def get_rom(self) -> ROM:
+        return self._rom
+
     def reset(self):
         self._cpu.reset()
 
+        if self._skip_boot:
+            self._set_post_boot_registers()
+            self._set_post_boot_io()
+
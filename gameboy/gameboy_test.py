@@ -1,7 +1,17 @@
+import os
+import wave
+
 import pytest
 
 from gameboy.gameboy import GameBoy
+from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
+from gameboy.memory.joypad import Joypad
+from gameboy.memory.real_time_clock import RealTimeClock
+from gameboy.memory.serial_endpoint import CaptureSerialEndpoint
+from gameboy.memory.serial_port import SerialPort
+from gameboy.memory.watchpoint import Watchpoint
 from gameboy.rom import ROM
+from gameboy.scheduler import Scheduler
 
 
 @pytest.fixture()
@@ -26,3 +36,606 @@ def test_gameboy_it_should_load_rom(gameboy_fixture, test_rom_fixture):
 
     assert gameboy_fixture._rom == test_rom_fixture
     assert gameboy_fixture._memory_unit._cartridge_rom == test_rom_fixture
+
+
+def test_gameboy_load_rom_quiet(gameboy_fixture, test_rom_fixture, capsys):
+    # Library code leaves stdout to whoever embeds it, the ROM farm writes results there
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    assert capsys.readouterr().out == ''
+
+
+def test_gameboy_fork(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+    gameboy_fixture.get_memory_unit().write_byte(0x8000, 1)
+
+    forked_gameboy = gameboy_fixture.fork()
+
+    assert forked_gameboy._rom == test_rom_fixture
+    assert forked_gameboy._cpu is not gameboy_fixture._cpu
+    assert forked_gameboy._cpu.get_memory_unit() == forked_gameboy.get_memory_unit()
+    assert forked_gameboy._gpu is not gameboy_fixture._gpu
+    assert forked_gameboy._gpu._memory_unit == forked_gameboy.get_memory_unit()
+    assert forked_gameboy.get_memory_unit() is not gameboy_fixture.get_memory_unit()
+
+    forked_gameboy.step()
+    forked_gameboy.get_memory_unit().write_byte(0x8000, 2)
+
+    assert gameboy_fixture._cpu.get_registers().get_program_counter() == 0
+    assert gameboy_fixture.get_memory_unit().read_byte(0x8000) == 1
+    assert forked_gameboy._cpu.get_registers().get_program_counter() != 0
+    assert forked_gameboy.get_memory_unit().read_byte(0x8000) == 2
+
+
+def test_gameboy_get_cpu(gameboy_fixture):
+    assert gameboy_fixture.get_cpu() == gameboy_fixture._cpu
+
+
+def test_gameboy_get_rom(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    assert gameboy_fixture.get_rom() == test_rom_fixture
+
+
+def test_gameboy_get_gpu(gameboy_fixture):
+    assert gameboy_fixture.get_gpu() == gameboy_fixture._gpu
+    assert gameboy_fixture.get_gpu()._memory_unit == gameboy_fixture._memory_unit
+
+
+def test_gameboy_step_runs_gpu(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    elapsed_clock_cycles = gameboy_fixture.step()
+
+    assert elapsed_clock_cycles == gameboy_fixture.get_cpu().get_cycle_clock().get_total_clock_cycles()
+    assert gameboy_fixture.get_gpu()._frame_progress == elapsed_clock_cycles
+
+
+def test_gameboy_step_cpu(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    gameboy_fixture.step_cpu()
+
+    assert gameboy_fixture.get_cpu().get_cycle_clock().get_total_clock_cycles() > 0
+    assert gameboy_fixture.get_gpu()._frame_progress == 0
+
+
+def test_gameboy_step_cpu_dma(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+
+    memory_unit = gameboy.get_memory_unit()
+    memory_unit.write_byte_range(0xC000, bytes(range(0, 160)))
+
+    # The usual OAM DMA routine in high RAM, it waits 160 machine cycles for the copy and returns
+    memory_unit.write_byte_range(0xFF80, bytes([
+        0x3E, 0xC0,  # ld a, 0xC0
+        0xE0, 0x46,  # ldh (0x46), a
+        0x3E, 0x28,  # ld a, 0x28
+        0x3D,  # dec a
+        0x20, 0xFD,  # jr nz, -3
+        0x00  # nop
+    ]))
+
+    registers = gameboy.get_cpu().get_registers()
+    registers.set_program_counter(0xFF80)
+
+    while registers.get_program_counter() != 0xFF89:
+        gameboy.step_cpu()
+
+    # Done by the time the wait is over, so the return can read the stack
+    assert not memory_unit.is_dma_busy()
+    assert bytes(memory_unit.get_oam().read_byte_range(0xFE00, 160)) == bytes(range(0, 160))
+
+
+def test_gameboy_run_for_cycles(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    elapsed_clock_cycles = gameboy_fixture.run_for_cycles(1000)
+
+    assert 1000 <= elapsed_clock_cycles < 1000 + 6 * 4
+    assert gameboy_fixture.get_cpu().get_cycle_clock().get_total_clock_cycles() == elapsed_clock_cycles
+
+
+def test_gameboy_run_for_cycles_stopped(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+    gameboy_fixture.get_cpu().stop()
+
+    assert gameboy_fixture.run_for_cycles(1000) == 0
+
+
+def test_gameboy_run_frames(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    assert gameboy_fixture.run_frames(1) >= GameBoy.CLOCK_CYCLES_PER_FRAME
+
+
+def test_gameboy_skip_boot(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+
+    registers = gameboy.get_cpu().get_registers()
+    memory_unit = gameboy.get_memory_unit()
+
+    assert gameboy.get_skip_boot()
+    assert registers.read_af() == 0x01B0
+    assert registers.read_bc() == 0x0013
+    assert registers.read_de() == 0x00D8
+    assert registers.read_hl() == 0x014D
+    assert registers.get_stack_pointer() == 0xFFFE
+    assert registers.get_program_counter() == 0x0100
+
+    assert memory_unit.get_io_ram().get_boot_ram_locked()
+    assert memory_unit.get_io_ram().get_lcd_on()
+    assert memory_unit.read_byte(0xFF40) == 0x91
+    assert memory_unit.read_byte(0xFF47) == 0xFC
+    assert memory_unit.read_byte(0xFF48) == 0xFF
+    assert memory_unit.read_byte(0xFF26) == 0xF1
+
+    # The first instruction comes from the cartridge, not the boot ROM
+    assert memory_unit.read_byte(0x0000) == test_rom_fixture.read_byte(0x0000)
+
+    gameboy.step()
+
+    assert registers.get_program_counter() != 0x0100
+
+
+def test_gameboy_skip_boot_reset_io(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+    gameboy.run_for_cycles(1000)
+
+    memory_unit = gameboy.get_memory_unit()
+    memory_unit.write_byte(0xFF40, 0x00)
+    memory_unit.write_byte(0xFF47, 0x1B)
+    memory_unit.write_byte(0xFF24, 0x00)
+
+    gameboy.reset()
+
+    new_gameboy = GameBoy(skip_boot=True)
+    new_gameboy.load_rom(test_rom_fixture)
+
+    for address, _ in GameBoy.POST_BOOT_IO_VALUES:
+        assert memory_unit.read_byte(address) == new_gameboy.get_memory_unit().read_byte(address)
+
+    assert gameboy.get_cpu().get_registers().__dict__ == new_gameboy.get_cpu().get_registers().__dict__
+
+
+def test_gameboy_skip_boot_io():
+    memory_unit = GameBoy(skip_boot=True).get_memory_unit()
+
+    assert memory_unit.read_byte(0xFF04) == 0xAB
+    assert memory_unit.read_byte(0xFF41) == 0x85
+
+
+def test_gameboy_skip_boot_tetris():
+    with open('../test_roms/TETRIS.GB', 'rb') as binary_file:
+        rom = ROM(bytearray(binary_file.read()))
+
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(rom)
+    gameboy.get_gpu().set_rendering_enabled(False)
+
+    assert gameboy.run_frames(20) >= 20 * GameBoy.CLOCK_CYCLES_PER_FRAME
+
+    # Past clearing OAM and its first DMA transfers, waiting on the copyright screen
+    assert gameboy.get_memory_unit().read_byte(0xFFE1) == 0x25
+    assert gameboy.get_memory_unit().get_io_ram().get_lcd_on()
+
+
+def test_gameboy_skip_boot_default(gameboy_fixture):
+    assert not gameboy_fixture.get_skip_boot()
+    assert gameboy_fixture.get_cpu().get_registers().get_program_counter() == 0
+    assert not gameboy_fixture.get_memory_unit().get_io_ram().get_boot_ram_locked()
+
+
+def test_gameboy_skip_boot_reset(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+    gameboy.run_for_cycles(1000)
+
+    gameboy.reset()
+
+    assert gameboy.get_cpu().get_registers().get_program_counter() == 0x0100
+    assert gameboy.get_cpu().get_registers().read_af() == 0x01B0
+
+
+def test_gameboy_watchpoint_break(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    # The boot ROM clears VRAM from 0x9FFF downwards
+    watchpoint = gameboy_fixture.add_watchpoint(Watchpoint(0x9FF0, break_execution=True))
+    elapsed_clock_cycles = gameboy_fixture.run_for_cycles(GameBoy.CLOCK_CYCLES_PER_FRAME)
+
+    assert elapsed_clock_cycles < GameBoy.CLOCK_CYCLES_PER_FRAME
+    assert gameboy_fixture.get_triggered_watchpoint() is watchpoint
+    assert watchpoint.get_hit_count() == 1
+
+    # Running again carries on from where it broke
+    gameboy_fixture.remove_watchpoint(watchpoint)
+    gameboy_fixture.run_for_cycles(100)
+
+    assert gameboy_fixture.get_triggered_watchpoint() is None
+
+
+def test_gameboy_watchpoint_execute(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    hits = []
+    watchpoint = gameboy_fixture.add_watchpoint(Watchpoint(
+        0x0003, access_type=Watchpoint.AccessType.EXECUTE, break_execution=True,
+        callback=lambda _, address, op_code: hits.append((address, op_code))))
+
+    gameboy_fixture.run_for_cycles(1000)
+
+    # ld sp, 0xfffe is followed by xor a at 0x0003
+    assert hits == [(0x0003, 0xAF)]
+    assert gameboy_fixture.get_triggered_watchpoint() is watchpoint
+    assert gameboy_fixture.get_cpu().get_registers().get_program_counter() == 0x0004
+
+    gameboy_fixture.clear_watchpoints()
+
+    assert '_execute_operation' not in gameboy_fixture.get_cpu().__dict__
+
+
+def test_gameboy_fork_watchpoints(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+    gameboy_fixture.add_watchpoint(Watchpoint(0x0003, access_type=Watchpoint.AccessType.EXECUTE))
+
+    forked_gameboy = gameboy_fixture.fork()
+
+    assert '_execute_operation' not in forked_gameboy.get_cpu().__dict__
+    assert forked_gameboy.get_memory_unit().get_watchpoints() == []
+
+
+@pytest.fixture()
+def battery_rom_fixture(test_rom_fixture) -> ROM:
+    data = bytearray(test_rom_fixture._data)
+    data[0x0147] = 0x03  # MBC1, RAM and battery
+    data[0x0149] = 0x02  # 8KB RAM
+
+    return ROM(data)
+
+
+def test_gameboy_map_save_file(gameboy_fixture, battery_rom_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+
+    gameboy_fixture.load_rom(battery_rom_fixture)
+    gameboy_fixture.map_save_file(path, flush_interval=100)
+
+    memory_unit = gameboy_fixture.get_memory_unit()
+    memory_unit.write_byte(0x0000, 0x0A)  # Enable cartridge RAM
+    memory_unit.write_byte(0xA010, 0x42)
+
+    with open(path, 'rb') as save_file:
+        assert save_file.read()[0x10] == 0x42
+
+    gameboy_fixture.run_for_cycles(200)
+
+    assert gameboy_fixture._next_save_flush_clock_cycles > 200
+
+    gameboy_fixture.close_save_file()
+
+    assert not memory_unit.get_cartridge_ram().is_mapped()
+    assert memory_unit.read_byte(0xA010) == 0x42
+
+
+def test_gameboy_map_save_file_invalid(gameboy_fixture, test_rom_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+
+    with pytest.raises(ValueError):
+        gameboy_fixture.map_save_file(path)
+
+    gameboy_fixture.load_rom(test_rom_fixture)
+
+    with pytest.raises(ValueError):
+        gameboy_fixture.map_save_file(path)
+
+
+def test_gameboy_fork_save_file(gameboy_fixture, battery_rom_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+
+    gameboy_fixture.load_rom(battery_rom_fixture)
+    gameboy_fixture.map_save_file(path)
+
+    forked_gameboy = gameboy_fixture.fork()
+    forked_gameboy.get_memory_unit().write_byte(0x0000, 0x0A)
+    forked_gameboy.get_memory_unit().write_byte(0xA010, 0x42)
+
+    assert forked_gameboy._save_flush_interval is None
+
+    with open(path, 'rb') as save_file:
+        assert save_file.read()[0x10] == 0
+
+    gameboy_fixture.close_save_file()
+
+
+@pytest.fixture()
+def real_time_clock_rom_fixture(test_rom_fixture) -> ROM:
+    data = bytearray(test_rom_fixture._data)
+    data[0x0147] = 0x10  # MBC3, timer, RAM and battery
+    data[0x0149] = 0x02  # 8KB RAM
+
+    return ROM(data)
+
+
+def test_gameboy_real_time_clock(gameboy_fixture, real_time_clock_rom_fixture):
+    gameboy_fixture.load_rom(real_time_clock_rom_fixture)
+
+    real_time_clock = gameboy_fixture.get_memory_unit().get_real_time_clock()
+
+    assert real_time_clock.get_time_source() == RealTimeClock.TimeSource.EMULATED
+
+    gameboy_fixture.get_cpu().get_cycle_clock().tick(3 * GameBoy.CLOCK_CYCLES_PER_SECOND // 4)
+
+    assert real_time_clock.get_registers()[0] == 3
+
+    # The fork's clock runs with the fork's CPU
+    forked_gameboy = gameboy_fixture.fork()
+    forked_gameboy.get_cpu().get_cycle_clock().tick(2 * GameBoy.CLOCK_CYCLES_PER_SECOND // 4)
+
+    assert forked_gameboy.get_memory_unit().get_real_time_clock().get_registers()[0] == 5
+    assert real_time_clock.get_registers()[0] == 3
+
+
+def test_gameboy_real_time_clock_host_time(real_time_clock_rom_fixture):
+    gameboy = GameBoy(rtc_time_source=RealTimeClock.TimeSource.HOST)
+    gameboy.load_rom(real_time_clock_rom_fixture)
+
+    assert gameboy.get_memory_unit().get_real_time_clock().get_time_source() == RealTimeClock.TimeSource.HOST
+
+
+def test_gameboy_real_time_clock_save_file(gameboy_fixture, real_time_clock_rom_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+
+    gameboy_fixture.load_rom(real_time_clock_rom_fixture)
+    gameboy_fixture.map_save_file(path)
+    gameboy_fixture.get_memory_unit().get_real_time_clock().write_register(RealTimeClock.REGISTER_HOURS, 7)
+    gameboy_fixture.close_save_file()
+
+    assert os.path.getsize(path) == 0x2000 + RealTimeClock.SAVE_SIZE
+
+    gameboy = GameBoy()
+    gameboy.load_rom(real_time_clock_rom_fixture)
+    gameboy.map_save_file(path)
+
+    assert gameboy.get_memory_unit().get_real_time_clock().get_registers()[2] == 7
+
+    gameboy.close_save_file()
+
+
+def test_gameboy_enable_audio(test_rom_fixture):
+    pytest.importorskip('numpy')
+
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+
+    apu = gameboy.enable_audio(sample_rate=32768, buffer_frame_count=4096)
+
+    assert gameboy.get_apu() is apu
+    assert gameboy.get_memory_unit().get_apu() is apu
+    assert apu.get_sample_rate() == 32768
+
+    # The post boot sound registers carry over, channel 1 is still playing
+    assert apu.is_powered()
+    assert gameboy.get_memory_unit().read_byte(0xFF24) == 0x77
+    assert gameboy.get_memory_unit().read_byte(0xFF26) == 0xF1
+
+    with pytest.raises(ValueError):
+        gameboy.enable_audio()
+
+    gameboy.run_for_cycles(1024)
+
+    frame_count = apu.get_sample_ring().get_available_frame_count()
+    clock_cycles = gameboy.get_cpu().get_cycle_clock().get_total_clock_cycles()
+
+    # Rendered up to the end of the run, 1 sample every 128 clock cycles
+    assert frame_count == clock_cycles // 128 + 1
+
+    forked_gameboy = gameboy.fork()
+    forked_apu = forked_gameboy.get_apu()
+
+    assert forked_apu is not apu
+    assert forked_gameboy.get_memory_unit().get_apu() is forked_apu
+    assert forked_apu.get_sample_ring().get_available_frame_count() == 0
+
+    forked_gameboy.run_for_cycles(1024)
+
+    assert forked_apu.get_sample_ring().get_available_frame_count() >= 7
+    assert apu.get_sample_ring().get_available_frame_count() == frame_count
+
+
+def test_gameboy_audio_disabled(gameboy_fixture):
+    assert gameboy_fixture.get_apu() is None
+    assert gameboy_fixture.fork().get_apu() is None
+
+
+def test_gameboy_audio_capture(test_rom_fixture, tmpdir):
+    pytest.importorskip('numpy')
+
+    path = os.path.join(str(tmpdir), 'audio.wav')
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+
+    with pytest.raises(ValueError):
+        gameboy.start_audio_capture(path)
+
+    apu = gameboy.enable_audio(sample_rate=32768, buffer_frame_count=16)
+    audio_capture = gameboy.start_audio_capture(path, threaded=True)
+
+    assert gameboy.get_audio_capture() is audio_capture
+    assert apu.get_capture() is audio_capture
+    assert gameboy.fork().get_audio_capture() is None
+
+    with pytest.raises(ValueError):
+        gameboy.start_audio_capture(path)
+
+    # Nobody reads the sample ring, the capture still gets every frame
+    gameboy.run_frames(2)
+    gameboy.stop_audio_capture()
+    gameboy.stop_audio_capture()
+
+    assert gameboy.get_audio_capture() is None
+    assert apu.get_capture() is None
+    assert apu.get_sample_ring().get_dropped_frame_count() > 0
+    assert audio_capture.get_frame_count() == gameboy.get_cpu().get_cycle_clock().get_total_clock_cycles() // 128 + 1
+
+    with wave.open(path, 'rb') as wave_file:
+        assert wave_file.getnframes() == audio_capture.get_frame_count()
+
+
+def test_gameboy_queue_input(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+
+    cycle_clock = gameboy.get_cpu().get_cycle_clock()
+    start_clock_cycles = cycle_clock.get_total_clock_cycles()
+    handled_clock_cycles = []
+
+    def handle_joypad(pressed_buttons: int) -> None:
+        handled_clock_cycles.append(cycle_clock.get_total_clock_cycles())
+        gameboy.set_pressed_buttons(pressed_buttons)
+
+    gameboy.get_scheduler().set_handler(Scheduler.EventType.JOYPAD, handle_joypad)
+    gameboy.queue_input(start_clock_cycles + 1001, Joypad.Button.START.value)
+    gameboy.queue_input(start_clock_cycles + 3000, 0)
+
+    with pytest.raises(ValueError):
+        gameboy.queue_input(start_clock_cycles, 0x100)
+
+    gameboy.run_for_cycles(500)
+
+    assert not gameboy.get_joypad().get_pressed_buttons()
+
+    # Both land on the first instruction boundary at or after their cycle, in a single run
+    gameboy.run_for_cycles(5000)
+
+    assert start_clock_cycles + 1001 <= handled_clock_cycles[0] < start_clock_cycles + 1001 + 24
+    assert start_clock_cycles + 3000 <= handled_clock_cycles[1] < start_clock_cycles + 3000 + 24
+    assert not gameboy.get_joypad().get_pressed_buttons()
+    assert gameboy.get_scheduler().get_event_count() == 0
+
+
+def test_gameboy_queue_input_fork(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+    gameboy.queue_input(1000, Joypad.Button.A.value)
+
+    forked_gameboy = gameboy.fork()
+    forked_gameboy.run_for_cycles(2000)
+
+    assert forked_gameboy.get_joypad().is_pressed(Joypad.Button.A)
+    assert not gameboy.get_joypad().is_pressed(Joypad.Button.A)
+    assert gameboy.get_scheduler().get_event_count() == 1
+
+
+def test_gameboy_set_pressed_buttons_stop(gameboy_fixture, test_rom_fixture):
+    gameboy_fixture.load_rom(test_rom_fixture)
+    gameboy_fixture.get_cpu().stop()
+
+    assert gameboy_fixture.run_for_cycles(1000) == 0
+
+    # A queued press wakes the CPU even though the clock can't reach its cycle while stopped
+    gameboy_fixture.queue_input(10 ** 9, Joypad.Button.SELECT.value)
+
+    assert gameboy_fixture.run_for_cycles(1000) >= 1000
+    assert not gameboy_fixture.get_cpu().is_stopped()
+    assert gameboy_fixture.get_joypad().is_pressed(Joypad.Button.SELECT)
+
+
+# Sends the zero terminated string at 0xC100 over serial a byte at a time, waiting for each transfer like Blargg's
+# test ROMs do, then loops forever
+SERIAL_PRINT_PROGRAM = bytes([
+    0x21, 0x00, 0xC1,  # ld hl, 0xC100
+    0x2A,  # ld a, (hl+)
+    0xB7,  # or a
+    0x28, 0xFE,  # jr z, -2
+    0xE0, 0x01,  # ldh (0x01), a
+    0x3E, 0x81,  # ld a, 0x81
+    0xE0, 0x02,  # ldh (0x02), a
+    0xF0, 0x02,  # ldh a, (0x02)
+    0xCB, 0x7F,  # bit 7, a
+    0x20, 0xFA,  # jr nz, -6
+    0x18, 0xEE  # jr -18
+])
+
+
+def _load_serial_print_program(gameboy: GameBoy, text: bytes) -> None:
+    memory_unit = gameboy.get_memory_unit()
+    memory_unit.write_byte_range(0xC000, SERIAL_PRINT_PROGRAM)
+    memory_unit.write_byte_range(0xC100, text + b'\x00')
+    gameboy.get_cpu().get_registers().set_program_counter(0xC000)
+
+
+def test_gameboy_serial_capture(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+    _load_serial_print_program(gameboy, b'Passed\n')
+
+    endpoint = CaptureSerialEndpoint()
+    gameboy.set_serial_endpoint(endpoint)
+
+    cycle_clock = gameboy.get_cpu().get_cycle_clock()
+    start_clock_cycles = []
+    completed_clock_cycles = []
+    serial_port = gameboy.get_serial_port()
+
+    def complete_transfer(value: int) -> None:
+        completed_clock_cycles.append(cycle_clock.get_total_clock_cycles())
+        serial_port.complete_transfer(value)
+
+    gameboy.get_scheduler().set_handler(Scheduler.EventType.SERIAL_TRANSFER, complete_transfer)
+    gameboy.add_watchpoint(Watchpoint(0xFF02, callback=lambda _, __, ___: start_clock_cycles.append(
+        cycle_clock.get_total_clock_cycles())))
+
+    gameboy.run_for_cycles(6 * SerialPort.TRANSFER_CLOCK_CYCLES)
+
+    assert endpoint.get_captured_bytes() == b'Passed'[:len(completed_clock_cycles)]
+    assert len(completed_clock_cycles) < 7
+
+    gameboy.run_for_cycles(2 * SerialPort.TRANSFER_CLOCK_CYCLES)
+
+    assert endpoint.get_captured_text() == 'Passed\n'
+    assert gameboy.get_memory_unit().read_byte(0xFF0F) & InterruptFlagRegister.INTERRUPT_SERIAL
+
+    # Each finishes within an instruction of its cycle, scheduled mid-run or not
+    assert len(start_clock_cycles) == len(completed_clock_cycles) == 7
+
+    for start, completed in zip(start_clock_cycles, completed_clock_cycles):
+        assert start + SerialPort.TRANSFER_CLOCK_CYCLES <= completed < start + SerialPort.TRANSFER_CLOCK_CYCLES + 24
+
+
+def test_gameboy_serial_fork(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+    _load_serial_print_program(gameboy, b'AB')
+    gameboy.set_serial_endpoint(CaptureSerialEndpoint())
+    gameboy.run_for_cycles(SerialPort.TRANSFER_CLOCK_CYCLES + 100)
+
+    forked_gameboy = gameboy.fork()
+    forked_gameboy.run_for_cycles(2 * SerialPort.TRANSFER_CLOCK_CYCLES)
+
+    assert forked_gameboy.get_serial_port().get_endpoint().get_captured_bytes() == b'AB'
+    assert gameboy.get_serial_port().get_endpoint().get_captured_bytes() == b'A'
+
+
+def test_gameboy_link_serial(test_rom_fixture):
+    gameboy = GameBoy(skip_boot=True)
+    gameboy.load_rom(test_rom_fixture)
+    _load_serial_print_program(gameboy, b'A')
+
+    linked_gameboy = GameBoy(skip_boot=True)
+    linked_gameboy.load_rom(test_rom_fixture)
+    gameboy.link_serial(linked_gameboy)
+
+    # Waiting on our clock
+    linked_memory_unit = linked_gameboy.get_memory_unit()
+    linked_memory_unit.write_byte(0xFF01, 0x42)
+    linked_memory_unit.write_byte(0xFF02, 0x80)
+
+    gameboy.run_for_cycles(2 * SerialPort.TRANSFER_CLOCK_CYCLES)
+
+    assert gameboy.get_memory_unit().read_byte(0xFF01) == 0x42
+    assert linked_memory_unit.read_byte(0xFF01) == 0x41
+    assert not linked_gameboy.get_serial_port().is_transferring()
+    assert linked_memory_unit.read_byte(0xFF0F) & InterruptFlagRegister.INTERRUPT_SERIAL
@@ -1,21 +1,92 @@
+import copy
 from math import floor
 from typing import List
 
 from gameboy.gpu.gpu_sprite import GPUSprite
+from gameboy.gpu.shared_frame_ring import SharedFrameRing
 from gameboy.memory.io_ram import IORAM
 from gameboy.memory.memory_unit import MemoryUnit
 
 
 class GPU:
+    SCREEN_WIDTH = 160
+    SCREEN_HEIGHT = 144
+    SPRITES_PER_LINE = 10
+
+    _EMPTY_SPRITE_LINE = bytes(SCREEN_WIDTH)
+
     def __init__(self, memory_unit: MemoryUnit):
         self._memory_unit = memory_unit
         self._frame_progress = 0
-        self._buffer = [[0 for _ in range(0, 144)] for _ in range(0, 160)]
+        # Row-major palette shades, one byte per pixel
+        self._buffer = bytearray(self.SCREEN_WIDTH * self.SCREEN_HEIGHT)
         self._new_frame_available = False
+        self._rendering_enabled = True
+        self._frame_ring: SharedFrameRing = None
         self._sprite_buffer: List[GPUSprite] = []
+        self._sprite_pool = self._create_sprite_pool()
+        self._sprite_line = bytearray(self.SCREEN_WIDTH)
+
+        # Per line OAM offsets, rebuilt when OAM or the sprite height changes
+        self._sprite_table_key = None
+        self._oam_entries: List[tuple] = []
+        self._line_sprite_tables: List[List[int]] = []
 
         self._current_x = 0
 
+    def fork(self, memory_unit: MemoryUnit) -> 'GPU':
+        forked_gpu = copy.copy(self)
+
+        forked_gpu._memory_unit = memory_unit
+        forked_gpu._buffer = bytearray(self._buffer)
+        forked_gpu._frame_ring = None
+
+        # Pooled sprites and the sprite row are refilled in place, the fork needs its own
+        forked_gpu._sprite_pool = self._create_sprite_pool()
+        forked_gpu._sprite_buffer = []
+        forked_gpu._sprite_line = bytearray(self._sprite_line)
+
+        return forked_gpu
+
+    @classmethod
+    def _create_sprite_pool(cls) -> List[GPUSprite]:
+        return [GPUSprite(x=0, y=0, pixels=[0, 0], attributes=0) for _ in range(0, cls.SPRITES_PER_LINE)]
+
+    def get_buffer(self) -> bytearray:
+        return self._buffer
+
+    def set_buffer(self, buffer) -> None:
+        # Any writable buffer of SCREEN_WIDTH * SCREEN_HEIGHT bytes, e.g. a view into shared memory
+        if len(buffer) != self.SCREEN_WIDTH * self.SCREEN_HEIGHT:
+            raise ValueError('Invalid frame buffer size')
+
+        self._buffer = buffer
+
+    def get_frame_ring(self) -> SharedFrameRing:
+        return self._frame_ring
+
+    def set_frame_ring(self, frame_ring: SharedFrameRing) -> None:
+        # Draw straight into a shared memory frame ring, a frame is published to readers on every VBlank. Set back
+        # to None before closing the ring, we hold a view of it until then.
+        if frame_ring is None:
+            self._buffer = bytearray(self._buffer)
+        else:
+            if frame_ring.get_frame_size() != self.SCREEN_WIDTH * self.SCREEN_HEIGHT:
+                raise ValueError('Invalid frame ring frame size')
+
+            frame_buffer = frame_ring.get_write_buffer()
+            frame_buffer[:] = self._buffer
+            self._buffer = frame_buffer
+
+        self._frame_ring = frame_ring
+
+    def get_rendering_enabled(self) -> bool:
+        return self._rendering_enabled
+
+    def set_rendering_enabled(self, value: bool) -> None:
+        # LCD timing and interrupts still run while disabled, pixels just aren't drawn
+        self._rendering_enabled = value
+
     def _get_map_pixel(self, high_map: bool, low_tiles: bool, x: int, y: int) -> int:
         base_tile_index_address = 0x9C00 if high_map else 0x9800
         tile_index_address = int(base_tile_index_address + ((floor(y / 8) * 32) + (floor(x / 8))))
@@ -46,31 +117,50 @@ class GPU:
 
         return (palette_byte >> (pixel_byte * 2)) & 0x03
 
-    def _get_scanline_sprites(self, scanline_number: int):
-        sprite_height = self._memory_unit\
-            .get_io_ram()\
-            .get_sprite_height()
+    def _update_line_sprite_tables(self) -> None:
+        oam = self._memory_unit.get_oam()
+        sprite_height = self._memory_unit.get_io_ram().get_sprite_height()
+        sprite_table_key = (oam.get_version(), sprite_height)
 
-        unordered_sprites = []
+        if sprite_table_key == self._sprite_table_key:
+            return
+
+        # Decode OAM once into (y, x, tile, attributes) entries and pick every line's sprites in one pass
+        oam_data = bytes(oam.read_byte_range(0xFE00, 160))
+        line_sprite_tables = [[] for _ in range(0, self.SCREEN_HEIGHT)]
 
         for sprite_oam_offset in range(0, 160, 4):
-            sprite_memory_address = 0xFE00 + sprite_oam_offset
+            sprite_y_position = oam_data[sprite_oam_offset]
+
+            # Sprites are selected in OAM order, only the first 10 on a line are drawn. Sprites off the sides
+            # of the screen still count towards the limit.
+            first_line = max(sprite_y_position - 16, 0)
+            last_line = min(sprite_y_position - 16 + sprite_height, self.SCREEN_HEIGHT)
 
-            sprite_y_position = self._memory_unit.read_byte(sprite_memory_address)
-            sprite_x_position = self._memory_unit.read_byte(sprite_memory_address + 1)
+            for scanline_number in range(first_line, last_line):
+                line_sprite_table = line_sprite_tables[scanline_number]
 
-            sprite_off_screen = sprite_y_position <= 0 or sprite_y_position >= 160 or sprite_x_position >= 168
+                if len(line_sprite_table) < self.SPRITES_PER_LINE:
+                    line_sprite_table.append(sprite_oam_offset)
 
-            if sprite_off_screen:
-                continue
+        for line_sprite_table in line_sprite_tables:
+            # Lower X draws on top, OAM order breaks ties
+            line_sprite_table.sort(key=lambda sprite_oam_offset: (oam_data[sprite_oam_offset + 1], sprite_oam_offset))
 
-            sprite_in_scan_line = sprite_y_position <= scanline_number + 16 < sprite_y_position + sprite_height
+        self._oam_entries = [tuple(oam_data[offset:offset + 4]) for offset in range(0, 160, 4)]
+        self._line_sprite_tables = line_sprite_tables
+        self._sprite_table_key = sprite_table_key
 
-            if not sprite_in_scan_line:
-                continue
+    def _get_scanline_sprites(self, scanline_number: int) -> List[GPUSprite]:
+        # Sprites on the line in drawing priority order, highest first
+        self._update_line_sprite_tables()
 
-            sprite_tile = self._memory_unit.read_byte(sprite_memory_address + 2)
-            sprite_attributes = self._memory_unit.read_byte(sprite_memory_address + 3)
+        sprite_height = self._sprite_table_key[1]
+        line_sprite_table = self._line_sprite_tables[scanline_number]
+
+        for sprite, sprite_oam_offset in zip(self._sprite_pool, line_sprite_table):
+            sprite_y_position, sprite_x_position, sprite_tile, sprite_attributes = \
+                self._oam_entries[sprite_oam_offset >> 2]
 
             if sprite_height == 16:
                 sprite_tile &= 0xFE
@@ -82,22 +172,37 @@ class GPU:
 
             sprite_tiles_address = self._get_tile_line_address(sprite_tile, sprite_tile_y, use_lower_bank=True)
 
-            unordered_sprites.append(
-                GPUSprite(
-                    x=sprite_x_position,
-                    y=sprite_y_position,
-                    pixels=[
-                        self._memory_unit.read_byte(sprite_tiles_address),
-                        self._memory_unit.read_byte(sprite_tiles_address + 1)
-                    ],
-                    attributes=sprite_attributes
-                )
+            sprite.set(
+                sprite_x_position,
+                sprite_y_position,
+                self._memory_unit.read_byte(sprite_tiles_address),
+                self._memory_unit.read_byte(sprite_tiles_address + 1),
+                sprite_attributes
             )
 
-            # TODO: order sprites
-            # TODO: limit to 10 sprites per scanline
+        return self._sprite_pool[:len(line_sprite_table)]
+
+    def _composite_sprites(self, sprites: List[GPUSprite]) -> bytearray:
+        # Flattens the line's sprites into one byte per screen column: the sprite pixel (0 is transparent) with
+        # the palette (0x10) and behind background (0x80) attribute bits. Lowest priority sprites are drawn first
+        # so higher priority opaque pixels end up on top.
+        sprite_line = self._sprite_line
+        sprite_line[:] = self._EMPTY_SPRITE_LINE
+
+        for sprite in reversed(sprites):
+            line_0_byte, line_1_byte = sprite._pixels
+            attributes = sprite._attributes
+            pixel_flags = attributes & 0x90
+            flip_x = attributes & 0x20
+            screen_x = sprite._x - 8
+
+            for tile_x in range(max(-screen_x, 0), min(self.SCREEN_WIDTH - screen_x, 8)):
+                sprite_pixel = self._get_line_pixel(line_0_byte, line_1_byte, 7 - tile_x if flip_x else tile_x)
+
+                if sprite_pixel > 0:
+                    sprite_line[screen_x + tile_x] = sprite_pixel | pixel_flags
 
-        return unordered_sprites
+        return sprite_line
 
     def draw_pixel(self, scanline_number: int, x: int):
         io_ram = self._memory_unit.get_io_ram()
@@ -135,33 +240,20 @@ class GPU:
         else:
             background_pixel = 0x00
 
-        background_pixel_color = self._get_pixel_palette(background_pixel, io_ram.get_lcd_background_palette())
+        sprite_pixel = self._sprite_line[x] if sprites_enabled else 0
 
-        sprite_pixel_color = 0
-
-        if sprites_enabled:
-            object_palettes = [
-                io_ram.get_lcd_object_palette0(),
-                io_ram.get_lcd_object_palette1()
-            ]
-
-            for sprite in self._sprite_buffer:
-                pixel_within_sprite = sprite.get_x() <= x + 8 < sprite.get_x() + 8
-
-                if not pixel_within_sprite:
-                    continue
-
-                tile_x = (x + 8) - sprite.get_x()
-                # TODO: mirroring
-
-                sprite_pixel = self._get_line_pixel(sprite.get_pixels()[0], sprite.get_pixels()[1], tile_x)
+        # Sprites flagged behind the background only show over background color 0
+        if sprite_pixel & 0x03 and not (sprite_pixel & 0x80 and background_pixel):
+            if sprite_pixel & 0x10:
+                object_palette = io_ram.get_lcd_object_palette1()
+            else:
+                object_palette = io_ram.get_lcd_object_palette0()
 
-                if sprite_pixel > 0:
-                    # TODO: priority
-                    sprite_pixel_color = self._get_pixel_palette(sprite_pixel, object_palettes[0])  # TODO: multiple palettes
-                    break
+            pixel_color = self._get_pixel_palette(sprite_pixel & 0x03, object_palette)
+        else:
+            pixel_color = self._get_pixel_palette(background_pixel, io_ram.get_lcd_background_palette())
 
-        self._buffer[x][scanline_number] = sprite_pixel_color or background_pixel_color
+        self._buffer[scanline_number * self.SCREEN_WIDTH + x] = pixel_color
 
     def video_update(self):
         io_ram = self._memory_unit.get_io_ram()
@@ -171,6 +263,7 @@ class GPU:
         lcd_stat = io_ram.get_lcd_stat()
 
         if lcd_on:
+            io_ram.set_lcd_y(scanline_number)
             self._lcdy_compare(scanline_number)
 
         lcd_mode = lcd_stat & 0x03
@@ -184,7 +277,7 @@ class GPU:
             scanline_progress = self._frame_progress % 456
 
             if scanline_progress < 92:
-                if lcd_mode != IORAM.LCDMode.LCD_OAM_READ:
+                if lcd_mode != IORAM.LCDMode.LCD_OAM_READ.value:
                     self._oam_read(scanline_number)
 
             elif scanline_progress < (160 + 92):
@@ -222,6 +315,9 @@ class GPU:
         # TODO: clear buffer if LCD not on (?)
         self._new_frame_available = True
 
+        if self._frame_ring is not None:
+            self._buffer = self._frame_ring.publish()
+
     def _oam_read(self, scanline_number: int):
         io_ram = self._memory_unit.get_io_ram()
         io_ram.set_lcd_mode(IORAM.LCDMode.LCD_OAM_READ)
@@ -232,12 +328,13 @@ class GPU:
             self._memory_unit.get_interrupt_flag_register().set_lcdc_interrupt()
 
         self._sprite_buffer = self._get_scanline_sprites(scanline_number)
+        self._sprite_line = self._composite_sprites(self._sprite_buffer)
         self._current_x = 0
 
     def _transfer_data_to_buffer(self, scanline_progress: int, scanline_number: int):
         self._memory_unit.get_io_ram().set_lcd_mode(IORAM.LCDMode.LCD_TRANSFER)
 
-        if self._memory_unit.get_io_ram().get_lcd_on():
+        if self._rendering_enabled and self._memory_unit.get_io_ram().get_lcd_on():
             while self._current_x < scanline_progress - 92:
                 self.draw_pixel(scanline_number, self._current_x)
                 self._current_x += 1
@@ -245,7 +342,7 @@ class GPU:
     def _hblank(self, scanline_number: int):
         self._memory_unit.get_io_ram().set_lcd_mode(IORAM.LCDMode.LCD_HBLANK)
 
-        if self._memory_unit.get_io_ram().get_lcd_on():
+        if self._rendering_enabled and self._memory_unit.get_io_ram().get_lcd_on():
             while self._current_x < 160:
                 self.draw_pixel(scanline_number, self._current_x)
                 self._current_x += 1
@@ -1,10 +1,20 @@
 class GPUSprite:
+    # The GPU keeps a fixed pool of these and refills them every line, slots keep that cheap
+    __slots__ = ('_x', '_y', '_pixels', '_attributes')
+
     def __init__(self, x: int, y: int, pixels: list, attributes: int):
         self._x = x
         self._y = y
         self._pixels = pixels
         self._attributes = attributes
 
+    def set(self, x: int, y: int, line_0_byte: int, line_1_byte: int, attributes: int) -> None:
+        self._x = x
+        self._y = y
+        self._pixels[0] = line_0_byte
+        self._pixels[1] = line_1_byte
+        self._attributes = attributes
+
     def get_x(self) -> int:
         return self._x
 
@@ -19,3 +29,12 @@ class GPUSprite:
 
     def get_flip_y(self) -> bool:
         return self._attributes & 0x40 > 0
+
+    def get_flip_x(self) -> bool:
+        return self._attributes & 0x20 > 0
+
+    def get_high_palette(self) -> bool:
+        return self._attributes & 0x10 > 0
+
+    def get_behind_background(self) -> bool:
+        return self._attributes & 0x80 > 0
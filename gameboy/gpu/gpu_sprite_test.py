@@ -40,3 +40,50 @@ def test_gpu_sprite_get_flip_y(gpu_sprite_fixture):
     gpu_sprite_fixture._attributes = 0b00000000
 
     assert not gpu_sprite_fixture.get_flip_y()
+
+
+def test_gpu_sprite_get_flip_x(gpu_sprite_fixture):
+    gpu_sprite_fixture._attributes = 0b00100000
+
+    assert gpu_sprite_fixture.get_flip_x()
+
+    gpu_sprite_fixture._attributes = 0b01000000
+
+    assert not gpu_sprite_fixture.get_flip_x()
+
+
+def test_gpu_sprite_get_high_palette(gpu_sprite_fixture):
+    gpu_sprite_fixture._attributes = 0b00010000
+
+    assert gpu_sprite_fixture.get_high_palette()
+
+    gpu_sprite_fixture._attributes = 0b00000000
+
+    assert not gpu_sprite_fixture.get_high_palette()
+
+
+def test_gpu_sprite_get_behind_background(gpu_sprite_fixture):
+    gpu_sprite_fixture._attributes = 0b10000000
+
+    assert gpu_sprite_fixture.get_behind_background()
+
+    gpu_sprite_fixture._attributes = 0b00000000
+
+    assert not gpu_sprite_fixture.get_behind_background()
+
+
+def test_gpu_sprite_set(gpu_sprite_fixture):
+    pixels = gpu_sprite_fixture.get_pixels()
+
+    gpu_sprite_fixture.set(1, 2, 3, 4, 5)
+
+    assert gpu_sprite_fixture.get_x() == 1
+    assert gpu_sprite_fixture.get_y() == 2
+    assert gpu_sprite_fixture.get_pixels() is pixels
+    assert pixels == [3, 4]
+    assert gpu_sprite_fixture.get_attributes_byte() == 5
+
+
+def test_gpu_sprite_slots(gpu_sprite_fixture):
+    with pytest.raises(AttributeError):
+        gpu_sprite_fixture.extra = 1
@@ -4,6 +4,7 @@ import pytest
 
 from gameboy.gpu.gpu import GPU
 from gameboy.gpu.gpu_sprite import GPUSprite
+from gameboy.gpu.shared_frame_ring import SharedFrameRing
 from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
 from gameboy.memory.io_ram import IORAM
 from gameboy.memory.memory_unit import MemoryUnit
@@ -15,8 +16,7 @@ def gpu_fixture() -> GPU:
 
 
 def test_gpu_init(gpu_fixture):
-    assert len(gpu_fixture._buffer) == 160
-    assert len(gpu_fixture._buffer[0]) == 144
+    assert len(gpu_fixture._buffer) == 160 * 144
     assert gpu_fixture._frame_progress == 0
     assert gpu_fixture._new_frame_available is False
     assert len(gpu_fixture._sprite_buffer) == 0
@@ -143,6 +143,142 @@ def test_get_scanline_sprites(gpu_fixture):
     assert sprites[0].get_pixels() == [0b01111100, 0b00111100]
 
 
+def _write_sprite(gpu: GPU, index: int, y: int, x: int, tile: int=0, attributes: int=0) -> None:
+    for offset, value in enumerate((y, x, tile, attributes)):
+        gpu._memory_unit.write_byte(0xFE00 + index * 4 + offset, value)
+
+
+def test_get_scanline_sprites_x_priority(gpu_fixture):
+    _write_sprite(gpu_fixture, 0, y=16, x=30)
+    _write_sprite(gpu_fixture, 1, y=16, x=20)
+    _write_sprite(gpu_fixture, 2, y=16, x=30, attributes=1)
+    _write_sprite(gpu_fixture, 3, y=16, x=10)
+
+    sprites = gpu_fixture._get_scanline_sprites(0)
+
+    assert [(sprite.get_x(), sprite.get_attributes_byte()) for sprite in sprites] == [(10, 0), (20, 0), (30, 0), (30, 1)]
+
+
+def test_get_scanline_sprites_line_limit(gpu_fixture):
+    # Sprite 0 is off screen to the left but still takes one of the 10 slots
+    for index in range(0, 12):
+        _write_sprite(gpu_fixture, index, y=20, x=index * 8)
+
+    sprites = gpu_fixture._get_scanline_sprites(4)
+
+    assert len(sprites) == GPU.SPRITES_PER_LINE
+    assert [sprite.get_x() for sprite in sprites] == [index * 8 for index in range(0, 10)]
+    assert gpu_fixture._get_scanline_sprites(3) == []
+
+
+def test_get_scanline_sprites_tall_sprites(gpu_fixture):
+    _write_sprite(gpu_fixture, 0, y=16, x=8)
+
+    assert len(gpu_fixture._get_scanline_sprites(8)) == 0
+
+    gpu_fixture._memory_unit.get_io_ram().write_byte(0xFF40, 0x04)
+
+    assert len(gpu_fixture._get_scanline_sprites(8)) == 1
+    assert len(gpu_fixture._get_scanline_sprites(16)) == 0
+
+
+def test_update_line_sprite_tables_cached_until_oam_write(gpu_fixture):
+    _write_sprite(gpu_fixture, 0, y=16, x=8)
+
+    gpu_fixture._update_line_sprite_tables()
+    line_sprite_tables = gpu_fixture._line_sprite_tables
+
+    gpu_fixture._update_line_sprite_tables()
+
+    assert gpu_fixture._line_sprite_tables is line_sprite_tables
+    assert line_sprite_tables[0] == [0]
+
+    _write_sprite(gpu_fixture, 1, y=16, x=4)
+    gpu_fixture._update_line_sprite_tables()
+
+    assert gpu_fixture._line_sprite_tables is not line_sprite_tables
+    assert gpu_fixture._line_sprite_tables[0] == [4, 0]
+
+
+def test_update_line_sprite_tables_after_dma(gpu_fixture):
+    gpu_fixture._memory_unit.write_byte(0xC000, 16)
+    gpu_fixture._memory_unit.write_byte(0xC001, 8)
+    gpu_fixture._update_line_sprite_tables()
+
+    assert gpu_fixture._line_sprite_tables[0] == []
+
+    gpu_fixture._memory_unit.write_byte(0xFF46, 0xC0)
+
+    for _ in range(0, 162):
+        gpu_fixture._memory_unit.dma_update()
+
+    gpu_fixture._update_line_sprite_tables()
+
+    assert gpu_fixture._line_sprite_tables[0] == [0]
+
+
+def test_composite_sprites(gpu_fixture):
+    sprites = [
+        GPUSprite(x=8, y=16, pixels=[0b11110000, 0b00000000], attributes=0),
+        GPUSprite(x=12, y=16, pixels=[0b11111111, 0b11111111], attributes=0),
+        GPUSprite(x=164, y=16, pixels=[0b11111111, 0b00000000], attributes=0)
+    ]
+
+    sprite_line = gpu_fixture._composite_sprites(sprites)
+
+    # The first sprite wins where it is opaque, the second shows through its transparent pixels
+    assert list(sprite_line[0:12]) == [1, 1, 1, 1, 3, 3, 3, 3, 3, 3, 3, 3]
+    assert list(sprite_line[12:156]) == [0] * 144
+    assert list(sprite_line[156:160]) == [1, 1, 1, 1]
+
+
+def test_composite_sprites_flip_x_and_flags(gpu_fixture):
+    sprites = [
+        GPUSprite(x=8, y=16, pixels=[0b11000000, 0b10000000], attributes=0b10110000)
+    ]
+
+    sprite_line = gpu_fixture._composite_sprites(sprites)
+
+    assert list(sprite_line[0:8]) == [0, 0, 0, 0, 0, 0, 0x91, 0x93]
+
+
+def test_get_scanline_sprites_reuses_pool(gpu_fixture):
+    _write_sprite(gpu_fixture, 0, y=16, x=8)
+
+    sprites = gpu_fixture._get_scanline_sprites(0)
+    sprite = sprites[0]
+
+    _write_sprite(gpu_fixture, 0, y=16, x=20)
+
+    assert gpu_fixture._get_scanline_sprites(0)[0] is sprite
+    assert sprite.get_x() == 20
+
+
+def test_oam_read_composites_sprites(gpu_fixture):
+    gpu_fixture._memory_unit.write_byte(0x8000, 0b10000000)
+    _write_sprite(gpu_fixture, 0, y=16, x=10)
+
+    gpu_fixture._oam_read(0)
+
+    assert gpu_fixture._sprite_line[2] == 1
+    assert gpu_fixture._sprite_line.count(0) == 159
+
+
+def test_oam_read_sprites_written_through_view(gpu_fixture):
+    gpu_fixture._memory_unit.write_byte(0x8000, 0b10000000)
+    view = gpu_fixture._memory_unit.get_memory_view(MemoryUnit.Region.OAM)
+
+    gpu_fixture._oam_read(0)
+
+    assert gpu_fixture._sprite_line.count(0) == 160
+
+    view[0:4] = bytes([16, 10, 0, 0])
+    gpu_fixture._oam_read(0)
+
+    assert gpu_fixture._sprite_line[2] == 1
+    assert gpu_fixture._sprite_line.count(0) == 159
+
+
 def test_lcdy_compare(gpu_fixture):
     scanline_number = 40
     gpu_fixture._lcdy_compare(scanline_number)
@@ -267,3 +403,180 @@ def test_hblank(gpu_fixture):
     assert gpu_fixture._memory_unit._io_ram.get_lcd_stat() & 0x03 == 0
     assert gpu_fixture._memory_unit._interrupt_flag_register._data[
                0] & InterruptFlagRegister.INTERRUPT_LCDC == InterruptFlagRegister.INTERRUPT_LCDC
+
+
+def test_gpu_get_buffer(gpu_fixture):
+    assert gpu_fixture.get_buffer() is gpu_fixture._buffer
+
+
+def test_gpu_fork(gpu_fixture):
+    memory_unit = MemoryUnit()
+    gpu_fixture._frame_progress = 100
+    gpu_fixture._buffer[5] = 3
+
+    forked_gpu = gpu_fixture.fork(memory_unit)
+    forked_gpu._buffer[5] = 1
+
+    assert forked_gpu._memory_unit == memory_unit
+    assert forked_gpu._frame_progress == 100
+    assert gpu_fixture._buffer[5] == 3
+
+
+def test_draw_pixel_buffer_position(gpu_fixture):
+    gpu_fixture._memory_unit._io_ram._data[0x40] = 0x01  # Background on
+    gpu_fixture._memory_unit._io_ram._data[0x47] = 0xFF  # Every shade maps to 3
+
+    gpu_fixture.draw_pixel(2, 7)
+
+    assert gpu_fixture._buffer[2 * 160 + 7] == 3
+    assert gpu_fixture._buffer.count(3) == 1
+
+
+def test_video_update_sets_lcd_y(gpu_fixture):
+    gpu_fixture._memory_unit._io_ram._data[0x40] = 0x80
+    gpu_fixture._frame_progress = 456 * 3
+
+    gpu_fixture.video_update()
+
+    assert gpu_fixture._memory_unit._io_ram.get_lcd_y() == 3
+
+
+def test_gpu_set_buffer(gpu_fixture):
+    buffer = memoryview(bytearray(160 * 144))
+
+    gpu_fixture.set_buffer(buffer)
+
+    assert gpu_fixture.get_buffer() is buffer
+
+    with pytest.raises(ValueError):
+        gpu_fixture.set_buffer(bytearray(10))
+
+
+def test_gpu_set_rendering_enabled(gpu_fixture):
+    assert gpu_fixture.get_rendering_enabled()
+
+    gpu_fixture.set_rendering_enabled(False)
+    gpu_fixture.draw_pixel = mock.Mock()
+    gpu_fixture._memory_unit._io_ram._data[0x40] |= 0x80
+
+    gpu_fixture._transfer_data_to_buffer(200, 50)
+    gpu_fixture._hblank(50)
+
+    assert not gpu_fixture.get_rendering_enabled()
+    assert gpu_fixture.draw_pixel.call_count == 0
+    assert gpu_fixture._memory_unit._io_ram.get_lcd_stat() & 0x03 == 0
+
+
+def test_gpu_set_frame_ring(gpu_fixture):
+    frame_ring = SharedFrameRing(slot_count=2)
+    gpu_fixture._buffer[10] = 2
+
+    gpu_fixture.set_frame_ring(frame_ring)
+
+    assert gpu_fixture.get_frame_ring() is frame_ring
+    assert gpu_fixture._buffer[10] == 2
+
+    gpu_fixture._buffer[11] = 3
+    gpu_fixture._vblank()
+
+    sequence, frame = frame_ring.get_latest_frame()
+
+    assert sequence == 1
+    assert frame[10] == 2 and frame[11] == 3
+
+    gpu_fixture._buffer[11] = 1
+    assert frame[11] == 3
+
+    forked_gpu = gpu_fixture.fork(MemoryUnit())
+    assert forked_gpu.get_frame_ring() is None
+    assert isinstance(forked_gpu.get_buffer(), bytearray)
+
+    gpu_fixture.set_frame_ring(None)
+
+    assert gpu_fixture.get_frame_ring() is None
+    assert gpu_fixture._buffer[11] == 1
+
+    del frame
+    frame_ring.close()
+    frame_ring.unlink()
+
+
+def test_gpu_set_frame_ring_close(gpu_fixture):
+    frame_ring = SharedFrameRing(slot_count=2)
+    gpu_fixture.set_frame_ring(frame_ring)
+    gpu_fixture._vblank()
+
+    # We're still drawing into it
+    with pytest.raises(ValueError):
+        frame_ring.close()
+
+    gpu_fixture.set_frame_ring(None)
+    frame_ring.close()
+    frame_ring.unlink()
+
+
+def test_gpu_set_frame_ring_invalid_size(gpu_fixture):
+    frame_ring = SharedFrameRing(frame_size=16)
+
+    with pytest.raises(ValueError):
+        gpu_fixture.set_frame_ring(frame_ring)
+
+    frame_ring.close()
+    frame_ring.unlink()
+
+
+def _setup_sprite_pixel(gpu: GPU, attributes: int, background_pixel: bool) -> None:
+    io_ram = gpu._memory_unit.get_io_ram()
+    io_ram.write_byte(0xFF40, 0x93)  # LCD, background, sprites on, low tiles
+    io_ram.write_byte(0xFF47, 0b11100100)
+    io_ram.write_byte(0xFF48, 0b00000100)  # Sprite pixel 1 is shade 1 in palette 0
+    io_ram.write_byte(0xFF49, 0b00001000)  # and shade 2 in palette 1
+
+    if background_pixel:
+        gpu._memory_unit.write_byte(0x8010, 0xFF)
+        gpu._memory_unit.write_byte(0x9800, 1)
+
+    gpu._memory_unit.write_byte(0x8000, 0xFF)
+    _write_sprite(gpu, 0, y=16, x=8, tile=0, attributes=attributes)
+
+    gpu._oam_read(0)
+    gpu.draw_pixel(0, 0)
+
+
+def test_draw_pixel_sprite_palettes(gpu_fixture):
+    _setup_sprite_pixel(gpu_fixture, attributes=0x00, background_pixel=False)
+
+    assert gpu_fixture._buffer[0] == 1
+
+    _setup_sprite_pixel(gpu_fixture, attributes=0x10, background_pixel=False)
+
+    assert gpu_fixture._buffer[0] == 2
+
+
+def test_draw_pixel_sprite_behind_background(gpu_fixture):
+    _setup_sprite_pixel(gpu_fixture, attributes=0x80, background_pixel=False)
+
+    assert gpu_fixture._buffer[0] == 1
+
+    _setup_sprite_pixel(gpu_fixture, attributes=0x80, background_pixel=True)
+
+    assert gpu_fixture._buffer[0] == 1  # Background pixel 1 is shade 1
+
+    _setup_sprite_pixel(gpu_fixture, attributes=0x90, background_pixel=True)
+
+    assert gpu_fixture._buffer[0] == 1
+
+    _setup_sprite_pixel(gpu_fixture, attributes=0x10, background_pixel=True)
+
+    assert gpu_fixture._buffer[0] == 2
+
+
+def test_gpu_fork_sprite_pool(gpu_fixture):
+    _write_sprite(gpu_fixture, 0, y=16, x=8)
+    gpu_fixture._oam_read(0)
+
+    forked_gpu = gpu_fixture.fork(gpu_fixture._memory_unit.fork())
+
+    assert forked_gpu._sprite_pool[0] is not gpu_fixture._sprite_pool[0]
+    assert forked_gpu._sprite_line is not gpu_fixture._sprite_line
+    assert forked_gpu._sprite_line == gpu_fixture._sprite_line
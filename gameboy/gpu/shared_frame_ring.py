@@ -0,0 +1,95 @@
+import struct
+from multiprocessing import shared_memory
+from typing import Tuple
+
+
+class SharedFrameRing:
+    # Header is the last published frame sequence, slot count and frame size. Frames start on a cache line.
+    HEADER_FORMAT = '<QII'
+    FRAMES_OFFSET = 64
+
+    DEFAULT_FRAME_SIZE = 160 * 144
+
+    def __init__(self, slot_count: int=3, frame_size: int=DEFAULT_FRAME_SIZE, name: str=None):
+        if slot_count < 2:
+            raise ValueError('A frame ring needs at least 2 slots')
+
+        self._shared_memory = shared_memory.SharedMemory(
+            name=name, create=True, size=self.FRAMES_OFFSET + slot_count * frame_size)
+        self._slot_count = slot_count
+        self._frame_size = frame_size
+        self._owner = True
+
+        struct.pack_into(self.HEADER_FORMAT, self._shared_memory.buf, 0, 0, slot_count, frame_size)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedFrameRing':
+        # Readers in other processes attach by name, the layout comes from the header
+        frame_ring = cls.__new__(cls)
+        frame_ring._shared_memory = shared_memory.SharedMemory(name=name)
+        frame_ring._owner = False
+
+        _, frame_ring._slot_count, frame_ring._frame_size = struct.unpack_from(
+            cls.HEADER_FORMAT, frame_ring._shared_memory.buf, 0)
+
+        return frame_ring
+
+    def get_name(self) -> str:
+        return self._shared_memory.name
+
+    def get_slot_count(self) -> int:
+        return self._slot_count
+
+    def get_frame_size(self) -> int:
+        return self._frame_size
+
+    def get_sequence(self) -> int:
+        return struct.unpack_from('<Q', self._shared_memory.buf, 0)[0]
+
+    def _get_slot(self, slot: int) -> memoryview:
+        slot_start = self.FRAMES_OFFSET + slot * self._frame_size
+
+        return self._shared_memory.buf[slot_start:slot_start + self._frame_size]
+
+    def get_write_buffer(self) -> memoryview:
+        # Frame sequence + 1 is being drawn into the slot after the last published one
+        return self._get_slot(self.get_sequence() % self._slot_count)
+
+    def publish(self) -> memoryview:
+        # Makes the write buffer the latest frame and returns the buffer for the next one
+        sequence = self.get_sequence() + 1
+        published_frame = self._get_slot((sequence - 1) % self._slot_count)
+        next_frame = self._get_slot(sequence % self._slot_count)
+
+        # Start the next frame from this one, lines the GPU doesn't draw (LCD off) keep their last contents
+        next_frame[:] = published_frame
+
+        struct.pack_into('<Q', self._shared_memory.buf, 0, sequence)
+
+        return next_frame
+
+    def get_latest_frame(self) -> Tuple[int, memoryview]:
+        # Returns (0, None) until the first frame is published
+        sequence = self.get_sequence()
+
+        if not sequence:
+            return 0, None
+
+        return sequence, self._get_slot((sequence - 1) % self._slot_count)
+
+    def is_frame_current(self, sequence: int) -> bool:
+        # Readers check this after using a frame, once the writer has moved slot_count - 1 frames on it may
+        # have started drawing over it
+        return 0 < sequence and self.get_sequence() - sequence < self._slot_count - 1
+
+    def close(self) -> None:
+        # Every view of our frames has to be gone first: detach GPUs drawing into the ring with
+        # GPU.set_frame_ring(None) and drop frames from get_latest_frame. Closing can be retried once they are.
+        try:
+            self._shared_memory.close()
+        except BufferError:
+            raise ValueError('Frame ring is still in use, detach it from the GPU first') from None
+
+    def unlink(self) -> None:
+        if self._owner:
+            self._shared_memory.unlink()
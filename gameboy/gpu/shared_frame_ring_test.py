@@ -0,0 +1,76 @@
+import pytest
+
+from gameboy.gpu.shared_frame_ring import SharedFrameRing
+
+
+@pytest.fixture()
+def shared_frame_ring_fixture() -> SharedFrameRing:
+    frame_ring = SharedFrameRing(slot_count=3, frame_size=16)
+
+    yield frame_ring
+
+    frame_ring.close()
+    frame_ring.unlink()
+
+
+def test_shared_frame_ring_init(shared_frame_ring_fixture):
+    assert shared_frame_ring_fixture.get_slot_count() == 3
+    assert shared_frame_ring_fixture.get_frame_size() == 16
+    assert shared_frame_ring_fixture.get_sequence() == 0
+    assert shared_frame_ring_fixture.get_latest_frame() == (0, None)
+
+
+def test_shared_frame_ring_init_invalid_slot_count():
+    with pytest.raises(ValueError):
+        SharedFrameRing(slot_count=1)
+
+
+def test_shared_frame_ring_publish(shared_frame_ring_fixture):
+    write_buffer = shared_frame_ring_fixture.get_write_buffer()
+    write_buffer[0] = 7
+
+    next_buffer = shared_frame_ring_fixture.publish()
+    sequence, frame = shared_frame_ring_fixture.get_latest_frame()
+
+    assert sequence == 1
+    assert frame[0] == 7
+    assert next_buffer[0] == 7  # Next frame starts as a copy of the last one
+
+    next_buffer[0] = 8
+    assert frame[0] == 7
+
+    del write_buffer, next_buffer, frame
+
+
+def test_shared_frame_ring_is_frame_current(shared_frame_ring_fixture):
+    assert not shared_frame_ring_fixture.is_frame_current(0)
+
+    shared_frame_ring_fixture.publish()
+    assert shared_frame_ring_fixture.is_frame_current(1)
+
+    shared_frame_ring_fixture.publish()
+    assert shared_frame_ring_fixture.is_frame_current(1)
+
+    # Triple buffered, the slot of frame 1 is being drawn over once frame 3 is out
+    shared_frame_ring_fixture.publish()
+    assert not shared_frame_ring_fixture.is_frame_current(1)
+    assert shared_frame_ring_fixture.is_frame_current(2)
+
+
+def test_shared_frame_ring_attach(shared_frame_ring_fixture):
+    shared_frame_ring_fixture.get_write_buffer()[3] = 42
+    shared_frame_ring_fixture.publish()
+
+    reader = SharedFrameRing.attach(shared_frame_ring_fixture.get_name())
+    sequence, frame = reader.get_latest_frame()
+
+    assert reader.get_slot_count() == 3
+    assert reader.get_frame_size() == 16
+    assert sequence == 1
+    assert frame[3] == 42
+
+    del frame
+    reader.close()
+    reader.unlink()  # Only the creator removes the segment
+
+    assert SharedFrameRing.attach(shared_frame_ring_fixture.get_name()).get_sequence() == 1
@@ -1,6 +1,79 @@
-from gameboy.memory.memory_region import MemoryRegion
+import mmap
+import os
 
+from gameboy.memory.copy_on_write_memory_region import CopyOnWriteMemoryRegion
 
-class CartridgeRAM(MemoryRegion):
+
+class CartridgeRAM(CopyOnWriteMemoryRegion):
     def __init__(self, size: int):
         super().__init__(bytearray(size), 0xA000)
+
+        self._save_file = None
+        self._save_path: str = None
+
+    def get_save_path(self) -> str:
+        return self._save_path
+
+    def is_mapped(self) -> bool:
+        return self._save_file is not None
+
+    def map_save_file(self, path: str) -> None:
+        # Backs this RAM with the .sav file, writes land in the OS page cache and survive us crashing.
+        # An existing save is loaded, otherwise one is created from the current contents.
+        if not self._data:
+            raise ValueError('Cartridge has no RAM to save')
+
+        if self._save_file is not None:
+            raise ValueError(f'Cartridge RAM is already mapped to {self._save_path}')
+
+        self.unshare()
+
+        save_file = open(path, 'r+b' if os.path.exists(path) else 'w+b')
+
+        try:
+            save_file_size = os.fstat(save_file.fileno()).st_size
+
+            if not save_file_size:
+                save_file.write(self._data)
+                save_file.flush()
+            elif save_file_size < len(self._data):
+                save_file.truncate(len(self._data))
+
+            # Saves from other emulators can have an RTC footer after the RAM, only the RAM itself is mapped
+            data = mmap.mmap(save_file.fileno(), len(self._data))
+        except Exception:
+            # Still plain memory, nothing is left open
+            save_file.close()
+            raise
+
+        self._data = data
+        self._save_file = save_file
+        self._save_path = path
+
+    def flush(self) -> None:
+        # Only needed to survive the OS going down, the page cache already has every write
+        if self._save_file is not None:
+            self._data.flush()
+
+    def close_save_file(self) -> None:
+        # Flushes and goes back to plain memory with the same contents. Views of the mapped RAM must be released first.
+        if self._save_file is None:
+            return
+
+        data = bytearray(self._data)
+
+        self._data.flush()
+        self._data.close()
+        self._save_file.close()
+
+        self._data = data
+        self._save_file = None
+        self._save_path = None
+
+    def fork(self) -> 'CartridgeRAM':
+        # Forks get a private copy, only this instance writes to the save file
+        forked_region = super().fork()
+        forked_region._save_file = None
+        forked_region._save_path = None
+
+        return forked_region
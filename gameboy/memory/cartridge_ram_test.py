@@ -0,0 +1,143 @@
+import os
+from unittest import mock
+
+import pytest
+
+from gameboy.memory.cartridge_ram import CartridgeRAM
+
+
+@pytest.fixture()
+def cartridge_ram_fixture() -> CartridgeRAM:
+    return CartridgeRAM(0x2000)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, 'rb') as save_file:
+        return save_file.read()
+
+
+def test_cartridge_ram_map_save_file_new(cartridge_ram_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+    cartridge_ram_fixture.write_byte(0xA000, 0x12)
+
+    cartridge_ram_fixture.map_save_file(path)
+
+    assert cartridge_ram_fixture.is_mapped()
+    assert cartridge_ram_fixture.get_save_path() == path
+    assert cartridge_ram_fixture.read_byte(0xA000) == 0x12
+
+    # Writes reach the file without an explicit save
+    cartridge_ram_fixture.write_byte(0xA001, 0x34)
+
+    assert _read_file(path)[:2] == b'\x12\x34'
+    assert len(_read_file(path)) == 0x2000
+
+
+def test_cartridge_ram_map_save_file_existing(cartridge_ram_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+
+    # A short save is padded out, anything after the RAM is left alone
+    with open(path, 'wb') as save_file:
+        save_file.write(b'\x56' * 0x100)
+
+    cartridge_ram_fixture.map_save_file(path)
+
+    assert cartridge_ram_fixture.read_byte(0xA0FF) == 0x56
+    assert cartridge_ram_fixture.read_byte(0xA100) == 0x00
+
+    cartridge_ram_fixture.close_save_file()
+
+    with open(path, 'ab') as save_file:
+        save_file.write(b'RTC!')
+
+    cartridge_ram = CartridgeRAM(0x2000)
+    cartridge_ram.map_save_file(path)
+    cartridge_ram.write_byte(0xA000, 0x78)
+    cartridge_ram.close_save_file()
+
+    assert _read_file(path)[0] == 0x78
+    assert _read_file(path)[0x2000:] == b'RTC!'
+
+
+def test_cartridge_ram_map_save_file_invalid(cartridge_ram_fixture, tmpdir):
+    with pytest.raises(ValueError):
+        CartridgeRAM(0).map_save_file(os.path.join(str(tmpdir), 'empty.sav'))
+
+    cartridge_ram_fixture.map_save_file(os.path.join(str(tmpdir), 'game.sav'))
+
+    with pytest.raises(ValueError):
+        cartridge_ram_fixture.map_save_file(os.path.join(str(tmpdir), 'other.sav'))
+
+
+def test_cartridge_ram_map_save_file_failed(cartridge_ram_fixture, tmpdir):
+    opened_files = []
+
+    def tracking_open(*args):
+        opened_files.append(open(*args))
+
+        return opened_files[-1]
+
+    cartridge_ram_fixture.write_byte(0xA000, 0x12)
+
+    with mock.patch('gameboy.memory.cartridge_ram.open', tracking_open, create=True), \
+            mock.patch('mmap.mmap', side_effect=OSError):
+        with pytest.raises(OSError):
+            cartridge_ram_fixture.map_save_file(os.path.join(str(tmpdir), 'game.sav'))
+
+    assert opened_files[0].closed
+    assert not cartridge_ram_fixture.is_mapped()
+    assert cartridge_ram_fixture.read_byte(0xA000) == 0x12
+
+
+def test_cartridge_ram_map_save_file_forked(cartridge_ram_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+    cartridge_ram_fixture.write_byte(0xA000, 0x12)
+    cartridge_ram_fixture.fork()
+
+    # Shared copy-on-write pages are gathered up before mapping
+    cartridge_ram_fixture.map_save_file(path)
+
+    assert _read_file(path)[0] == 0x12
+
+
+def test_cartridge_ram_flush(cartridge_ram_fixture, tmpdir):
+    # Nothing to do when not mapped
+    cartridge_ram_fixture.flush()
+
+    cartridge_ram_fixture.map_save_file(os.path.join(str(tmpdir), 'game.sav'))
+    cartridge_ram_fixture.write_byte(0xA000, 0x12)
+    cartridge_ram_fixture.flush()
+
+
+def test_cartridge_ram_close_save_file(cartridge_ram_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+
+    cartridge_ram_fixture.map_save_file(path)
+    cartridge_ram_fixture.write_byte(0xA000, 0x12)
+    cartridge_ram_fixture.close_save_file()
+
+    assert not cartridge_ram_fixture.is_mapped()
+    assert cartridge_ram_fixture.get_save_path() is None
+    assert isinstance(cartridge_ram_fixture._data, bytearray)
+    assert cartridge_ram_fixture.read_byte(0xA000) == 0x12
+
+    cartridge_ram_fixture.write_byte(0xA000, 0x34)
+
+    assert _read_file(path)[0] == 0x12
+
+    cartridge_ram_fixture.close_save_file()
+
+
+def test_cartridge_ram_fork_mapped(cartridge_ram_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'game.sav')
+
+    cartridge_ram_fixture.map_save_file(path)
+    cartridge_ram_fixture.write_byte(0xA000, 0x12)
+
+    forked_cartridge_ram = cartridge_ram_fixture.fork()
+    forked_cartridge_ram.write_byte(0xA000, 0x34)
+
+    assert not forked_cartridge_ram.is_mapped()
+    assert forked_cartridge_ram.read_byte(0xA000) == 0x34
+    assert cartridge_ram_fixture.read_byte(0xA000) == 0x12
+    assert _read_file(path)[0] == 0x12
@@ -0,0 +1,162 @@
+import copy
+
+from gameboy.memory.memory_region import MemoryRegion
+
+
+class CopyOnWriteMemoryRegion(MemoryRegion):
+    PAGE_SHIFT = 8
+    PAGE_SIZE = 1 << PAGE_SHIFT
+
+    def __init__(self, data: bytearray, base_address: int):
+        super().__init__(data, base_address)
+
+        # While forked, pages we haven't written to yet are read from the snapshot shared with other forks
+        self._shared_data: bytearray = None
+        self._owned_pages: bytearray = None
+        self._shared_page_count = 0
+
+        # get_view handed out our buffer, so the next fork can't take it over as the snapshot
+        self._view_exported = False
+
+    def get_page_count(self) -> int:
+        return (len(self._data) + self.PAGE_SIZE - 1) >> self.PAGE_SHIFT
+
+    def is_shared(self) -> bool:
+        return self._shared_data is not None
+
+    def read_byte(self, address: int) -> int:
+        offset = (address - self._base_address) % len(self._data)
+
+        if self._shared_data is not None and not self._owned_pages[offset >> self.PAGE_SHIFT]:
+            return self._shared_data[offset]
+
+        return self._data[offset]
+
+    def write_byte(self, address: int, value: int):
+        offset = address - self._base_address
+
+        if self._shared_data is not None and not self._owned_pages[offset >> self.PAGE_SHIFT]:
+            self._copy_page(offset >> self.PAGE_SHIFT)
+
+        self._data[offset] = value
+
+    def read_word(self, address: int) -> int:
+        offset = address - self._base_address
+        page = offset >> self.PAGE_SHIFT
+
+        # Both bytes in one page, so they come from the same buffer
+        if (offset + 1) >> self.PAGE_SHIFT != page or offset + 1 >= len(self._data):
+            return super().read_word(address)
+
+        data = self._data
+
+        if self._shared_data is not None and not self._owned_pages[page]:
+            data = self._shared_data
+
+        return data[offset] | (data[offset + 1] << 8)
+
+    def write_word(self, address: int, value: int):
+        offset = address - self._base_address
+        page = offset >> self.PAGE_SHIFT
+
+        if (offset + 1) >> self.PAGE_SHIFT != page or offset + 1 >= len(self._data):
+            return super().write_word(address, value)
+
+        if self._shared_data is not None and not self._owned_pages[page]:
+            self._copy_page(page)
+
+        self._data[offset] = value & 0xFF
+        self._data[offset + 1] = value >> 8
+
+    def read_byte_range(self, address_start, length):
+        if self._shared_data is None:
+            return super().read_byte_range(address_start, length)
+
+        # Each page comes from whichever buffer holds it, reading never copies anything out of the snapshot
+        offset = address_start - self._base_address
+        end_offset = offset + length
+        data = bytearray()
+
+        for page in range(offset >> self.PAGE_SHIFT, ((end_offset - 1) >> self.PAGE_SHIFT) + 1):
+            source = self._data if self._owned_pages[page] else self._shared_data
+            data += source[max(offset, page << self.PAGE_SHIFT):min(end_offset, (page + 1) << self.PAGE_SHIFT)]
+
+        return data
+
+    def write_byte_range(self, address_start, data):
+        if self._shared_data is not None and data:
+            offset = address_start - self._base_address
+
+            for page in range(offset >> self.PAGE_SHIFT, ((offset + len(data) - 1) >> self.PAGE_SHIFT) + 1):
+                if self._shared_data is not None and not self._owned_pages[page]:
+                    self._copy_page(page)
+
+        super().write_byte_range(address_start, data)
+
+    def get_view(self) -> memoryview:
+        # Our pages have to be in one buffer to be viewed. The next fork moves this region onto a new buffer, so
+        # views taken before it stop following our writes, and writes through them don't reach either side.
+        self.unshare()
+        self._view_exported = True
+
+        return super().get_view()
+
+    def fork(self) -> 'CopyOnWriteMemoryRegion':
+        # Regions backed by memory someone else owns (a view or a mapped file) give the fork a private copy
+        if not self._data or not isinstance(self._data, bytearray):
+            return super().fork()
+
+        # Our current contents become a read-only snapshot that both sides copy pages out of on write.
+        # If nothing has been written since the last fork we can hand out the same snapshot again.
+        if self._shared_data is not None and self._shared_page_count == self.get_page_count():
+            snapshot = self._shared_data
+        else:
+            self.unshare()
+            snapshot = bytearray(self._data) if self._view_exported else self._data
+
+        forked_region = copy.copy(self)
+        forked_region._share(snapshot)
+        self._share(snapshot)
+
+        forked_region._view_exported = False
+        self._view_exported = False
+
+        return forked_region
+
+    def unshare(self) -> None:
+        if self._shared_data is None:
+            return
+
+        data = bytearray(self._shared_data)
+        page = self._owned_pages.find(1)
+
+        while page != -1:
+            page_start = page << self.PAGE_SHIFT
+            page_end = page_start + self.PAGE_SIZE
+
+            data[page_start:page_end] = self._data[page_start:page_end]
+            page = self._owned_pages.find(1, page + 1)
+
+        self._data = data
+        self._shared_data = None
+        self._owned_pages = None
+        self._shared_page_count = 0
+
+    def _share(self, snapshot: bytearray) -> None:
+        self._shared_data = snapshot
+        self._data = bytearray(len(snapshot))
+        self._shared_page_count = self.get_page_count()
+        self._owned_pages = bytearray(self._shared_page_count)
+
+    def _copy_page(self, page: int) -> None:
+        page_start = page << self.PAGE_SHIFT
+        page_end = page_start + self.PAGE_SIZE
+
+        self._data[page_start:page_end] = self._shared_data[page_start:page_end]
+        self._owned_pages[page] = 1
+        self._shared_page_count -= 1
+
+        # Every page has been copied, drop the snapshot so reads take the plain path again
+        if not self._shared_page_count:
+            self._shared_data = None
+            self._owned_pages = None
@@ -0,0 +1,187 @@
+import pytest
+
+from gameboy.memory.copy_on_write_memory_region import CopyOnWriteMemoryRegion
+
+
+@pytest.fixture()
+def copy_on_write_memory_region_fixture() -> CopyOnWriteMemoryRegion:
+    return CopyOnWriteMemoryRegion(bytearray(1024), 0xC000)
+
+
+def test_copy_on_write_memory_region_init(copy_on_write_memory_region_fixture):
+    assert len(copy_on_write_memory_region_fixture._data) == 1024
+    assert copy_on_write_memory_region_fixture._base_address == 0xC000
+    assert copy_on_write_memory_region_fixture.get_page_count() == 4
+    assert not copy_on_write_memory_region_fixture.is_shared()
+
+
+def test_copy_on_write_memory_region_fork_shares_pages(copy_on_write_memory_region_fixture):
+    copy_on_write_memory_region_fixture.write_byte(0xC001, 123)
+
+    forked_region = copy_on_write_memory_region_fixture.fork()
+
+    assert forked_region.is_shared()
+    assert copy_on_write_memory_region_fixture.is_shared()
+    assert forked_region._shared_data is copy_on_write_memory_region_fixture._shared_data
+    assert forked_region.read_byte(0xC001) == 123
+
+
+def test_copy_on_write_memory_region_write_copies_page(copy_on_write_memory_region_fixture):
+    copy_on_write_memory_region_fixture.write_byte(0xC001, 123)
+    copy_on_write_memory_region_fixture.write_byte(0xC101, 45)
+
+    forked_region = copy_on_write_memory_region_fixture.fork()
+    forked_region.write_byte(0xC002, 1)
+
+    assert forked_region._owned_pages[0] == 1
+    assert forked_region._owned_pages[1] == 0
+    assert forked_region._shared_page_count == 3
+
+    assert forked_region.read_byte(0xC001) == 123
+    assert forked_region.read_byte(0xC002) == 1
+    assert forked_region.read_byte(0xC101) == 45
+    assert copy_on_write_memory_region_fixture.read_byte(0xC002) == 0
+
+
+def test_copy_on_write_memory_region_writes_are_isolated(copy_on_write_memory_region_fixture):
+    forked_region = copy_on_write_memory_region_fixture.fork()
+
+    copy_on_write_memory_region_fixture.write_byte(0xC010, 1)
+    forked_region.write_byte(0xC010, 2)
+
+    assert copy_on_write_memory_region_fixture.read_byte(0xC010) == 1
+    assert forked_region.read_byte(0xC010) == 2
+
+
+def test_copy_on_write_memory_region_drops_snapshot_when_all_pages_owned(copy_on_write_memory_region_fixture):
+    forked_region = copy_on_write_memory_region_fixture.fork()
+
+    for page in range(0, 4):
+        forked_region.write_byte(0xC000 + (page * 256), page)
+
+    assert not forked_region.is_shared()
+    assert forked_region._owned_pages is None
+    assert forked_region.read_byte(0xC300) == 3
+
+
+def test_copy_on_write_memory_region_fork_of_fork(copy_on_write_memory_region_fixture):
+    copy_on_write_memory_region_fixture.write_byte(0xC000, 1)
+
+    forked_region = copy_on_write_memory_region_fixture.fork()
+    forked_region.write_byte(0xC200, 2)
+
+    second_forked_region = forked_region.fork()
+    second_forked_region.write_byte(0xC000, 3)
+
+    assert copy_on_write_memory_region_fixture.read_byte(0xC000) == 1
+    assert copy_on_write_memory_region_fixture.read_byte(0xC200) == 0
+    assert forked_region.read_byte(0xC000) == 1
+    assert forked_region.read_byte(0xC200) == 2
+    assert second_forked_region.read_byte(0xC000) == 3
+    assert second_forked_region.read_byte(0xC200) == 2
+
+
+def test_copy_on_write_memory_region_read_byte_range(copy_on_write_memory_region_fixture):
+    copy_on_write_memory_region_fixture.write_byte(0xC0FF, 1)
+    copy_on_write_memory_region_fixture.write_byte(0xC100, 2)
+
+    forked_region = copy_on_write_memory_region_fixture.fork()
+
+    assert forked_region.read_byte_range(0xC0FF, 2) == bytearray([1, 2])
+    assert forked_region.is_shared()
+
+    # Owned and shared pages in the one range, still without copying the rest
+    forked_region.write_byte(0xC100, 3)
+
+    assert forked_region.read_byte_range(0xC0FE, 4) == bytearray([0, 1, 3, 0])
+    assert forked_region._owned_pages[:3] == bytearray([0, 1, 0])
+    assert forked_region.read_byte_range(0xC0FE, 0) == bytearray()
+
+
+def test_copy_on_write_memory_region_write_byte_range(copy_on_write_memory_region_fixture):
+    copy_on_write_memory_region_fixture.write_byte(0xC000, 1)
+
+    forked_region = copy_on_write_memory_region_fixture.fork()
+    forked_region.write_byte_range(0xC0FE, bytes([2, 3, 4]))
+
+    # Only the two pages written to are copied out of the snapshot
+    assert forked_region.is_shared()
+    assert forked_region._owned_pages[:3] == bytearray([1, 1, 0])
+    assert forked_region.read_byte(0xC000) == 1
+    assert forked_region.read_byte_range(0xC0FE, 3) == bytearray([2, 3, 4])
+    assert copy_on_write_memory_region_fixture.read_byte_range(0xC0FE, 3) == bytearray(3)
+
+
+def test_copy_on_write_memory_region_word(copy_on_write_memory_region_fixture):
+    copy_on_write_memory_region_fixture.write_word(0xC010, 0x1234)
+
+    forked_region = copy_on_write_memory_region_fixture.fork()
+
+    assert forked_region.read_word(0xC010) == 0x1234
+
+    forked_region.write_word(0xC010, 0x5678)
+
+    assert forked_region.read_word(0xC010) == 0x5678
+    assert forked_region._owned_pages[0]
+    assert copy_on_write_memory_region_fixture.read_word(0xC010) == 0x1234
+
+
+def test_copy_on_write_memory_region_word_across_pages(copy_on_write_memory_region_fixture):
+    forked_region = copy_on_write_memory_region_fixture.fork()
+    forked_region.write_word(0xC0FF, 0x1234)
+
+    assert forked_region.read_byte(0xC0FF) == 0x34
+    assert forked_region.read_byte(0xC100) == 0x12
+    assert forked_region.read_word(0xC0FF) == 0x1234
+    assert copy_on_write_memory_region_fixture.read_word(0xC0FF) == 0
+
+
+def test_copy_on_write_memory_region_write_byte_overflow_error(copy_on_write_memory_region_fixture):
+    forked_region = copy_on_write_memory_region_fixture.fork()
+
+    with pytest.raises(ValueError):
+        forked_region.write_byte(0xC000, 256)
+
+
+def test_copy_on_write_memory_region_fork_empty():
+    empty_region = CopyOnWriteMemoryRegion(bytearray(0), 0xA000)
+
+    forked_region = empty_region.fork()
+
+    assert forked_region is not empty_region
+    assert not forked_region.is_shared()
+
+
+def test_copy_on_write_memory_region_get_view(copy_on_write_memory_region_fixture):
+    copy_on_write_memory_region_fixture.write_byte(0xC000, 1)
+
+    forked_region = copy_on_write_memory_region_fixture.fork()
+    forked_region.write_byte(0xC100, 2)
+
+    view = forked_region.get_view()
+
+    # Shared and owned pages both show up in the view, and it follows later writes
+    assert not forked_region.is_shared()
+    assert view[0] == 1
+    assert view[0x100] == 2
+
+    forked_region.write_byte(0xC200, 3)
+
+    assert view[0x200] == 3
+    assert copy_on_write_memory_region_fixture.read_byte(0xC100) == 0
+
+
+def test_copy_on_write_memory_region_get_view_then_fork(copy_on_write_memory_region_fixture):
+    copy_on_write_memory_region_fixture.write_byte(0xC000, 1)
+    view = copy_on_write_memory_region_fixture.get_view()
+
+    forked_region = copy_on_write_memory_region_fixture.fork()
+
+    # The view's buffer isn't the snapshot, writing through it changes neither side
+    view[0] = 9
+    view[0x100] = 9
+
+    assert forked_region.read_byte(0xC000) == 1
+    assert forked_region.read_byte(0xC100) == 0
+    assert copy_on_write_memory_region_fixture.read_byte(0xC000) == 1
+    assert copy_on_write_memory_region_fixture.read_byte(0xC100) == 0
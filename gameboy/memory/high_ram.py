@@ -4,3 +4,14 @@ from gameboy.memory.memory_region import MemoryRegion
 class HighRAM(MemoryRegion):
     def __init__(self):
         super().__init__(bytearray(127), 0xFF80)
+
+    def read_word(self, address: int) -> int:
+        offset = address - self._base_address
+
+        return self._data[offset] | (self._data[offset + 1] << 8)
+
+    def write_word(self, address: int, value: int):
+        offset = address - self._base_address
+
+        self._data[offset] = value & 0xFF
+        self._data[offset + 1] = value >> 8
@@ -11,3 +11,11 @@ def high_ram_fixture() -> HighRAM:
 def test_video_ram_init(high_ram_fixture):
     assert len(high_ram_fixture._data) == 127
     assert high_ram_fixture._base_address == 0xFF80
+
+
+def test_high_ram_word(high_ram_fixture):
+    high_ram_fixture.write_word(0xFFFC, 0x1234)
+
+    assert high_ram_fixture.read_byte(0xFFFC) == 0x34
+    assert high_ram_fixture.read_byte(0xFFFD) == 0x12
+    assert high_ram_fixture.read_word(0xFFFC) == 0x1234
@@ -72,6 +72,13 @@ class IORAM(MemoryRegion):
     def get_lcd_background_palette(self) -> int:
         return self.read_byte(0xFF47)
 
+    def get_lcd_y(self) -> int:
+        return self.read_byte(0xFF44)
+
+    def set_lcd_y(self, value: int):
+        # Writes from the CPU reset LY, only the GPU can set it
+        self._data[0x44] = value
+
     def get_lcd_y_compare(self) -> int:
         return self.read_byte(0xFF45)
 
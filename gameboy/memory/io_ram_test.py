@@ -220,3 +220,9 @@ def test_get_lcd_object_palette1(io_ram_fixture):
     io_ram_fixture._data[0x49] = 0x02
 
     assert io_ram_fixture.get_lcd_object_palette1() == 2
+
+
+def test_set_lcd_y(io_ram_fixture):
+    io_ram_fixture.set_lcd_y(0x90)
+
+    assert io_ram_fixture.get_lcd_y() == 0x90
@@ -0,0 +1,81 @@
+from enum import Enum
+
+from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
+from gameboy.memory.memory_region import MemoryRegion
+
+
+class Joypad(MemoryRegion):
+    # P1 at 0xFF00. Writing 0 to bit 4 selects the direction buttons and to bit 5 the action buttons, bits 0-3 then
+    # read 0 for each selected button that's held. Reads are worked out from the held buttons when they happen.
+    class Button(Enum):
+        RIGHT = 0x01
+        LEFT = 0x02
+        UP = 0x04
+        DOWN = 0x08
+        A = 0x10
+        B = 0x20
+        SELECT = 0x40
+        START = 0x80
+
+    ADDRESS = 0xFF00
+
+    SELECT_DIRECTIONS = 0x10
+    SELECT_ACTIONS = 0x20
+
+    def __init__(self, interrupt_flag_register: InterruptFlagRegister):
+        # Only the select bits are stored
+        super().__init__(bytearray(1), self.ADDRESS)
+
+        self._interrupt_flag_register = interrupt_flag_register
+
+        # Button bits, 1 for held
+        self._pressed_buttons = 0
+
+    def set_interrupt_flag_register(self, interrupt_flag_register: InterruptFlagRegister) -> None:
+        # For forks, which need to raise interrupts on their own register
+        self._interrupt_flag_register = interrupt_flag_register
+
+    def get_pressed_buttons(self) -> int:
+        return self._pressed_buttons
+
+    def set_pressed_buttons(self, pressed_buttons: int) -> None:
+        if pressed_buttons & ~0xFF:
+            raise ValueError(f'Invalid buttons: {pressed_buttons}')
+
+        held_lines = self._get_held_lines()
+        self._pressed_buttons = pressed_buttons
+        self._update_interrupt(held_lines)
+
+    def press(self, button: Button) -> None:
+        self.set_pressed_buttons(self._pressed_buttons | button.value)
+
+    def release(self, button: Button) -> None:
+        self.set_pressed_buttons(self._pressed_buttons & ~button.value)
+
+    def is_pressed(self, button: Button) -> bool:
+        return self._pressed_buttons & button.value > 0
+
+    def read_byte(self, address: int) -> int:
+        return 0xC0 | self._data[0] | (~self._get_held_lines() & 0x0F)
+
+    def write_byte(self, address: int, value: int) -> None:
+        # Selecting a group with a button already held pulls its line low too
+        held_lines = self._get_held_lines()
+        self._data[0] = value & (self.SELECT_DIRECTIONS | self.SELECT_ACTIONS)
+        self._update_interrupt(held_lines)
+
+    def _get_held_lines(self) -> int:
+        held_lines = 0
+
+        if not self._data[0] & self.SELECT_DIRECTIONS:
+            held_lines |= self._pressed_buttons & 0x0F
+
+        if not self._data[0] & self.SELECT_ACTIONS:
+            held_lines |= self._pressed_buttons >> 4
+
+        return held_lines
+
+    def _update_interrupt(self, old_held_lines: int) -> None:
+        # The interrupt is raised when any of bits 0-3 goes from high to low
+        if self._get_held_lines() & ~old_held_lines:
+            self._interrupt_flag_register.set_joypad_interrupt()
@@ -0,0 +1,108 @@
+import pytest
+
+from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
+from gameboy.memory.joypad import Joypad
+
+
+@pytest.fixture()
+def interrupt_flag_register_fixture() -> InterruptFlagRegister:
+    return InterruptFlagRegister()
+
+
+@pytest.fixture()
+def joypad_fixture(interrupt_flag_register_fixture) -> Joypad:
+    return Joypad(interrupt_flag_register_fixture)
+
+
+def _joypad_interrupt_raised(interrupt_flag_register: InterruptFlagRegister) -> bool:
+    return interrupt_flag_register.get_interrupt_bits() & InterruptFlagRegister.INTERRUPT_JOYPAD > 0
+
+
+def test_joypad_init(joypad_fixture):
+    assert joypad_fixture.read_byte(0xFF00) == 0xCF
+    assert joypad_fixture.get_pressed_buttons() == 0
+
+
+def test_joypad_select(joypad_fixture):
+    joypad_fixture.press(Joypad.Button.RIGHT)
+    joypad_fixture.press(Joypad.Button.DOWN)
+    joypad_fixture.press(Joypad.Button.START)
+
+    # Neither group selected
+    joypad_fixture.write_byte(0xFF00, 0x30)
+
+    assert joypad_fixture.read_byte(0xFF00) == 0xFF
+
+    joypad_fixture.write_byte(0xFF00, 0x20)
+
+    assert joypad_fixture.read_byte(0xFF00) == 0xE6
+
+    joypad_fixture.write_byte(0xFF00, 0x10)
+
+    assert joypad_fixture.read_byte(0xFF00) == 0xD7
+
+    # Both groups, the lines are shared
+    joypad_fixture.write_byte(0xFF00, 0x00)
+
+    assert joypad_fixture.read_byte(0xFF00) == 0xC6
+
+    # Only the select bits can be written
+    joypad_fixture.write_byte(0xFF00, 0xEF)
+
+    assert joypad_fixture.read_byte(0xFF00) == 0xE6
+
+
+def test_joypad_press_release(joypad_fixture):
+    joypad_fixture.press(Joypad.Button.A)
+    joypad_fixture.press(Joypad.Button.B)
+
+    assert joypad_fixture.is_pressed(Joypad.Button.A)
+    assert joypad_fixture.get_pressed_buttons() == 0x30
+
+    joypad_fixture.release(Joypad.Button.A)
+
+    assert not joypad_fixture.is_pressed(Joypad.Button.A)
+    assert joypad_fixture.is_pressed(Joypad.Button.B)
+
+    with pytest.raises(ValueError):
+        joypad_fixture.set_pressed_buttons(0x100)
+
+
+def test_joypad_interrupt(joypad_fixture, interrupt_flag_register_fixture):
+    joypad_fixture.write_byte(0xFF00, 0x20)
+
+    # Unselected buttons don't reach the lines
+    joypad_fixture.press(Joypad.Button.START)
+
+    assert not _joypad_interrupt_raised(interrupt_flag_register_fixture)
+
+    joypad_fixture.press(Joypad.Button.UP)
+
+    assert _joypad_interrupt_raised(interrupt_flag_register_fixture)
+
+    # Releasing, or pressing another button on a line that's already low, doesn't raise it
+    interrupt_flag_register_fixture.clear_joypad_interrupt()
+    joypad_fixture.release(Joypad.Button.UP)
+    joypad_fixture.press(Joypad.Button.UP)
+    interrupt_flag_register_fixture.clear_joypad_interrupt()
+    joypad_fixture.write_byte(0xFF00, 0x00)
+
+    assert _joypad_interrupt_raised(interrupt_flag_register_fixture)
+
+    interrupt_flag_register_fixture.clear_joypad_interrupt()
+    joypad_fixture.press(Joypad.Button.SELECT)
+
+    assert not _joypad_interrupt_raised(interrupt_flag_register_fixture)
+
+
+def test_joypad_fork(joypad_fixture, interrupt_flag_register_fixture):
+    joypad_fixture.press(Joypad.Button.LEFT)
+
+    forked_interrupt_flag_register = InterruptFlagRegister()
+    forked_joypad = joypad_fixture.fork()
+    forked_joypad.set_interrupt_flag_register(forked_interrupt_flag_register)
+    forked_joypad.press(Joypad.Button.DOWN)
+
+    assert forked_joypad.get_pressed_buttons() == 0x0A
+    assert joypad_fixture.get_pressed_buttons() == 0x02
+    assert _joypad_interrupt_raised(forked_interrupt_flag_register)
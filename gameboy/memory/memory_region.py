@@ -1,3 +1,6 @@
+import copy
+
+
 class MemoryRegion:
     def __init__(self, data: bytearray, base_address: int):
         self._data = data
@@ -19,3 +22,24 @@ class MemoryRegion:
     def read_byte_range(self, address_start, length):
         start_index = address_start - self._base_address
         return self._data[start_index: start_index + length]
+
+    def write_byte_range(self, address_start, data):
+        start_index = address_start - self._base_address
+        self._data[start_index: start_index + len(data)] = data
+
+    def get_view(self) -> memoryview:
+        # Zero-copy view of the whole region
+        return memoryview(self._data)
+
+    def __copy__(self) -> 'MemoryRegion':
+        # Plain attribute copy, much cheaper than the generic reduce protocol when forking many regions
+        copied_region = self.__class__.__new__(self.__class__)
+        copied_region.__dict__.update(self.__dict__)
+
+        return copied_region
+
+    def fork(self) -> 'MemoryRegion':
+        forked_region = copy.copy(self)
+        forked_region._data = bytearray(self._data)
+
+        return forked_region
@@ -28,6 +28,12 @@ def test_write_byte_overflow_error(memory_region_fixture):
         memory_region_fixture.write_byte(0x0C, 256)
 
 
+def test_write_byte_range(memory_region_fixture):
+    memory_region_fixture.write_byte_range(0x0A, bytes([1, 2, 3]))
+
+    assert memory_region_fixture.read_byte_range(0x09, 5) == bytearray([0, 1, 2, 3, 0])
+
+
 def test_read_word(memory_region_fixture):
     memory_region_fixture._data[7] = 244
     memory_region_fixture._data[8] = 1
@@ -40,3 +46,27 @@ def test_write_word(memory_region_fixture):
 
     assert memory_region_fixture._data[7] == 244
     assert memory_region_fixture._data[8] == 1
+
+
+def test_fork(memory_region_fixture):
+    memory_region_fixture._data[7] = 124
+
+    forked_region = memory_region_fixture.fork()
+    forked_region.write_byte(0x0C, 1)
+
+    assert forked_region._base_address == 5
+    assert forked_region._data is not memory_region_fixture._data
+    assert memory_region_fixture._data[7] == 124
+    assert forked_region._data[7] == 1
+
+
+def test_get_view(memory_region_fixture):
+    view = memory_region_fixture.get_view()
+    memory_region_fixture.write_byte(6, 0x12)
+
+    assert len(view) == 10
+    assert view[1] == 0x12
+
+    view[2] = 0x34
+
+    assert memory_region_fixture.read_byte(7) == 0x34
@@ -1,16 +1,32 @@
+import copy
+from enum import Enum
+from typing import List, Optional
+
 from gameboy.boot_rom import BootROM
 from gameboy.memory.cartridge_ram import CartridgeRAM
 from gameboy.memory.high_ram import HighRAM
 from gameboy.memory.interrupt_enable_register import InterruptEnableRegister
 from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
 from gameboy.memory.io_ram import IORAM
+from gameboy.memory.joypad import Joypad
+from gameboy.memory.memory_region import MemoryRegion
 from gameboy.memory.oam_ram import OAMRam
+from gameboy.memory.real_time_clock import RealTimeClock
+from gameboy.memory.serial_port import SerialPort
 from gameboy.memory.video_ram import VideoRAM
+from gameboy.memory.watchpoint import Watchpoint
 from gameboy.memory.work_ram import WorkRAM
 from gameboy.rom import ROM
 
 
 class MemoryUnit:
+    class Region(Enum):
+        VIDEO_RAM = 0
+        CARTRIDGE_RAM = 1
+        WORK_RAM = 2
+        OAM = 3
+        HIGH_RAM = 4
+
     def __init__(self):
         self._interrupt_flag_register = InterruptFlagRegister()
         self._interrupt_enable_register = InterruptEnableRegister()
@@ -20,9 +36,15 @@ class MemoryUnit:
         self._boot_rom = BootROM()
         self._oam = OAMRam()
         self._io_ram = IORAM()
+        self._joypad = Joypad(self._interrupt_flag_register)
+        self._serial_port = SerialPort(self._interrupt_flag_register)
 
         self._cartridge_rom: ROM = None
         self._cartridge_ram: CartridgeRAM = None
+        self._real_time_clock: RealTimeClock = None
+
+        # gameboy.apu.apu.APU, only there once audio is enabled, it needs NumPy
+        self._apu = None
 
         self._cartridge_ram_bank_enabled = False
 
@@ -35,9 +57,73 @@ class MemoryUnit:
         self._dma_source = 0
         self._dma_active = False
 
+        self._watchpoints: List[Watchpoint] = []
+        self._watched_read_pages: list = None
+        self._watched_write_pages: list = None
+        self._watched_execute_pages: list = None
+        self._triggered_watchpoint: Watchpoint = None
+        self._watchpoint_callback_active = False
+
     def set_cartridge_rom(self, rom: ROM):
         self._cartridge_rom = rom
         self._cartridge_ram = CartridgeRAM(self._cartridge_rom.get_ram_size())
+        self._real_time_clock = RealTimeClock() if rom.get_has_real_time_clock() else None
+
+    def fork(self) -> 'MemoryUnit':
+        forked_memory_unit = copy.copy(self)
+
+        forked_memory_unit._interrupt_flag_register = self._interrupt_flag_register.fork()
+        forked_memory_unit._interrupt_enable_register = self._interrupt_enable_register.fork()
+        forked_memory_unit._video_ram = self._video_ram.fork()
+        forked_memory_unit._work_ram = self._work_ram.fork()
+        forked_memory_unit._high_ram = self._high_ram.fork()
+        forked_memory_unit._boot_rom = self._boot_rom.fork()
+        forked_memory_unit._oam = self._oam.fork()
+        forked_memory_unit._io_ram = self._io_ram.fork()
+        forked_memory_unit._joypad = self._joypad.fork()
+        forked_memory_unit._joypad.set_interrupt_flag_register(forked_memory_unit._interrupt_flag_register)
+
+        # Carries on any transfer under way, the forked GameBoy gives it the scheduler to finish it with
+        forked_memory_unit._serial_port = self._serial_port.fork()
+        forked_memory_unit._serial_port.set_interrupt_flag_register(forked_memory_unit._interrupt_flag_register)
+
+        if self._cartridge_rom:
+            forked_memory_unit._cartridge_rom = self._cartridge_rom.fork()
+            forked_memory_unit._cartridge_ram = self._cartridge_ram.fork()
+
+        if self._real_time_clock:
+            forked_memory_unit._real_time_clock = self._real_time_clock.fork()
+
+        # The APU forks with the CPU clock it follows, see GameBoy.fork
+        forked_memory_unit._apu = None
+
+        # Watchpoints stay with the instance they were set on
+        forked_memory_unit._watchpoints = []
+        forked_memory_unit._triggered_watchpoint = None
+        forked_memory_unit._update_watched_pages()
+
+        return forked_memory_unit
+
+    def get_cartridge_rom(self) -> ROM:
+        return self._cartridge_rom
+
+    def get_code_bank(self, address: int) -> Optional[int]:
+        # ROM bank an address in the ROM area reads from, None while reads there aren't plain ROM reads
+        if self._dma_active or self._cartridge_rom is None:
+            return None
+
+        # Cached instructions skip the reads watchpoints hook into, an instruction is up to 3 bytes long
+        if self._watchpoints and (self._watched_execute_pages[address >> 8] is not None or
+                                  self._is_range_watched(self._watched_read_pages, address, 3)):
+            return None
+
+        if address >= 0x4000:
+            return self._mbc_rom_bank
+
+        if address <= 0x00FF and not self._io_ram.get_boot_ram_locked():
+            return None
+
+        return 0
 
     def get_interrupt_flag_register(self) -> InterruptFlagRegister:
         return self._interrupt_flag_register
@@ -45,18 +131,176 @@ class MemoryUnit:
     def get_interrupt_enable_register(self) -> InterruptEnableRegister:
         return self._interrupt_enable_register
 
+    def get_cartridge_ram(self) -> CartridgeRAM:
+        return self._cartridge_ram
+
+    def get_real_time_clock(self) -> RealTimeClock:
+        return self._real_time_clock
+
+    def set_real_time_clock(self, real_time_clock: RealTimeClock) -> None:
+        if self._real_time_clock is None:
+            raise ValueError('Cartridge has no real-time clock')
+
+        self._real_time_clock = real_time_clock
+
+    def get_apu(self):
+        return self._apu
+
+    def set_apu(self, apu) -> None:
+        # Sound registers and wave RAM (0xFF10-0xFF3F) go to the APU instead of IO RAM, None to stop
+        self._apu = apu
+
     def get_video_ram(self) -> VideoRAM:
         return self._video_ram
 
     def get_io_ram(self) -> IORAM:
         return self._io_ram
 
+    def get_joypad(self) -> Joypad:
+        return self._joypad
+
+    def get_serial_port(self) -> SerialPort:
+        return self._serial_port
+
+    def get_oam(self) -> OAMRam:
+        return self._oam
+
+    def get_memory_view(self, region: Region) -> memoryview:
+        # Reads and writes through the view skip read_byte/write_byte, so watchpoints and MBC banking don't apply.
+        # Cartridge RAM views cover every bank. OAM still notices writes through its view, see OAMRam.get_version.
+        if region == self.Region.VIDEO_RAM:
+            return self._video_ram.get_view()
+
+        if region == self.Region.CARTRIDGE_RAM:
+            if self._cartridge_ram is None:
+                raise ValueError('No ROM loaded')
+
+            return self._cartridge_ram.get_view()
+
+        if region == self.Region.WORK_RAM:
+            return self._work_ram.get_view()
+
+        if region == self.Region.OAM:
+            return self._oam.get_view()
+
+        if region == self.Region.HIGH_RAM:
+            return self._high_ram.get_view()
+
+        raise ValueError(f'Unknown memory region: {region}')
+
+    def get_rom_bank(self) -> int:
+        return self._mbc_rom_bank
+
+    def get_watchpoints(self) -> List[Watchpoint]:
+        return self._watchpoints
+
+    def add_watchpoint(self, watchpoint: Watchpoint) -> Watchpoint:
+        self._watchpoints.append(watchpoint)
+        self._update_watched_pages()
+
+        return watchpoint
+
+    def remove_watchpoint(self, watchpoint: Watchpoint) -> None:
+        self._watchpoints.remove(watchpoint)
+        self._update_watched_pages()
+
+    def clear_watchpoints(self) -> None:
+        self._watchpoints = []
+        self._update_watched_pages()
+
+    def has_watchpoints(self, access_type: Watchpoint.AccessType) -> bool:
+        return any(watchpoint.get_access_type() == access_type for watchpoint in self._watchpoints)
+
+    def get_triggered_watchpoint(self) -> Optional[Watchpoint]:
+        # The first watchpoint that asked to break execution since this was last cleared
+        return self._triggered_watchpoint
+
+    def clear_triggered_watchpoint(self) -> None:
+        self._triggered_watchpoint = None
+
+    def _update_watched_pages(self) -> None:
+        # 256 pages of 256 addresses, unwatched pages are None and watched ones list the watchpoints per address
+        watched_pages = {access_type: [None] * 0x100 for access_type in Watchpoint.AccessType}
+
+        for watchpoint in self._watchpoints:
+            pages = watched_pages[watchpoint.get_access_type()]
+
+            for page in watchpoint.get_pages():
+                if pages[page] is None:
+                    pages[page] = [None] * 0x100
+
+                for address in range(max(page << 8, watchpoint.get_start_address()),
+                                     min((page << 8) | 0xFF, watchpoint.get_end_address()) + 1):
+                    if pages[page][address & 0xFF] is None:
+                        pages[page][address & 0xFF] = []
+
+                    pages[page][address & 0xFF].append(watchpoint)
+
+        self._watched_read_pages = watched_pages[Watchpoint.AccessType.READ]
+        self._watched_write_pages = watched_pages[Watchpoint.AccessType.WRITE]
+        self._watched_execute_pages = watched_pages[Watchpoint.AccessType.EXECUTE]
+
+        # Only swap in the instrumented accessors while something is watched, they shadow the plain methods on
+        # this instance so unwatched memory units never pay for the page check
+        self._set_instance_method('read_byte', self._watched_read_byte,
+                                  self.has_watchpoints(Watchpoint.AccessType.READ))
+        self._set_instance_method('write_byte', self._watched_write_byte,
+                                  self.has_watchpoints(Watchpoint.AccessType.WRITE))
+
+    def _set_instance_method(self, name: str, method, enabled: bool) -> None:
+        if enabled:
+            setattr(self, name, method)
+        elif name in self.__dict__:
+            delattr(self, name)
+
+    def _watched_read_byte(self, address: int) -> int:
+        value = MemoryUnit.read_byte(self, address)
+        page = self._watched_read_pages[address >> 8]
+
+        if page is not None and page[address & 0xFF] is not None:
+            self._trigger_watchpoints(page[address & 0xFF], address, value)
+
+        return value
+
+    def _watched_write_byte(self, address: int, value: int) -> None:
+        MemoryUnit.write_byte(self, address, value)
+        page = self._watched_write_pages[address >> 8]
+
+        if page is not None and page[address & 0xFF] is not None:
+            self._trigger_watchpoints(page[address & 0xFF], address, value)
+
+    def check_execute_watchpoints(self, address: int, op_code: int) -> None:
+        page = self._watched_execute_pages[address >> 8]
+
+        if page is not None and page[address & 0xFF] is not None:
+            self._trigger_watchpoints(page[address & 0xFF], address, op_code)
+
+    def _trigger_watchpoints(self, watchpoints: List[Watchpoint], address: int, value: int) -> None:
+        # Memory accessed from inside a callback doesn't trigger anything
+        if self._watchpoint_callback_active:
+            return
+
+        self._watchpoint_callback_active = True
+
+        try:
+            for watchpoint in watchpoints:
+                watchpoint.hit(address, value)
+
+                if watchpoint.get_break_execution() and self._triggered_watchpoint is None:
+                    self._triggered_watchpoint = watchpoint
+        finally:
+            self._watchpoint_callback_active = False
+
     def read_byte(self, address: int) -> int:
         if self._dma_active and address < 0xFF00:
             return 0xFF
 
         return self._read_byte_direct(address)
 
+    def peek_byte(self, address: int) -> int:
+        # read_byte without triggering read watchpoints, for tools looking at what the CPU reads anyway
+        return MemoryUnit.read_byte(self, address)
+
     def _read_byte_direct(self, address: int):
         if address <= 0x00FF and not self._io_ram.get_boot_ram_locked():  # Boot ROM
             return self._boot_rom.read_byte(address)
@@ -82,7 +326,7 @@ class MemoryUnit:
         if 0xE000 <= address < 0xFE00:  # Work RAM Mirror
             return self._work_ram.read_byte(address - 0x2000)
 
-        if 0xFE00 <= address < 0xFE9F:  # OAM
+        if 0xFE00 <= address < 0xFEA0:  # OAM
             return self._oam.read_byte(address)
 
         if 0xFEA0 <= address < 0xFF00:  # Empty
@@ -91,7 +335,16 @@ class MemoryUnit:
         if address == 0xFF0F:  # Interrupt flags
             return self._interrupt_flag_register.read_byte(address)
 
+        if address == 0xFF00:  # Joypad
+            return self._joypad.read_byte(address)
+
+        if 0xFF01 <= address < 0xFF03:  # Serial
+            return self._serial_port.read_byte(address)
+
         if 0xFF00 <= address < 0xFF80:  # IO
+            if 0xFF10 <= address < 0xFF40 and self._apu is not None:  # Sound
+                return self._apu.read_byte(address)
+
             return self._io_ram.read_byte(address)
 
         if 0xFF80 <= address < 0xFFFF:  # High RAM
@@ -128,10 +381,14 @@ class MemoryUnit:
                 return
 
             if self._cartridge_rom.get_memory_bank_model() == ROM.MemoryBankModel.MBC_3:
-                pass  # TODO: RTC latch
+                if self._real_time_clock is not None:
+                    self._real_time_clock.write_latch(value)
 
                 return
 
+            # Nothing to select on other cartridges, the write goes nowhere
+            return
+
         if 0x8000 <= address < 0xA000:  # Video RAM
             # TODO: Writes to VRAM should be ignored when the LCD is being redrawn
             return self._video_ram.write_byte(address, value)
@@ -145,7 +402,7 @@ class MemoryUnit:
         if 0xE000 <= address < 0xFE00:  # Work RAM Mirror
             return self._work_ram.write_byte(address - 0x2000, value)
 
-        if 0xFE00 <= address < 0xFE9F:  # OAM
+        if 0xFE00 <= address < 0xFEA0:  # OAM
             return self._oam.write_byte(address, value)
 
         if 0xFEA0 <= address < 0xFF00:  # Empty
@@ -154,10 +411,19 @@ class MemoryUnit:
         if address == 0xFF0F:  # Interrupt flags
             return self._interrupt_flag_register.write_byte(address, value)
 
+        if address == 0xFF00:  # Joypad
+            return self._joypad.write_byte(address, value)
+
+        if 0xFF01 <= address < 0xFF03:  # Serial
+            return self._serial_port.write_byte(address, value)
+
         if address == 0xFF46:  # OAM DMA
             return self._schedule_dma_transfer(value)
 
         if 0xFF00 <= address < 0xFF80:  # IO
+            if 0xFF10 <= address < 0xFF40 and self._apu is not None:  # Sound
+                return self._apu.write_byte(address, value)
+
             return self._io_ram.write_byte(address, value)
 
         if 0xFF80 <= address < 0xFFFF:  # High RAM
@@ -227,9 +493,16 @@ class MemoryUnit:
 
     def _write_banked_ram(self, address: int, value: int):
         if self._cartridge_ram_bank_enabled:
+            # MBC3 maps the RTC registers in as RAM banks 0x08 - 0x0C
+            if self._real_time_clock is not None and self._mbc_ram_bank >= RealTimeClock.REGISTER_SECONDS:
+                if self._mbc_ram_bank <= RealTimeClock.REGISTER_DAYS_HIGH:
+                    self._real_time_clock.write_register(self._mbc_ram_bank, value)
+
+                return
+
             cartridge_address = (self._mbc_ram_bank * 0x2000) + address
 
-            if cartridge_address < self._cartridge_rom.get_ram_size():
+            if cartridge_address - 0xA000 < self._cartridge_rom.get_ram_size():
                 # MBC2 has 4 bit memory
                 if self._cartridge_rom.get_memory_bank_model() == ROM.MemoryBankModel.MBC_2:
                     value &= 0x0F
@@ -242,6 +515,12 @@ class MemoryUnit:
         return self._cartridge_rom.read_byte((cartridge_address - 0x4000) % self._cartridge_rom.get_rom_size())
 
     def _read_banked_ram(self, address: int) -> int:
+        if self._real_time_clock is not None and self._mbc_ram_bank >= RealTimeClock.REGISTER_SECONDS:
+            if self._cartridge_ram_bank_enabled and self._mbc_ram_bank <= RealTimeClock.REGISTER_DAYS_HIGH:
+                return self._real_time_clock.read_register(self._mbc_ram_bank)
+
+            return 0xFF
+
         cartridge_address = (self._mbc_ram_bank * 0x2000) + address
 
         if self._cartridge_rom.get_ram_size() > 0 and self._cartridge_ram_bank_enabled:
@@ -250,12 +529,109 @@ class MemoryUnit:
         return 0xFF
 
     def write_word(self, address: int, value: int):
+        # Stacks live in work RAM and high RAM, words there skip the per byte dispatch unless their pages are watched
+        if not self._watchpoints or not self._is_range_watched(self._watched_write_pages, address, 2):
+            if 0xC000 <= address < 0xDFFF:
+                if not self._dma_active:
+                    return self._work_ram.write_word(address, value)
+            elif 0xFF80 <= address < 0xFFFE:
+                return self._high_ram.write_word(address, value)
+
         self.write_byte(address, value & 255)
         self.write_byte(address + 1, (value >> 8))
 
     def read_word(self, address: int):
+        if not self._watchpoints or not self._is_range_watched(self._watched_read_pages, address, 2):
+            if 0xC000 <= address < 0xDFFF:
+                if not self._dma_active:
+                    return self._work_ram.read_word(address)
+            elif 0xFF80 <= address < 0xFFFE:
+                return self._high_ram.read_word(address)
+
         return self.read_byte(address) + ((self.read_byte(address + 1)) << 8)
 
+    def _get_plain_ram(self, address: int, length: int) -> Optional[MemoryRegion]:
+        # RAM with no side effects on access, for ranges that fit in a single region
+        end_address = address + length
+
+        if 0x8000 <= address and end_address <= 0xA000:
+            return self._video_ram
+
+        if 0xC000 <= address and end_address <= 0xE000:
+            return self._work_ram
+
+        if 0xFE00 <= address and end_address <= 0xFEA0:
+            return self._oam
+
+        if 0xFF80 <= address and end_address <= 0xFFFF:
+            return self._high_ram
+
+        return None
+
+    def is_fetch_watched(self, address: int) -> bool:
+        # An op code fetched from here has to go through read_byte and check_execute_watchpoints
+        if not self._watchpoints:
+            return False
+
+        page = address >> 8
+
+        return self._watched_execute_pages[page] is not None or self._watched_read_pages[page] is not None
+
+    def _is_range_watched(self, watched_pages: list, address: int, length: int) -> bool:
+        # Any of the pages the range touches has a watchpoint of this access type
+        if not self._watchpoints:
+            return False
+
+        for page in range(address >> 8, min((address + length - 1) >> 8, 0xFF) + 1):
+            if watched_pages[page] is not None:
+                return True
+
+        return False
+
+    def read_byte_range(self, address: int, length: int) -> Optional[bytes]:
+        # Bulk read_byte for plain RAM and ROM. None when the range can't be read in one go: it crosses a region,
+        # touches IO, cartridge RAM or the boot ROM, or reads have to go one by one for DMA or a watched page.
+        if self._dma_active or length < 1 or self._is_range_watched(self._watched_read_pages, address, length):
+            return None
+
+        region = self._get_plain_ram(address, length)
+
+        if region is not None:
+            return bytes(region.read_byte_range(address, length))
+
+        if not self._cartridge_rom:
+            return None
+
+        if 0x0000 <= address and address + length <= 0x4000:  # ROM bank 0
+            if address <= 0x00FF and not self._io_ram.get_boot_ram_locked():
+                return None
+
+            return bytes(self._cartridge_rom.read_byte_range(address, length))
+
+        if 0x4000 <= address and address + length <= 0x8000:  # Banked ROM
+            cartridge_address = (self._mbc_rom_bank * 0x4000 + address - 0x4000) % self._cartridge_rom.get_rom_size()
+
+            if cartridge_address + length > self._cartridge_rom.get_rom_size():
+                return None
+
+            return bytes(self._cartridge_rom.read_byte_range(cartridge_address, length))
+
+        return None
+
+    def write_byte_range(self, address: int, data: bytes) -> bool:
+        # Bulk write_byte for plain RAM, False when nothing was written and the range needs write_byte instead
+        if self._dma_active or not data or self._is_range_watched(self._watched_write_pages, address, len(data)):
+            return False
+
+        region = self._get_plain_ram(address, len(data))
+
+        if region is None:
+            return False
+
+        region.write_byte_range(address, data)
+
+        return True
+
     def _schedule_dma_transfer(self, value: int):
         if value > 0xF1:
             raise ValueError('Invalid LCD OAM transfer range')
@@ -263,6 +639,10 @@ class MemoryUnit:
         self._dma_pending_source = value
         self._dma_delay_start = True
 
+    def is_dma_busy(self) -> bool:
+        # A transfer is scheduled, waiting on its start delay or copying
+        return bool(self._dma_active or self._dma_source or self._dma_pending_source)
+
     def dma_update(self):
         if self._dma_pending_source:
             if not self._dma_delay_start:
@@ -3,7 +3,12 @@ from unittest import mock
 import pytest
 
 from gameboy.memory.cartridge_ram import CartridgeRAM
+from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
+from gameboy.memory.joypad import Joypad
 from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.memory.real_time_clock import RealTimeClock
+from gameboy.memory.serial_endpoint import CaptureSerialEndpoint
+from gameboy.memory.watchpoint import Watchpoint
 from gameboy.rom import ROM
 
 
@@ -41,6 +46,81 @@ def test_memory_unit_get_ioram(memory_unit_fixture):
     assert memory_unit_fixture.get_io_ram() == memory_unit_fixture._io_ram
 
 
+def test_memory_unit_get_oam(memory_unit_fixture):
+    assert memory_unit_fixture.get_oam() == memory_unit_fixture._oam
+
+
+def test_memory_unit_oam_dma_bumps_oam_version(memory_unit_fixture):
+    version = memory_unit_fixture.get_oam().get_version()
+
+    memory_unit_fixture.write_byte(0xFF46, 0xC0)
+
+    for _ in range(0, 162):
+        memory_unit_fixture.dma_update()
+
+    assert memory_unit_fixture.get_oam().get_version() > version
+
+
+def test_memory_unit_write_byte_range(memory_unit_fixture):
+    assert memory_unit_fixture.write_byte_range(0xC0FF, bytes([1, 2]))
+    assert memory_unit_fixture.read_byte(0xC100) == 2
+
+    assert memory_unit_fixture.write_byte_range(0x9FFF, bytes([3]))
+    assert memory_unit_fixture.write_byte_range(0xFF80, bytes(0x7F))
+
+
+def test_memory_unit_write_byte_range_not_plain_ram(memory_unit_fixture):
+    assert not memory_unit_fixture.write_byte_range(0x9FFF, bytes(2))  # Crosses into cartridge RAM
+    assert not memory_unit_fixture.write_byte_range(0x2000, bytes(1))  # MBC registers
+    assert not memory_unit_fixture.write_byte_range(0xE000, bytes(1))  # Echo
+    assert not memory_unit_fixture.write_byte_range(0xFF40, bytes(1))  # IO
+    assert not memory_unit_fixture.write_byte_range(0xFF80, bytes(0x80))  # IE
+    assert not memory_unit_fixture.write_byte_range(0xC000, bytes())
+
+    memory_unit_fixture.add_watchpoint(Watchpoint(0xD000, access_type=Watchpoint.AccessType.WRITE))
+
+    # Only ranges touching a watched page go byte by byte
+    assert not memory_unit_fixture.write_byte_range(0xCFFF, bytes(2))
+    assert memory_unit_fixture.write_byte_range(0xC000, bytes(1))
+
+
+def test_memory_unit_byte_range_watched_pages(memory_unit_fixture):
+    memory_unit_fixture.add_watchpoint(Watchpoint(0xC180, access_type=Watchpoint.AccessType.READ))
+
+    assert memory_unit_fixture.read_byte_range(0xC100, 1) is None
+    assert memory_unit_fixture.read_byte_range(0xC0FF, 2) is None
+    assert memory_unit_fixture.read_byte_range(0xC000, 0x100) == bytes(0x100)
+    assert memory_unit_fixture.write_byte_range(0xC100, bytes(1))
+    assert memory_unit_fixture.read_byte_range(0xFF80, 0x7F) == bytes(0x7F)
+
+
+def test_memory_unit_byte_range_oam_end(memory_unit_fixture):
+    assert memory_unit_fixture.write_byte_range(0xFE00, bytes(range(0xA0)))
+    assert memory_unit_fixture.read_byte_range(0xFE9F, 1) == bytes([0x9F])
+    assert memory_unit_fixture.read_byte_range(0xFE9F, 2) is None
+
+
+def test_memory_unit_read_byte_range(memory_unit_fixture, test_rom_fixture):
+    memory_unit_fixture.write_byte(0xFE00, 7)
+
+    assert memory_unit_fixture.read_byte_range(0xFE00, 2) == bytes([7, 0])
+    assert memory_unit_fixture.read_byte_range(0x0100, 4) == bytes(test_rom_fixture._data[0x0100:0x0104])
+    assert memory_unit_fixture.read_byte_range(0x4000, 4) == bytes(test_rom_fixture._data[0x4000:0x4004])
+
+    # Still mapped over by the boot ROM
+    assert memory_unit_fixture.read_byte_range(0x0000, 4) is None
+    assert memory_unit_fixture.read_byte_range(0x3FFF, 2) is None
+    assert memory_unit_fixture.read_byte_range(0xA000, 1) is None
+    assert memory_unit_fixture.read_byte_range(0xFF00, 1) is None
+
+
+def test_memory_unit_read_byte_range_dma_active(memory_unit_fixture):
+    memory_unit_fixture._dma_active = True
+
+    assert memory_unit_fixture.read_byte_range(0xC000, 1) is None
+    assert not memory_unit_fixture.write_byte_range(0xC000, bytes(1))
+
+
 def test_memory_unit_set_cartridge_rom(memory_unit_fixture, test_rom_fixture):
     test_rom_fixture.get_ram_size = mock.Mock()
     test_rom_fixture.get_ram_size.return_value = 8192
@@ -132,6 +212,32 @@ def test_write_word(memory_unit_fixture):
     assert memory_unit_fixture.read_byte(0xC001) == 1
 
 
+def test_high_ram_word(memory_unit_fixture):
+    memory_unit_fixture.write_word(0xFFFC, 0x1234)
+
+    assert memory_unit_fixture.read_byte(0xFFFD) == 0x12
+    assert memory_unit_fixture.read_word(0xFFFC) == 0x1234
+
+    # Runs into the interrupt enable register
+    memory_unit_fixture.write_word(0xFFFE, 0x0142)
+
+    assert memory_unit_fixture.read_byte(0xFFFF) == 0x01
+    assert memory_unit_fixture.read_word(0xFFFE) == 0x0142
+
+
+def test_work_ram_word_dma_active(memory_unit_fixture):
+    memory_unit_fixture.write_word(0xC000, 500)
+    memory_unit_fixture._dma_active = True
+
+    memory_unit_fixture.write_word(0xC000, 600)
+
+    assert memory_unit_fixture.read_word(0xC000) == 0xFFFF
+
+    memory_unit_fixture._dma_active = False
+
+    assert memory_unit_fixture.read_word(0xC000) == 500
+
+
 def test_lock_boot_rom(memory_unit_fixture):
     memory_unit_fixture.write_byte(0xFF50, 1)
 
@@ -349,6 +455,23 @@ def test_dma_transfer(memory_unit_fixture):
     assert memory_unit_fixture._dma_source == 0b100000010
 
 
+def test_is_dma_busy(memory_unit_fixture):
+    assert not memory_unit_fixture.is_dma_busy()
+
+    memory_unit_fixture._schedule_dma_transfer(0xC0)
+
+    assert memory_unit_fixture.is_dma_busy()
+
+    for _ in range(0, 161):
+        memory_unit_fixture.dma_update()
+
+    assert memory_unit_fixture.is_dma_busy()
+
+    memory_unit_fixture.dma_update()
+
+    assert not memory_unit_fixture.is_dma_busy()
+
+
 def test_dma_transfer_restrict_write(memory_unit_fixture):
     memory_unit_fixture._schedule_dma_transfer(0x01)
 
@@ -372,3 +495,391 @@ def test_dma_transfer_restrict_read(memory_unit_fixture):
 
     assert memory_unit_fixture.read_byte(0x8000) == 0xFF
     assert memory_unit_fixture.read_byte(0xFF80) == 0x00
+
+
+def test_memory_unit_fork(memory_unit_fixture):
+    memory_unit_fixture.write_byte(0xC000, 1)
+    memory_unit_fixture.write_byte(0xFF80, 2)
+    memory_unit_fixture._mbc_rom_bank = 3
+
+    forked_memory_unit = memory_unit_fixture.fork()
+
+    assert forked_memory_unit._cartridge_rom is memory_unit_fixture._cartridge_rom
+    assert forked_memory_unit._work_ram is not memory_unit_fixture._work_ram
+    assert forked_memory_unit._work_ram.is_shared()
+    assert forked_memory_unit._mbc_rom_bank == 3
+    assert forked_memory_unit.read_byte(0xC000) == 1
+    assert forked_memory_unit.read_byte(0xFF80) == 2
+
+    forked_memory_unit.write_byte(0xC000, 3)
+    forked_memory_unit.write_byte(0xFF80, 4)
+    forked_memory_unit.write_byte(0xFFFF, 0x01)
+    forked_memory_unit._mbc_rom_bank = 4
+
+    assert memory_unit_fixture.read_byte(0xC000) == 1
+    assert memory_unit_fixture.read_byte(0xFF80) == 2
+    assert memory_unit_fixture.read_byte(0xFFFF) == 0x00
+    assert memory_unit_fixture._mbc_rom_bank == 3
+
+
+def test_memory_unit_fork_without_rom():
+    forked_memory_unit = MemoryUnit().fork()
+
+    assert forked_memory_unit._cartridge_rom is None
+    assert forked_memory_unit._cartridge_ram is None
+
+
+def test_memory_unit_get_code_bank(memory_unit_fixture):
+    memory_unit_fixture._mbc_rom_bank = 5
+
+    assert memory_unit_fixture.get_code_bank(0x4000) == 5
+    assert memory_unit_fixture.get_code_bank(0x0100) == 0
+    assert memory_unit_fixture.get_code_bank(0x0000) is None  # Boot ROM
+
+    memory_unit_fixture.write_byte(0xFF50, 1)
+
+    assert memory_unit_fixture.get_code_bank(0x0000) == 0
+
+    memory_unit_fixture._dma_active = True
+
+    assert memory_unit_fixture.get_code_bank(0x4000) is None
+
+
+def test_memory_unit_get_code_bank_watched_pages(memory_unit_fixture):
+    memory_unit_fixture.write_byte(0xFF50, 1)
+    memory_unit_fixture.add_watchpoint(Watchpoint(0xC000))
+    memory_unit_fixture.add_watchpoint(Watchpoint(0x0200, access_type=Watchpoint.AccessType.READ))
+    memory_unit_fixture.add_watchpoint(Watchpoint(0x4100, access_type=Watchpoint.AccessType.EXECUTE))
+
+    # Only pages with read or execute watchpoints are fetched uncached
+    assert memory_unit_fixture.get_code_bank(0x0100) == 0
+    assert memory_unit_fixture.get_code_bank(0x01FE) is None  # Operands run into the watched page
+    assert memory_unit_fixture.get_code_bank(0x0250) is None
+    assert memory_unit_fixture.get_code_bank(0x4150) is None
+    assert memory_unit_fixture.get_code_bank(0x4000) == 1
+
+
+def test_memory_unit_get_code_bank_without_rom():
+    assert MemoryUnit().get_code_bank(0x0100) is None
+
+
+def test_memory_unit_get_rom_bank(memory_unit_fixture):
+    memory_unit_fixture._mbc_rom_bank = 5
+
+    assert memory_unit_fixture.get_rom_bank() == 5
+
+
+def test_memory_unit_watchpoint_write(memory_unit_fixture):
+    hits = []
+    watchpoint = memory_unit_fixture.add_watchpoint(
+        Watchpoint(0xC010, 0xC01F, callback=lambda _, address, value: hits.append((address, value))))
+
+    assert memory_unit_fixture.get_watchpoints() == [watchpoint]
+
+    memory_unit_fixture.write_byte(0xC000, 1)  # Same page, outside the range
+    memory_unit_fixture.write_byte(0xC010, 2)
+    memory_unit_fixture.write_byte(0xC01F, 3)
+    memory_unit_fixture.write_byte(0xD010, 4)
+    memory_unit_fixture.read_byte(0xC010)
+
+    assert hits == [(0xC010, 2), (0xC01F, 3)]
+    assert memory_unit_fixture.read_byte(0xC01F) == 3
+    assert memory_unit_fixture.get_triggered_watchpoint() is None
+
+
+def test_memory_unit_watchpoint_read(memory_unit_fixture):
+    hits = []
+    memory_unit_fixture.write_byte(0xFF90, 0x42)
+    memory_unit_fixture.add_watchpoint(Watchpoint(0xFF90, access_type=Watchpoint.AccessType.READ,
+                                                  callback=lambda _, address, value: hits.append((address, value))))
+
+    assert memory_unit_fixture.read_byte(0xFF90) == 0x42
+
+    memory_unit_fixture.write_byte(0xFF90, 0x43)
+
+    assert hits == [(0xFF90, 0x42)]
+
+
+def test_memory_unit_peek_byte(memory_unit_fixture):
+    hits = []
+
+    memory_unit_fixture.write_byte(0xC000, 0x42)
+    memory_unit_fixture.add_watchpoint(Watchpoint(0xC000, access_type=Watchpoint.AccessType.READ,
+                                                  callback=lambda _, address, value: hits.append(address)))
+
+    assert memory_unit_fixture.peek_byte(0xC000) == 0x42
+    assert hits == []
+
+
+def test_memory_unit_watchpoint_word(memory_unit_fixture):
+    hits = []
+
+    for access_type in (Watchpoint.AccessType.READ, Watchpoint.AccessType.WRITE):
+        memory_unit_fixture.add_watchpoint(Watchpoint(0xFFF0, 0xFFF1, access_type=access_type,
+                                                      callback=lambda _, address, value: hits.append((address, value))))
+
+    memory_unit_fixture.write_word(0xFFF0, 0x1234)
+
+    assert memory_unit_fixture.read_word(0xFFF0) == 0x1234
+    assert hits == [(0xFFF0, 0x34), (0xFFF1, 0x12), (0xFFF0, 0x34), (0xFFF1, 0x12)]
+
+
+def test_memory_unit_watchpoint_word_other_page(memory_unit_fixture):
+    hits = []
+
+    for access_type in (Watchpoint.AccessType.READ, Watchpoint.AccessType.WRITE):
+        memory_unit_fixture.add_watchpoint(Watchpoint(0xC100, access_type=access_type,
+                                                      callback=lambda _, address, value: hits.append((address, value))))
+
+    # Words away from the watched page stay on the work RAM fast path
+    with mock.patch.object(memory_unit_fixture._work_ram, 'write_word') as write_word:
+        memory_unit_fixture.write_word(0xC010, 0x1234)
+
+    write_word.assert_called_once_with(0xC010, 0x1234)
+
+    # A word whose high byte is on the watched page is checked byte by byte
+    memory_unit_fixture.write_word(0xC0FF, 0x5678)
+
+    assert memory_unit_fixture.read_word(0xC0FF) == 0x5678
+    assert memory_unit_fixture.read_word(0xC000) == 0
+    assert hits == [(0xC100, 0x56), (0xC100, 0x56)]
+
+
+def test_memory_unit_watchpoint_fast_path(memory_unit_fixture):
+    assert 'read_byte' not in memory_unit_fixture.__dict__
+    assert 'write_byte' not in memory_unit_fixture.__dict__
+
+    write_watchpoint = memory_unit_fixture.add_watchpoint(Watchpoint(0xC000))
+
+    # Only the watched access is instrumented
+    assert 'read_byte' not in memory_unit_fixture.__dict__
+    assert 'write_byte' in memory_unit_fixture.__dict__
+
+    read_watchpoint = memory_unit_fixture.add_watchpoint(
+        Watchpoint(0xC000, access_type=Watchpoint.AccessType.READ))
+
+    assert 'read_byte' in memory_unit_fixture.__dict__
+
+    memory_unit_fixture.remove_watchpoint(write_watchpoint)
+
+    assert 'write_byte' not in memory_unit_fixture.__dict__
+    assert memory_unit_fixture.get_watchpoints() == [read_watchpoint]
+
+    memory_unit_fixture.clear_watchpoints()
+
+    assert 'read_byte' not in memory_unit_fixture.__dict__
+    assert memory_unit_fixture.get_watchpoints() == []
+
+
+def test_memory_unit_watchpoint_break(memory_unit_fixture):
+    first_watchpoint = memory_unit_fixture.add_watchpoint(Watchpoint(0xC000, break_execution=True))
+    memory_unit_fixture.add_watchpoint(Watchpoint(0xC001, break_execution=True))
+
+    memory_unit_fixture.write_byte(0xC000, 1)
+    memory_unit_fixture.write_byte(0xC001, 1)
+
+    assert memory_unit_fixture.get_triggered_watchpoint() is first_watchpoint
+
+    memory_unit_fixture.clear_triggered_watchpoint()
+
+    assert memory_unit_fixture.get_triggered_watchpoint() is None
+
+
+def test_memory_unit_watchpoint_callback_access(memory_unit_fixture):
+    hits = []
+
+    def callback(_, address, value):
+        hits.append(address)
+
+        # Reading back from a callback doesn't trigger again
+        memory_unit_fixture.read_byte(address)
+
+    memory_unit_fixture.add_watchpoint(Watchpoint(0xC000, access_type=Watchpoint.AccessType.READ, callback=callback))
+    memory_unit_fixture.read_byte(0xC000)
+
+    assert hits == [0xC000]
+
+
+def test_memory_unit_check_execute_watchpoints(memory_unit_fixture):
+    hits = []
+    memory_unit_fixture.add_watchpoint(Watchpoint(0x0150, 0x0152, access_type=Watchpoint.AccessType.EXECUTE,
+                                                  callback=lambda _, address, value: hits.append((address, value))))
+
+    memory_unit_fixture.check_execute_watchpoints(0x0151, 0x00)
+    memory_unit_fixture.check_execute_watchpoints(0x0160, 0x00)
+
+    assert hits == [(0x0151, 0x00)]
+    assert memory_unit_fixture.has_watchpoints(Watchpoint.AccessType.EXECUTE)
+    assert not memory_unit_fixture.has_watchpoints(Watchpoint.AccessType.READ)
+
+
+def test_memory_unit_fork_watchpoints(memory_unit_fixture):
+    hits = []
+    memory_unit_fixture.add_watchpoint(Watchpoint(0xC000, callback=lambda *args: hits.append(args)))
+
+    forked_memory_unit = memory_unit_fixture.fork()
+    forked_memory_unit.write_byte(0xC000, 1)
+
+    assert forked_memory_unit.get_watchpoints() == []
+    assert 'write_byte' not in forked_memory_unit.__dict__
+    assert hits == []
+    assert memory_unit_fixture.read_byte(0xC000) == 0
+
+
+@pytest.mark.parametrize('region, address, size', [
+    (MemoryUnit.Region.VIDEO_RAM, 0x8000, 0x2000),
+    (MemoryUnit.Region.WORK_RAM, 0xC000, 0x2000),
+    (MemoryUnit.Region.OAM, 0xFE00, 0xA0),
+    (MemoryUnit.Region.HIGH_RAM, 0xFF80, 0x7F)
+])
+def test_memory_unit_get_memory_view(memory_unit_fixture, region, address, size):
+    memory_unit_fixture.write_byte(address + 1, 0x42)
+    view = memory_unit_fixture.get_memory_view(region)
+
+    assert len(view) == size
+    assert view[1] == 0x42
+
+    memory_unit_fixture.write_byte(address + 2, 0x43)
+
+    assert view[2] == 0x43
+
+
+def test_memory_unit_get_memory_view_cartridge_ram(memory_unit_fixture):
+    assert len(memory_unit_fixture.get_memory_view(MemoryUnit.Region.CARTRIDGE_RAM)) == \
+        memory_unit_fixture._cartridge_rom.get_ram_size()
+
+    with pytest.raises(ValueError):
+        MemoryUnit().get_memory_view(MemoryUnit.Region.CARTRIDGE_RAM)
+
+
+def test_memory_unit_get_memory_view_fork(memory_unit_fixture):
+    memory_unit_fixture.write_byte(0xC000, 1)
+
+    forked_memory_unit = memory_unit_fixture.fork()
+    forked_memory_unit.write_byte(0xC000, 2)
+
+    assert memory_unit_fixture.get_memory_view(MemoryUnit.Region.WORK_RAM)[0] == 1
+    assert forked_memory_unit.get_memory_view(MemoryUnit.Region.WORK_RAM)[0] == 2
+
+
+def test_write_banked_ram_bank_0(memory_unit_fixture, test_rom_fixture):
+    test_rom_fixture._data[0x0149] = 0x02  # 8KB RAM
+    memory_unit_fixture.set_cartridge_rom(test_rom_fixture)
+
+    memory_unit_fixture.write_byte(0x0000, 0x0A)  # Enable cartridge RAM
+    memory_unit_fixture.write_byte(0xBFFF, 123)
+
+    assert memory_unit_fixture.read_byte(0xBFFF) == 123
+    assert memory_unit_fixture.get_cartridge_ram().read_byte(0xBFFF) == 123
+
+
+def test_memory_unit_real_time_clock(memory_unit_fixture, test_rom_fixture):
+    assert memory_unit_fixture.get_real_time_clock() is None
+
+    with pytest.raises(ValueError):
+        memory_unit_fixture.set_real_time_clock(RealTimeClock())
+
+    test_rom_fixture._data[0x0147] = 0x10  # MBC3, timer, RAM and battery
+    test_rom_fixture._data[0x0149] = 0x02  # 8KB RAM
+    memory_unit_fixture.set_cartridge_rom(test_rom_fixture)
+
+    real_time_clock = memory_unit_fixture.get_real_time_clock()
+    real_time_clock.write_register(RealTimeClock.REGISTER_MINUTES, 12)
+
+    memory_unit_fixture.write_byte(0x4000, 0x09)  # Select the RTC minutes register
+
+    # Disabled like cartridge RAM
+    assert memory_unit_fixture.read_byte(0xA000) == 0xFF
+
+    memory_unit_fixture.write_byte(0x0000, 0x0A)
+    memory_unit_fixture.write_byte(0x6000, 0x00)
+    memory_unit_fixture.write_byte(0x6000, 0x01)
+
+    assert memory_unit_fixture.read_byte(0xA000) == 12
+
+    memory_unit_fixture.write_byte(0xA000, 34)
+
+    assert memory_unit_fixture.read_byte(0xA000) == 34
+    assert real_time_clock.get_registers()[1] == 34
+
+    # RAM banks are still RAM
+    memory_unit_fixture.write_byte(0x4000, 0x00)
+    memory_unit_fixture.write_byte(0xA000, 56)
+
+    assert memory_unit_fixture.read_byte(0xA000) == 56
+    assert memory_unit_fixture.fork().get_real_time_clock() is not real_time_clock
+
+
+def test_memory_unit_apu(memory_unit_fixture):
+    pytest.importorskip('numpy')
+
+    from gameboy.apu.apu import APU
+
+    apu = APU(lambda: 0)
+    memory_unit_fixture.write_byte(0xFF12, 0xF0)
+    memory_unit_fixture.set_apu(apu)
+
+    assert memory_unit_fixture.get_apu() is apu
+
+    # Sound registers go to the APU, the rest of IO doesn't
+    memory_unit_fixture.write_byte(0xFF26, 0x80)
+    memory_unit_fixture.write_byte(0xFF24, 0x35)
+    memory_unit_fixture.write_byte(0xFF3A, 0x42)
+    memory_unit_fixture.write_byte(0xFF42, 0x12)
+
+    assert memory_unit_fixture.read_byte(0xFF24) == 0x35
+    assert memory_unit_fixture.read_byte(0xFF26) == 0xF0
+    assert memory_unit_fixture.read_byte(0xFF3A) == 0x42
+    assert memory_unit_fixture.read_byte(0xFF12) == 0x00
+    assert memory_unit_fixture.read_byte(0xFF42) == 0x12
+    assert apu.read_byte(0xFF3A) == 0x42
+    assert memory_unit_fixture.get_io_ram().read_byte(0xFF24) == 0x00
+
+    assert memory_unit_fixture.fork().get_apu() is None
+
+    memory_unit_fixture.set_apu(None)
+
+    assert memory_unit_fixture.read_byte(0xFF12) == 0xF0
+
+
+def test_memory_unit_joypad(memory_unit_fixture):
+    joypad = memory_unit_fixture.get_joypad()
+    joypad.press(Joypad.Button.B)
+
+    memory_unit_fixture.write_byte(0xFF00, 0x10)
+
+    assert memory_unit_fixture.read_byte(0xFF00) == 0xDD
+    assert memory_unit_fixture.read_byte(0xFF0F) & InterruptFlagRegister.INTERRUPT_JOYPAD
+
+    forked_memory_unit = memory_unit_fixture.fork()
+    forked_memory_unit.get_interrupt_flag_register().clear_joypad_interrupt()
+    memory_unit_fixture.get_interrupt_flag_register().clear_joypad_interrupt()
+    forked_memory_unit.get_joypad().press(Joypad.Button.A)
+
+    assert forked_memory_unit.get_joypad() is not joypad
+    assert forked_memory_unit.read_byte(0xFF0F) & InterruptFlagRegister.INTERRUPT_JOYPAD
+    assert not memory_unit_fixture.read_byte(0xFF0F) & InterruptFlagRegister.INTERRUPT_JOYPAD
+    assert not joypad.is_pressed(Joypad.Button.A)
+
+
+def test_memory_unit_serial_port(memory_unit_fixture):
+    serial_port = memory_unit_fixture.get_serial_port()
+    endpoint = CaptureSerialEndpoint()
+    serial_port.set_endpoint(endpoint)
+
+    memory_unit_fixture.write_byte(0xFF01, 0x41)
+
+    forked_memory_unit = memory_unit_fixture.fork()
+
+    # Without a scheduler the transfer completes on the write
+    memory_unit_fixture.write_byte(0xFF02, 0x81)
+
+    assert memory_unit_fixture.read_byte(0xFF01) == 0xFF
+    assert memory_unit_fixture.read_byte(0xFF02) == 0x7F
+    assert memory_unit_fixture.read_byte(0xFF0F) & InterruptFlagRegister.INTERRUPT_SERIAL
+    assert endpoint.get_captured_bytes() == b'A'
+
+    assert forked_memory_unit.get_serial_port() is not serial_port
+    assert forked_memory_unit.read_byte(0xFF01) == 0x41
+    assert not forked_memory_unit.read_byte(0xFF0F) & InterruptFlagRegister.INTERRUPT_SERIAL
+    assert forked_memory_unit.get_serial_port().get_endpoint().get_captured_bytes() == b''
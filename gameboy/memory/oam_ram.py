@@ -4,3 +4,40 @@ from gameboy.memory.memory_region import MemoryRegion
 class OAMRam(MemoryRegion):
     def __init__(self):
         super().__init__(bytearray(160), 0xFE00)
+
+        # Bumped on every write (CPU and DMA), lets the GPU keep its decoded sprite tables until OAM changes
+        self._version = 0
+
+        # Contents as of the last version once get_view has handed out our buffer, writes through it skip write_byte
+        self._viewed_data: bytes = None
+
+    def write_byte(self, address: int, value: int):
+        self._data[address - self._base_address] = value
+        self._version += 1
+
+    def write_byte_range(self, address_start, data):
+        super().write_byte_range(address_start, data)
+        self._version += 1
+
+    def get_version(self) -> int:
+        if self._viewed_data is not None and self._viewed_data != self._data:
+            self._viewed_data = bytes(self._data)
+            self._version += 1
+
+        return self._version
+
+    def get_view(self) -> memoryview:
+        self._viewed_data = bytes(self._data)
+
+        return super().get_view()
+
+    def fork(self) -> 'OAMRam':
+        # Views of our buffer don't reach the fork's copy
+        forked_region = super().fork()
+        forked_region._viewed_data = None
+
+        return forked_region
+
+    def invalidate(self) -> None:
+        # For writes that bypass write_byte, e.g. through a memory view
+        self._version += 1
@@ -0,0 +1,57 @@
+import pytest
+
+from gameboy.memory.oam_ram import OAMRam
+
+
+@pytest.fixture()
+def oam_ram_fixture() -> OAMRam:
+    return OAMRam()
+
+
+def test_oam_ram_write_byte_bumps_version(oam_ram_fixture):
+    version = oam_ram_fixture.get_version()
+
+    oam_ram_fixture.write_byte(0xFE10, 0x42)
+
+    assert oam_ram_fixture.read_byte(0xFE10) == 0x42
+    assert oam_ram_fixture.get_version() == version + 1
+
+
+def test_oam_ram_write_byte_range_bumps_version(oam_ram_fixture):
+    version = oam_ram_fixture.get_version()
+
+    oam_ram_fixture.write_byte_range(0xFE10, bytes([1, 2]))
+
+    assert oam_ram_fixture.read_byte(0xFE11) == 2
+    assert oam_ram_fixture.get_version() == version + 1
+
+
+def test_oam_ram_invalidate(oam_ram_fixture):
+    version = oam_ram_fixture.get_version()
+
+    oam_ram_fixture.invalidate()
+
+    assert oam_ram_fixture.get_version() == version + 1
+
+
+def test_oam_ram_get_view_write_bumps_version(oam_ram_fixture):
+    view = oam_ram_fixture.get_view()
+    version = oam_ram_fixture.get_version()
+
+    assert oam_ram_fixture.get_version() == version
+
+    view[0x10] = 0x42
+
+    assert oam_ram_fixture.get_version() == version + 1
+    assert oam_ram_fixture.get_version() == version + 1
+
+
+def test_oam_ram_fork_keeps_version(oam_ram_fixture):
+    oam_ram_fixture.write_byte(0xFE00, 1)
+
+    forked_oam_ram = oam_ram_fixture.fork()
+    forked_oam_ram.write_byte(0xFE00, 2)
+
+    assert oam_ram_fixture.get_version() == 1
+    assert forked_oam_ram.get_version() == 2
+    assert oam_ram_fixture.read_byte(0xFE00) == 1
@@ -0,0 +1,161 @@
+import json
+import struct
+from enum import Enum
+from typing import Dict, Iterable, List
+
+from gameboy.memory.memory_unit import MemoryUnit
+
+# First address, last address, region and the address the region's view starts at
+_REGION_ADDRESS_RANGES = (
+    (0x8000, 0x9FFF, MemoryUnit.Region.VIDEO_RAM, 0x8000),
+    (0xA000, 0xBFFF, MemoryUnit.Region.CARTRIDGE_RAM, 0xA000),
+    (0xC000, 0xDFFF, MemoryUnit.Region.WORK_RAM, 0xC000),
+    (0xE000, 0xFDFF, MemoryUnit.Region.WORK_RAM, 0xE000),  # Work RAM mirror
+    (0xFE00, 0xFE9F, MemoryUnit.Region.OAM, 0xFE00),
+    (0xFF80, 0xFFFE, MemoryUnit.Region.HIGH_RAM, 0xFF80)
+)
+
+
+class RAMVariable:
+    class Type(Enum):
+        U8 = 'u8'
+        I8 = 'i8'
+        U16 = 'u16'
+        I16 = 'i16'
+        U32 = 'u32'
+        I32 = 'i32'
+        BCD = 'bcd'  # Two decimal digits per byte, length bytes long
+
+    class Endianness(Enum):
+        LITTLE = 'little'
+        BIG = 'big'
+
+    STRUCT_FORMATS = {
+        Type.U8: 'B',
+        Type.I8: 'b',
+        Type.U16: 'H',
+        Type.I16: 'h',
+        Type.U32: 'I',
+        Type.I32: 'i'
+    }
+
+    def __init__(self, name: str, address: int, variable_type: Type=Type.U8, endianness: Endianness=Endianness.LITTLE,
+                 length: int=1, bank: int=0):
+        self._name = name
+        self._address = address
+        self._type = variable_type
+        self._endianness = endianness
+        self._bank = bank
+
+        if variable_type == self.Type.BCD:
+            if length < 1:
+                raise ValueError(f'Invalid BCD length for {name}: {length}')
+
+            self._struct_format = None
+            self._size = length
+        else:
+            # A format string rather than a compiled Struct keeps maps picklable, struct caches the compiled ones
+            byte_order = '<' if endianness == self.Endianness.LITTLE else '>'
+
+            self._struct_format = byte_order + self.STRUCT_FORMATS[variable_type]
+            self._size = struct.calcsize(self._struct_format)
+
+        for first_address, last_address, region, region_address in _REGION_ADDRESS_RANGES:
+            if first_address <= address <= last_address:
+                if address + self._size - 1 > last_address:
+                    raise ValueError(f'{name} runs past the end of its memory region')
+
+                self._region = region
+                self._offset = address - region_address
+
+                # Cartridge RAM views cover every bank one after the other
+                if region == MemoryUnit.Region.CARTRIDGE_RAM:
+                    self._offset += bank * 0x2000
+
+                break
+        else:
+            raise ValueError('{} is not in viewable RAM: {}'.format(name, hex(address)))
+
+    @classmethod
+    def from_dict(cls, name: str, variable: dict) -> 'RAMVariable':
+        address = variable['address']
+
+        return cls(
+            name=name,
+            address=int(address, 16) if isinstance(address, str) else address,
+            variable_type=cls.Type(variable.get('type', cls.Type.U8.value)),
+            endianness=cls.Endianness(variable.get('endianness', cls.Endianness.LITTLE.value)),
+            length=variable.get('length', 1),
+            bank=variable.get('bank', 0)
+        )
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_address(self) -> int:
+        return self._address
+
+    def get_type(self) -> Type:
+        return self._type
+
+    def get_endianness(self) -> Endianness:
+        return self._endianness
+
+    def get_size(self) -> int:
+        return self._size
+
+    def get_region(self) -> MemoryUnit.Region:
+        return self._region
+
+    def get_offset(self) -> int:
+        return self._offset
+
+    def decode(self, view: memoryview) -> int:
+        # view is the variable's whole memory region
+        if self._struct_format is not None:
+            return struct.unpack_from(self._struct_format, view, self._offset)[0]
+
+        value = 0
+        data = view[self._offset:self._offset + self._size]
+
+        if self._endianness == self.Endianness.LITTLE:
+            data = reversed(data)
+
+        for byte in data:
+            value = value * 100 + (byte >> 4) * 10 + (byte & 0x0F)
+
+        return value
+
+
+class RAMVariableMap:
+    def __init__(self, variables: Iterable[RAMVariable]=()):
+        self._variables: List[RAMVariable] = []
+        self._regions: List[MemoryUnit.Region] = []
+
+        for variable in variables:
+            self.add_variable(variable)
+
+    @classmethod
+    def from_dict(cls, variables: Dict[str, dict]) -> 'RAMVariableMap':
+        # {"score": {"address": "0xc0a0", "type": "bcd", "length": 3, "endianness": "big"}, ...}
+        return cls(RAMVariable.from_dict(name, variable) for name, variable in variables.items())
+
+    @classmethod
+    def load(cls, path: str) -> 'RAMVariableMap':
+        with open(path, 'r') as json_file:
+            return cls.from_dict(json.load(json_file))
+
+    def add_variable(self, variable: RAMVariable) -> None:
+        self._variables.append(variable)
+
+        if variable.get_region() not in self._regions:
+            self._regions.append(variable.get_region())
+
+    def get_variables(self) -> List[RAMVariable]:
+        return self._variables
+
+    def decode(self, memory_unit: MemoryUnit) -> Dict[str, int]:
+        # One view per region, then every variable is unpacked straight out of guest RAM
+        views = {region: memory_unit.get_memory_view(region) for region in self._regions}
+
+        return {variable.get_name(): variable.decode(views[variable.get_region()]) for variable in self._variables}
@@ -0,0 +1,110 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from gameboy.memory.memory_unit import MemoryUnit
+from gameboy.memory.ram_variable_map import RAMVariable, RAMVariableMap
+
+
+@pytest.fixture()
+def memory_unit_fixture(test_rom_fixture) -> MemoryUnit:
+    memory_unit = MemoryUnit()
+    memory_unit.set_cartridge_rom(test_rom_fixture)
+
+    for address, value in ((0xC0A0, 0x34), (0xC0A1, 0x12), (0xC0A2, 0x56), (0xFF90, 0xFE), (0x8010, 0x99)):
+        memory_unit.write_byte(address, value)
+
+    return memory_unit
+
+
+def test_ram_variable_init():
+    variable = RAMVariable('lives', 0xE0A0, RAMVariable.Type.U16)
+
+    assert variable.get_name() == 'lives'
+    assert variable.get_address() == 0xE0A0
+    assert variable.get_size() == 2
+    assert variable.get_region() == MemoryUnit.Region.WORK_RAM
+    assert variable.get_offset() == 0xA0
+
+
+def test_ram_variable_init_cartridge_ram_bank():
+    variable = RAMVariable('save', 0xA010, bank=2)
+
+    assert variable.get_region() == MemoryUnit.Region.CARTRIDGE_RAM
+    assert variable.get_offset() == 0x4010
+
+
+def test_ram_variable_init_invalid():
+    # ROM and IO registers aren't viewable
+    with pytest.raises(ValueError):
+        RAMVariable('rom', 0x0100)
+
+    with pytest.raises(ValueError):
+        RAMVariable('io', 0xFF40)
+
+    with pytest.raises(ValueError):
+        RAMVariable('overflow', 0xDFFF, RAMVariable.Type.U16)
+
+    with pytest.raises(ValueError):
+        RAMVariable('bcd', 0xC000, RAMVariable.Type.BCD, length=0)
+
+
+@pytest.mark.parametrize('variable_type, endianness, expected_value', [
+    (RAMVariable.Type.U8, RAMVariable.Endianness.LITTLE, 0x34),
+    (RAMVariable.Type.U16, RAMVariable.Endianness.LITTLE, 0x1234),
+    (RAMVariable.Type.U16, RAMVariable.Endianness.BIG, 0x3412),
+    (RAMVariable.Type.U32, RAMVariable.Endianness.LITTLE, 0x00561234),
+    (RAMVariable.Type.I8, RAMVariable.Endianness.LITTLE, 0x34)
+])
+def test_ram_variable_decode(memory_unit_fixture, variable_type, endianness, expected_value):
+    variable = RAMVariable('value', 0xC0A0, variable_type, endianness)
+
+    assert variable.decode(memory_unit_fixture.get_memory_view(MemoryUnit.Region.WORK_RAM)) == expected_value
+
+
+def test_ram_variable_decode_bcd(memory_unit_fixture):
+    view = memory_unit_fixture.get_memory_view(MemoryUnit.Region.WORK_RAM)
+
+    assert RAMVariable('score', 0xC0A0, RAMVariable.Type.BCD, RAMVariable.Endianness.BIG, length=3).decode(view) == 341256
+    assert RAMVariable('score', 0xC0A0, RAMVariable.Type.BCD, length=3).decode(view) == 561234
+
+
+def test_ram_variable_map_decode(memory_unit_fixture):
+    variable_map = RAMVariableMap([
+        RAMVariable('score', 0xC0A0, RAMVariable.Type.U16),
+        RAMVariable('timer', 0xFF90, RAMVariable.Type.I8),
+        RAMVariable('tile', 0x8010)
+    ])
+
+    assert variable_map.decode(memory_unit_fixture) == {'score': 0x1234, 'timer': -2, 'tile': 0x99}
+
+    memory_unit_fixture.write_byte(0xC0A0, 0x35)
+
+    assert variable_map.decode(memory_unit_fixture)['score'] == 0x1235
+
+
+def test_ram_variable_map_from_dict(memory_unit_fixture):
+    variable_map = RAMVariableMap.from_dict({
+        'score': {'address': '0xc0a0', 'type': 'bcd', 'length': 2, 'endianness': 'big'},
+        'timer': {'address': 0xFF90}
+    })
+
+    assert len(variable_map.get_variables()) == 2
+    assert variable_map.decode(memory_unit_fixture) == {'score': 3412, 'timer': 0xFE}
+
+
+def test_ram_variable_map_load(memory_unit_fixture, tmpdir):
+    path = os.path.join(str(tmpdir), 'variables.json')
+
+    with open(path, 'w') as json_file:
+        json.dump({'score': {'address': '0xc0a0', 'type': 'u16'}}, json_file)
+
+    assert RAMVariableMap.load(path).decode(memory_unit_fixture) == {'score': 0x1234}
+
+
+def test_ram_variable_map_pickle(memory_unit_fixture):
+    variable_map = RAMVariableMap([RAMVariable('score', 0xC0A0, RAMVariable.Type.U16)])
+
+    assert pickle.loads(pickle.dumps(variable_map)).decode(memory_unit_fixture) == {'score': 0x1234}
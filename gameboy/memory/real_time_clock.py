@@ -0,0 +1,162 @@
+import struct
+import time
+from enum import Enum
+from typing import Callable
+
+SECONDS_PER_DAY = 86400
+DAY_COUNTER_LIMIT = 512
+
+CLOCK_CYCLES_PER_SECOND = 4194304
+
+
+class RealTimeClock:
+    # MBC3 RTC, selected as RAM banks 0x08 - 0x0C. Rather than ticking every cycle the counter is kept as a base value
+    # plus the time elapsed since, and only worked out into registers when latched or written.
+
+    class TimeSource(Enum):
+        EMULATED = 0  # Follows the CPU clock, deterministic
+        HOST = 1  # Follows wall-clock time, keeps running while we're not
+
+    REGISTER_SECONDS = 0x08
+    REGISTER_MINUTES = 0x09
+    REGISTER_HOURS = 0x0A
+    REGISTER_DAYS_LOW = 0x0B
+    REGISTER_DAYS_HIGH = 0x0C
+
+    DAYS_HIGH_HALT = 0x40
+    DAYS_HIGH_CARRY = 0x80
+
+    # The footer BGB and VBA-M append to .sav files: current and latched registers as 32 bit words, then a timestamp
+    SAVE_FORMAT = '<10IQ'
+    SAVE_SIZE = struct.calcsize(SAVE_FORMAT)
+
+    def __init__(self, time_source: TimeSource=TimeSource.EMULATED, cycle_source: Callable[[], int]=None):
+        self._time_source = time_source
+        self._cycle_source = cycle_source
+
+        self._base_seconds = 0.0
+        self._base_time = self._get_source_time()
+        self._halted = False
+        self._day_carry = False
+
+        self._latched_registers = [0] * 5
+        self._latch_prepared = False
+
+    def get_time_source(self) -> TimeSource:
+        return self._time_source
+
+    def set_cycle_source(self, cycle_source: Callable[[], int]) -> None:
+        # Moving to another clock (like a forked CPU's) keeps the counter where it is
+        seconds = self.get_seconds()
+
+        self._cycle_source = cycle_source
+        self._set_seconds(seconds)
+
+    def _get_source_time(self) -> float:
+        if self._time_source == self.TimeSource.HOST:
+            return time.time()
+
+        if self._cycle_source is None:
+            return 0.0
+
+        return self._cycle_source() / CLOCK_CYCLES_PER_SECOND
+
+    def get_seconds(self) -> float:
+        if self._halted:
+            return self._base_seconds
+
+        seconds = self._base_seconds + self._get_source_time() - self._base_time
+
+        # The 9 bit day counter overflowed, wrap it and set the sticky carry bit
+        if seconds >= DAY_COUNTER_LIMIT * SECONDS_PER_DAY:
+            wrapped_days = int(seconds // (DAY_COUNTER_LIMIT * SECONDS_PER_DAY)) * DAY_COUNTER_LIMIT
+
+            self._base_seconds -= wrapped_days * SECONDS_PER_DAY
+            self._day_carry = True
+            seconds -= wrapped_days * SECONDS_PER_DAY
+
+        return seconds
+
+    def _set_seconds(self, seconds: float) -> None:
+        self._base_seconds = seconds
+        self._base_time = self._get_source_time()
+
+    def get_halted(self) -> bool:
+        return self._halted
+
+    def get_day_carry(self) -> bool:
+        return self._day_carry
+
+    def get_registers(self) -> list:
+        seconds = int(self.get_seconds())
+        days = seconds // SECONDS_PER_DAY
+
+        days_high = (days >> 8) & 0x01
+
+        if self._halted:
+            days_high |= self.DAYS_HIGH_HALT
+
+        if self._day_carry:
+            days_high |= self.DAYS_HIGH_CARRY
+
+        return [seconds % 60, (seconds // 60) % 60, (seconds // 3600) % 24, days & 0xFF, days_high]
+
+    def write_latch(self, value: int) -> None:
+        # Writing 0x00 then 0x01 copies the running counter into the registers the CPU reads
+        if self._latch_prepared and value == 0x01:
+            self._latched_registers = self.get_registers()
+
+        self._latch_prepared = value == 0x00
+
+    def read_register(self, register: int) -> int:
+        return self._latched_registers[register - self.REGISTER_SECONDS]
+
+    def write_register(self, register: int, value: int) -> None:
+        registers = self.get_registers()
+        registers[register - self.REGISTER_SECONDS] = value
+
+        # The latched copy is what reads see, so they pick up the write too
+        self._latched_registers[register - self.REGISTER_SECONDS] = value
+
+        seconds, minutes, hours, days_low, days_high = registers
+        days = ((days_high & 0x01) << 8) | days_low
+
+        # Writes start a new second
+        self._set_seconds(float(days * SECONDS_PER_DAY + (hours % 24) * 3600 + (minutes % 60) * 60 + seconds % 60))
+
+        self._day_carry = (days_high & self.DAYS_HIGH_CARRY) > 0
+        self._halted = (days_high & self.DAYS_HIGH_HALT) > 0
+
+    def fork(self, cycle_source: Callable[[], int]=None) -> 'RealTimeClock':
+        forked_real_time_clock = RealTimeClock.__new__(RealTimeClock)
+        forked_real_time_clock.__dict__.update(self.__dict__)
+        forked_real_time_clock._latched_registers = list(self._latched_registers)
+
+        if cycle_source is not None:
+            forked_real_time_clock.set_cycle_source(cycle_source)
+
+        return forked_real_time_clock
+
+    def to_bytes(self) -> bytes:
+        return struct.pack(self.SAVE_FORMAT, *self.get_registers(), *self._latched_registers, int(time.time()))
+
+    def load_bytes(self, data: bytes) -> None:
+        # Older saves leave the timestamp as 32 bits
+        if len(data) == self.SAVE_SIZE - 4:
+            data = data + bytes(4)
+
+        if len(data) != self.SAVE_SIZE:
+            raise ValueError(f'Invalid RTC save size: {len(data)}')
+
+        values = struct.unpack(self.SAVE_FORMAT, data)
+        registers = values[0:5]
+        timestamp = values[10]
+
+        for register, value in enumerate(registers):
+            self.write_register(self.REGISTER_SECONDS + register, value)
+
+        self._latched_registers = list(values[5:10])
+
+        # Following the host clock, the cartridge kept running while it was on the shelf
+        if self._time_source == self.TimeSource.HOST and not self._halted and timestamp:
+            self._set_seconds(self._base_seconds + max(0, time.time() - timestamp))
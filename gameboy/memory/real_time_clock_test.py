@@ -0,0 +1,161 @@
+import pytest
+
+from gameboy.memory.real_time_clock import RealTimeClock
+
+
+@pytest.fixture()
+def real_time_clock_fixture(cycle_source_fixture) -> RealTimeClock:
+    return RealTimeClock(cycle_source=cycle_source_fixture)
+
+
+def _latch(real_time_clock: RealTimeClock) -> list:
+    real_time_clock.write_latch(0x00)
+    real_time_clock.write_latch(0x01)
+
+    return [real_time_clock.read_register(register) for register in range(0x08, 0x0D)]
+
+
+def test_real_time_clock_init(real_time_clock_fixture):
+    assert real_time_clock_fixture.get_time_source() == RealTimeClock.TimeSource.EMULATED
+    assert not real_time_clock_fixture.get_halted()
+    assert not real_time_clock_fixture.get_day_carry()
+    assert _latch(real_time_clock_fixture) == [0, 0, 0, 0, 0]
+
+
+def test_real_time_clock_emulated_time(real_time_clock_fixture, cycle_source_fixture):
+    cycle_source_fixture.advance(2 * 86400 + 3 * 3600 + 4 * 60 + 5.5)
+
+    assert _latch(real_time_clock_fixture) == [5, 4, 3, 2, 0]
+
+    cycle_source_fixture.advance(300 * 86400)
+
+    assert _latch(real_time_clock_fixture) == [5, 4, 3, 302 & 0xFF, 1]
+
+
+def test_real_time_clock_latch(real_time_clock_fixture, cycle_source_fixture):
+    _latch(real_time_clock_fixture)
+    cycle_source_fixture.advance(10)
+
+    # Reads stay on the latched values until the next 0 -> 1 latch write
+    assert real_time_clock_fixture.read_register(RealTimeClock.REGISTER_SECONDS) == 0
+
+    real_time_clock_fixture.write_latch(0x01)
+
+    assert real_time_clock_fixture.read_register(RealTimeClock.REGISTER_SECONDS) == 0
+
+    real_time_clock_fixture.write_latch(0x00)
+    real_time_clock_fixture.write_latch(0x01)
+
+    assert real_time_clock_fixture.read_register(RealTimeClock.REGISTER_SECONDS) == 10
+
+
+def test_real_time_clock_write_register(real_time_clock_fixture, cycle_source_fixture):
+    cycle_source_fixture.advance(0.5)
+    real_time_clock_fixture.write_register(RealTimeClock.REGISTER_MINUTES, 30)
+
+    assert real_time_clock_fixture.read_register(RealTimeClock.REGISTER_MINUTES) == 30
+
+    cycle_source_fixture.advance(0.75)
+
+    # The write restarted the second
+    assert _latch(real_time_clock_fixture) == [0, 30, 0, 0, 0]
+
+
+def test_real_time_clock_halt(real_time_clock_fixture, cycle_source_fixture):
+    cycle_source_fixture.advance(10)
+    real_time_clock_fixture.write_register(RealTimeClock.REGISTER_DAYS_HIGH, RealTimeClock.DAYS_HIGH_HALT)
+    cycle_source_fixture.advance(100)
+
+    assert real_time_clock_fixture.get_halted()
+    assert _latch(real_time_clock_fixture) == [10, 0, 0, 0, RealTimeClock.DAYS_HIGH_HALT]
+
+    real_time_clock_fixture.write_register(RealTimeClock.REGISTER_DAYS_HIGH, 0)
+    cycle_source_fixture.advance(5)
+
+    assert _latch(real_time_clock_fixture) == [15, 0, 0, 0, 0]
+
+
+def test_real_time_clock_day_carry(real_time_clock_fixture, cycle_source_fixture):
+    for register, value in ((0x08, 59), (0x09, 59), (0x0A, 23), (0x0B, 0xFF), (0x0C, 0x01)):
+        real_time_clock_fixture.write_register(register, value)
+
+    cycle_source_fixture.advance(1)
+
+    assert _latch(real_time_clock_fixture) == [0, 0, 0, 0, RealTimeClock.DAYS_HIGH_CARRY]
+    assert real_time_clock_fixture.get_day_carry()
+
+    # The carry sticks until it's written
+    cycle_source_fixture.advance(86400)
+
+    assert _latch(real_time_clock_fixture) == [0, 0, 0, 1, RealTimeClock.DAYS_HIGH_CARRY]
+
+    real_time_clock_fixture.write_register(RealTimeClock.REGISTER_DAYS_HIGH, 0)
+
+    assert not real_time_clock_fixture.get_day_carry()
+
+
+def test_real_time_clock_host_time(monkeypatch):
+    host_time = [1000.0]
+    monkeypatch.setattr('time.time', lambda: host_time[0])
+
+    real_time_clock = RealTimeClock(RealTimeClock.TimeSource.HOST)
+    host_time[0] += 90
+
+    assert _latch(real_time_clock) == [30, 1, 0, 0, 0]
+
+
+def test_real_time_clock_set_cycle_source(real_time_clock_fixture, cycle_source_fixture, new_cycle_source_fixture):
+    cycle_source_fixture.advance(10)
+
+    other_cycle_source = new_cycle_source_fixture()
+    real_time_clock_fixture.set_cycle_source(other_cycle_source)
+    other_cycle_source.advance(5)
+
+    assert _latch(real_time_clock_fixture) == [15, 0, 0, 0, 0]
+
+
+def test_real_time_clock_fork(real_time_clock_fixture, cycle_source_fixture, new_cycle_source_fixture):
+    cycle_source_fixture.advance(10)
+    _latch(real_time_clock_fixture)
+
+    other_cycle_source = new_cycle_source_fixture()
+    forked_real_time_clock = real_time_clock_fixture.fork(other_cycle_source)
+    other_cycle_source.advance(5)
+
+    assert _latch(forked_real_time_clock) == [15, 0, 0, 0, 0]
+    assert real_time_clock_fixture.read_register(RealTimeClock.REGISTER_SECONDS) == 10
+
+
+def test_real_time_clock_save(real_time_clock_fixture, cycle_source_fixture, new_cycle_source_fixture):
+    cycle_source_fixture.advance(3661)
+    _latch(real_time_clock_fixture)
+
+    data = real_time_clock_fixture.to_bytes()
+
+    assert len(data) == RealTimeClock.SAVE_SIZE == 48
+
+    real_time_clock = RealTimeClock(cycle_source=new_cycle_source_fixture())
+    real_time_clock.load_bytes(data)
+
+    assert real_time_clock.read_register(RealTimeClock.REGISTER_HOURS) == 1
+    assert _latch(real_time_clock) == [1, 1, 1, 0, 0]
+
+    # 32 bit timestamps
+    real_time_clock.load_bytes(data[:44])
+
+    with pytest.raises(ValueError):
+        real_time_clock.load_bytes(data[:40])
+
+
+def test_real_time_clock_save_host_time(monkeypatch):
+    host_time = [1000.0]
+    monkeypatch.setattr('time.time', lambda: host_time[0])
+
+    data = RealTimeClock(RealTimeClock.TimeSource.HOST).to_bytes()
+    host_time[0] += 120
+
+    # The cartridge kept time while it was switched off
+    real_time_clock = RealTimeClock(RealTimeClock.TimeSource.HOST)
+    real_time_clock.load_bytes(data)
+
+    assert _latch(real_time_clock) == [0, 2, 0, 0, 0]
@@ -0,0 +1,65 @@
+class SerialEndpoint:
+    # Whatever is plugged into the link port. exchange is called when one of our internally clocked transfers
+    # completes, with the byte we shifted out, and returns the byte shifted in.
+
+    def exchange(self, outgoing: int) -> int:
+        raise NotImplementedError()
+
+    def fork(self) -> 'SerialEndpoint':
+        # What a forked GameBoy gets plugged into, nothing by default
+        return NullSerialEndpoint()
+
+
+class NullSerialEndpoint(SerialEndpoint):
+    # No cable, the line floats high so every transfer reads 0xFF
+
+    def exchange(self, outgoing: int) -> int:
+        return 0xFF
+
+    def fork(self) -> 'SerialEndpoint':
+        return self
+
+
+class CaptureSerialEndpoint(SerialEndpoint):
+    # Keeps every byte sent, for test ROMs that report their results over serial. Nothing answers, transfers read
+    # 0xFF like they would without a cable.
+
+    def __init__(self):
+        self._captured = bytearray()
+
+    def exchange(self, outgoing: int) -> int:
+        self._captured.append(outgoing)
+
+        return 0xFF
+
+    def get_captured_bytes(self) -> bytes:
+        return bytes(self._captured)
+
+    def get_captured_text(self) -> str:
+        return self._captured.decode('latin-1')
+
+    def clear(self) -> None:
+        self._captured.clear()
+
+    def fork(self) -> 'SerialEndpoint':
+        # The fork carries on from what we've captured so far, into its own buffer
+        forked_endpoint = CaptureSerialEndpoint()
+        forked_endpoint._captured = bytearray(self._captured)
+
+        return forked_endpoint
+
+
+class LinkedSerialEndpoint(SerialEndpoint):
+    # Another emulated GameBoy's serial port, in the same process. Our internally clocked transfers clock the other
+    # side's shift register, which only takes part if it has a transfer waiting on an external clock. The two run
+    # on their own clocks, the other side finishes its transfer at whatever point it has run to.
+
+    def __init__(self, serial_port):
+        # gameboy.memory.serial_port.SerialPort
+        self._serial_port = serial_port
+
+    def get_serial_port(self):
+        return self._serial_port
+
+    def exchange(self, outgoing: int) -> int:
+        return self._serial_port.receive_external_transfer(outgoing)
@@ -0,0 +1,67 @@
+import pytest
+
+from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
+from gameboy.memory.serial_endpoint import (CaptureSerialEndpoint, LinkedSerialEndpoint, NullSerialEndpoint,
+                                            SerialEndpoint)
+from gameboy.memory.serial_port import SerialPort
+
+
+@pytest.fixture()
+def capture_serial_endpoint_fixture() -> CaptureSerialEndpoint:
+    return CaptureSerialEndpoint()
+
+
+def test_serial_endpoint_exchange():
+    with pytest.raises(NotImplementedError):
+        SerialEndpoint().exchange(0x00)
+
+
+def test_serial_endpoint_null():
+    endpoint = NullSerialEndpoint()
+
+    assert endpoint.exchange(0x12) == 0xFF
+    assert endpoint.fork() is endpoint
+
+
+def test_serial_endpoint_capture(capture_serial_endpoint_fixture):
+    for value in b'Passed\n\xe9':
+        assert capture_serial_endpoint_fixture.exchange(value) == 0xFF
+
+    assert capture_serial_endpoint_fixture.get_captured_bytes() == b'Passed\n\xe9'
+    assert capture_serial_endpoint_fixture.get_captured_text() == 'Passed\né'
+
+    capture_serial_endpoint_fixture.clear()
+
+    assert capture_serial_endpoint_fixture.get_captured_bytes() == b''
+
+
+def test_serial_endpoint_capture_fork(capture_serial_endpoint_fixture):
+    capture_serial_endpoint_fixture.exchange(0x41)
+
+    forked_endpoint = capture_serial_endpoint_fixture.fork()
+    forked_endpoint.exchange(0x42)
+
+    assert forked_endpoint.get_captured_bytes() == b'AB'
+    assert capture_serial_endpoint_fixture.get_captured_bytes() == b'A'
+
+
+def test_serial_endpoint_linked():
+    interrupt_flag_register = InterruptFlagRegister()
+    serial_port = SerialPort(interrupt_flag_register)
+    endpoint = LinkedSerialEndpoint(serial_port)
+
+    assert endpoint.get_serial_port() is serial_port
+
+    # Not waiting on an external clock, so it doesn't take part
+    assert endpoint.exchange(0x41) == 0xFF
+
+    serial_port.write_byte(0xFF01, 0x42)
+    serial_port.write_byte(0xFF02, 0x80)
+
+    assert endpoint.exchange(0x41) == 0x42
+    assert serial_port.read_byte(0xFF01) == 0x41
+    assert not serial_port.is_transferring()
+    assert interrupt_flag_register.get_interrupt_bits() & InterruptFlagRegister.INTERRUPT_SERIAL
+
+    # Forks aren't plugged into anything
+    assert isinstance(endpoint.fork(), NullSerialEndpoint)
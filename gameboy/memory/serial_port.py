@@ -0,0 +1,99 @@
+from typing import Callable
+
+from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
+from gameboy.memory.memory_region import MemoryRegion
+from gameboy.memory.serial_endpoint import NullSerialEndpoint, SerialEndpoint
+from gameboy.scheduler import Scheduler
+
+
+class SerialPort(MemoryRegion):
+    # SB at 0xFF01 and SC at 0xFF02. Writing SC with bit 7 and the internal clock bit 0 set starts a transfer, which
+    # completes 8 bits at 8192Hz later as a scheduled event: SB is swapped with the endpoint, bit 7 is cleared and the
+    # serial interrupt raised. With the external clock the transfer waits for the other side to clock it.
+    TRANSFER_ADDRESS = 0xFF01
+    CONTROL_ADDRESS = 0xFF02
+
+    CONTROL_START = 0x80
+    CONTROL_INTERNAL_CLOCK = 0x01
+
+    TRANSFER_CLOCK_CYCLES = 4096  # 8 bits, 512 clock cycles each
+
+    def __init__(self, interrupt_flag_register: InterruptFlagRegister):
+        # SB then SC, unused SC bits aren't stored
+        super().__init__(bytearray(2), self.TRANSFER_ADDRESS)
+
+        self._interrupt_flag_register = interrupt_flag_register
+        self._endpoint: SerialEndpoint = NullSerialEndpoint()
+
+        # Set by the owning GameBoy, without them transfers complete as soon as they start
+        self._scheduler: Scheduler = None
+        self._cycle_source: Callable[[], int] = None
+
+    def set_interrupt_flag_register(self, interrupt_flag_register: InterruptFlagRegister) -> None:
+        self._interrupt_flag_register = interrupt_flag_register
+
+    def set_scheduler(self, scheduler: Scheduler, cycle_source: Callable[[], int]) -> None:
+        self._scheduler = scheduler
+        self._cycle_source = cycle_source
+
+    def get_endpoint(self) -> SerialEndpoint:
+        return self._endpoint
+
+    def set_endpoint(self, endpoint: SerialEndpoint) -> None:
+        self._endpoint = endpoint
+
+    def is_transferring(self) -> bool:
+        return self._data[1] & self.CONTROL_START > 0
+
+    def fork(self) -> 'SerialPort':
+        forked_serial_port = super().fork()
+        forked_serial_port._endpoint = self._endpoint.fork()
+
+        return forked_serial_port
+
+    def read_byte(self, address: int) -> int:
+        if address == self.CONTROL_ADDRESS:
+            return self._data[1] | 0x7E
+
+        return self._data[0]
+
+    def write_byte(self, address: int, value: int) -> None:
+        if address == self.TRANSFER_ADDRESS:
+            self._data[0] = value
+
+            return
+
+        self._data[1] = value & (self.CONTROL_START | self.CONTROL_INTERNAL_CLOCK)
+
+        # Starting over, or stopping, drops a transfer already under way
+        if self._scheduler is not None:
+            self._scheduler.cancel(Scheduler.EventType.SERIAL_TRANSFER)
+
+        if self._data[1] != self.CONTROL_START | self.CONTROL_INTERNAL_CLOCK:
+            return
+
+        if self._scheduler is None:
+            self.complete_transfer()
+        else:
+            self._scheduler.schedule(self._cycle_source() + self.TRANSFER_CLOCK_CYCLES,
+                                     Scheduler.EventType.SERIAL_TRANSFER)
+
+    def complete_transfer(self, _: int=0) -> None:
+        # Scheduler.EventType.SERIAL_TRANSFER handler
+        self._finish_transfer(self._endpoint.exchange(self._data[0]))
+
+    def receive_external_transfer(self, incoming: int) -> int:
+        # The other side clocking a whole byte through, returns what we shifted out. Only a transfer started on the
+        # external clock takes part, otherwise the other side reads 0xFF.
+        if self._data[1] != self.CONTROL_START:
+            return 0xFF
+
+        outgoing = self._data[0]
+        self._finish_transfer(incoming)
+
+        return outgoing
+
+    def _finish_transfer(self, incoming: int) -> None:
+        self._data[0] = incoming
+        self._data[1] &= ~self.CONTROL_START
+        self._interrupt_flag_register.set_serial_interrupt()
@@ -0,0 +1,121 @@
+import pytest
+
+from gameboy.memory.interrupt_flag_register import InterruptFlagRegister
+from gameboy.memory.serial_endpoint import CaptureSerialEndpoint, NullSerialEndpoint
+from gameboy.memory.serial_port import SerialPort
+from gameboy.scheduler import Scheduler
+
+
+@pytest.fixture()
+def interrupt_flag_register_fixture() -> InterruptFlagRegister:
+    return InterruptFlagRegister()
+
+
+@pytest.fixture()
+def serial_port_fixture(interrupt_flag_register_fixture) -> SerialPort:
+    return SerialPort(interrupt_flag_register_fixture)
+
+
+def _serial_interrupt_raised(interrupt_flag_register: InterruptFlagRegister) -> bool:
+    return interrupt_flag_register.get_interrupt_bits() & InterruptFlagRegister.INTERRUPT_SERIAL > 0
+
+
+def test_serial_port_init(serial_port_fixture):
+    assert serial_port_fixture.read_byte(0xFF01) == 0x00
+    assert serial_port_fixture.read_byte(0xFF02) == 0x7E
+    assert not serial_port_fixture.is_transferring()
+    assert isinstance(serial_port_fixture.get_endpoint(), NullSerialEndpoint)
+
+
+def test_serial_port_read_write(serial_port_fixture):
+    serial_port_fixture.write_byte(0xFF01, 0x5A)
+
+    assert serial_port_fixture.read_byte(0xFF01) == 0x5A
+
+    # External clock, waits for the other side
+    serial_port_fixture.write_byte(0xFF02, 0xFE)
+
+    assert serial_port_fixture.read_byte(0xFF02) == 0xFE
+    assert serial_port_fixture.is_transferring()
+
+
+def test_serial_port_transfer_unscheduled(serial_port_fixture, interrupt_flag_register_fixture):
+    endpoint = CaptureSerialEndpoint()
+    serial_port_fixture.set_endpoint(endpoint)
+
+    serial_port_fixture.write_byte(0xFF01, 0x41)
+    serial_port_fixture.write_byte(0xFF02, 0x81)
+
+    # No scheduler to time it against, so it's done straight away
+    assert endpoint.get_captured_bytes() == b'A'
+    assert serial_port_fixture.read_byte(0xFF01) == 0xFF
+    assert serial_port_fixture.read_byte(0xFF02) == 0x7F
+    assert _serial_interrupt_raised(interrupt_flag_register_fixture)
+
+
+def test_serial_port_transfer_scheduled(serial_port_fixture, interrupt_flag_register_fixture, cycle_source_fixture):
+    cycle_source_fixture.clock_cycles = 1000
+    scheduler = Scheduler()
+    scheduler.set_handler(Scheduler.EventType.SERIAL_TRANSFER, serial_port_fixture.complete_transfer)
+    serial_port_fixture.set_scheduler(scheduler, cycle_source_fixture)
+
+    serial_port_fixture.write_byte(0xFF01, 0x41)
+    serial_port_fixture.write_byte(0xFF02, 0x81)
+
+    assert scheduler.get_next_clock_cycles() == 1000 + SerialPort.TRANSFER_CLOCK_CYCLES
+
+    scheduler.run_due(1000 + SerialPort.TRANSFER_CLOCK_CYCLES - 1)
+
+    assert serial_port_fixture.is_transferring()
+    assert not _serial_interrupt_raised(interrupt_flag_register_fixture)
+
+    scheduler.run_due(1000 + SerialPort.TRANSFER_CLOCK_CYCLES)
+
+    assert not serial_port_fixture.is_transferring()
+    assert serial_port_fixture.read_byte(0xFF01) == 0xFF
+    assert _serial_interrupt_raised(interrupt_flag_register_fixture)
+
+
+def test_serial_port_transfer_restart(serial_port_fixture, cycle_source_fixture):
+    scheduler = Scheduler()
+    serial_port_fixture.set_scheduler(scheduler, cycle_source_fixture)
+
+    serial_port_fixture.write_byte(0xFF02, 0x81)
+    cycle_source_fixture.clock_cycles = 2000
+    serial_port_fixture.write_byte(0xFF02, 0x81)
+
+    assert scheduler.get_event_count() == 1
+    assert scheduler.get_next_clock_cycles() == 2000 + SerialPort.TRANSFER_CLOCK_CYCLES
+
+    # Clearing the start bit drops it
+    serial_port_fixture.write_byte(0xFF02, 0x01)
+
+    assert scheduler.get_event_count() == 0
+
+
+def test_serial_port_receive_external_transfer(serial_port_fixture, interrupt_flag_register_fixture):
+    serial_port_fixture.write_byte(0xFF01, 0x42)
+
+    assert serial_port_fixture.receive_external_transfer(0x41) == 0xFF
+    assert serial_port_fixture.read_byte(0xFF01) == 0x42
+
+    serial_port_fixture.write_byte(0xFF02, 0x80)
+
+    assert serial_port_fixture.receive_external_transfer(0x41) == 0x42
+    assert serial_port_fixture.read_byte(0xFF01) == 0x41
+    assert serial_port_fixture.read_byte(0xFF02) == 0x7E
+    assert _serial_interrupt_raised(interrupt_flag_register_fixture)
+
+
+def test_serial_port_fork(serial_port_fixture):
+    endpoint = CaptureSerialEndpoint()
+    serial_port_fixture.set_endpoint(endpoint)
+    serial_port_fixture.write_byte(0xFF01, 0x41)
+
+    forked_serial_port = serial_port_fixture.fork()
+    forked_serial_port.set_interrupt_flag_register(InterruptFlagRegister())
+    forked_serial_port.write_byte(0xFF02, 0x81)
+
+    assert forked_serial_port.get_endpoint().get_captured_bytes() == b'A'
+    assert endpoint.get_captured_bytes() == b''
+    assert serial_port_fixture.read_byte(0xFF01) == 0x41
@@ -1,6 +1,6 @@
-from gameboy.memory.memory_region import MemoryRegion
+from gameboy.memory.copy_on_write_memory_region import CopyOnWriteMemoryRegion
 
 
-class VideoRAM(MemoryRegion):
+class VideoRAM(CopyOnWriteMemoryRegion):
     def __init__(self):
         super().__init__(bytearray(8192), 0x8000)
@@ -0,0 +1,53 @@
+from enum import Enum
+from typing import Callable
+
+
+class Watchpoint:
+    class AccessType(Enum):
+        READ = 0
+        WRITE = 1
+        EXECUTE = 2
+
+    def __init__(self, start_address: int, end_address: int=None, access_type: AccessType=AccessType.WRITE,
+                 callback: Callable[['Watchpoint', int, int], None]=None, break_execution: bool=False):
+        # end_address is inclusive, a single address is watched when it's left out
+        if end_address is None:
+            end_address = start_address
+
+        if not 0 <= start_address <= end_address <= 0xFFFF:
+            raise ValueError('Invalid watchpoint range: {} - {}'.format(hex(start_address), hex(end_address)))
+
+        self._start_address = start_address
+        self._end_address = end_address
+        self._access_type = access_type
+        self._callback = callback
+        self._break_execution = break_execution
+        self._hit_count = 0
+
+    def get_start_address(self) -> int:
+        return self._start_address
+
+    def get_end_address(self) -> int:
+        return self._end_address
+
+    def get_access_type(self) -> AccessType:
+        return self._access_type
+
+    def get_break_execution(self) -> bool:
+        return self._break_execution
+
+    def get_hit_count(self) -> int:
+        return self._hit_count
+
+    def get_pages(self) -> range:
+        return range(self._start_address >> 8, (self._end_address >> 8) + 1)
+
+    def matches(self, address: int) -> bool:
+        return self._start_address <= address <= self._end_address
+
+    def hit(self, address: int, value: int) -> None:
+        # value is the byte read or written, or the op code about to run for execute watchpoints
+        self._hit_count += 1
+
+        if self._callback is not None:
+            self._callback(self, address, value)
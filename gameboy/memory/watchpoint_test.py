@@ -0,0 +1,45 @@
+import pytest
+
+from gameboy.memory.watchpoint import Watchpoint
+
+
+def test_watchpoint_init():
+    watchpoint = Watchpoint(0xC000)
+
+    assert watchpoint.get_start_address() == 0xC000
+    assert watchpoint.get_end_address() == 0xC000
+    assert watchpoint.get_access_type() == Watchpoint.AccessType.WRITE
+    assert not watchpoint.get_break_execution()
+    assert watchpoint.get_hit_count() == 0
+
+
+def test_watchpoint_init_invalid():
+    with pytest.raises(ValueError):
+        Watchpoint(0xC010, 0xC000)
+
+    with pytest.raises(ValueError):
+        Watchpoint(0xFFFF, 0x10000)
+
+
+def test_watchpoint_get_pages():
+    assert list(Watchpoint(0xC0F0, 0xC210).get_pages()) == [0xC0, 0xC1, 0xC2]
+    assert list(Watchpoint(0xFFFF).get_pages()) == [0xFF]
+
+
+def test_watchpoint_matches():
+    watchpoint = Watchpoint(0xC000, 0xC00F)
+
+    assert watchpoint.matches(0xC000)
+    assert watchpoint.matches(0xC00F)
+    assert not watchpoint.matches(0xC010)
+    assert not watchpoint.matches(0xBFFF)
+
+
+def test_watchpoint_hit():
+    hits = []
+    watchpoint = Watchpoint(0xC000, callback=lambda *args: hits.append(args))
+
+    watchpoint.hit(0xC000, 0x12)
+
+    assert watchpoint.get_hit_count() == 1
+    assert hits == [(watchpoint, 0xC000, 0x12)]
@@ -15,6 +15,10 @@ class ROM(MemoryRegion):
     def __init__(self, data: bytearray):
         super().__init__(data, 0x00)
 
+    def fork(self) -> 'ROM':
+        # Cartridge ROM is never written to by the emulator, so every fork shares the same data
+        return self
+
     def get_title(self) -> str:
         return self.read_byte_range(0x0134, 14).decode('ascii')
 
@@ -0,0 +1,286 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from gameboy.apu.audio_capture import AudioCapture
+from gameboy.gameboy import GameBoy
+from gameboy.memory.serial_endpoint import CaptureSerialEndpoint
+from gameboy.rom import ROM
+
+
+class ROMFarmJob:
+    OUTPUT_FRAME_HASHES = 'frame_hashes'
+    OUTPUT_SERIAL = 'serial'
+    OUTPUT_FINAL_STATE = 'final_state'
+    OUTPUT_TIMING = 'timing'
+
+    OUTPUTS = (OUTPUT_FRAME_HASHES, OUTPUT_SERIAL, OUTPUT_FINAL_STATE, OUTPUT_TIMING)
+    DEFAULT_OUTPUTS = (OUTPUT_FRAME_HASHES, OUTPUT_FINAL_STATE, OUTPUT_TIMING)
+
+    def __init__(self, rom_path: str, frames: int=None, cycles: int=None, input_log: list=None,
+                 outputs: Iterable[str]=None, job_id: str=None, skip_boot: bool=False, audio_path: str=None):
+        # audio_path captures the job's sound to a .wav file, or raw 16 bit stereo PCM for any other extension
+        if (frames is None) == (cycles is None):
+            raise ValueError('A job runs for either frames or cycles')
+
+        if outputs is None:
+            outputs = self.DEFAULT_OUTPUTS if frames is not None else (self.OUTPUT_FINAL_STATE, self.OUTPUT_TIMING)
+
+        outputs = tuple(outputs)
+
+        for output in outputs:
+            if output not in self.OUTPUTS:
+                raise ValueError(f'Unknown job output: {output}')
+
+        if self.OUTPUT_FRAME_HASHES in outputs and frames is None:
+            raise ValueError('Frame hashes need a job that runs for frames')
+
+        # input_log entries are [clock cycles from the start of the job, Joypad.Button bits held from then on]
+        for entry in input_log or []:
+            if len(entry) != 2 or entry[0] < 0 or not 0 <= entry[1] <= 0xFF:
+                raise ValueError(f'Invalid input log entry: {entry}')
+
+        self._rom_path = rom_path
+        self._frames = frames
+        self._cycles = cycles
+        self._input_log = input_log or []
+        self._outputs = outputs
+        self._job_id = job_id
+        self._skip_boot = skip_boot
+        self._audio_path = audio_path
+
+    @classmethod
+    def from_dict(cls, job: dict, base_path: str='') -> 'ROMFarmJob':
+        return cls(
+            rom_path=os.path.join(base_path, job['rom']),
+            frames=job.get('frames'),
+            cycles=job.get('cycles'),
+            input_log=job.get('input_log'),
+            outputs=job.get('outputs'),
+            job_id=job.get('id'),
+            skip_boot=job.get('skip_boot', False),
+            audio_path=os.path.join(base_path, job['audio']) if job.get('audio') else None
+        )
+
+    def get_rom_path(self) -> str:
+        return self._rom_path
+
+    def get_frames(self) -> Optional[int]:
+        return self._frames
+
+    def get_cycles(self) -> Optional[int]:
+        return self._cycles
+
+    def get_input_log(self) -> list:
+        return self._input_log
+
+    def get_outputs(self) -> tuple:
+        return self._outputs
+
+    def get_job_id(self) -> Optional[str]:
+        return self._job_id
+
+    def get_skip_boot(self) -> bool:
+        return self._skip_boot
+
+    def get_audio_path(self) -> Optional[str]:
+        return self._audio_path
+
+    def get_clock_cycles(self) -> int:
+        if self._frames is not None:
+            return self._frames * GameBoy.CLOCK_CYCLES_PER_FRAME
+
+        return self._cycles
+
+
+def load_manifest(manifest_path: str) -> List[ROMFarmJob]:
+    # A JSON list of jobs, or an object with a "jobs" list. ROM paths are relative to the manifest.
+    with open(manifest_path, 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+
+    if isinstance(manifest, dict):
+        manifest = manifest['jobs']
+
+    base_path = os.path.dirname(manifest_path)
+
+    return [ROMFarmJob.from_dict(job, base_path) for job in manifest]
+
+
+# Per worker process, a GameBoy with each ROM seen so far loaded. Jobs fork these instead of reparsing the ROM.
+_worker_game_boys: Dict[Tuple[str, bool], GameBoy] = {}
+
+
+def _initialize_worker(rom_paths: Iterable[str]) -> None:
+    for rom_path in rom_paths:
+        _get_worker_game_boy(rom_path)
+
+
+def _get_worker_game_boy(rom_path: str, skip_boot: bool=False) -> GameBoy:
+    game_boy = _worker_game_boys.get((rom_path, skip_boot))
+
+    if game_boy is None:
+        with open(rom_path, 'rb') as rom_file:
+            rom = ROM(bytearray(rom_file.read()))
+
+        game_boy = GameBoy(skip_boot=skip_boot)
+        game_boy.load_rom(rom)
+
+        _worker_game_boys[(rom_path, skip_boot)] = game_boy
+
+    return game_boy
+
+
+def _run_indexed_job(indexed_job: tuple) -> dict:
+    job_index, job = indexed_job
+
+    try:
+        result = run_job(job)
+    except Exception as exception:
+        result = {'error': f'{type(exception).__name__}: {exception}'}
+
+    result['job'] = job_index
+    result['id'] = job.get_job_id()
+    result['rom'] = job.get_rom_path()
+
+    return result
+
+
+def get_frame_hash(game_boy: GameBoy) -> str:
+    return hashlib.sha1(game_boy.get_gpu().get_buffer()).hexdigest()
+
+
+def get_final_state(game_boy: GameBoy) -> dict:
+    cpu = game_boy.get_cpu()
+    registers = cpu.get_registers()
+
+    return {
+        'af': registers.read_af(),
+        'bc': registers.read_bc(),
+        'de': registers.read_de(),
+        'hl': registers.read_hl(),
+        'sp': registers.get_stack_pointer(),
+        'pc': registers.get_program_counter(),
+        'ime': registers.get_interrupts_enabled(),
+        'clock_cycles': cpu.get_cycle_clock().get_total_clock_cycles()
+    }
+
+
+def run_job(job: ROMFarmJob) -> dict:
+    game_boy = _get_worker_game_boy(job.get_rom_path(), job.get_skip_boot()).fork()
+    outputs = job.get_outputs()
+    result = {}
+
+    if job.get_audio_path() is not None:
+        capture_format = AudioCapture.Format.WAV if job.get_audio_path().lower().endswith('.wav') else \
+            AudioCapture.Format.RAW
+
+        game_boy.enable_audio()
+        game_boy.start_audio_capture(job.get_audio_path(), capture_format, threaded=True)
+
+    # Test ROMs report over serial, there's no need to draw anything for jobs that don't hash frames
+    if ROMFarmJob.OUTPUT_FRAME_HASHES not in outputs:
+        game_boy.get_gpu().set_rendering_enabled(False)
+
+    serial_endpoint = CaptureSerialEndpoint()
+    game_boy.set_serial_endpoint(serial_endpoint)
+
+    start_clock_cycles = game_boy.get_cpu().get_cycle_clock().get_total_clock_cycles()
+
+    for clock_cycles, pressed_buttons in job.get_input_log():
+        game_boy.queue_input(start_clock_cycles + clock_cycles, pressed_buttons)
+
+    start_time = time.perf_counter()
+    elapsed_clock_cycles = 0
+
+    try:
+        if ROMFarmJob.OUTPUT_FRAME_HASHES in outputs:
+            frame_hashes = []
+
+            for frame in range(0, job.get_frames()):
+                # Aim for each frame boundary so instruction overshoot doesn't drift the frames
+                frame_end = (frame + 1) * GameBoy.CLOCK_CYCLES_PER_FRAME
+                elapsed_clock_cycles += game_boy.run_for_cycles(frame_end - elapsed_clock_cycles)
+                frame_hashes.append(get_frame_hash(game_boy))
+
+            result[ROMFarmJob.OUTPUT_FRAME_HASHES] = frame_hashes
+        else:
+            elapsed_clock_cycles = game_boy.run_for_cycles(job.get_clock_cycles())
+    finally:
+        audio_capture = game_boy.get_audio_capture()
+        game_boy.stop_audio_capture()
+
+    wall_seconds = time.perf_counter() - start_time
+
+    if audio_capture is not None:
+        result['audio'] = {
+            'path': audio_capture.get_path(),
+            'sample_rate': audio_capture.get_sample_rate(),
+            'frame_count': audio_capture.get_frame_count()
+        }
+
+    if ROMFarmJob.OUTPUT_SERIAL in outputs:
+        # Bytes are kept as latin-1 so nothing is lost in the JSON
+        result[ROMFarmJob.OUTPUT_SERIAL] = serial_endpoint.get_captured_text()
+
+    if ROMFarmJob.OUTPUT_FINAL_STATE in outputs:
+        result[ROMFarmJob.OUTPUT_FINAL_STATE] = get_final_state(game_boy)
+
+    if ROMFarmJob.OUTPUT_TIMING in outputs:
+        emulated_seconds = elapsed_clock_cycles / GameBoy.CLOCK_CYCLES_PER_SECOND
+
+        result[ROMFarmJob.OUTPUT_TIMING] = {
+            'wall_seconds': wall_seconds,
+            'clock_cycles': elapsed_clock_cycles,
+            'emulated_seconds': emulated_seconds,
+            'speed': emulated_seconds / wall_seconds if wall_seconds else 0.0
+        }
+
+    return result
+
+
+class ROMFarm:
+    def __init__(self, process_count: int=None, rom_paths: Iterable[str]=()):
+        # process_count of 0 runs every job in this process, which is handy for debugging
+        self._process_count = process_count
+        self._rom_paths = list(rom_paths)
+        self._pool = None
+
+    def __enter__(self) -> 'ROMFarm':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_process_count(self) -> Optional[int]:
+        return self._process_count
+
+    def _get_pool(self, rom_paths: Iterable[str]):
+        # Workers live as long as the farm, ROMs not preloaded here get loaded on first use by each worker
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self._process_count, initializer=_initialize_worker,
+                                              initargs=(sorted(set(self._rom_paths) | set(rom_paths)),))
+
+        return self._pool
+
+    def run(self, jobs: Iterable[ROMFarmJob]) -> Iterator[dict]:
+        # Results are yielded as they finish, not in job order. Each carries the index of its job.
+        jobs = list(jobs)
+
+        if self._process_count == 0:
+            for indexed_job in enumerate(jobs):
+                yield _run_indexed_job(indexed_job)
+
+            return
+
+        pool = self._get_pool(job.get_rom_path() for job in jobs)
+
+        yield from pool.imap_unordered(_run_indexed_job, enumerate(jobs))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
@@ -0,0 +1,150 @@
+import json
+import os
+
+import pytest
+
+from gameboy.gameboy import GameBoy
+from gameboy.rom_farm import ROMFarm, ROMFarmJob, load_manifest, run_job
+
+TEST_ROM_PATH = '../test_roms/instr_timing.gb'
+TETRIS_ROM_PATH = '../test_roms/TETRIS.GB'
+
+
+@pytest.fixture()
+def rom_farm_job_fixture() -> ROMFarmJob:
+    return ROMFarmJob(TEST_ROM_PATH, frames=2, job_id='test')
+
+
+def test_rom_farm_job_init(rom_farm_job_fixture):
+    assert rom_farm_job_fixture.get_rom_path() == TEST_ROM_PATH
+    assert rom_farm_job_fixture.get_frames() == 2
+    assert rom_farm_job_fixture.get_cycles() is None
+    assert rom_farm_job_fixture.get_input_log() == []
+    assert rom_farm_job_fixture.get_outputs() == ROMFarmJob.DEFAULT_OUTPUTS
+    assert rom_farm_job_fixture.get_job_id() == 'test'
+    assert not rom_farm_job_fixture.get_skip_boot()
+    assert rom_farm_job_fixture.get_audio_path() is None
+    assert rom_farm_job_fixture.get_clock_cycles() == 2 * GameBoy.CLOCK_CYCLES_PER_FRAME
+
+
+def test_rom_farm_job_init_cycles():
+    job = ROMFarmJob(TEST_ROM_PATH, cycles=1000)
+
+    assert job.get_clock_cycles() == 1000
+    assert ROMFarmJob.OUTPUT_FRAME_HASHES not in job.get_outputs()
+
+
+def test_rom_farm_job_init_invalid():
+    with pytest.raises(ValueError):
+        ROMFarmJob(TEST_ROM_PATH)
+
+    with pytest.raises(ValueError):
+        ROMFarmJob(TEST_ROM_PATH, frames=1, cycles=1000)
+
+    with pytest.raises(ValueError):
+        ROMFarmJob(TEST_ROM_PATH, frames=1, outputs=['screenshots'])
+
+    with pytest.raises(ValueError):
+        ROMFarmJob(TEST_ROM_PATH, cycles=1000, outputs=[ROMFarmJob.OUTPUT_FRAME_HASHES])
+
+
+def test_rom_farm_load_manifest(tmpdir):
+    manifest_path = os.path.join(str(tmpdir), 'manifest.json')
+
+    with open(manifest_path, 'w') as manifest_file:
+        json.dump({'jobs': [{'rom': 'a.gb', 'frames': 3, 'id': 'a'}, {'rom': 'b.gb', 'cycles': 10, 'skip_boot': True}]}, manifest_file)
+
+    jobs = load_manifest(manifest_path)
+
+    assert len(jobs) == 2
+    assert jobs[0].get_rom_path() == os.path.join(str(tmpdir), 'a.gb')
+    assert jobs[0].get_frames() == 3
+    assert jobs[0].get_job_id() == 'a'
+    assert jobs[1].get_cycles() == 10
+    assert not jobs[0].get_skip_boot()
+    assert jobs[1].get_skip_boot()
+
+
+def test_rom_farm_run_job(rom_farm_job_fixture):
+    result = run_job(rom_farm_job_fixture)
+
+    assert len(result['frame_hashes']) == 2
+    assert result['timing']['clock_cycles'] >= 2 * GameBoy.CLOCK_CYCLES_PER_FRAME
+    assert result['final_state']['clock_cycles'] == result['timing']['clock_cycles']
+    assert result['final_state']['pc'] != 0
+
+    # Every job starts from a fresh fork of the worker's GameBoy
+    assert run_job(rom_farm_job_fixture)['final_state'] == result['final_state']
+
+
+def test_rom_farm_run_job_skip_boot():
+    # 1000 cycles is still well inside the boot ROM unless it's skipped
+    assert run_job(ROMFarmJob(TEST_ROM_PATH, cycles=1000))['final_state']['pc'] < 0x0100
+    assert run_job(ROMFarmJob(TEST_ROM_PATH, cycles=1000, skip_boot=True))['final_state']['pc'] >= 0x0100
+
+
+def test_rom_farm_run_in_process():
+    jobs = [ROMFarmJob(TEST_ROM_PATH, cycles=1000), ROMFarmJob('missing.gb', cycles=1000, job_id='missing')]
+
+    with ROMFarm(process_count=0) as rom_farm:
+        results = sorted(rom_farm.run(jobs), key=lambda result: result['job'])
+
+    assert results[0]['final_state']['clock_cycles'] >= 1000
+    assert results[1]['id'] == 'missing'
+    assert 'FileNotFoundError' in results[1]['error']
+
+
+def test_rom_farm_run_pool():
+    jobs = [ROMFarmJob(TEST_ROM_PATH, cycles=2000 * (i + 1), job_id=str(i)) for i in range(0, 4)]
+
+    with ROMFarm(process_count=2, rom_paths=[TEST_ROM_PATH]) as rom_farm:
+        results = sorted(rom_farm.run(jobs), key=lambda result: result['job'])
+        rerun_results = list(rom_farm.run(jobs[:1]))
+
+    assert [result['id'] for result in results] == ['0', '1', '2', '3']
+    assert results[3]['timing']['clock_cycles'] >= 8000
+    assert rerun_results[0]['final_state'] == results[0]['final_state']
+
+
+def test_rom_farm_run_job_audio(tmpdir):
+    pytest.importorskip('numpy')
+
+    path = os.path.join(str(tmpdir), 'audio.raw')
+    result = run_job(ROMFarmJob(TEST_ROM_PATH, frames=2, audio_path=path))
+
+    assert result['audio']['path'] == path
+    assert result['audio']['sample_rate'] == 48000
+    assert result['audio']['frame_count'] > 2 * 800
+    assert os.path.getsize(path) == result['audio']['frame_count'] * 4
+
+    assert ROMFarmJob.from_dict({'rom': 'a.gb', 'frames': 1, 'audio': 'a.wav'}, 'jobs').get_audio_path() == \
+        os.path.join('jobs', 'a.wav')
+    assert 'audio' not in run_job(ROMFarmJob(TEST_ROM_PATH, cycles=1000))
+
+
+def test_rom_farm_run_job_input_log():
+    # The last input is still held at the end
+    job = ROMFarmJob(TEST_ROM_PATH, cycles=5000, input_log=[[1000, 0x81], [2000, 0x80]], skip_boot=True)
+
+    assert job.get_input_log() == [[1000, 0x81], [2000, 0x80]]
+    assert run_job(job)['final_state']['clock_cycles'] >= 5000
+
+    with pytest.raises(ValueError):
+        ROMFarmJob(TEST_ROM_PATH, cycles=1000, input_log=[[1000, 0x100]])
+
+    with pytest.raises(ValueError):
+        ROMFarmJob(TEST_ROM_PATH, cycles=1000, input_log=[[1000]])
+
+
+def test_rom_farm_run_job_serial():
+    result = run_job(ROMFarmJob(TEST_ROM_PATH, cycles=10000, outputs=[ROMFarmJob.OUTPUT_SERIAL], skip_boot=True))
+
+    # Nothing is sent this early, the whole text is kept as a string
+    assert result[ROMFarmJob.OUTPUT_SERIAL] == ''
+
+
+def test_rom_farm_run_job_long():
+    # A real game well past its start up, through OAM clears, DMA and its copyright screen
+    result = run_job(ROMFarmJob(TETRIS_ROM_PATH, cycles=200 * GameBoy.CLOCK_CYCLES_PER_FRAME, skip_boot=True))
+
+    assert result[ROMFarmJob.OUTPUT_TIMING]['clock_cycles'] >= 200 * GameBoy.CLOCK_CYCLES_PER_FRAME
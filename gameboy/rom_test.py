@@ -92,3 +92,7 @@ def test_validate_rom_checksum(test_rom_fixture):
 
     test_rom_fixture.write_byte(0x00, 255)
     assert not test_rom_fixture.validate_rom_checksum()
+
+
+def test_rom_fork_shares_rom(test_rom_fixture):
+    assert test_rom_fixture.fork() is test_rom_fixture
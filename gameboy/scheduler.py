@@ -0,0 +1,77 @@
+import copy
+import heapq
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class Scheduler:
+    # Events due at a total clock cycle count. GameBoy.run_for_cycles handles each at the first instruction boundary
+    # at or after its clock cycle, the only per-step cost is comparing the clock with get_deadline(). Events are data,
+    # each type is handled by whatever the owning GameBoy registered for it, so pending events survive a fork and go
+    # to the fork's own components.
+    class EventType(Enum):
+        JOYPAD = 0
+        SERIAL_TRANSFER = 1
+
+    # get_deadline() with nothing scheduled, later than any clock will get
+    NO_DEADLINE = 1 << 62
+
+    def __init__(self):
+        # Heap of (clock cycles, sequence, event type, value), the sequence keeps same-cycle events in order
+        self._events: List[Tuple[int, int, Scheduler.EventType, int]] = []
+        self._sequence = 0
+
+        self._handlers: Dict[Scheduler.EventType, Callable[[int], None]] = {}
+
+    def set_handler(self, event_type: EventType, handler: Callable[[int], None]) -> None:
+        self._handlers[event_type] = handler
+
+    def schedule(self, clock_cycles: int, event_type: EventType, value: int=0) -> None:
+        heapq.heappush(self._events, (clock_cycles, self._sequence, event_type, value))
+        self._sequence += 1
+
+    def cancel(self, event_type: EventType) -> None:
+        self._events = [event for event in self._events if event[2] != event_type]
+        heapq.heapify(self._events)
+
+    def get_event_count(self) -> int:
+        return len(self._events)
+
+    def get_next_clock_cycles(self) -> Optional[int]:
+        return self._events[0][0] if self._events else None
+
+    def get_deadline(self) -> int:
+        # get_next_clock_cycles for the run loop, which can compare it without checking for None
+        return self._events[0][0] if self._events else self.NO_DEADLINE
+
+    def run_due(self, clock_cycles: int) -> int:
+        # Handles every event due at or before clock_cycles, returns how many there were
+        event_count = 0
+
+        while self._events and self._events[0][0] <= clock_cycles:
+            self.run_next()
+            event_count += 1
+
+        return event_count
+
+    def run_next(self) -> bool:
+        # Handles the next event however far off it is, False if there wasn't one
+        if not self._events:
+            return False
+
+        _, _, event_type, value = heapq.heappop(self._events)
+        self._handlers[event_type](value)
+
+        return True
+
+    def clear(self) -> None:
+        self._events = []
+
+    def fork(self) -> 'Scheduler':
+        # Pending events carry over, handlers are the forked GameBoy's to set
+        forked_scheduler = copy.copy(self)
+
+        forked_scheduler._events = list(self._events)
+        forked_scheduler._handlers = {}
+
+        return forked_scheduler
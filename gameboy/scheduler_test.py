@@ -0,0 +1,79 @@
+import pytest
+
+from gameboy.scheduler import Scheduler
+
+
+@pytest.fixture()
+def scheduler_fixture() -> Scheduler:
+    scheduler = Scheduler()
+    scheduler.handled_values = []
+    scheduler.set_handler(Scheduler.EventType.JOYPAD, scheduler.handled_values.append)
+
+    return scheduler
+
+
+def test_scheduler_init():
+    scheduler = Scheduler()
+
+    assert scheduler.get_event_count() == 0
+    assert scheduler.get_next_clock_cycles() is None
+    assert scheduler.get_deadline() == Scheduler.NO_DEADLINE
+    assert not scheduler.run_next()
+
+
+def test_scheduler_run_due(scheduler_fixture):
+    scheduler_fixture.schedule(300, Scheduler.EventType.JOYPAD, 3)
+    scheduler_fixture.schedule(100, Scheduler.EventType.JOYPAD, 1)
+    scheduler_fixture.schedule(200, Scheduler.EventType.JOYPAD, 2)
+    scheduler_fixture.schedule(200, Scheduler.EventType.JOYPAD, 4)
+
+    assert scheduler_fixture.get_event_count() == 4
+    assert scheduler_fixture.get_next_clock_cycles() == 100
+    assert scheduler_fixture.run_due(99) == 0
+
+    # Same clock cycle, in the order they were scheduled
+    assert scheduler_fixture.run_due(200) == 3
+    assert scheduler_fixture.handled_values == [1, 2, 4]
+    assert scheduler_fixture.get_next_clock_cycles() == 300
+
+    assert scheduler_fixture.run_next()
+    assert scheduler_fixture.handled_values == [1, 2, 4, 3]
+
+
+def test_scheduler_cancel_clear(scheduler_fixture):
+    scheduler_fixture.schedule(100, Scheduler.EventType.JOYPAD, 1)
+    scheduler_fixture.cancel(Scheduler.EventType.JOYPAD)
+
+    assert scheduler_fixture.get_event_count() == 0
+
+    scheduler_fixture.schedule(100, Scheduler.EventType.JOYPAD, 1)
+    scheduler_fixture.clear()
+
+    assert scheduler_fixture.get_next_clock_cycles() is None
+
+
+def test_scheduler_fork(scheduler_fixture):
+    scheduler_fixture.schedule(100, Scheduler.EventType.JOYPAD, 1)
+
+    forked_scheduler = scheduler_fixture.fork()
+    forked_values = []
+    forked_scheduler.set_handler(Scheduler.EventType.JOYPAD, forked_values.append)
+    forked_scheduler.schedule(50, Scheduler.EventType.JOYPAD, 2)
+
+    assert scheduler_fixture.get_event_count() == 1
+
+    forked_scheduler.run_due(100)
+
+    assert forked_values == [2, 1]
+    assert scheduler_fixture.handled_values == []
+
+
+def test_scheduler_get_deadline(scheduler_fixture):
+    scheduler_fixture.schedule(300, Scheduler.EventType.JOYPAD)
+    scheduler_fixture.schedule(200, Scheduler.EventType.SERIAL_TRANSFER)
+
+    assert scheduler_fixture.get_deadline() == 200
+
+    scheduler_fixture.cancel(Scheduler.EventType.SERIAL_TRANSFER)
+
+    assert scheduler_fixture.get_deadline() == 300
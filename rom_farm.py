@@ -0,0 +1,32 @@
+import argparse
+import json
+import sys
+
+from gameboy.rom_farm import ROMFarm, load_manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a manifest of headless ROM jobs over a pool of workers')
+    parser.add_argument('manifest',
+                        help='JSON list of jobs: rom, frames or cycles, input_log, outputs, id, skip_boot, audio')
+    parser.add_argument('-p', '--processes', type=int, default=None,
+                        help='Worker processes, defaults to one per CPU. 0 runs jobs in this process.')
+    parser.add_argument('-o', '--output', default='-', help='JSON lines results file, defaults to stdout')
+
+    args = parser.parse_args()
+    jobs = load_manifest(args.manifest)
+
+    output_file = sys.stdout if args.output == '-' else open(args.output, 'w')
+
+    try:
+        with ROMFarm(process_count=args.processes) as rom_farm:
+            for result in rom_farm.run(jobs):
+                output_file.write(json.dumps(result) + '\n')
+                output_file.flush()
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+if __name__ == "__main__":
+    main()